@@ -18,17 +18,26 @@ from __future__ import annotations
 
 from typing import (TYPE_CHECKING,
                     Any,
+                    Dict,
+                    List,
                     Union)
 
 from couchbase.logic.observability import ObservableRequestHandler
-from couchbase.logic.operation_types import KeyValueOperationType
-from couchbase.result import CounterResult, MutationResult
+from couchbase.logic.operation_types import KeyValueMultiOperationType, KeyValueOperationType
+from couchbase.result import (CounterResult,
+                              MultiCounterResult,
+                              MultiMutationResult,
+                              MutationResult)
 
 if TYPE_CHECKING:
     from acouchbase.logic.collection_impl import AsyncCollectionImpl
-    from couchbase.options import (AppendOptions,
+    from couchbase.options import (AppendMultiOptions,
+                                   AppendOptions,
+                                   DecrementMultiOptions,
                                    DecrementOptions,
+                                   IncrementMultiOptions,
                                    IncrementOptions,
+                                   PrependMultiOptions,
                                    PrependOptions)
 
 
@@ -252,3 +261,128 @@ class BinaryCollection:
         async with ObservableRequestHandler.create(KeyValueOperationType.Prepend, instruments) as obs_handler:
             req = self._impl.request_builder.build_prepend_request(key, value, obs_handler, *opts, **kwargs)
             return await self._impl.prepend(req, obs_handler)
+
+    async def append_multi(self,
+                           keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+                           *opts,  # type: AppendMultiOptions
+                           **kwargs,  # type: Any
+                           ) -> MultiMutationResult:
+        """For each key-value pair, appends the specified value to the end of the document specified by the key.
+
+        Args:
+            keys_and_values (Dict[str, Union[str,bytes,bytearray]]): The key-value pairs to use for the multiple
+                append operations.  Each key should correspond to the document to append to and each value should
+                correspond to the value to append to the document.
+            opts (:class:`~couchbase.options.AppendMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.AppendMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.AppendMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_append_multi_request(
+                keys_and_values, obs_handler, *opts, **kwargs)
+            return await self._impl.append_multi(req, obs_handler)
+
+    async def prepend_multi(self,
+                            keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+                            *opts,  # type: PrependMultiOptions
+                            **kwargs,  # type: Any
+                            ) -> MultiMutationResult:
+        """For each key-value pair, prepends the specified value to the beginning of the document specified by
+        the key.
+
+        Args:
+            keys_and_values (Dict[str, Union[str,bytes,bytearray]]): The key-value pairs to use for the multiple
+                prepend operations.  Each key should correspond to the document to prepend to and each value should
+                correspond to the value to prepend to the document.
+            opts (:class:`~couchbase.options.PrependMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.PrependMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.PrependMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_prepend_multi_request(
+                keys_and_values, obs_handler, *opts, **kwargs)
+            return await self._impl.prepend_multi(req, obs_handler)
+
+    async def increment_multi(self,
+                              keys,  # type: List[str]
+                              *opts,  # type: IncrementMultiOptions
+                              **kwargs,  # type: Any
+                              ) -> MultiCounterResult:
+        """For each key in the provided list, increments the ASCII value of the document, specified by the key,
+        by the amount indicated in the delta option (defaults to 1).
+
+        Args:
+            keys (List[str]): The keys to use for the multiple increment operations.  Each key should correspond
+                to the document to increment.
+            opts (:class:`~couchbase.options.IncrementMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.IncrementMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiCounterResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiCounterResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.IncrementMulti,
+                                                   instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_increment_multi_request(keys, obs_handler, *opts, **kwargs)
+            return await self._impl.increment_multi(req, obs_handler)
+
+    async def decrement_multi(self,
+                              keys,  # type: List[str]
+                              *opts,  # type: DecrementMultiOptions
+                              **kwargs,  # type: Any
+                              ) -> MultiCounterResult:
+        """For each key in the provided list, decrements the ASCII value of the document, specified by the key,
+        by the amount indicated in the delta option (defaults to 1).
+
+        Args:
+            keys (List[str]): The keys to use for the multiple decrement operations.  Each key should correspond
+                to the document to decrement.
+            opts (:class:`~couchbase.options.DecrementMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.DecrementMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiCounterResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiCounterResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.DecrementMulti,
+                                                   instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_decrement_multi_request(keys, obs_handler, *opts, **kwargs)
+            return await self._impl.decrement_multi(req, obs_handler)
@@ -88,6 +88,8 @@ class AsyncBucket:
     def scope(self, name: str) -> Scope:
         """Creates a :class:`~acouchbase.scope.Scope` instance of the specified scope.
 
+        The instance is cached, later calls for the same scope return the same instance.
+
         Args:
             name (str): Name of the scope to reference.
 
@@ -95,7 +97,7 @@ class AsyncBucket:
             :class:`~acouchbase.scope.Scope`: A :class:`~couchbase.scope.Scope` instance of the specified scope.
 
         """
-        return Scope(self, name)
+        return self._impl._client_adapter.handle_cache.get_or_create((self.name, name), lambda: Scope(self, name))
 
     def collection(self, collection_name: str) -> Collection:
         """Creates a :class:`~acouchbase.collection.Collection` instance of the specified collection.
@@ -19,6 +19,9 @@ from asyncio import AbstractEventLoop
 from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
+                    ContextManager,
+                    Dict,
+                    Optional,
                     Union)
 
 from acouchbase import get_event_loop  # noqa: F401
@@ -44,6 +47,7 @@ from couchbase.result import (AnalyticsResult,
                               SearchResult)
 
 if TYPE_CHECKING:
+    from couchbase.logic.observability import HotPathStats
     from couchbase.options import (AnalyticsOptions,
                                    ClusterOptions,
                                    DiagnosticsOptions,
@@ -159,6 +163,9 @@ class AsyncCluster:
     def bucket(self, bucket_name: str) -> AsyncBucket:
         """Creates a Bucket instance to a specific bucket.
 
+        The instance is cached, later calls for the same bucket return the same instance (until the bucket or
+        this cluster is closed).
+
         .. seealso::
             :class:`.bucket.AsyncBucket`
 
@@ -173,7 +180,8 @@ class AsyncCluster:
                 be found.
 
         """
-        return AsyncBucket(self, bucket_name)
+        return self._impl.client_adapter.handle_cache.get_or_create((bucket_name,),
+                                                                    lambda: AsyncBucket(self, bucket_name))
 
     async def cluster_info(self) -> ClusterInfoResult:
         """Retrieve the Couchbase cluster information
@@ -237,6 +245,77 @@ class AsyncCluster:
         req = self._impl.request_builder.build_diagnostics_request(*opts, **kwargs)
         return await self._impl.diagnostics(req)
 
+    def streaming_executor_stats(self) -> Dict[str, int]:
+        """Returns the saturation metrics of the executor shared by the cluster's streaming results.
+
+        Rows for async query, analytics, search, view and range scan results are fetched on a single,
+        bounded, cluster-level executor (see the `streaming_executor_max_workers` and
+        `streaming_executor_queue_depth` :class:`~couchbase.options.ClusterOptions`).
+
+        Returns:
+            Dict[str, int]: A snapshot of the executor metrics: ``max_workers``, ``max_queue_depth``,
+            ``active`` (fetches running on a worker), ``queued`` (fetches waiting for a worker),
+            ``waiting`` (fetches waiting, on the event loop, for room in the queue), ``peak_in_flight``,
+            ``submitted``, ``completed`` and ``saturated`` (number of fetches that found the queue full).
+
+        Examples:
+            Check if streaming results are waiting on the executor::
+
+                stats = cluster.streaming_executor_stats()
+                if stats['waiting'] > 0:
+                    print(f'Streaming executor saturated: {stats}')
+
+        """
+        return self._impl.client_adapter.streaming_executor.stats()
+
+    def hot_path_profiling(self) -> ContextManager[None]:
+        """Enables hot path profiling for the KV operations started within the returned context manager.
+
+        Use it to profile some operations only, instead of every operation of the cluster (the
+        `enable_hot_path_profiling` :class:`~couchbase.options.ClusterOptions` option).  Profiling follows the
+        current context, so with acouchbase only the operations of the task entering the block are profiled.
+
+        Returns:
+            ContextManager[None]: A context manager enabling profiling while it is entered.
+
+        Examples:
+            Profile a single get::
+
+                with cluster.hot_path_profiling():
+                    res = await collection.get('airline_10')
+                print(cluster.hot_path_stats()['get'])
+
+        """
+        return self._impl.cluster_settings.get_hot_path_profiler().profile()
+
+    def hot_path_stats(self, reset: Optional[bool] = None) -> HotPathStats:
+        """Returns the latency of the profiled KV operations, broken down by stage.
+
+        Each operation's stages (see :class:`~couchbase.logic.observability.HotPathStage`), from building the
+        request to decoding the result's content, are recorded in HDR histograms.  The stats cover every operation
+        profiled since profiling started, or since the last call with `reset` set to True.
+
+        Args:
+            reset (bool, optional): Set to True to clear the histograms once read. Defaults to False.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: The stats, keyed by operation name (e.g. ``get``, ``upsert_multi``)
+            and stage name.  Each stage has the ``total_count`` of recorded values and its ``percentiles_ns``, the
+            50th, 90th, 99th, 99.9th and 100th percentiles in nanoseconds.  Empty if profiling was never enabled.
+
+        Examples:
+            Find which stage regressed::
+
+                stats = cluster.hot_path_stats()
+                for stage, report in stats['get'].items():
+                    print(f'{stage}: p99={report["percentiles_ns"]["99.0"]}ns')
+
+        """
+        profiler = self._impl.observability_instruments.hot_path_profiler
+        if profiler is None:
+            return {}
+        return profiler.snapshot(reset=reset)
+
     async def wait_until_ready(self,
                                timeout,  # type: timedelta
                                *opts,  # type: WaitUntilReadyOptions
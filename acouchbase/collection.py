@@ -17,7 +17,14 @@ from __future__ import annotations
 
 from typing import (TYPE_CHECKING,
                     Any,
-                    Iterable)
+                    AsyncIterable,
+                    AsyncIterator,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
 
 from acouchbase.binary_collection import BinaryCollection
 from acouchbase.datastructures import (CouchbaseList,
@@ -26,13 +33,29 @@ from acouchbase.datastructures import (CouchbaseList,
                                        CouchbaseSet)
 from acouchbase.logic.collection_impl import AsyncCollectionImpl
 from acouchbase.management.queries import CollectionQueryIndexManager
+from couchbase.exceptions import CouchbaseException
+from couchbase.logic.kv_range_scan import (SCAN_PARTITION_SAMPLE_SIZE,
+                                           SamplingScan,
+                                           ScanPartition,
+                                           build_scan_partitions,
+                                           get_scan_partition_bounds)
+from couchbase.logic.kv_stream import (DEFAULT_STREAM_WINDOW,
+                                       get_stream_window,
+                                       keys_as_stream_items,
+                                       stream_kv_ops_async)
 from couchbase.logic.observability import ObservableRequestHandler
-from couchbase.logic.operation_types import KeyValueOperationType
+from couchbase.logic.operation_types import KeyValueMultiOperationType, KeyValueOperationType
+from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
+from couchbase.options import ScanOptions
 from couchbase.result import (ExistsResult,
                               GetReplicaResult,
                               GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiExistsResult,
+                              MultiGetReplicaResult,
+                              MultiGetResult,
+                              MultiMutationResult,
                               MutateInResult,
                               MutationResult,
                               ScanResultIterable)
@@ -43,23 +66,33 @@ if TYPE_CHECKING:
     from acouchbase.scope import AsyncScope
     from couchbase._utils import JSONType
     from couchbase.kv_range_scan import ScanType
-    from couchbase.options import (ExistsOptions,
+    from couchbase.options import (ExistsMultiOptions,
+                                   ExistsOptions,
                                    GetAllReplicasOptions,
+                                   GetAndLockMultiOptions,
                                    GetAndLockOptions,
                                    GetAndTouchOptions,
+                                   GetAnyReplicaMultiOptions,
                                    GetAnyReplicaOptions,
+                                   GetMultiOptions,
                                    GetOptions,
+                                   InsertMultiOptions,
                                    InsertOptions,
                                    LookupInAllReplicasOptions,
                                    LookupInAnyReplicaOptions,
                                    LookupInOptions,
                                    MutateInOptions,
+                                   RemoveMultiOptions,
                                    RemoveOptions,
+                                   ReplaceMultiOptions,
                                    ReplaceOptions,
-                                   ScanOptions,
+                                   TouchMultiOptions,
                                    TouchOptions,
+                                   UnlockMultiOptions,
                                    UnlockOptions,
+                                   UpsertMultiOptions,
                                    UpsertOptions)
+    from couchbase.result import MultiResultType
     from couchbase.subdocument import Spec
 
 
@@ -1075,9 +1108,203 @@ class AsyncCollection:
 
         """  # noqa: E501
         req = self._impl.request_builder.build_range_scan_async_request(
-            self._impl.connection, scan_type, *opts, **kwargs)
+            self._impl.connection,
+            scan_type,
+            *opts,
+            streaming_executor=self._impl.client_adapter.streaming_executor,
+            **kwargs)
         return self._impl.range_scan(req)
 
+    async def scan_partitions(self,
+                              scan_type,  # type: ScanType
+                              partitions,  # type: int
+                              ) -> List[ScanPartition]:
+        """Splits a key-value range scan into disjoint partitions that can be scanned in parallel.
+
+        The key space of the scan is split into ranges that hold about the same number of documents, the split points
+        are picked from a (keys only) sampling scan of the collection.  If too few of the sampled keys fall in the
+        scanned range, e.g. a narrow :class:`~couchbase.kv_range_scan.PrefixScan`, the range is split evenly over the
+        printable ASCII characters instead.  Each partition is scanned independently by
+        passing its :attr:`~couchbase.kv_range_scan.ScanPartition.scan_type` to :meth:`scan`, e.g. from its own
+        thread, asyncio task or process.  Together the partitions return each document of the original scan exactly
+        once.
+
+        A partition is the unit of resumption: a consumer that fails can re-scan its partition, and
+        :attr:`~couchbase.kv_range_scan.ScanPartition.token` can be used to record, or hand over, the partitions that
+        still need to be scanned.
+
+        Args:
+            scan_type (:class:`~couchbase.kv_range_scan.ScanType`): Either a :class:`~couchbase.kv_range_scan.RangeScan`
+                or :class:`~couchbase.kv_range_scan.PrefixScan` instance.
+            partitions (int): The number of partitions to split the scan into.  Fewer partitions are returned when the
+                collection is small and does not have enough documents in the scanned range.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If scan_type is not either a RangeScan or
+                PrefixScan instance, or if partitions is not a positive int.
+
+        Returns:
+            List[:class:`~couchbase.kv_range_scan.ScanPartition`]: The partitions of the scan, ordered by key range.
+
+        Examples:
+
+            Export a collection from multiple processes (with the blocking API)::
+
+                from concurrent.futures import ProcessPoolExecutor
+
+                from couchbase.kv_range_scan import RangeScan
+
+                # ... other code ...
+
+                def export_partition(partition):
+                    collection = connect_to_collection()  # each process uses its own connection
+                    return sum(1 for _ in collection.scan(partition.scan_type))
+
+                partitions = await collection.scan_partitions(RangeScan(), 8)
+                with ProcessPoolExecutor(max_workers=8) as pool:
+                    total = sum(pool.map(export_partition, partitions))
+
+        """
+        get_scan_partition_bounds(scan_type, partitions)
+        if partitions == 1:
+            return build_scan_partitions(scan_type, partitions, ())
+        sample_size = partitions * SCAN_PARTITION_SAMPLE_SIZE
+        sample = self.scan(SamplingScan(sample_size), ScanOptions(ids_only=True))
+        return build_scan_partitions(scan_type, partitions, [res.id async for res in sample], sample_size=sample_size)
+
+    def with_cache(self,
+                   max_entries,  # type: int
+                   max_bytes=None,  # type: Optional[int]
+                   ttl=None,  # type: Optional[timedelta]
+                   revalidate=None,  # type: Optional[bool]
+                   ) -> AsyncCollection:
+        """Enables a client-side, read-through cache of the documents retrieved with :meth:`get`.
+
+        Meant for hot documents that rarely change (e.g. feature flags or configuration).  A cached document is
+        returned without a round trip to the server, the least recently used documents are evicted once the cache
+        is full.  Mutations (e.g. upsert, replace, remove or mutate_in) made through this collection invalidate the
+        cached document, mutations made by other clients are only seen once the cached document expires (see
+        ``ttl``), or on every get when ``revalidate`` is enabled.
+
+        Gets that request the document's expiry or a projection bypass the cache.  The collection returned by
+        :meth:`~acouchbase.scope.AsyncScope.collection` is shared by every caller that looks it up, and so is its
+        cache.  Calling this method again with the same arguments keeps the cache and the documents cached so far,
+        with different arguments it replaces the cache.  When the cluster uses the default logging meter, the cache's
+        hits, misses and evictions are reported along with the operation metrics.
+
+        Args:
+            max_entries (int): The maximum number of cached documents.
+            max_bytes (Optional[int]): The maximum total size, in bytes, of the cached (encoded) documents.
+            ttl (Optional[timedelta]): How long a document is cached for.  Defaults to until it is evicted or
+                invalidated.
+            revalidate (Optional[bool]): If set to True, a cached document is only returned if its CAS still matches
+                the CAS on the server.  Checking the CAS is a round trip, but the document itself is not transferred.
+
+        Returns:
+            :class:`~acouchbase.collection.AsyncCollection`: This collection, with the cache enabled.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If any of the provided arguments is invalid.
+
+        Examples:
+
+            Cache up to 100 documents for at most 30 seconds::
+
+                from datetime import timedelta
+
+                # ... other code ...
+
+                collection = bucket.scope('inventory').collection('airline').with_cache(100, ttl=timedelta(seconds=30))
+                res = await collection.get('airline_10')
+
+        """
+        self._impl.enable_document_cache(max_entries, max_bytes=max_bytes, ttl=ttl, revalidate=revalidate)
+        return self
+
+    def with_coalescing(self,
+                        max_batch=None,  # type: Optional[int]
+                        window=None,  # type: Optional[timedelta]
+                        ) -> AsyncCollection:
+        """Enables the coalescing of the :meth:`get` and :meth:`upsert` operations issued by concurrent coroutines.
+
+        Meant for services awaiting many independent single-key operations at once, e.g. one per request they
+        handle.  The operations issued within ``window`` of each other are gathered and dispatched together through
+        the multi operation bindings (see :meth:`get_multi` and :meth:`upsert_multi`), and the event loop is woken
+        once per batch rather than once per operation.  Each coroutine still awaits its own result, or exception,
+        exactly as without coalescing.
+
+        A batch is dispatched once ``window`` has elapsed since its first operation, or as soon as it holds
+        ``max_batch`` operations.  Without a window, the operations issued during the same iteration of the event
+        loop (e.g. from ``asyncio.gather``) are gathered.  Gets that request the document's expiry or a projection,
+        and upserts with legacy durability, are not coalesced.  The collection returned by
+        :meth:`~acouchbase.scope.AsyncScope.collection` is shared by every caller that looks it up, and so are its
+        batches.  Calling this method again with the same arguments keeps the operations gathered so far, with
+        different arguments the gathered operations are dispatched and the new settings apply from then on.
+
+        Args:
+            max_batch (Optional[int]): The maximum number of operations dispatched together.  Defaults to 128.
+            window (Optional[timedelta]): How long an operation can wait for others to be gathered with it.
+                Defaults to the current iteration of the event loop.
+
+        Returns:
+            :class:`~acouchbase.collection.AsyncCollection`: This collection, with coalescing enabled.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If any of the provided arguments is invalid.
+
+        Examples:
+
+            Gather the gets issued within 1 millisecond, up to 64 at a time::
+
+                from datetime import timedelta
+
+                # ... other code ...
+
+                collection = bucket.default_collection().with_coalescing(max_batch=64,
+                                                                         window=timedelta(milliseconds=1))
+                results = await asyncio.gather(*(collection.get(key) for key in keys))
+
+        """
+        self._impl.enable_coalescing(max_batch=max_batch, window=window)
+        return self
+
+    def with_single_flight(self) -> AsyncCollection:
+        """Enables the sharing of identical reads of a document that are in flight at the same time.
+
+        Meant for hot documents read by many coroutines at once, e.g. when the document expires from an application
+        cache.  A :meth:`get`, :meth:`exists`, :meth:`lookup_in` or :meth:`get_any_replica` issued while an identical
+        read (same document, operation and options) is in flight does not send a request, it awaits the read in
+        flight and gets its own result built from the same response, or the same exception.  Mutations made through
+        this collection are seen by the reads issued once they complete.
+
+        The number of requests that were not sent is available as :attr:`single_flight_saved`.  When the cluster
+        uses the default logging meter, it is also reported along with the operation metrics.  Calling this method
+        again keeps the reads in flight and the count.
+
+        Returns:
+            :class:`~acouchbase.collection.AsyncCollection`: This collection, with single-flight enabled.
+
+        Examples:
+
+            Share the concurrent gets of a hot document::
+
+                collection = bucket.scope('inventory').collection('airline').with_single_flight()
+                results = await asyncio.gather(*(collection.get('airline_10') for _ in range(100)))
+                print(f'Requests saved: {collection.single_flight_saved}')
+
+        """
+        self._impl.enable_single_flight()
+        return self
+
+    @property
+    def single_flight_saved(self) -> int:
+        """
+            int: The number of reads that shared an identical read in flight instead of sending a request, see
+            :meth:`with_single_flight`.
+        """
+        single_flight = self._impl.single_flight
+        return single_flight.saved if single_flight is not None else 0
+
     def binary(self) -> BinaryCollection:
         """Creates a BinaryCollection instance, allowing access to various binary operations
         possible against a collection.
@@ -1139,6 +1366,433 @@ class AsyncCollection:
         """
         return CouchbaseQueue(key, self._impl)
 
+    async def get_multi(self,
+                        keys,  # type: List[str]
+                        *opts,  # type: GetMultiOptions
+                        **kwargs,  # type: Any
+                        ) -> MultiGetResult:
+        """For each key in the provided list, retrieve the document associated with the key.
+
+        The whole batch is dispatched through a single call into the C++ core and resolves a single future.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple get operations.
+            opts (:class:`~couchbase.options.GetMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiGetResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiGetResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        Examples:
+
+            Simple get-multi operation::
+
+                collection = bucket.default_collection()
+                keys = ['doc1', 'doc2', 'doc3']
+                res = await collection.get_multi(keys)
+                for k, v in res.results.items():
+                    print(f'Doc {k} has value: {v.content_as[dict]}')
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.GetMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_get_multi_request(keys, obs_handler, *opts, **kwargs)
+            return await self._impl.get_multi(req, obs_handler)
+
+    def get_stream(self,
+                   keys,  # type: Union[Iterable[str], AsyncIterable[str]]
+                   *opts,  # type: GetOptions
+                   window=DEFAULT_STREAM_WINDOW,  # type: int
+                   **kwargs,  # type: Any
+                   ) -> AsyncIterator[Tuple[str, Union[GetResult, CouchbaseException]]]:
+        """Retrieves the document of each key of the provided iterable, keeping at most ``window`` operations in
+        flight, and yields the results as they arrive.
+
+        Unlike :meth:`get_multi`, which returns once every document has been retrieved, each result is handed back
+        as soon as its response arrives, so processing can start with the first document instead of waiting for the
+        slowest one.  Keys are pulled from ``keys`` only as in-flight operations complete, so memory use is bounded
+        by ``window`` regardless of the number of keys.  If iteration is stopped early, the operations still in
+        flight are cancelled.
+
+        Args:
+            keys (Union[Iterable[str], AsyncIterable[str]]): The keys of the documents to retrieve.  Any iterable or
+                async iterable is accepted.
+            opts (:class:`~couchbase.options.GetOptions`): Optional parameters applied to every get operation.
+            window (int, optional): Maximum number of get operations in flight.  Defaults to 128.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetOptions`
+
+        Returns:
+            AsyncIterator[Tuple[str, Union[:class:`~couchbase.result.GetResult`, :class:`~couchbase.exceptions.CouchbaseException`]]]:
+            An async iterator of the (key, result) pairs, in completion order.  If an operation failed (e.g. the
+            document does not exist), the exception is returned in place of the result.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the window is not a positive int, or if a
+                single key is provided instead of an iterable of keys.
+
+        Examples:
+
+            Process documents as they are retrieved::
+
+                collection = bucket.default_collection()
+                keys = [f'doc{i}' for i in range(50_000)]
+                async for key, res in collection.get_stream(keys, window=512):
+                    if isinstance(res, CouchbaseException):
+                        print(f'Failed to get doc: key={key}, error={res}')
+                        continue
+                    process(res.content_as[dict])
+
+        """  # noqa: E501
+        window = get_stream_window(window)
+
+        async def _get(key, _):
+            return await self.get(key, *opts, **kwargs)
+
+        return stream_kv_ops_async(_get, keys_as_stream_items(keys), window)
+
+    async def get_any_replica_multi(self,
+                                    keys,  # type: List[str]
+                                    *opts,  # type: GetAnyReplicaMultiOptions
+                                    **kwargs,  # type: Any
+                                    ) -> MultiGetReplicaResult:
+        """For each key in the provided list, retrieve the document associated with the key from the collection
+        leveraging both active and all available replicas returning the first available.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple get operations.
+            opts (:class:`~couchbase.options.GetAnyReplicaMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetAnyReplicaMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiGetReplicaResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiGetReplicaResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentUnretrievableException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.GetAnyReplicaMulti,
+                                                   instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_get_any_replica_multi_request(keys,
+                                                                                       obs_handler,
+                                                                                       *opts,
+                                                                                       **kwargs)
+            return await self._impl.get_any_replica_multi(req, obs_handler)
+
+    async def get_and_lock_multi(self,
+                                 keys,  # type: List[str]
+                                 lock_time,  # type: timedelta
+                                 *opts,  # type: GetAndLockMultiOptions
+                                 **kwargs,  # type: Any
+                                 ) -> MultiGetResult:
+        """For each key in the provided list, lock the document associated with the key.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple lock operations.
+            lock_time (timedelta):  The amount of time to lock the documents.
+            opts (:class:`~couchbase.options.GetAndLockMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetAndLockMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiGetResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiGetResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.GetAndLockMulti,
+                                                   instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_get_and_lock_multi_request(keys,
+                                                                                    lock_time,
+                                                                                    obs_handler,
+                                                                                    *opts,
+                                                                                    **kwargs)
+            return await self._impl.get_and_lock_multi(req, obs_handler)
+
+    async def exists_multi(self,
+                           keys,  # type: List[str]
+                           *opts,  # type: ExistsMultiOptions
+                           **kwargs,  # type: Any
+                           ) -> MultiExistsResult:
+        """For each key in the provided list, check if the document associated with the key exists.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple exists operations.
+            opts (:class:`~couchbase.options.ExistsMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.ExistsMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiExistsResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiExistsResult` if successful.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.ExistsMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_exists_multi_request(keys, obs_handler, *opts, **kwargs)
+            return await self._impl.exists_multi(req, obs_handler)
+
+    async def insert_multi(self,
+                           keys_and_docs,  # type: Dict[str, JSONType]
+                           *opts,  # type: InsertMultiOptions
+                           **kwargs,  # type: Any
+                           ) -> MultiMutationResult:
+        """For each key, value pair in the provided dict, inserts a new document to the collection,
+        failing if the document already exists.
+
+        Args:
+            keys_and_docs (Dict[str, JSONType]): The keys and values/docs to use for the multiple insert operations.
+            opts (:class:`~couchbase.options.InsertMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.InsertMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentExistsException`: If the key provided already exists on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.InsertMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_insert_multi_request(keys_and_docs,
+                                                                              obs_handler,
+                                                                              *opts,
+                                                                              **kwargs)
+            return await self._impl.insert_multi(req, obs_handler)
+
+    async def upsert_multi(self,
+                           keys_and_docs,  # type: Dict[str, JSONType]
+                           *opts,  # type: UpsertMultiOptions
+                           **kwargs,  # type: Any
+                           ) -> MultiMutationResult:
+        """For each key, value pair in the provided dict, upserts a document to the collection. This operation
+        succeeds whether or not the document already exists.
+
+        Args:
+            keys_and_docs (Dict[str, JSONType]): The keys and values/docs to use for the multiple upsert operations.
+            opts (:class:`~couchbase.options.UpsertMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.UpsertMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Examples:
+
+            Simple upsert_multi operation::
+
+                collection = bucket.default_collection()
+                keys_and_docs = {
+                    'doc1': {'foo': 'bar', 'id': 'doc1'},
+                    'doc2': {'bar': 'baz', 'id': 'doc2'},
+                }
+                res = await collection.upsert_multi(keys_and_docs)
+                for k, v in res.results.items():
+                    print(f'Doc upserted: key={k}, cas={v.cas}')
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.UpsertMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_upsert_multi_request(keys_and_docs,
+                                                                              obs_handler,
+                                                                              *opts,
+                                                                              **kwargs)
+            return await self._impl.upsert_multi(req, obs_handler)
+
+    def upsert_stream(self,
+                      keys_and_docs,  # type: Union[Iterable[Tuple[str, JSONType]], AsyncIterable[Tuple[str, JSONType]], Dict[str, JSONType]]  # noqa: E501
+                      *opts,  # type: UpsertOptions
+                      window=DEFAULT_STREAM_WINDOW,  # type: int
+                      **kwargs,  # type: Any
+                      ) -> AsyncIterator[Tuple[str, Union[MutationResult, CouchbaseException]]]:
+        """Upserts each (key, document) pair of the provided iterable, keeping at most ``window`` operations in
+        flight.
+
+        Unlike :meth:`upsert_multi`, the input is consumed lazily: a document is pulled from ``keys_and_docs``, and
+        encoded, only once an in-flight operation completes, so memory use is bounded by ``window`` regardless of
+        the size of the input.  If iteration is stopped early, the operations still in flight are cancelled.
+
+        Args:
+            keys_and_docs (Union[Iterable[Tuple[str, JSONType]], AsyncIterable[Tuple[str, JSONType]], Dict[str, JSONType]]):
+                The (key, document) pairs to upsert.  Any iterable or async iterable of pairs, or a dict, is accepted.
+            opts (:class:`~couchbase.options.UpsertOptions`): Optional parameters applied to every upsert operation.
+            window (int, optional): Maximum number of upsert operations in flight.  Defaults to 128.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.UpsertOptions`
+
+        Returns:
+            AsyncIterator[Tuple[str, Union[:class:`~couchbase.result.MutationResult`, :class:`~couchbase.exceptions.CouchbaseException`]]]:
+            An async iterator of the (key, result) pairs, in completion order.  If an operation failed, the exception
+            is returned in place of the result.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the window is not a positive int.
+
+        Examples:
+
+            Load documents from an async source::
+
+                collection = bucket.default_collection()
+                async for key, res in collection.upsert_stream(fetch_docs(), window=256):
+                    if isinstance(res, CouchbaseException):
+                        print(f'Failed to upsert doc: key={key}, error={res}')
+
+        """  # noqa: E501
+        window = get_stream_window(window)
+
+        async def _upsert(key, value):
+            return await self.upsert(key, value, *opts, **kwargs)
+
+        return stream_kv_ops_async(_upsert, keys_and_docs, window)
+
+    async def replace_multi(self,
+                            keys_and_docs,  # type: Dict[str, JSONType]
+                            *opts,  # type: ReplaceMultiOptions
+                            **kwargs,  # type: Any
+                            ) -> MultiMutationResult:
+        """For each key, value pair in the provided dict, replaces the value of a document in the collection.
+        This operation fails if the document does not exist.
+
+        Args:
+            keys_and_docs (Dict[str, JSONType]): The keys and values/docs to use for the multiple replace operations.
+            opts (:class:`~couchbase.options.ReplaceMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.ReplaceMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.ReplaceMulti,
+                                                   instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_replace_multi_request(keys_and_docs,
+                                                                               obs_handler,
+                                                                               *opts,
+                                                                               **kwargs)
+            return await self._impl.replace_multi(req, obs_handler)
+
+    async def remove_multi(self,
+                           keys,  # type: List[str]
+                           *opts,  # type: RemoveMultiOptions
+                           **kwargs,  # type: Any
+                           ) -> MultiMutationResult:
+        """For each key in the provided list, remove the existing document.  This operation fails
+        if the document does not exist.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple remove operations.
+            opts (:class:`~couchbase.options.RemoveMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.RemoveMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.RemoveMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_remove_multi_request(keys, obs_handler, *opts, **kwargs)
+            return await self._impl.remove_multi(req, obs_handler)
+
+    async def touch_multi(self,
+                          keys,  # type: List[str]
+                          expiry,  # type: timedelta
+                          *opts,  # type: TouchMultiOptions
+                          **kwargs,  # type: Any
+                          ) -> MultiMutationResult:
+        """For each key in the provided list, update the expiry on an existing document. This operation fails
+        if the document does not exist.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple touch operations.
+            expiry (timedelta): The new expiry for the document.
+            opts (:class:`~couchbase.options.TouchMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TouchMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.TouchMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_touch_multi_request(keys,
+                                                                             expiry,
+                                                                             obs_handler,
+                                                                             *opts,
+                                                                             **kwargs)
+            return await self._impl.touch_multi(req, obs_handler)
+
+    async def unlock_multi(self,
+                           keys,  # type: Union[MultiResultType, Dict[str, int]]
+                           *opts,  # type: UnlockMultiOptions
+                           **kwargs,  # type: Any
+                           ) -> Dict[str, Union[None, PycbcCoreException]]:
+        """For each result in the provided :class:`~couchbase.result.MultiResultType` in the provided list,
+        unlocks a previously locked document. This operation fails if the document does not exist.
+
+        Args:
+            keys (Union[MultiResultType, Dict[str, int]]): The result from a previous multi operation.
+            opts (:class:`~couchbase.options.UnlockMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.UnlockMultiOptions`
+
+        Returns:
+            Awaitable[Dict[str, Union[None, CouchbaseBaseException]]]: A future that contains, per key, either
+            None if operation successful or an Exception if the operation was unsuccessful
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        instruments = self._impl.observability_instruments
+        async with ObservableRequestHandler.create(KeyValueMultiOperationType.UnlockMulti, instruments) as obs_handler:
+            req = self._impl.multi_request_builder.build_unlock_multi_request(keys, obs_handler, *opts, **kwargs)
+            return await self._impl.unlock_multi(req, obs_handler)
+
     def query_indexes(self) -> CollectionQueryIndexManager:
         """
         Get a :class:`~acouchbase.management.queries.CollectionQueryIndexManager` which can be used to manage the query
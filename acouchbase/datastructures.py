@@ -16,14 +16,15 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
+                    AsyncGenerator,
                     Awaitable,
                     Callable,
                     Dict,
                     Generator,
+                    Iterable,
                     List,
                     Optional,
                     Union)
@@ -36,6 +37,14 @@ from couchbase.exceptions import (CasMismatchException,
                                   PathNotFoundException,
                                   QueueEmpty,
                                   UnAmbiguousTimeoutException)
+from couchbase.logic.datastructures import (MAX_SUBDOC_SPECS,
+                                            CasRetryBackoff,
+                                            build_page_lookup_specs,
+                                            build_pop_lookup_specs,
+                                            build_pop_remove_specs,
+                                            parse_page_values,
+                                            parse_popped_values,
+                                            validate_item_count)
 from couchbase.logic.observability import ObservableRequestHandler
 from couchbase.logic.operation_types import DatastructureOperationType, KeyValueOperationType
 from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
@@ -349,6 +358,59 @@ class CouchbaseList:
                 except DocumentNotFoundException:
                     pass
 
+    async def _get_page(self, start: int, page_size: int) -> List[Any]:
+        """
+        Get up to page_size items of the list, starting at index start.
+        """
+        op_type = DatastructureOperationType.ListGetAll
+        async with ObservableRequestHandler(op_type, self._impl.observability_instruments) as ds_obs_handler:
+            ds_obs_handler.create_kv_span(self._impl._request_builder._collection_dtls.get_details_as_dict())
+            kv_op_type = KeyValueOperationType.LookupIn
+            async with ObservableRequestHandler(kv_op_type, self._impl.observability_instruments) as obs_handler:
+                try:
+                    specs = build_page_lookup_specs(start, page_size)
+                    req, transcoder = self._impl.request_builder.build_lookup_in_request(self._key,
+                                                                                         specs,
+                                                                                         obs_handler,
+                                                                                         parent_span=ds_obs_handler.wrapped_span)  # noqa: E501
+                    sdres: LookupInResult = await self._execute_op(self._impl.lookup_in,
+                                                                   req,
+                                                                   obs_handler,
+                                                                   ds_obs_handler.wrapped_span,
+                                                                   create_type=True,
+                                                                   transcoder=transcoder)
+                    return parse_page_values(sdres)
+                except PathNotFoundException:
+                    return []
+
+    async def _iter_pages(self, page_size: int) -> AsyncGenerator[Any, None]:
+        start = 0
+        while True:
+            page = await self._get_page(start, page_size)
+            for val in page:
+                yield val
+            if len(page) < page_size:
+                return
+            start += page_size
+
+    def iter_items(self, page_size: Optional[int] = None) -> AsyncGenerator[Any, None]:
+        """
+        Iterate over the items in the list, a page of items at a time.  Use with ``async for``.
+
+        Each page is read with a single lookup of its array indexes, so the
+        entire list is never fetched at once.  Unlike iterating over the list
+        itself, the items are not a snapshot of the list: changes made to the
+        list while iterating may be reflected in later pages.
+
+        :param page_size: The number of items read per page, at most 16.  Defaults to 16.
+        :return: An async generator of the items in the list.
+        :raise: :cb_exc:`InvalidArgumentException` if the page_size is invalid.
+        """
+        if page_size is None:
+            page_size = MAX_SUBDOC_SPECS
+        validate_item_count('page_size', page_size, MAX_SUBDOC_SPECS)
+        return self._iter_pages(page_size)
+
     def __aiter__(self):
         return self
 
@@ -752,14 +814,7 @@ class CouchbaseSet:
         async with ObservableRequestHandler(op_type, self._impl.observability_instruments) as ds_obs_handler:
             ds_obs_handler.create_kv_span(self._impl._request_builder._collection_dtls.get_details_as_dict())
 
-            if timeout is None:
-                timeout = timedelta(seconds=10)
-
-            timeout_millis = timeout.total_seconds() * 1000
-
-            interval_millis = float(50)
-            start = time.perf_counter()
-            time_left = timeout_millis
+            backoff = CasRetryBackoff(timeout)
             kv_op_type = KeyValueOperationType.MutateIn
             while True:
                 sd_res = await self._get(parent_span=ds_obs_handler.wrapped_span)
@@ -787,18 +842,11 @@ class CouchbaseSet:
                 else:
                     break
 
-                interval_millis += 500
-                if interval_millis > 1000:
-                    interval_millis = 1000
-
-                time_left = timeout_millis - ((time.perf_counter() - start) * 1000)
-                if interval_millis > time_left:
-                    interval_millis = time_left
-
-                if time_left <= 0:
+                delay = backoff.next_delay()
+                if delay is None:
                     raise UnAmbiguousTimeoutException(message=f"Unable to remove {value} from the CouchbaseSet.")
 
-                await asyncio.sleep(interval_millis / 1000)
+                await asyncio.sleep(delay)
 
     async def contains(self, value: Any) -> bool:
         """
@@ -974,14 +1022,7 @@ class CouchbaseQueue:
         op_type = DatastructureOperationType.QueuePop
         async with ObservableRequestHandler(op_type, self._impl.observability_instruments) as ds_obs_handler:
             ds_obs_handler.create_kv_span(self._impl._request_builder._collection_dtls.get_details_as_dict())
-            if timeout is None:
-                timeout = timedelta(seconds=10)
-
-            timeout_millis = timeout.total_seconds() * 1000
-
-            interval_millis = float(50)
-            start = time.perf_counter()
-            time_left = timeout_millis
+            backoff = CasRetryBackoff(timeout)
             parent_span = ds_obs_handler.wrapped_span
             lookup_in_op_type = KeyValueOperationType.LookupIn
             mutate_in_op_type = KeyValueOperationType.MutateIn
@@ -1012,21 +1053,104 @@ class CouchbaseQueue:
                         except CasMismatchException:
                             pass
 
-                    interval_millis += 500
-                    if interval_millis > 1000:
-                        interval_millis = 1000
-
-                    time_left = timeout_millis - ((time.perf_counter() - start) * 1000)
-                    if interval_millis > time_left:
-                        interval_millis = time_left
-
-                    if time_left <= 0:
+                    delay = backoff.next_delay()
+                    if delay is None:
                         raise UnAmbiguousTimeoutException(message="Unable to pop from the CouchbaseQueue.")
 
-                    await asyncio.sleep(interval_millis / 1000)
+                    await asyncio.sleep(delay)
                 except PathNotFoundException:
                     raise QueueEmpty('No items to remove from the queue')
 
+    async def push_many(self, values: Iterable[JSONType]) -> None:
+        """
+        Add items to the queue, in order, with a single operation.
+
+        Equivalent to calling :meth:`push` for each value, in a single round trip.
+
+        :param values: Values to push onto queue
+        """
+        values = list(values)
+        if not values:
+            return
+        op_type = DatastructureOperationType.QueuePush
+        async with ObservableRequestHandler(op_type, self._impl.observability_instruments) as ds_obs_handler:
+            ds_obs_handler.create_kv_span(self._impl._request_builder._collection_dtls.get_details_as_dict())
+            kv_op_type = KeyValueOperationType.MutateIn
+            async with ObservableRequestHandler(kv_op_type, self._impl.observability_instruments) as obs_handler:
+                # the back of the queue is the start of the array
+                op = array_prepend('', *reversed(values))
+                req = self._impl.request_builder.build_mutate_in_request(self._key,
+                                                                         (op,),
+                                                                         obs_handler,
+                                                                         parent_span=ds_obs_handler.wrapped_span)
+                await self._execute_op(self._impl.mutate_in,
+                                       req,
+                                       obs_handler,
+                                       ds_obs_handler.wrapped_span,
+                                       create_type=True)
+
+    async def pop_many(self, n: int, timeout: Optional[timedelta] = None) -> List[Any]:
+        """
+        Pop up to n items from the queue.
+
+        Up to 15 items are removed per round trip: they are read with a single
+        lookup and removed with a single mutation, which is retried (with a
+        jittered exponential backoff) if the queue changed in between.
+
+        :param n: The maximum number of items to remove
+        :param timeout: Amount of time allowed when attempting to remove the values.  Defaults to 10 seconds.
+        :return: The removed values, in the order they were pushed.  Fewer than n
+            values are returned if the queue holds fewer items, none if the queue is empty.
+        :raise: :cb_exc:`InvalidArgumentException` if n is not an int greater than 0.
+        :raise: :cb_exc:`UnAmbiguousTimeoutException` if no value could be removed before the timeout.
+        """
+        validate_item_count('n', n)
+        op_type = DatastructureOperationType.QueuePop
+        async with ObservableRequestHandler(op_type, self._impl.observability_instruments) as ds_obs_handler:
+            ds_obs_handler.create_kv_span(self._impl._request_builder._collection_dtls.get_details_as_dict())
+            backoff = CasRetryBackoff(timeout)
+            parent_span = ds_obs_handler.wrapped_span
+            lookup_in_op_type = KeyValueOperationType.LookupIn
+            mutate_in_op_type = KeyValueOperationType.MutateIn
+            popped = []
+            while len(popped) < n:
+                async with ObservableRequestHandler(lookup_in_op_type,
+                                                    self._impl.observability_instruments) as obs_handler:
+                    specs = build_pop_lookup_specs(n - len(popped))
+                    lookup_in_req, tc = self._impl.request_builder.build_lookup_in_request(self._key,
+                                                                                           specs,
+                                                                                           obs_handler,
+                                                                                           parent_span=parent_span)
+                    sd_res = await self._impl.lookup_in(lookup_in_req, tc, obs_handler)
+                    values = parse_popped_values(self._key, sd_res)
+
+                if not values:
+                    break
+
+                async with ObservableRequestHandler(mutate_in_op_type,
+                                                    self._impl.observability_instruments) as obs_handler:
+                    try:
+                        mutate_in_opts = MutateInOptions(cas=sd_res.cas, parent_span=parent_span)
+                        mutate_in_req = self._impl.request_builder.build_mutate_in_request(self._key,
+                                                                                           build_pop_remove_specs(len(values)),  # noqa: E501
+                                                                                           obs_handler,
+                                                                                           mutate_in_opts)
+                        await self._impl.mutate_in(mutate_in_req, obs_handler)
+                        popped.extend(values)
+                        continue
+                    except CasMismatchException:
+                        pass
+
+                delay = backoff.next_delay()
+                if delay is None:
+                    if popped:
+                        break
+                    raise UnAmbiguousTimeoutException(message="Unable to pop from the CouchbaseQueue.")
+
+                await asyncio.sleep(delay)
+
+            return popped
+
     async def size(self) -> int:
         """
         Get the number of items in the queue.
@@ -16,9 +16,9 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
+from acouchbase.logic.streaming_executor import get_default_streaming_executor
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
@@ -32,12 +32,13 @@ if TYPE_CHECKING:
 
 class AsyncRangeScanRequest(RangeScanRequestLogic):
     def __init__(self, connection: pycbc_connection, loop: asyncio.AbstractEventLoop, **kwargs: Any) -> None:
-        num_workers = kwargs.pop('num_workers', None) or 1
+        # num_workers is no longer used, items are fetched on the cluster's shared streaming executor
+        kwargs.pop('num_workers', None)
+        streaming_executor = kwargs.pop('streaming_executor', None)
         super().__init__(connection, **kwargs)
         self._loop = loop
         self._result_ftr = None
-        self._tp_executor = ThreadPoolExecutor(num_workers)
-        self._executor_shutdown = False
+        self._streaming_executor = streaming_executor or get_default_streaming_executor()
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -55,38 +56,25 @@ class AsyncRangeScanRequest(RangeScanRequestLogic):
 
         return self
 
-    def _shutdown_executor(self):
-        """
-        **INTERNAL**
-
-        Release the per-request streaming executor.  Safe to call multiple times.
-        """
-        if not self._executor_shutdown:
-            self._executor_shutdown = True
-            self._tp_executor.shutdown(wait=False)
-
     def _abort(self):
         """
         **INTERNAL**
 
-        Cancel the in-flight core scan so a worker still waiting on the C++ core unwinds promptly,
-        then release the executor.  Used on the error/cancellation paths only.
+        Cancel the in-flight core scan so a worker still waiting on the C++ core unwinds promptly and
+        its shared executor thread is released.  Used on the error/cancellation paths only.
         """
         if self._scan_iterator is not None and self._scan_iterator.is_cancelled() is False:
             self._scan_iterator.cancel_scan()
-        self._shutdown_executor()
 
     async def __anext__(self):
         try:
-            return await self._loop.run_in_executor(self._tp_executor, self._get_next_row)
+            return await self._streaming_executor.run(self._loop, self._get_next_row)
         # We can stop iterator when we receive RangeScanCompletedException
         except RangeScanCompletedException:
             self._done_streaming = True
-            self._shutdown_executor()
             raise StopAsyncIteration
         except StopAsyncIteration:
             self._done_streaming = True
-            self._shutdown_executor()
             raise
         except CouchbaseException as ex:
             self._abort()
@@ -98,7 +86,7 @@ class AsyncRangeScanRequest(RangeScanRequestLogic):
             raise excptn
         except BaseException:
             # asyncio.CancelledError (and KeyboardInterrupt/SystemExit) derive from BaseException,
-            # not Exception, so they fall through every handler above.  Cancel the in-flight scan
-            # and release the executor so the worker thread is not orphaned, then re-raise unchanged.
+            # not Exception, so they fall through every handler above.  Cancel the in-flight scan so
+            # the worker thread is not orphaned, then re-raise unchanged.
             self._abort()
             raise
@@ -136,7 +136,8 @@ class AsyncBucketImpl:
                                                                  default_serializer=self.default_serializer,
                                                                  streaming_timeout=streaming_timeout,
                                                                  obs_handler=req.obs_handler,
-                                                                 num_workers=req.num_workers))
+                                                                 num_workers=req.num_workers,
+                                                                 streaming_executor=self._client_adapter.streaming_executor))  # noqa: E501
 
     async def wait_until_bucket_connected(self) -> None:
         """**INTERNAL**"""
@@ -21,9 +21,12 @@ from typing import (TYPE_CHECKING,
                     Any,
                     Callable,
                     Dict,
-                    Optional)
+                    List,
+                    Optional,
+                    Union)
 
 from acouchbase import get_event_loop
+from acouchbase.logic.streaming_executor import StreamingExecutor
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   CouchbaseException,
                                   ErrorMapper,
@@ -32,6 +35,7 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
 from couchbase.logic.binding_map import BindingMap
 from couchbase.logic.bucket_types import CloseBucketRequest, OpenBucketRequest
 from couchbase.logic.cluster_types import CloseConnectionRequest
+from couchbase.logic.handle_cache import HandleCache
 from couchbase.logic.observability import ObservableRequestHandler
 from couchbase.logic.pycbc_core import pycbc_connection
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
@@ -41,11 +45,19 @@ if TYPE_CHECKING:
 
     from couchbase.logic.bucket_types import BucketRequest
     from couchbase.logic.cluster_types import ClusterRequest, CreateConnectionRequest
-    from couchbase.logic.operation_types import KeyValueOperationCode
+    from couchbase.logic.observability.hot_path import HotPathTimer
+    from couchbase.logic.operation_types import KeyValueMultiOperationCode, KeyValueOperationCode
     from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
     from couchbase.management.logic.mgmt_req import MgmtRequest
 
 
+def _complete_stage_timer(stage_timer: HotPathTimer, ft: Future[Any]) -> None:
+    if ft.cancelled():
+        return
+    exc = ft.exception()
+    stage_timer.completed(ft.result() if exc is None else exc)
+
+
 class AsyncClientAdapter:
 
     def __init__(self,
@@ -53,8 +65,16 @@ class AsyncClientAdapter:
                  loop: Optional[AbstractEventLoop] = None,
                  loop_validator: Optional[Callable[[Optional[AbstractEventLoop]], AbstractEventLoop]] = None
                  ) -> None:
+        connection_opts = {}
         num_io_threads = connect_req.options.get('num_io_threads', None)
-        self._connection = pycbc_connection(num_io_threads) if num_io_threads is not None else pycbc_connection()
+        if num_io_threads is not None:
+            connection_opts['num_io_threads'] = num_io_threads
+        if connect_req.options.get('enable_zero_copy_values', False) is True:
+            connection_opts['zero_copy_values'] = True
+        self._connection = pycbc_connection(**connection_opts)
+        # All async streaming results created from this cluster fetch rows on this (lazily started) executor
+        self._streaming_executor = StreamingExecutor(connect_req.options.get('streaming_executor_max_workers', None),
+                                                     connect_req.options.get('streaming_executor_queue_depth', None))
         # The loop will be setup prior to running the first async op.
         # This is the preferred mechanism to handling the event loop.
         self._loop: Optional[AbstractEventLoop] = loop
@@ -62,6 +82,7 @@ class AsyncClientAdapter:
         self._connect_req = connect_req
         self._binding_map = BindingMap(self._connection)
         self._close_ft: Optional[Future[None]] = None
+        self._handle_cache = HandleCache()
         self._connect_ft: Optional[Future[None]] = None
         self._closed = False
         self._create_connection()
@@ -86,6 +107,16 @@ class AsyncClientAdapter:
         """**INTERNAL**"""
         return self._connect_ft
 
+    @property
+    def handle_cache(self) -> HandleCache:
+        """**INTERNAL**"""
+        return self._handle_cache
+
+    @property
+    def streaming_executor(self) -> StreamingExecutor:
+        """**INTERNAL**"""
+        return self._streaming_executor
+
     @property
     def loop(self) -> AbstractEventLoop:
         if not self._loop:
@@ -105,9 +136,11 @@ class AsyncClientAdapter:
         if self._closed:
             return  # Already closed, idempotent behavior
 
+        self._handle_cache.clear()
         self._close_ft = self._execute_close_connection_request()
         await self._close_ft
         self._closed = True
+        self._streaming_executor.shutdown()
 
     def execute_bucket_request(self, req: BucketRequest) -> Future[Any]:
         self._ensure_not_closed()
@@ -127,6 +160,7 @@ class AsyncClientAdapter:
         return ft
 
     def execute_close_bucket_request(self, bucket_name: str) -> Future[None]:
+        self._handle_cache.invalidate(bucket_name)
         req = CloseBucketRequest(bucket_name)
         return self.execute_bucket_request(req)
 
@@ -158,14 +192,15 @@ class AsyncClientAdapter:
             raise ErrorMapper.build_exception(ret)
         return ret
 
-    def execute_collection_request(self,
-                                   opcode: KeyValueOperationCode,
-                                   req: PycbcCoreKeyValueRequest,
+    def execute_collection_request(self,  # noqa: C901
+                                   opcode: Union[KeyValueOperationCode, KeyValueMultiOperationCode],
+                                   req: Union[List[PycbcCoreKeyValueRequest], PycbcCoreKeyValueRequest],
                                    obs_handler: Optional[ObservableRequestHandler] = None) -> Future[Any]:
         self._ensure_not_closed()
         self._ensure_connected()
 
         ft = self.loop.create_future()
+        stage_timer = obs_handler.stage_timer if obs_handler else None
 
         def _callback(result) -> None:
             if obs_handler and hasattr(result, 'core_span'):
@@ -178,11 +213,19 @@ class AsyncClientAdapter:
             excptn = ErrorMapper.build_exception(exc)
             self.loop.call_soon_threadsafe(ft.set_exception, excptn)
 
-        req.callback = _callback
-        req.errback = _errback
+        if stage_timer is not None:
+            # registered before the awaiting task, so it runs right before the task resumes
+            ft.add_done_callback(partial(_complete_stage_timer, stage_timer))
+            stage_timer.dispatched()
 
         try:
-            self._binding_map.kv_ops[opcode](req)
+            if isinstance(req, list):
+                # multi ops resolve the whole batch through a single callback
+                self._binding_map.kv_ops[opcode]((req, _callback, _errback))
+            else:
+                req.callback = _callback
+                req.errback = _errback
+                self._binding_map.kv_ops[opcode](req)
         except CouchbaseException as e:
             ft.set_exception(e)
         except Exception as e:
@@ -210,6 +253,12 @@ class AsyncClientAdapter:
             if not ft.done():
                 self.loop.call_soon_threadsafe(ft.set_exception, excptn)
 
+        def _invalidate_on_error(_ft: Future[None]) -> None:
+            # the bucket (or the cluster) could not be connected, later lookups must not get the failed bucket
+            if _ft.cancelled() or _ft.exception() is not None:
+                self._handle_cache.invalidate(bucket_name)
+
+        ft.add_done_callback(_invalidate_on_error)
         req_dict = req.req_to_dict(callback=_callback, errback=_errback)
         if not self.connected:
             chained_ft = self._execute_connect_request() if self._connect_ft is None else self._connect_ft
@@ -169,7 +169,8 @@ class AsyncClusterImpl:
                                                                                 default_serializer=self.default_serializer,  # noqa: E501
                                                                                 streaming_timeout=streaming_timeout,
                                                                                 obs_handler=req.obs_handler,
-                                                                                num_workers=req.num_workers))
+                                                                                num_workers=req.num_workers,
+                                                                                streaming_executor=self._client_adapter.streaming_executor))  # noqa: E501
 
     async def close_connection(self) -> None:
         """**INTERNAL**"""
@@ -230,7 +231,8 @@ class AsyncClusterImpl:
                                                                   default_serializer=self.default_serializer,
                                                                   streaming_timeout=streaming_timeout,
                                                                   obs_handler=req.obs_handler,
-                                                                  num_workers=req.num_workers))
+                                                                  num_workers=req.num_workers,
+                                                                  streaming_executor=self._client_adapter.streaming_executor))  # noqa: E501
 
     def search(self, req: SearchQueryRequest) -> SearchResult:
         """**INTERNAL**"""
@@ -248,7 +250,8 @@ class AsyncClusterImpl:
                                                                                default_serializer=self.default_serializer,  # noqa: E501
                                                                                streaming_timeout=streaming_timeout,
                                                                                obs_handler=req.obs_handler,
-                                                                               num_workers=req.num_workers))
+                                                                               num_workers=req.num_workers,
+                                                                               streaming_executor=self._client_adapter.streaming_executor))  # noqa: E501
 
     def update_credentials(self, req: UpdateCredentialsRequest) -> None:
         """**INTERNAL**"""
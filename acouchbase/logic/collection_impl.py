@@ -15,16 +15,31 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
                     Iterable,
                     Iterator,
+                    Optional,
                     Union)
 
 from acouchbase.logic.client_adapter import AsyncClientAdapter
-from couchbase.exceptions import ErrorMapper, UnAmbiguousTimeoutException
+from acouchbase.logic.kv_coalescer import KeyValueCoalescer
+from acouchbase.logic.single_flight import AsyncSingleFlight
+from couchbase.exceptions import (DocumentNotFoundException,
+                                  ErrorMapper,
+                                  UnAmbiguousTimeoutException)
+from couchbase.logic.collection_multi_req_builder import CollectionMultiRequestBuilder
+from couchbase.logic.collection_multi_types import KeyValueMultiChunkedRequest
 from couchbase.logic.collection_req_builder import CollectionRequestBuilder
 from couchbase.logic.collection_types import CollectionDetails
+from couchbase.logic.document_cache import DocumentCache, build_cas_lookup_request
+from couchbase.logic.encoding_pool import (cancel_encode_chunks,
+                                           merge_multi_results,
+                                           set_encoded_values)
 from couchbase.logic.observability import ObservabilityInstruments, ObservableRequestHandler
+from couchbase.logic.operation_types import KeyValueOperationCode
 from couchbase.logic.pycbc_core import pycbc_connection
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
 from couchbase.result import (CounterResult,
@@ -33,15 +48,22 @@ from couchbase.result import (CounterResult,
                               GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiCounterResult,
+                              MultiExistsResult,
+                              MultiGetReplicaResult,
+                              MultiGetResult,
+                              MultiMutationResult,
                               MutateInResult,
                               MutationResult,
                               ScanResultIterable)
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
+    from datetime import timedelta
 
     from acouchbase.kv_range_scan import AsyncRangeScanRequest
     from acouchbase.scope import AsyncScope
+    from couchbase.logic.collection_multi_types import KeyValueMultiRequest, KeyValueMultiWithTranscoderRequest
     from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
     from couchbase.transcoder import Transcoder
     from txcouchbase.scope import TxScope
@@ -57,6 +79,10 @@ class AsyncCollectionImpl:
                                                      collection_name,
                                                      self._scope._impl.cluster_settings.default_transcoder)
         self._request_builder = CollectionRequestBuilder(self._collection_details, self._client_adapter.loop)
+        self._multi_request_builder = CollectionMultiRequestBuilder(self._collection_details)
+        self._document_cache = None  # type: Optional[DocumentCache]
+        self._coalescer = None  # type: Optional[KeyValueCoalescer]
+        self._single_flight = None  # type: Optional[AsyncSingleFlight]
 
     @property
     def bucket_name(self) -> str:
@@ -84,6 +110,10 @@ class AsyncCollectionImpl:
     def loop(self) -> AbstractEventLoop:
         return self._client_adapter.loop
 
+    @property
+    def multi_request_builder(self) -> CollectionMultiRequestBuilder:
+        return self._multi_request_builder
+
     @property
     def name(self) -> str:
         """
@@ -109,21 +139,104 @@ class AsyncCollectionImpl:
         """
         return self._scope._impl.cluster_settings.observability_instruments
 
+    @property
+    def document_cache(self) -> Optional[DocumentCache]:
+        """
+        **INTERNAL**
+        """
+        return self._document_cache
+
+    def enable_document_cache(self,
+                              max_entries: int,
+                              max_bytes: Optional[int] = None,
+                              ttl: Optional[timedelta] = None,
+                              revalidate: Optional[bool] = None) -> None:
+        """
+        **INTERNAL**
+        """
+        cache = DocumentCache(max_entries,
+                              max_bytes=max_bytes,
+                              ttl=ttl,
+                              revalidate=revalidate,
+                              meter=self.observability_instruments.meter)
+        # the collection handle is shared, e.g. looked up again for every request, the cached documents are kept
+        if self._document_cache is None or not self._document_cache.has_same_settings(cache):
+            self._document_cache = cache
+
+    @property
+    def coalescer(self) -> Optional[KeyValueCoalescer]:
+        """
+        **INTERNAL**
+        """
+        return self._coalescer
+
+    def enable_coalescing(self,
+                          max_batch: Optional[int] = None,
+                          window: Optional[timedelta] = None) -> None:
+        """
+        **INTERNAL**
+        """
+        coalescer = KeyValueCoalescer(self._client_adapter, max_batch=max_batch, window=window)
+        if self._coalescer is not None:
+            # the collection handle is shared, e.g. looked up again for every request, the batches are kept
+            if self._coalescer.has_same_settings(coalescer):
+                return
+            # the operations gathered so far are not left behind
+            self._coalescer.flush()
+        self._coalescer = coalescer
+
+    @property
+    def single_flight(self) -> Optional[AsyncSingleFlight]:
+        """
+        **INTERNAL**
+        """
+        return self._single_flight
+
+    def enable_single_flight(self) -> None:
+        """
+        **INTERNAL**
+        """
+        if self._single_flight is None:
+            self._single_flight = AsyncSingleFlight(meter=self.observability_instruments.meter)
+
     async def append(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
+    async def append_multi(self,
+                           req: KeyValueMultiRequest,
+                           obs_handler: ObservableRequestHandler) -> MultiMutationResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def decrement(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> CounterResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return CounterResult(ret, key=req.key)
 
+    async def decrement_multi(self,
+                              req: KeyValueMultiRequest,
+                              obs_handler: ObservableRequestHandler) -> MultiCounterResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiCounterResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def exists(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> ExistsResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_read(req, obs_handler)
         return ExistsResult(ret, key=req.key)
 
+    async def exists_multi(self,
+                           req: KeyValueMultiRequest,
+                           obs_handler: ObservableRequestHandler) -> MultiExistsResult:
+        await self.wait_until_bucket_connected()
+        ret = await self.client_adapter.execute_collection_request(req.opcode,
+                                                                   req.request_list,
+                                                                   obs_handler=obs_handler)
+        return MultiExistsResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def get_all_replicas(self,
                                req: PycbcCoreKeyValueRequest,
                                transcoder: Transcoder,
@@ -157,6 +270,18 @@ class AsyncCollectionImpl:
         ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
         return GetResult(ret, transcoder=transcoder, key=req.key)
 
+    async def get_and_lock_multi(self,
+                                 req: KeyValueMultiWithTranscoderRequest,
+                                 obs_handler: ObservableRequestHandler) -> MultiGetResult:
+        await self.wait_until_bucket_connected()
+        ret = await self.client_adapter.execute_collection_request(req.opcode,
+                                                                   req.request_list,
+                                                                   obs_handler=obs_handler)
+        return MultiGetResult(ret,
+                              return_exceptions=req.return_exceptions,
+                              transcoders=req.key_transcoders,
+                              obs_handler=obs_handler)
+
     async def get_and_touch(self,
                             req: PycbcCoreKeyValueRequest,
                             transcoder: Transcoder,
@@ -170,33 +295,75 @@ class AsyncCollectionImpl:
                               transcoder: Transcoder,
                               obs_handler: ObservableRequestHandler) -> GetReplicaResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_read(req, obs_handler)
         return GetReplicaResult(ret, transcoder=transcoder, key=req.key)
 
+    async def get_any_replica_multi(self,
+                                    req: KeyValueMultiWithTranscoderRequest,
+                                    obs_handler: ObservableRequestHandler) -> MultiGetReplicaResult:
+        await self.wait_until_bucket_connected()
+        ret = await self.client_adapter.execute_collection_request(req.opcode,
+                                                                   req.request_list,
+                                                                   obs_handler=obs_handler)
+        return MultiGetReplicaResult(ret,
+                                     return_exceptions=req.return_exceptions,
+                                     transcoders=req.key_transcoders,
+                                     obs_handler=obs_handler)
+
     async def get(self,
                   req: PycbcCoreKeyValueRequest,
                   transcoder: Transcoder,
                   obs_handler: ObservableRequestHandler) -> GetResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        cache = self._document_cache
+        # projections and expiry are not cached
+        if cache is not None and req.opcode == KeyValueOperationCode.Get.value:
+            return await self._get_through_cache(cache, req, transcoder, obs_handler)
+        ret = await self._execute_read(req, obs_handler)
         return GetResult(ret, transcoder=transcoder, key=req.key)
 
+    async def get_multi(self,
+                        req: KeyValueMultiWithTranscoderRequest,
+                        obs_handler: ObservableRequestHandler) -> MultiGetResult:
+        await self.wait_until_bucket_connected()
+        ret = await self.client_adapter.execute_collection_request(req.opcode,
+                                                                   req.request_list,
+                                                                   obs_handler=obs_handler)
+        return MultiGetResult(ret,
+                              return_exceptions=req.return_exceptions,
+                              transcoders=req.key_transcoders,
+                              obs_handler=obs_handler)
+
     async def increment(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> CounterResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return CounterResult(ret, key=req.key)
 
+    async def increment_multi(self,
+                              req: KeyValueMultiRequest,
+                              obs_handler: ObservableRequestHandler) -> MultiCounterResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiCounterResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def insert(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
+    async def insert_multi(self,
+                           req: KeyValueMultiRequest,
+                           obs_handler: ObservableRequestHandler) -> MultiMutationResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def lookup_in(self,
                         req: PycbcCoreKeyValueRequest,
                         transcoder: Transcoder,
                         obs_handler: ObservableRequestHandler) -> LookupInResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_read(req, obs_handler)
         return LookupInResult(ret, transcoder=transcoder, is_subdoc=True, key=req.key)
 
     async def lookup_in_all_replicas(self,
@@ -233,43 +400,204 @@ class AsyncCollectionImpl:
 
     async def mutate_in(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutateInResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         transcoder = self._collection_details.default_transcoder
         return MutateInResult(ret, transcoder=transcoder, is_subdoc=True, key=req.key)
 
     async def prepend(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
+    async def prepend_multi(self,
+                            req: KeyValueMultiRequest,
+                            obs_handler: ObservableRequestHandler) -> MultiMutationResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     def range_scan(self, req: AsyncRangeScanRequest) -> ScanResultIterable:
         return ScanResultIterable(req)
 
     async def remove(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
+    async def remove_multi(self,
+                           req: KeyValueMultiRequest,
+                           obs_handler: ObservableRequestHandler) -> MultiMutationResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def replace(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
+    async def replace_multi(self,
+                            req: KeyValueMultiRequest,
+                            obs_handler: ObservableRequestHandler) -> MultiMutationResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def touch(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
         await self.wait_until_bucket_connected()
         ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
         return MutationResult(ret, key=req.key)
 
+    async def touch_multi(self,
+                          req: KeyValueMultiRequest,
+                          obs_handler: ObservableRequestHandler) -> MultiMutationResult:
+        await self.wait_until_bucket_connected()
+        ret = await self.client_adapter.execute_collection_request(req.opcode,
+                                                                   req.request_list,
+                                                                   obs_handler=obs_handler)
+        return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def unlock(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> None:
         await self.wait_until_bucket_connected()
         await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
 
+    async def unlock_multi(self,
+                           req: KeyValueMultiRequest,
+                           obs_handler: ObservableRequestHandler) -> Dict[str, Optional[PycbcCoreException]]:
+        await self.wait_until_bucket_connected()
+        ret = await self.client_adapter.execute_collection_request(req.opcode,
+                                                                   req.request_list,
+                                                                   obs_handler=obs_handler)
+        output: Dict[str, Optional[PycbcCoreException]] = {}
+        for k, v in ret.raw_result.items():
+            if k == 'all_okay':
+                continue
+            # pycbc_streamed_result and pycbc_exception have a core_span member
+            if obs_handler and hasattr(v, 'core_span'):
+                obs_handler.process_core_span(v.core_span)
+            if isinstance(v, PycbcCoreException):
+                ex = ErrorMapper.build_exception(v)
+                if obs_handler:
+                    obs_handler.process_multi_sub_op(v, exc_val=ex)
+                if not req.return_exceptions:
+                    raise ex
+                else:
+                    output[k] = ex
+            else:
+                if obs_handler:
+                    obs_handler.process_multi_sub_op(v)
+                output[k] = None
+
+        return output
+
     async def upsert(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
         await self.wait_until_bucket_connected()
-        ret = await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = await self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
+    async def upsert_multi(self,
+                           req: KeyValueMultiRequest,
+                           obs_handler: ObservableRequestHandler) -> MultiMutationResult:
+        await self.wait_until_bucket_connected()
+        ret = await self._execute_multi_mutation(req, obs_handler)
+        return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
+
     async def wait_until_bucket_connected(self) -> None:
         if self.connected:
             return
         await self._scope._impl.wait_until_bucket_connected()
+
+    async def _get_through_cache(self,
+                                 cache: DocumentCache,
+                                 req: PycbcCoreKeyValueRequest,
+                                 transcoder: Transcoder,
+                                 obs_handler: ObservableRequestHandler) -> GetResult:
+        entry = cache.lookup(req.key)
+        if entry is not None:
+            if not cache.revalidate or await self._cached_cas_matches(req.key, entry.cas):
+                cache.record_hit()
+                return GetResult(entry.result, transcoder=transcoder, key=req.key)
+            cache.mark_stale(req.key)
+
+        token = cache.fill_token()
+        ret = await self._execute_read(req, obs_handler)
+        cache.put(req.key, ret, token)
+        return GetResult(ret, transcoder=transcoder, key=req.key)
+
+    async def _cached_cas_matches(self, key: str, cas: int) -> bool:
+        lookup_req = build_cas_lookup_request(self._request_builder, key)
+        try:
+            ret = await self.client_adapter.execute_collection_request(lookup_req.opcode, lookup_req)
+        except DocumentNotFoundException:
+            # the get that follows raises the exception
+            return False
+        return ret.raw_result.get('cas', None) == cas
+
+    def _invalidate_cached(self, key: str) -> None:
+        if self._document_cache is not None:
+            self._document_cache.invalidate(key)
+        if self._single_flight is not None:
+            self._single_flight.forget(key)
+
+    def _invalidate_cached_keys(self, keys: Iterable[str]) -> None:
+        if self._document_cache is not None:
+            self._document_cache.invalidate_keys(keys)
+        if self._single_flight is not None:
+            self._single_flight.forget_keys(keys)
+
+    async def _execute_read(self,
+                            req: PycbcCoreKeyValueRequest,
+                            obs_handler: Optional[ObservableRequestHandler]) -> Any:
+        single_flight = self._single_flight
+        if single_flight is not None and single_flight.accepts(req):
+            return await single_flight.execute(req, lambda: self._execute_kv_request(req, obs_handler))
+        return await self._execute_kv_request(req, obs_handler)
+
+    async def _execute_kv_request(self,
+                                  req: PycbcCoreKeyValueRequest,
+                                  obs_handler: Optional[ObservableRequestHandler]) -> Any:
+        coalescer = self._coalescer
+        if coalescer is not None and coalescer.accepts(req):
+            return await coalescer.submit(req, obs_handler)
+        return await self.client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+
+    async def _execute_mutation(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> Any:
+        try:
+            return await self._execute_kv_request(req, obs_handler)
+        finally:
+            # also on failure, an ambiguous failure might have mutated the document
+            self._invalidate_cached(req.key)
+
+    async def _execute_multi_mutation(self,
+                                      req: KeyValueMultiRequest,
+                                      obs_handler: ObservableRequestHandler) -> Any:
+        try:
+            return await self._dispatch_multi_mutation(req, obs_handler)
+        finally:
+            self._invalidate_cached_keys([r.key for r in req.request_list])
+
+    async def _dispatch_multi_mutation(self,
+                                       req: KeyValueMultiRequest,
+                                       obs_handler: ObservableRequestHandler) -> Any:
+        if not isinstance(req, KeyValueMultiChunkedRequest):
+            return await self.client_adapter.execute_collection_request(req.opcode,
+                                                                        req.request_list,
+                                                                        obs_handler=obs_handler)
+
+        # each chunk is dispatched as soon as it is encoded, while the encoding pool works on the next chunks
+        dispatched = []
+        chunk_exc = None
+        for requests, encoded in req.chunks:
+            try:
+                set_encoded_values(requests, await asyncio.wrap_future(encoded))
+                dispatched.append(self.client_adapter.execute_collection_request(req.opcode, requests))
+            except Exception as ex:
+                chunk_exc = ex
+                cancel_encode_chunks(req.chunks)
+                break
+
+        # wait for the chunks already in flight before surfacing an encoding (or dispatch) error
+        results = await asyncio.gather(*dispatched, return_exceptions=True)
+        if chunk_exc is not None:
+            raise chunk_exc
+        return merge_multi_results(results, obs_handler=obs_handler)
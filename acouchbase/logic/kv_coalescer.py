@@ -0,0 +1,200 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import (ErrorMapper,
+                                  InternalSDKException,
+                                  InvalidArgumentException)
+from couchbase.logic.operation_types import KeyValueMultiOperationCode, KeyValueOperationCode
+from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
+
+if TYPE_CHECKING:
+    from asyncio import Future, Handle
+
+    from acouchbase.logic.client_adapter import AsyncClientAdapter
+    from couchbase.logic.observability import ObservableRequestHandler
+    from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
+
+DEFAULT_COALESCE_MAX_BATCH = 128
+
+# the single-key operations that are coalesced, and the multi operation they are dispatched with
+COALESCED_OPCODES = {
+    KeyValueOperationCode.Get.value: KeyValueMultiOperationCode.GetMulti,
+    KeyValueOperationCode.Upsert.value: KeyValueMultiOperationCode.UpsertMulti,
+}
+
+CoalescedEntry = Tuple['PycbcCoreKeyValueRequest', 'Future[Any]', Optional['ObservableRequestHandler']]
+
+
+def _set_key_result(ft: Future[Any], key: str, res: Any) -> None:
+    if res is None:
+        ft.set_exception(InternalSDKException(message=f'No result for key {key} in coalesced batch.'))
+    elif isinstance(res, PycbcCoreException):
+        ft.set_exception(ErrorMapper.build_exception(res))
+    else:
+        ft.set_result(res)
+
+
+class CoalescedBatch:
+    """**INTERNAL**
+
+    The operations of one kind gathered since the last dispatch, at most one per key.
+    """
+
+    __slots__ = ('entries', 'keys', 'handle')
+
+    def __init__(self) -> None:
+        self.entries = []  # type: List[CoalescedEntry]
+        self.keys = set()
+        # the scheduled dispatch of the batch
+        self.handle = None  # type: Optional[Handle]
+
+    def add(self,
+            req: PycbcCoreKeyValueRequest,
+            ft: Future[Any],
+            obs_handler: Optional[ObservableRequestHandler]) -> None:
+        self.entries.append((req, ft, obs_handler))
+        self.keys.add(req.key)
+
+    def fail(self, exc: BaseException) -> None:
+        for _, ft, _ in self.entries:
+            if not ft.done():
+                ft.set_exception(exc)
+
+    def complete(self, batch_ft: Future[Any]) -> None:
+        """Hands the result of each key of the multi operation over to the operation's future."""
+        if batch_ft.cancelled():
+            for _, ft, _ in self.entries:
+                ft.cancel()
+            return
+        exc = batch_ft.exception()
+        if exc is not None:
+            self.fail(exc)
+            return
+
+        raw_result = batch_ft.result().raw_result
+        for req, ft, obs_handler in self.entries:
+            res = raw_result.get(req.key, None)
+            if obs_handler:
+                if hasattr(res, 'core_span'):
+                    obs_handler.process_core_span(res.core_span)
+                if obs_handler.stage_timer is not None:
+                    obs_handler.stage_timer.completed(res)
+            # the future is done if the awaiting coroutine was cancelled
+            if not ft.done():
+                _set_key_result(ft, req.key, res)
+
+
+class KeyValueCoalescer:
+    """**INTERNAL**
+
+    Gathers the single-key gets and upserts issued by concurrent coroutines and dispatches them through the multi
+    operation bindings.  A batch is dispatched once ``window`` has elapsed since its first operation (by default,
+    on the next iteration of the event loop), or as soon as it holds ``max_batch`` operations.  The results are
+    handed back from a single callback, so the event loop is woken once per batch rather than once per operation.
+
+    A multi operation returns a single result per key, so an operation on a key already in the pending batch
+    dispatches that batch first.
+    """
+
+    def __init__(self,
+                 client_adapter: AsyncClientAdapter,
+                 max_batch: Optional[int] = None,
+                 window: Optional[timedelta] = None) -> None:
+        if max_batch is None:
+            max_batch = DEFAULT_COALESCE_MAX_BATCH
+        if not isinstance(max_batch, int) or isinstance(max_batch, bool) or max_batch < 1:
+            raise InvalidArgumentException(message='Expected max_batch to be an int greater than 0.')
+        if window is not None and (not isinstance(window, timedelta) or window.total_seconds() < 0):
+            raise InvalidArgumentException(message='Expected window to be a non-negative timedelta.')
+        self._client_adapter = client_adapter
+        self._max_batch = max_batch
+        self._window = window.total_seconds() if window is not None else 0.0
+        self._batches = {}  # type: Dict[int, CoalescedBatch]
+
+    @property
+    def max_batch(self) -> int:
+        return self._max_batch
+
+    @property
+    def window(self) -> float:
+        """The window, in seconds."""
+        return self._window
+
+    def has_same_settings(self, other: KeyValueCoalescer) -> bool:
+        """**INTERNAL**"""
+        return (self._max_batch, self._window) == (other._max_batch, other._window)
+
+    @staticmethod
+    def accepts(req: PycbcCoreKeyValueRequest) -> bool:
+        return req.opcode in COALESCED_OPCODES
+
+    def submit(self,
+               req: PycbcCoreKeyValueRequest,
+               obs_handler: Optional[ObservableRequestHandler] = None) -> Future[Any]:
+        """Adds the request to the pending batch of its operation.  Must be called from the event loop."""
+        opcode = req.opcode
+        batch = self._batches.get(opcode, None)
+        if batch is not None and req.key in batch.keys:
+            self.flush(opcode)
+            batch = None
+        if batch is None:
+            batch = self._batches[opcode] = CoalescedBatch()
+            batch.handle = self._schedule_flush(opcode)
+
+        ft = self._client_adapter.loop.create_future()
+        batch.add(req, ft, obs_handler)
+        if obs_handler and obs_handler.stage_timer is not None:
+            # the time spent in the pending batch counts as dispatch time
+            obs_handler.stage_timer.dispatched()
+        if len(batch.entries) >= self._max_batch:
+            self.flush(opcode)
+        return ft
+
+    def flush(self, opcode: Optional[int] = None) -> None:
+        """Dispatches the pending batch of the operation, or every pending batch if opcode is None."""
+        opcodes = [opcode] if opcode is not None else list(self._batches.keys())
+        for op in opcodes:
+            batch = self._batches.pop(op, None)
+            if batch is None:
+                continue
+            if batch.handle is not None:
+                batch.handle.cancel()
+            self._dispatch(op, batch)
+
+    def _schedule_flush(self, opcode: int) -> Handle:
+        loop = self._client_adapter.loop
+        if self._window > 0:
+            return loop.call_later(self._window, self.flush, opcode)
+        return loop.call_soon(self.flush, opcode)
+
+    def _dispatch(self, opcode: int, batch: CoalescedBatch) -> None:
+        requests = [req for req, _, _ in batch.entries]
+        try:
+            batch_ft = self._client_adapter.execute_collection_request(COALESCED_OPCODES[opcode], requests)
+        except Exception as ex:
+            # e.g. the cluster was closed since the operations were submitted
+            batch.fail(ex)
+            return
+        batch_ft.add_done_callback(batch.complete)
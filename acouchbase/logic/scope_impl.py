@@ -121,7 +121,8 @@ class AsyncScopeImpl:
                                                                                 default_serializer=self.default_serializer,  # noqa: E501
                                                                                 streaming_timeout=streaming_timeout,
                                                                                 obs_handler=req.obs_handler,
-                                                                                num_workers=req.num_workers))
+                                                                                num_workers=req.num_workers,
+                                                                                streaming_executor=self._client_adapter.streaming_executor))  # noqa: E501
 
     def query(self, req: QueryRequest) -> QueryResult:
         self._client_adapter._ensure_not_closed()
@@ -138,7 +139,8 @@ class AsyncScopeImpl:
                                                                   default_serializer=self.default_serializer,
                                                                   streaming_timeout=streaming_timeout,
                                                                   obs_handler=req.obs_handler,
-                                                                  num_workers=req.num_workers))
+                                                                  num_workers=req.num_workers,
+                                                                  streaming_executor=self._client_adapter.streaming_executor))  # noqa: E501
 
     def search(self, req: SearchQueryRequest) -> SearchResult:
         self._client_adapter._ensure_not_closed()
@@ -157,7 +159,8 @@ class AsyncScopeImpl:
                                                                                obs_handler=req.obs_handler,
                                                                                bucket_name=req.bucket_name,
                                                                                scope_name=req.scope_name,
-                                                                               num_workers=req.num_workers))
+                                                                               num_workers=req.num_workers,
+                                                                               streaming_executor=self._client_adapter.streaming_executor))  # noqa: E501
 
     async def wait_until_bucket_connected(self) -> None:
         await self._bucket_impl.wait_until_bucket_connected()
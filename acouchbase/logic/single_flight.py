@@ -0,0 +1,90 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Awaitable,
+                    Callable,
+                    Dict,
+                    Hashable,
+                    Iterable,
+                    Optional)
+
+from couchbase.logic.single_flight import (SingleFlightBase,
+                                           copy_shared_exception,
+                                           single_flight_key)
+
+if TYPE_CHECKING:
+    from couchbase.logic.observability.observability_types import MeterProtocol
+    from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
+
+
+class AsyncSingleFlight(SingleFlightBase):
+    """**INTERNAL**
+
+    Single-flight of the asyncio API.  The request of the first caller of a read is sent from a task of its own,
+    which every caller of an identical read awaits.  A cancelled caller does not cancel the read shared with
+    the other callers.  Must be used from the event loop.
+    """
+
+    def __init__(self, meter: Optional[MeterProtocol] = None) -> None:
+        super().__init__(meter=meter)
+        self._calls = {}  # type: Dict[str, Dict[Hashable, asyncio.Task]]
+
+    async def execute(self, req: PycbcCoreKeyValueRequest, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """**INTERNAL**
+
+        Returns the result of ``fn``, the coroutine sending the request, or of the identical read in flight.
+        """
+        flight_key = single_flight_key(req)
+        if flight_key is None:
+            return await fn()
+        calls = self._calls.setdefault(req.key, {})
+        task = calls.get(flight_key, None)
+        if task is not None:
+            self._record_saved()
+        else:
+            task = calls[flight_key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._remove(req.key, flight_key, t))
+        try:
+            return await asyncio.shield(task)
+        except BaseException as ex:
+            # the caller might have been cancelled, rather than the read failed
+            if task.done() and not task.cancelled() and task.exception() is ex:
+                raise copy_shared_exception(ex) from ex
+            raise
+
+    def forget(self, key: str) -> None:
+        """**INTERNAL**"""
+        self._calls.pop(key, None)
+
+    def forget_keys(self, keys: Iterable[str]) -> None:
+        """**INTERNAL**"""
+        for key in keys:
+            self._calls.pop(key, None)
+
+    def _remove(self, key: str, flight_key: Hashable, task: asyncio.Task) -> None:
+        if not task.cancelled():
+            # retrieved, in case every caller was cancelled
+            task.exception()
+        calls = self._calls.get(key, None)
+        # the read might have been forgotten, and an identical one started since
+        if calls is not None and calls.get(flight_key, None) is task:
+            del calls[flight_key]
+            if not calls:
+                del self._calls[key]
@@ -0,0 +1,253 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Deque,
+                    Dict,
+                    Optional,
+                    Tuple,
+                    TypeVar)
+
+from couchbase.exceptions import InvalidArgumentException
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Future
+
+T = TypeVar('T')
+
+# The blocking row fetch of every async streaming request (query, analytics, search, views and
+# range scans) is offloaded to a single, cluster-level StreamingExecutor rather than to a
+# per-request ThreadPoolExecutor.  The number of worker threads is fixed (max_workers) and the
+# number of fetches admitted to the pool is bounded (max_workers + max_queue_depth); any caller
+# beyond that waits on its own event loop (without blocking it) until a slot is handed over.
+
+
+class StreamingExecutor:
+    """**INTERNAL**
+
+    Bounded executor shared by all async streaming requests created from a cluster.
+
+    Args:
+        max_workers (int, optional): Maximum number of worker threads.  Defaults to the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default.
+        max_queue_depth (int, optional): Maximum number of fetches admitted to the pool that are waiting
+            for a worker.  Defaults to 4 * ``max_workers``.
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 max_queue_depth: Optional[int] = None
+                 ) -> None:
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers < 1:
+            raise InvalidArgumentException(message='streaming_executor_max_workers must be greater than 0.')
+        if max_queue_depth is None:
+            max_queue_depth = 4 * max_workers
+        if max_queue_depth < 0:
+            raise InvalidArgumentException(message='streaming_executor_queue_depth cannot be negative.')
+
+        self._max_workers = max_workers
+        self._max_queue_depth = max_queue_depth
+        self._capacity = max_workers + max_queue_depth
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._waiters: Deque[Tuple[AbstractEventLoop, Future[None]]] = deque()
+        self._shutdown = False
+        # metrics
+        self._active = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._saturated = 0
+
+    @property
+    def max_workers(self) -> int:
+        """**INTERNAL**"""
+        return self._max_workers
+
+    @property
+    def max_queue_depth(self) -> int:
+        """**INTERNAL**"""
+        return self._max_queue_depth
+
+    async def run(self, loop: AbstractEventLoop, fn: Callable[[], T]) -> T:
+        """**INTERNAL**
+
+        Run the blocking ``fn`` on a worker thread, waiting (on ``loop``) for a free slot if the
+        executor is saturated.
+        """
+        await self._acquire(loop)
+        try:
+            cf = self._get_executor().submit(self._run_tracked, fn)
+        except BaseException:
+            self._release()
+            raise
+        # the slot is released when the worker is done, even if the awaiting task is cancelled,
+        # so the bound always reflects the number of fetches actually occupying the pool
+        cf.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(cf, loop=loop)
+
+    def shutdown(self) -> None:
+        """**INTERNAL**
+
+        Stop accepting new work and release the worker threads once in-flight fetches complete.
+        Safe to call multiple times.
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            executor = self._executor
+            self._executor = None
+            waiters = list(self._waiters)
+            self._waiters.clear()
+
+        for loop, ft in waiters:
+            self._call_soon_threadsafe(loop, self._fail_waiter, ft)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, int]:
+        """**INTERNAL**
+
+        Snapshot of the executor's saturation metrics.
+        """
+        with self._lock:
+            return {
+                'max_workers': self._max_workers,
+                'max_queue_depth': self._max_queue_depth,
+                'active': self._active,
+                'queued': self._in_flight - self._active,
+                'waiting': len(self._waiters),
+                'peak_in_flight': self._peak_in_flight,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'saturated': self._saturated,
+            }
+
+    async def _acquire(self, loop: AbstractEventLoop) -> None:
+        with self._lock:
+            self._raise_if_shutdown()
+            self._submitted += 1
+            if self._in_flight < self._capacity:
+                self._take_slot()
+                return
+            self._saturated += 1
+            ft = loop.create_future()
+            waiter = (loop, ft)
+            self._waiters.append(waiter)
+
+        try:
+            await ft
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    granted = False
+                except ValueError:
+                    granted = True
+            # If the slot was already handed over, give it back.  A pending grant sees the cancelled
+            # future and releases the slot itself (see _grant_waiter).
+            if granted and ft.done() and not ft.cancelled() and ft.exception() is None:
+                self._release()
+            raise
+
+    def _call_soon_threadsafe(self, loop: AbstractEventLoop, callback: Callable[..., Any], *args: Any) -> bool:
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+            return True
+        except RuntimeError:
+            # the waiter's event loop has been closed
+            return False
+
+    def _fail_waiter(self, ft: Future[None]) -> None:
+        if not ft.done():
+            ft.set_exception(RuntimeError('Cannot perform streaming operations on a closed cluster.'))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            self._raise_if_shutdown()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix='pycbc-streaming')
+            return self._executor
+
+    def _grant_waiter(self, ft: Future[None]) -> None:
+        # runs on the waiter's event loop; the slot was transferred to it in _release
+        if ft.done():
+            self._release()
+        else:
+            ft.set_result(None)
+
+    def _on_done(self, _: Any) -> None:
+        with self._lock:
+            self._completed += 1
+        self._release()
+
+    def _raise_if_shutdown(self) -> None:
+        if self._shutdown:
+            raise RuntimeError('Cannot perform streaming operations on a closed cluster.')
+
+    def _release(self) -> None:
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._in_flight -= 1
+                    return
+                loop, ft = self._waiters.popleft()
+            # hand the slot directly to the next waiter, the in-flight count is unchanged
+            if self._call_soon_threadsafe(loop, self._grant_waiter, ft):
+                return
+
+    def _run_tracked(self, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._active += 1
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _take_slot(self) -> None:
+        # caller must hold self._lock
+        self._in_flight += 1
+        if self._in_flight > self._peak_in_flight:
+            self._peak_in_flight = self._in_flight
+
+
+_DEFAULT_EXECUTOR: Optional[StreamingExecutor] = None
+_DEFAULT_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_default_streaming_executor() -> StreamingExecutor:
+    """**INTERNAL**
+
+    Process-wide executor used by streaming requests that were not created from a cluster.
+    """
+    global _DEFAULT_EXECUTOR
+    with _DEFAULT_EXECUTOR_LOCK:
+        if _DEFAULT_EXECUTOR is None:
+            _DEFAULT_EXECUTOR = StreamingExecutor()
+        return _DEFAULT_EXECUTOR
@@ -73,13 +73,16 @@ class AsyncScope:
     def collection(self, name) -> Collection:
         """Creates a :class:`~acouchbase.collection.Collection` instance of the specified collection.
 
+        The instance is cached, later calls for the same collection return the same instance.
+
         Args:
             name (str): Name of the collection to reference.
 
         Returns:
             :class:`~acouchbase.collection.Collection`: A :class:`~acouchbase.collection.Collection` instance of the specified collection.
         """  # noqa: E501
-        return Collection(self, name)
+        return self._impl._client_adapter.handle_cache.get_or_create((self.bucket_name, self.name, name),
+                                                                     lambda: Collection(self, name))
 
     def query(self,
               statement,  # type: str
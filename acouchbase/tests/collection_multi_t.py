@@ -0,0 +1,162 @@
+#  Copyright 2016-2023. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+
+from acouchbase.cluster import get_event_loop
+from couchbase.exceptions import (DocumentExistsException,
+                                  DocumentNotFoundException,
+                                  InvalidArgumentException)
+from couchbase.options import (GetMultiOptions,
+                               IncrementMultiOptions,
+                               InsertMultiOptions,
+                               SignedInt64)
+from couchbase.result import (CounterResult,
+                              ExistsResult,
+                              GetResult,
+                              MultiCounterResult,
+                              MultiExistsResult,
+                              MultiGetResult,
+                              MultiMutationResult,
+                              MutationResult)
+
+from ._test_utils import CollectionType, TestEnvironment
+
+
+class CollectionMultiTests:
+
+    FAKE_KEYS = ['not-a-key1', 'not-a-key2', 'not-a-key3', 'not-a-key4']
+
+    @pytest_asyncio.fixture(scope="class")
+    def event_loop(self):
+        loop = get_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest_asyncio.fixture(scope="class", name="cb_env", params=[CollectionType.DEFAULT, CollectionType.NAMED])
+    async def couchbase_test_environment(self, couchbase_config, request):
+        cb_env = await TestEnvironment.get_environment(__name__,
+                                                       couchbase_config,
+                                                       request.param,
+                                                       manage_buckets=True)
+        if request.param == CollectionType.NAMED:
+            await cb_env.try_n_times(5, 3, cb_env.setup_named_collections)
+
+        await cb_env.try_n_times(3, 5, cb_env.load_data)
+        yield cb_env
+        await cb_env.try_n_times_till_exception(3, 5,
+                                                cb_env.purge_data,
+                                                raise_if_no_exception=False)
+        if request.param == CollectionType.NAMED:
+            await cb_env.try_n_times_till_exception(5, 3,
+                                                    cb_env.teardown_named_collections,
+                                                    raise_if_no_exception=False)
+
+    @pytest_asyncio.fixture(name='new_docs')
+    async def new_docs_with_reset(self, cb_env):
+        docs = {f'multi-doc-{i}': {'id': i, 'what': 'an async multi test doc'} for i in range(4)}
+        yield docs
+        await cb_env.collection.remove_multi(list(docs.keys()))
+
+    @pytest.mark.asyncio
+    async def test_multi_get_simple(self, cb_env):
+        keys = cb_env._loaded_keys[:4]
+        res = await cb_env.collection.get_multi(keys)
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is True
+        assert res.exceptions == {}
+        assert set(res.results.keys()) == set(keys)
+        assert all(map(lambda r: isinstance(r, GetResult), res.results.values())) is True
+
+    @pytest.mark.asyncio
+    async def test_multi_get_fail(self, cb_env):
+        with pytest.raises(DocumentNotFoundException):
+            await cb_env.collection.get_multi(self.FAKE_KEYS, GetMultiOptions(return_exceptions=False))
+
+        res = await cb_env.collection.get_multi(self.FAKE_KEYS)
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is False
+        assert res.results == {}
+        assert all(map(lambda e: issubclass(type(e), DocumentNotFoundException), res.exceptions.values())) is True
+
+    @pytest.mark.asyncio
+    async def test_multi_get_invalid_input(self, cb_env):
+        with pytest.raises(InvalidArgumentException):
+            await cb_env.collection.get_multi(cb_env._loaded_keys[0])
+
+    @pytest.mark.asyncio
+    async def test_multi_exists_simple(self, cb_env):
+        keys = cb_env._loaded_keys[:4] + self.FAKE_KEYS
+        res = await cb_env.collection.exists_multi(keys)
+        assert isinstance(res, MultiExistsResult)
+        assert res.all_ok is True
+        assert all(map(lambda r: isinstance(r, ExistsResult), res.results.values())) is True
+        for k, r in res.results.items():
+            assert r.exists is (k not in self.FAKE_KEYS)
+
+    @pytest.mark.asyncio
+    async def test_multi_insert_fail(self, cb_env, new_docs):
+        await cb_env.collection.upsert_multi(new_docs)
+        with pytest.raises(DocumentExistsException):
+            await cb_env.collection.insert_multi(new_docs, InsertMultiOptions(return_exceptions=False))
+
+    @pytest.mark.asyncio
+    async def test_multi_upsert_replace_remove(self, cb_env, new_docs):
+        res = await cb_env.collection.insert_multi(new_docs)
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+        assert all(map(lambda r: isinstance(r, MutationResult), res.results.values())) is True
+
+        res = await cb_env.collection.upsert_multi(new_docs)
+        assert res.all_ok is True
+
+        res = await cb_env.collection.replace_multi({k: {'replaced': True} for k in new_docs})
+        assert res.all_ok is True
+        get_res = await cb_env.collection.get_multi(list(new_docs.keys()))
+        assert all(map(lambda r: r.content_as[dict] == {'replaced': True}, get_res.results.values())) is True
+
+        res = await cb_env.collection.remove_multi(list(new_docs.keys()))
+        assert res.all_ok is True
+        res = await cb_env.collection.exists_multi(list(new_docs.keys()))
+        assert all(map(lambda r: r.exists is False, res.results.values())) is True
+        # fixture cleanup expects the docs to exist
+        await cb_env.collection.upsert_multi(new_docs)
+
+    @pytest.mark.asyncio
+    async def test_multi_touch_simple(self, cb_env, new_docs):
+        await cb_env.collection.upsert_multi(new_docs)
+        res = await cb_env.collection.touch_multi(list(new_docs.keys()), timedelta(seconds=30))
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+
+    @pytest.mark.asyncio
+    async def test_multi_increment_simple(self, cb_env):
+        keys = [f'multi-counter-{i}' for i in range(4)]
+        try:
+            res = await cb_env.collection.binary().increment_multi(keys,
+                                                                   IncrementMultiOptions(initial=SignedInt64(10)))
+            assert isinstance(res, MultiCounterResult)
+            assert res.all_ok is True
+            assert all(map(lambda r: isinstance(r, CounterResult), res.results.values())) is True
+            assert all(map(lambda r: r.content == 10, res.results.values())) is True
+
+            res = await cb_env.collection.binary().decrement_multi(keys)
+            assert res.all_ok is True
+            assert all(map(lambda r: r.content == 9, res.results.values())) is True
+        finally:
+            await cb_env.collection.remove_multi(keys)
@@ -117,6 +117,18 @@ class CollectionTests:
         key, value = cb_env.get_default_key_value()
         yield KVPair(key, value)
 
+    @pytest.fixture()
+    def disable_document_cache(self, cb_env):
+        yield
+        # the collection instance is shared with the other tests
+        cb_env.collection._impl._document_cache = None
+
+    @pytest.fixture()
+    def disable_coalescing(self, cb_env):
+        yield
+        # the collection instance is shared with the other tests
+        cb_env.collection._impl._coalescer = None
+
     @pytest_asyncio.fixture(name="default_kvp_and_reset")
     async def default_key_and_value_with_reset(self, cb_env) -> KVPair:
         key, value = cb_env.get_default_key_value()
@@ -724,3 +736,77 @@ class CollectionTests:
 
             after = int(time() + 1.0)
             before + expiry <= res_expiry <= after + expiry
+
+    @pytest.mark.usefixtures("disable_document_cache")
+    @pytest.mark.asyncio
+    async def test_with_cache(self, cb_env, new_kvp):
+        key = new_kvp.key
+        value = new_kvp.value
+        await cb_env.collection.upsert(key, value)
+        cb = cb_env.collection.with_cache(10, ttl=timedelta(seconds=30))
+        cache = cb._impl.document_cache
+        result = await cb.get(key)
+        assert cache.lookup(key) is not None
+        cached = await cb.get(key)
+        assert cached.cas == result.cas
+        assert cached.content_as[dict] == value
+        # a get with the document's expiry bypasses the cache
+        assert (await cb.get(key, GetOptions(with_expiry=True))).expiry_time is None
+
+        # mutations through the collection invalidate the cached document
+        value['cached'] = False
+        await cb.upsert(key, value)
+        assert cache.lookup(key) is None
+        result = await cb.get(key)
+        assert result.content_as[dict] == value
+        await cb.mutate_in(key, (SD.upsert('cached', True),))
+        assert (await cb.get(key)).content_as[dict]['cached'] is True
+
+    @pytest.mark.usefixtures("disable_document_cache")
+    @pytest.mark.asyncio
+    async def test_with_cache_interned_handle(self, cb_env, new_kvp):
+        key = new_kvp.key
+        value = new_kvp.value
+        await cb_env.collection.upsert(key, value)
+        cb = cb_env.scope.collection(cb_env.collection.name).with_cache(10, ttl=timedelta(seconds=30))
+        cache = cb._impl.document_cache
+        await cb.get(key)
+        # e.g. the collection is looked up again for every request
+        again = cb_env.scope.collection(cb_env.collection.name).with_cache(10, ttl=timedelta(seconds=30))
+        assert again is cb
+        assert again._impl.document_cache is cache
+        assert cache.lookup(key) is not None
+        # different settings replace the cache
+        assert again.with_cache(20)._impl.document_cache is not cache
+
+    @pytest.mark.usefixtures("disable_coalescing")
+    @pytest.mark.asyncio
+    async def test_with_coalescing_interned_handle(self, cb_env, new_kvp):
+        key = new_kvp.key
+        value = new_kvp.value
+        await cb_env.collection.upsert(key, value)
+        cb = cb_env.scope.collection(cb_env.collection.name).with_coalescing(window=timedelta(milliseconds=1))
+        coalescer = cb._impl.coalescer
+        # e.g. the collection is looked up again for every request
+        lookups = [cb_env.scope.collection(cb_env.collection.name).with_coalescing(window=timedelta(milliseconds=1))
+                   for _ in range(3)]
+        assert all(c is cb and c._impl.coalescer is coalescer for c in lookups)
+        results = await asyncio.gather(*(c.get(key) for c in lookups))
+        assert all(r.content_as[dict] == value for r in results)
+        # different settings replace the coalescer
+        assert cb.with_coalescing(max_batch=16)._impl.coalescer is not coalescer
+
+    @pytest.mark.usefixtures("check_xattr_supported")
+    @pytest.mark.usefixtures("disable_document_cache")
+    @pytest.mark.asyncio
+    async def test_with_cache_revalidate(self, cb_env, new_kvp):
+        key = new_kvp.key
+        value = new_kvp.value
+        await cb_env.collection.upsert(key, value)
+        cb = cb_env.collection.with_cache(10, revalidate=True)
+        result = await cb.get(key)
+        assert (await cb.get(key)).cas == result.cas
+        # stand in for a mutation from another client
+        cb._impl.document_cache.lookup(key).cas = result.cas + 1
+        assert (await cb.get(key)).cas == result.cas
+        assert cb._impl.document_cache.lookup(key).cas == result.cas
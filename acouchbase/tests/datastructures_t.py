@@ -182,6 +182,21 @@ class DatastructuresTests:
         await cb_set.clear()
         assert 0 == await cb_set.size()
 
+    @pytest.mark.usefixtures("remove_ds")
+    @pytest.mark.asyncio
+    async def test_list_iter_items(self, cb_env):
+        cb_list = cb_env.collection.couchbase_list(self.TEST_DS_KEY)
+        assert [v async for v in cb_list.iter_items()] == []
+
+        for v in range(35):
+            await cb_list.append(v)
+
+        assert [v async for v in cb_list.iter_items()] == list(range(35))
+        assert [v async for v in cb_list.iter_items(page_size=5)] == list(range(35))
+        for page_size in (0, 17, 'a'):
+            with pytest.raises(InvalidArgumentException):
+                cb_list.iter_items(page_size=page_size)
+
     @pytest.mark.usefixtures("remove_ds")
     @pytest.mark.asyncio
     async def test_queue(self, cb_env):
@@ -214,3 +229,22 @@ class DatastructuresTests:
         await cb_queue.clear()
 
         assert 0 == await cb_queue.size()
+
+    @pytest.mark.usefixtures("remove_ds")
+    @pytest.mark.asyncio
+    async def test_queue_batch(self, cb_env):
+        cb_queue = cb_env.collection.couchbase_queue(self.TEST_DS_KEY)
+
+        await cb_queue.push_many([])
+        await cb_queue.push_many(range(20))
+        await cb_queue.push(20)
+        assert await cb_queue.size() == 21
+
+        assert await cb_queue.pop() == 0
+        assert await cb_queue.pop_many(3) == [1, 2, 3]
+        # more than a single round trip's worth of items
+        assert await cb_queue.pop_many(16) == list(range(4, 20))
+        assert await cb_queue.pop_many(5) == [20]
+        assert await cb_queue.pop_many(5) == []
+        with pytest.raises(InvalidArgumentException):
+            await cb_queue.pop_many(0)
@@ -0,0 +1,190 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from acouchbase.logic.kv_coalescer import KeyValueCoalescer
+from couchbase.exceptions import InvalidArgumentException, UnAmbiguousTimeoutException
+from couchbase.logic.operation_types import KeyValueMultiOperationCode, KeyValueOperationCode
+
+
+class _FakeRequest:
+    def __init__(self, opcode, key):
+        self.opcode = opcode.value
+        self.key = key
+
+
+class _FakeMultiResult:
+    def __init__(self, raw_result):
+        self.raw_result = raw_result
+
+
+class _FakeClientAdapter:
+    """Stands in for the AsyncClientAdapter: each multi operation resolves on the next loop iteration."""
+
+    def __init__(self, fail=False):
+        self._fail = fail
+        self.batches = []
+
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+    def execute_collection_request(self, opcode, requests):
+        self.batches.append((opcode, [r.key for r in requests]))
+        ft = self.loop.create_future()
+        if self._fail:
+            self.loop.call_soon(ft.set_exception, UnAmbiguousTimeoutException())
+        else:
+            raw_result = {r.key: f'{opcode.name}:{r.key}' for r in requests}
+            raw_result['all_okay'] = True
+            self.loop.call_soon(ft.set_result, _FakeMultiResult(raw_result))
+        return ft
+
+
+def _get(key):
+    return _FakeRequest(KeyValueOperationCode.Get, key)
+
+
+def _upsert(key):
+    return _FakeRequest(KeyValueOperationCode.Upsert, key)
+
+
+class KeyValueCoalescerTestSuite:
+    TEST_MANIFEST = [
+        'test_accepts',
+        'test_batch_failure',
+        'test_cancelled_operation',
+        'test_coalesces_concurrent_operations',
+        'test_duplicate_key_starts_new_batch',
+        'test_has_same_settings',
+        'test_invalid_arguments',
+        'test_max_batch',
+        'test_operations_batched_by_kind',
+        'test_window',
+    ]
+
+    def test_accepts(self):
+        assert KeyValueCoalescer.accepts(_get('a')) is True
+        assert KeyValueCoalescer.accepts(_upsert('a')) is True
+        assert KeyValueCoalescer.accepts(_FakeRequest(KeyValueOperationCode.GetProjected, 'a')) is False
+        assert KeyValueCoalescer.accepts(_FakeRequest(KeyValueOperationCode.UpsertWithLegacyDurability, 'a')) is False
+
+    @pytest.mark.asyncio
+    async def test_batch_failure(self):
+        adapter = _FakeClientAdapter(fail=True)
+        coalescer = KeyValueCoalescer(adapter)
+        results = await asyncio.gather(*(coalescer.submit(_get(f'key-{i}')) for i in range(3)),
+                                       return_exceptions=True)
+        assert len(adapter.batches) == 1
+        assert all(isinstance(r, UnAmbiguousTimeoutException) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_operation(self):
+        adapter = _FakeClientAdapter()
+        coalescer = KeyValueCoalescer(adapter)
+        fts = [coalescer.submit(_get(f'key-{i}')) for i in range(3)]
+        fts[1].cancel()
+        results = await asyncio.gather(*fts, return_exceptions=True)
+        assert results[0] == 'GetMulti:key-0'
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert results[2] == 'GetMulti:key-2'
+        # the cancelled operation was already part of the batch
+        assert adapter.batches == [(KeyValueMultiOperationCode.GetMulti, ['key-0', 'key-1', 'key-2'])]
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_operations(self):
+        adapter = _FakeClientAdapter()
+        coalescer = KeyValueCoalescer(adapter)
+        keys = [f'key-{i}' for i in range(10)]
+        results = await asyncio.gather(*(coalescer.submit(_get(k)) for k in keys))
+        assert results == [f'GetMulti:{k}' for k in keys]
+        assert adapter.batches == [(KeyValueMultiOperationCode.GetMulti, keys)]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_key_starts_new_batch(self):
+        adapter = _FakeClientAdapter()
+        coalescer = KeyValueCoalescer(adapter)
+        results = await asyncio.gather(*(coalescer.submit(_upsert(k)) for k in ['a', 'b', 'a', 'c']))
+        assert results == ['UpsertMulti:a', 'UpsertMulti:b', 'UpsertMulti:a', 'UpsertMulti:c']
+        assert adapter.batches == [(KeyValueMultiOperationCode.UpsertMulti, ['a', 'b']),
+                                   (KeyValueMultiOperationCode.UpsertMulti, ['a', 'c'])]
+
+    def test_invalid_arguments(self):
+        adapter = _FakeClientAdapter()
+        for max_batch in (0, -1, 1.5, True, '2'):
+            with pytest.raises(InvalidArgumentException):
+                KeyValueCoalescer(adapter, max_batch=max_batch)
+        for window in (timedelta(seconds=-1), 0.5):
+            with pytest.raises(InvalidArgumentException):
+                KeyValueCoalescer(adapter, window=window)
+        coalescer = KeyValueCoalescer(adapter, window=timedelta(milliseconds=5))
+        assert coalescer.max_batch == 128
+        assert coalescer.window == 0.005
+
+    def test_has_same_settings(self):
+        adapter = _FakeClientAdapter()
+        coalescer = KeyValueCoalescer(adapter, window=timedelta(milliseconds=5))
+        same = KeyValueCoalescer(adapter, max_batch=128, window=timedelta(microseconds=5000))
+        assert coalescer.has_same_settings(same)
+        assert not coalescer.has_same_settings(KeyValueCoalescer(adapter,
+                                                                 max_batch=64,
+                                                                 window=timedelta(milliseconds=5)))
+        assert not coalescer.has_same_settings(KeyValueCoalescer(adapter))
+
+    @pytest.mark.asyncio
+    async def test_max_batch(self):
+        adapter = _FakeClientAdapter()
+        coalescer = KeyValueCoalescer(adapter, max_batch=4)
+        await asyncio.gather(*(coalescer.submit(_get(f'key-{i}')) for i in range(10)))
+        assert [len(keys) for _, keys in adapter.batches] == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_operations_batched_by_kind(self):
+        adapter = _FakeClientAdapter()
+        coalescer = KeyValueCoalescer(adapter)
+        results = await asyncio.gather(coalescer.submit(_get('a')),
+                                       coalescer.submit(_upsert('a')),
+                                       coalescer.submit(_get('b')))
+        assert results == ['GetMulti:a', 'UpsertMulti:a', 'GetMulti:b']
+        assert sorted(adapter.batches) == [(KeyValueMultiOperationCode.GetMulti, ['a', 'b']),
+                                           (KeyValueMultiOperationCode.UpsertMulti, ['a'])]
+
+    @pytest.mark.asyncio
+    async def test_window(self):
+        adapter = _FakeClientAdapter()
+        coalescer = KeyValueCoalescer(adapter, window=timedelta(milliseconds=50))
+        first = coalescer.submit(_get('a'))
+        await asyncio.sleep(0.005)
+        # still gathering
+        assert adapter.batches == []
+        second = coalescer.submit(_get('b'))
+        assert await asyncio.gather(first, second) == ['GetMulti:a', 'GetMulti:b']
+        assert adapter.batches == [(KeyValueMultiOperationCode.GetMulti, ['a', 'b'])]
+
+
+class KeyValueCoalescerTests(KeyValueCoalescerTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(KeyValueCoalescerTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(KeyValueCoalescerTests) if valid_test_method(meth)]
+        test_list = set(KeyValueCoalescerTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -41,6 +41,7 @@ class RangeScanTestSuite:
         'test_range_scan_ids_only',
         'test_range_scan_default_terms',
         'test_prefix_scan',
+        'test_prefix_scan_partitions',
         'test_sampling_scan',
         'test_sampling_scan_with_seed',
         'test_range_scan_with_batch_byte_limit',
@@ -216,6 +217,22 @@ class RangeScanTestSuite:
         for r in rows:
             assert r.id in test_ids
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('check_range_scan_supported')
+    async def test_prefix_scan_partitions(self, cb_env, test_id, test_ids, test_mutation_state):
+        partitions = await cb_env.collection.scan_partitions(PrefixScan(f'{test_id}'), 4)
+        assert 1 <= len(partitions) <= 4
+        ids = []
+        for partition in partitions:
+            res = cb_env.collection.scan(partition.scan_type, ScanOptions(timeout=timedelta(seconds=10),
+                                                                          ids_only=True,
+                                                                          consistent_with=test_mutation_state))
+            ids.extend([r.id async for r in res])
+        # every document is returned by exactly one partition
+        assert sorted(ids) == sorted(test_ids)
+        with pytest.raises(InvalidArgumentException):
+            await cb_env.collection.scan_partitions(SamplingScan(10), 4)
+
     @pytest.mark.asyncio
     @pytest.mark.usefixtures('check_range_scan_supported')
     @pytest.mark.parametrize('batch_byte_limit', [0, 1, 25, 100])
@@ -0,0 +1,137 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import pytest
+
+from couchbase.exceptions import DocumentExistsException, InvalidArgumentException
+from couchbase.logic.kv_stream import keys_as_stream_items, stream_kv_ops_async
+
+
+class _FakeUpsert:
+    def __init__(self, fail_keys=None):
+        self._fail_keys = fail_keys or set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.cancelled = 0
+
+    async def __call__(self, key, doc):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (hash(key) % 3))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        if key in self._fail_keys:
+            raise DocumentExistsException()
+        return doc
+
+
+async def _async_docs(num_docs, pulled=None):
+    for i in range(num_docs):
+        if pulled is not None:
+            pulled.append(i)
+        yield f'key-{i}', i
+
+
+class AsyncKeyValueStreamTestSuite:
+    TEST_MANIFEST = [
+        'test_accepts_async_iterable',
+        'test_accepts_iterable',
+        'test_early_exit_cancels_in_flight',
+        'test_errors_are_returned',
+        'test_input_consumed_lazily',
+        'test_invalid_window',
+        'test_keys_as_stream_items',
+    ]
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterable(self):
+        upsert = _FakeUpsert()
+        results = [r async for r in stream_kv_ops_async(upsert, _async_docs(200), 16)]
+        assert sorted(r for _, r in results) == list(range(200))
+        assert upsert.peak_in_flight <= 16
+
+    @pytest.mark.asyncio
+    async def test_accepts_iterable(self):
+        upsert = _FakeUpsert()
+        docs = {f'key-{i}': i for i in range(20)}
+        results = {k: r async for k, r in stream_kv_ops_async(upsert, docs, 4)}
+        assert results == docs
+        results = {k: r async for k, r in stream_kv_ops_async(upsert, list(docs.items()), 4)}
+        assert results == docs
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_in_flight(self):
+        upsert = _FakeUpsert()
+        stream = stream_kv_ops_async(upsert, _async_docs(100), 8)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        # let the cancellations propagate
+        await asyncio.sleep(0.01)
+        assert upsert.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_returned(self):
+        upsert = _FakeUpsert(fail_keys={'key-1', 'key-5'})
+        results = {k: r async for k, r in stream_kv_ops_async(upsert, _async_docs(10), 3)}
+        assert len(results) == 10
+        assert isinstance(results['key-1'], DocumentExistsException)
+        assert isinstance(results['key-5'], DocumentExistsException)
+        assert results['key-2'] == 2
+
+    @pytest.mark.asyncio
+    async def test_input_consumed_lazily(self):
+        upsert = _FakeUpsert()
+        pulled = []
+        stream = stream_kv_ops_async(upsert, _async_docs(100, pulled), 5)
+        await stream.__anext__()
+        assert len(pulled) <= 5
+        await stream.aclose()
+
+    def test_invalid_window(self):
+        for window in (0, -1, 1.5, True, None):
+            with pytest.raises(InvalidArgumentException):
+                asyncio.run(stream_kv_ops_async(_FakeUpsert(), [('key', 'doc')], window).__anext__())
+
+    @pytest.mark.asyncio
+    async def test_keys_as_stream_items(self):
+        async def _keys():
+            for i in range(20):
+                yield f'key-{i}'
+
+        upsert = _FakeUpsert()
+        results = {k: r async for k, r in stream_kv_ops_async(upsert, keys_as_stream_items(_keys()), 4)}
+        assert set(results.keys()) == {f'key-{i}' for i in range(20)}
+        assert all(r is None for r in results.values())
+        results = {k: r async for k, r in stream_kv_ops_async(upsert, keys_as_stream_items(['a', 'b']), 4)}
+        assert results == {'a': None, 'b': None}
+
+
+class AsyncKeyValueStreamTests(AsyncKeyValueStreamTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(AsyncKeyValueStreamTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(AsyncKeyValueStreamTests) if valid_test_method(meth)]
+        test_list = set(AsyncKeyValueStreamTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -0,0 +1,152 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import pytest
+
+from acouchbase.logic.single_flight import AsyncSingleFlight
+from couchbase.exceptions import DocumentNotFoundException
+from couchbase.logic.operation_types import KeyValueOperationCode
+
+
+class _FakeRequest:
+    def __init__(self, opcode, key, **options):
+        self.opcode = opcode.value
+        self.key = key
+        for k, v in options.items():
+            setattr(self, k, v)
+
+
+class _BlockingRead:
+    """Sends a read that only completes once released."""
+
+    def __init__(self, result=None, exc=None):
+        self.calls = 0
+        self.released = asyncio.Event()
+        self._result = result
+        self._exc = exc
+
+    async def __call__(self):
+        self.calls += 1
+        await self.released.wait()
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+
+class AsyncSingleFlightTestSuite:
+    TEST_MANIFEST = [
+        'test_cancelled_caller',
+        'test_exception_shared',
+        'test_forget',
+        'test_identical_reads_shared',
+        'test_unsupported_operation',
+    ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller(self):
+        single_flight = AsyncSingleFlight()
+        read = _BlockingRead(result='doc')
+        req = _FakeRequest(KeyValueOperationCode.Get, 'key-1')
+        tasks = [asyncio.ensure_future(single_flight.execute(req, read)) for _ in range(3)]
+        await asyncio.sleep(0)
+        # the caller that sent the request is cancelled, the others still get the result
+        tasks[0].cancel()
+        read.released.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1:] == ['doc', 'doc']
+        assert read.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_exception_shared(self):
+        single_flight = AsyncSingleFlight()
+        exc = DocumentNotFoundException(message='not found')
+        read = _BlockingRead(exc=exc)
+        req = _FakeRequest(KeyValueOperationCode.LookupIn, 'key-1', specs=[])
+        tasks = [asyncio.ensure_future(single_flight.execute(req, read)) for _ in range(3)]
+        await asyncio.sleep(0)
+        read.released.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, DocumentNotFoundException) for r in results)
+        assert read.calls == 1
+        assert single_flight.saved == 2
+        # each caller raises its own copy of the exception
+        assert len({id(r) for r in results}) == 3
+        assert all(r is not exc and r.__cause__ is exc and r.message == 'not found' for r in results)
+
+    @pytest.mark.asyncio
+    async def test_forget(self):
+        single_flight = AsyncSingleFlight()
+        first = _BlockingRead(result='before')
+        second = _BlockingRead(result='after')
+        req = _FakeRequest(KeyValueOperationCode.Get, 'key-1')
+        in_flight = asyncio.ensure_future(single_flight.execute(req, first))
+        await asyncio.sleep(0)
+        # e.g. the document was mutated through the collection
+        single_flight.forget('key-1')
+        tasks = [asyncio.ensure_future(single_flight.execute(req, second)) for _ in range(2)]
+        await asyncio.sleep(0)
+        first.released.set()
+        second.released.set()
+        assert await in_flight == 'before'
+        assert await asyncio.gather(*tasks) == ['after', 'after']
+        assert (first.calls, second.calls) == (1, 1)
+        assert single_flight.saved == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_shared(self):
+        single_flight = AsyncSingleFlight()
+        read = _BlockingRead(result='doc')
+        other = _BlockingRead(result='other')
+        req = _FakeRequest(KeyValueOperationCode.Get, 'key-1')
+        other_req = _FakeRequest(KeyValueOperationCode.Get, 'key-2')
+        tasks = [asyncio.ensure_future(single_flight.execute(req, read)) for _ in range(10)]
+        tasks.append(asyncio.ensure_future(single_flight.execute(other_req, other)))
+        await asyncio.sleep(0)
+        read.released.set()
+        other.released.set()
+        assert await asyncio.gather(*tasks) == ['doc'] * 10 + ['other']
+        assert (read.calls, other.calls) == (1, 1)
+        assert single_flight.saved == 9
+        # every read completed, none is left in flight
+        next_read = _BlockingRead(result='next')
+        next_read.released.set()
+        assert await single_flight.execute(req, next_read) == 'next'
+        assert next_read.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_unsupported_operation(self):
+        single_flight = AsyncSingleFlight()
+        req = _FakeRequest(KeyValueOperationCode.Upsert, 'key-1')
+        assert single_flight.accepts(req) is False
+        read = _BlockingRead(result='ok')
+        read.released.set()
+        assert await asyncio.gather(*(single_flight.execute(req, read) for _ in range(3))) == ['ok'] * 3
+        assert read.calls == 3
+        assert single_flight.saved == 0
+
+
+class AsyncSingleFlightTests(AsyncSingleFlightTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(AsyncSingleFlightTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(AsyncSingleFlightTests) if valid_test_method(meth)]
+        test_list = set(AsyncSingleFlightTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
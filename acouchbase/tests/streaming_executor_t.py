@@ -0,0 +1,161 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import threading
+
+import pytest
+
+from acouchbase.logic.streaming_executor import StreamingExecutor
+from couchbase.exceptions import InvalidArgumentException
+
+
+async def _wait_for(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            pytest.fail('Timed out waiting for the streaming executor.')
+        await asyncio.sleep(0.01)
+
+
+class StreamingExecutorTestSuite:
+    TEST_MANIFEST = [
+        'test_cancelled_waiter_does_not_leak_slot',
+        'test_fetches_are_bounded',
+        'test_invalid_options',
+        'test_run_returns_result',
+        'test_run_propagates_exception',
+        'test_shutdown_rejects_new_work',
+        'test_worker_threads_stay_bounded',
+    ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        executor = StreamingExecutor(max_workers=1, max_queue_depth=0)
+        block = threading.Event()
+        try:
+            loop = asyncio.get_running_loop()
+            running = asyncio.ensure_future(executor.run(loop, block.wait))
+            await _wait_for(lambda: executor.stats()['active'] == 1)
+            waiting = asyncio.ensure_future(executor.run(loop, lambda: 'never'))
+            await _wait_for(lambda: executor.stats()['waiting'] == 1)
+
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            assert executor.stats()['waiting'] == 0
+
+            block.set()
+            await running
+            # the slot held by the finished fetch must be free again
+            assert await executor.run(loop, lambda: 'row') == 'row'
+            await _wait_for(lambda: executor.stats()['completed'] == 2)
+            stats = executor.stats()
+            assert stats['active'] == 0
+            assert stats['queued'] == 0
+        finally:
+            block.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_fetches_are_bounded(self):
+        executor = StreamingExecutor(max_workers=1, max_queue_depth=1)
+        block = threading.Event()
+        try:
+            loop = asyncio.get_running_loop()
+            tasks = [asyncio.ensure_future(executor.run(loop, block.wait)) for _ in range(4)]
+            await _wait_for(lambda: executor.stats()['waiting'] == 2)
+            stats = executor.stats()
+            assert stats['active'] == 1
+            assert stats['queued'] == 1
+            assert stats['saturated'] == 2
+
+            block.set()
+            await asyncio.gather(*tasks)
+            await _wait_for(lambda: executor.stats()['completed'] == 4)
+            stats = executor.stats()
+            assert stats['submitted'] == 4
+            assert stats['waiting'] == 0
+            assert stats['peak_in_flight'] == 2
+        finally:
+            block.set()
+            executor.shutdown()
+
+    def test_invalid_options(self):
+        with pytest.raises(InvalidArgumentException):
+            StreamingExecutor(max_workers=0)
+        with pytest.raises(InvalidArgumentException):
+            StreamingExecutor(max_workers=1, max_queue_depth=-1)
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result(self):
+        executor = StreamingExecutor(max_workers=1)
+        try:
+            assert await executor.run(asyncio.get_running_loop(), lambda: 'row-1') == 'row-1'
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exception(self):
+        def _raise():
+            raise StopAsyncIteration
+
+        executor = StreamingExecutor(max_workers=1)
+        try:
+            with pytest.raises(StopAsyncIteration):
+                await executor.run(asyncio.get_running_loop(), _raise)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_rejects_new_work(self):
+        executor = StreamingExecutor(max_workers=1)
+        executor.shutdown()
+        # idempotent
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            await executor.run(asyncio.get_running_loop(), lambda: 'row')
+
+    @pytest.mark.asyncio
+    async def test_worker_threads_stay_bounded(self):
+        executor = StreamingExecutor(max_workers=2, max_queue_depth=2)
+        try:
+            loop = asyncio.get_running_loop()
+            thread_names = set()
+
+            def _fetch():
+                thread_names.add(threading.current_thread().name)
+                return 1
+
+            # many more concurrent fetches than workers, as with hundreds of concurrent queries
+            results = await asyncio.gather(*[executor.run(loop, _fetch) for _ in range(200)])
+            assert sum(results) == 200
+            assert 0 < len(thread_names) <= 2
+            assert executor.stats()['peak_in_flight'] <= 4
+        finally:
+            executor.shutdown()
+
+
+class AsyncStreamingExecutorTests(StreamingExecutorTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(AsyncStreamingExecutorTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(AsyncStreamingExecutorTests) if valid_test_method(meth)]
+        test_list = set(StreamingExecutorTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -15,13 +15,15 @@
 
 import asyncio
 import threading
-from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+from acouchbase.logic.streaming_executor import StreamingExecutor, get_default_streaming_executor
 from acouchbase.n1ql import AsyncN1QLRequest
 from couchbase.exceptions import CouchbaseException, InternalSDKException
-from couchbase.logic.streaming import stream_anext
+from couchbase.logic.streaming import (RowBuffer,
+                                       enable_loop_delivery,
+                                       stream_anext)
 
 
 class _FakeStreamingResult:
@@ -34,14 +36,67 @@ class _FakeStreamingResult:
         self.cancel_calls += 1
 
 
+class _FakeNotifyingStreamingResult:
+    """Stand-in for a ``pycbc_streamed_result`` in event loop delivery mode.  ``put`` mirrors the C++
+    core queueing a row from an IO thread and calls the registered notifier on the empty -> ready
+    transition."""
+
+    def __init__(self):
+        self._rows = []
+        self._lock = threading.Lock()
+        self._notifier = None
+        self.next_batch_calls = 0
+
+    def put(self, row):
+        with self._lock:
+            notify = self._notifier is not None and not self._rows
+            self._rows.append(row)
+        if notify:
+            self._notifier()
+
+    def set_notifier(self, notifier):
+        self._notifier = notifier
+        if self.is_ready():
+            notifier()
+
+    def is_ready(self):
+        with self._lock:
+            return len(self._rows) > 0
+
+    def __next__(self):
+        with self._lock:
+            return self._rows.pop(0)
+
+    def next_batch(self, max_rows, max_wait=None):
+        # only called once ready; like the C++ rows_queue, the batch ends after the end-of-rows sentinel
+        self.next_batch_calls += 1
+        batch = []
+        with self._lock:
+            while self._rows and len(batch) < max_rows:
+                batch.append(self._rows.pop(0))
+                if batch[-1] is None:
+                    break
+        return batch
+
+
+class _NoExecutor:
+    """Streaming executor that fails the test if a fetch is offloaded to it."""
+
+    async def run(self, loop, fn):
+        pytest.fail('Row fetch should not be offloaded to the streaming executor.')
+
+
 class _FakeAsyncStreamingRequest:
     """Minimal stand-in implementing the contract ``stream_anext`` relies on, so the streaming
     iterator teardown/error handling can be exercised without a live cluster.  Records the
     teardown calls the helper makes so the tests can assert on them."""
 
-    def __init__(self, loop, *, rows=None, raise_exc=None, block_event=None):
+    def __init__(self, loop, *, rows=None, raise_exc=None, block_event=None, streaming_result=None, rows_per_fetch=1):
         self._loop = loop
-        self._tp_executor = ThreadPoolExecutor(1)
+        self._streaming_executor = StreamingExecutor(max_workers=1)
+        self._streaming_result = streaming_result
+        self._row_ready = None
+        self._row_buffer = RowBuffer(rows_per_fetch)
         self._done_streaming = False
         self._rows = list(rows or [])
         self._raise_exc = raise_exc
@@ -50,9 +105,14 @@ class _FakeAsyncStreamingRequest:
         self.process_core_span_calls = []
         self.finalize_calls = []
         self.get_metadata_calls = 0
-        self.executor_shutdown = False
 
     def _get_next_row(self):
+        if self._streaming_result is not None:
+            # event loop delivery, only called once the streaming result is ready
+            row = self._row_buffer.next(self._streaming_result)
+            if row is None:
+                raise StopAsyncIteration
+            return row
         # runs in the executor thread, mirroring the real (blocking) row fetch
         if self._block_event is not None:
             self._block_event.wait()
@@ -67,12 +127,6 @@ class _FakeAsyncStreamingRequest:
 
     def _finalize(self, exc_val=None):
         self.finalize_calls.append(exc_val)
-        self._shutdown_executor()
-
-    def _shutdown_executor(self):
-        if not self.executor_shutdown:
-            self.executor_shutdown = True
-            self._tp_executor.shutdown(wait=False)
 
     def _get_metadata(self):
         self.get_metadata_calls += 1
@@ -88,6 +142,10 @@ class StreamingAnextTestSuite:
         'test_cancellation_finalizes_and_propagates',
         'test_finalize_cancels_streaming_result_on_error',
         'test_finalize_skips_cancel_on_normal_completion',
+        'test_loop_delivery_awaits_rows_without_executor',
+        'test_loop_delivery_cancelled_stream_ends_iteration',
+        'test_loop_delivery_fetches_rows_in_batches',
+        'test_loop_delivery_rows_queued_before_registration',
     ]
 
     @pytest.mark.asyncio
@@ -99,9 +157,8 @@ class StreamingAnextTestSuite:
             # span ended on the (first) row, no error, and the op is NOT finalized mid-stream
             assert req.process_core_span_calls == [None]
             assert req.finalize_calls == []
-            assert req.executor_shutdown is False
         finally:
-            req._tp_executor.shutdown(wait=False)
+            req._streaming_executor.shutdown()
 
     @pytest.mark.asyncio
     async def test_stop_async_iteration_finalizes_and_reads_metadata(self):
@@ -111,7 +168,6 @@ class StreamingAnextTestSuite:
         assert req._done_streaming is True
         assert req.finalize_calls == [None]
         assert req.get_metadata_calls == 1
-        assert req.executor_shutdown is True
 
     @pytest.mark.asyncio
     async def test_couchbase_exception_propagates_unchanged(self):
@@ -121,7 +177,6 @@ class StreamingAnextTestSuite:
             await stream_anext(req)
         assert exc_info.value is err
         assert req.finalize_calls == [err]
-        assert req.executor_shutdown is True
 
     @pytest.mark.asyncio
     async def test_generic_exception_converted_to_internal(self):
@@ -130,7 +185,6 @@ class StreamingAnextTestSuite:
             await stream_anext(req)
         assert len(req.finalize_calls) == 1
         assert isinstance(req.finalize_calls[0], InternalSDKException)
-        assert req.executor_shutdown is True
 
     @pytest.mark.asyncio
     async def test_keyboard_interrupt_propagates_unconverted(self):
@@ -140,7 +194,6 @@ class StreamingAnextTestSuite:
         # BaseException must be finalized for cleanup but NOT converted to a CouchbaseException
         assert len(req.finalize_calls) == 1
         assert isinstance(req.finalize_calls[0], KeyboardInterrupt)
-        assert req.executor_shutdown is True
 
     @pytest.mark.asyncio
     async def test_cancellation_finalizes_and_propagates(self):
@@ -148,7 +201,7 @@ class StreamingAnextTestSuite:
         block = threading.Event()
         req = _FakeAsyncStreamingRequest(asyncio.get_running_loop(), rows=['late-row'], block_event=block)
         task = asyncio.ensure_future(stream_anext(req))
-        # let the task reach the run_in_executor await (worker is now blocked on the event)
+        # let the task reach the streaming executor await (worker is now blocked on the event)
         await asyncio.sleep(0.05)
         task.cancel()
         # release the worker so the in-flight executor future can complete; the pending
@@ -159,7 +212,6 @@ class StreamingAnextTestSuite:
         # CancelledError (a BaseException) must have triggered teardown, unconverted
         assert len(req.finalize_calls) == 1
         assert isinstance(req.finalize_calls[0], asyncio.CancelledError)
-        assert req.executor_shutdown is True
 
     def test_finalize_cancels_streaming_result_on_error(self):
         # _finalize is exercised on a real request to verify the cancel() wiring (Phase III).
@@ -170,7 +222,8 @@ class StreamingAnextTestSuite:
             req._finalize(exc_val=CouchbaseException('boom'))
             # abort path: the C++ streamed result is cancelled so a blocked worker can unwind
             assert req._streaming_result.cancel_calls == 1
-            assert req._executor_shutdown is True
+            # requests not created from a cluster share the process-wide executor, never their own
+            assert req._streaming_executor is get_default_streaming_executor()
         finally:
             loop.close()
 
@@ -181,10 +234,135 @@ class StreamingAnextTestSuite:
             req._streaming_result = _FakeStreamingResult()
             req._finalize()  # exc_val is None -> normal completion must NOT cancel (metadata follows)
             assert req._streaming_result.cancel_calls == 0
-            assert req._executor_shutdown is True
+            assert req._streaming_executor is get_default_streaming_executor()
         finally:
             loop.close()
 
+    @pytest.mark.asyncio
+    async def test_loop_delivery_awaits_rows_without_executor(self):
+        loop = asyncio.get_running_loop()
+        streaming_result = _FakeNotifyingStreamingResult()
+        req = _FakeAsyncStreamingRequest(loop, streaming_result=streaming_result)
+        req._streaming_executor = _NoExecutor()
+        enable_loop_delivery(req)
+
+        task = asyncio.ensure_future(stream_anext(req))
+        await asyncio.sleep(0.05)
+        # nothing queued yet: the task waits on the loop, no thread is blocked
+        assert task.done() is False
+
+        # rows arrive from a "core IO thread"
+        producer = threading.Thread(target=lambda: [streaming_result.put(r) for r in ('row-1', 'row-2', None)])
+        producer.start()
+        assert await asyncio.wait_for(task, 2) == 'row-1'
+        producer.join()
+        assert await stream_anext(req) == 'row-2'
+        with pytest.raises(StopAsyncIteration):
+            await stream_anext(req)
+        assert req._done_streaming is True
+        assert req.finalize_calls == [None]
+        assert req.get_metadata_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_delivery_cancelled_stream_ends_iteration(self):
+        class _CancelledStreamingResult(_FakeNotifyingStreamingResult):
+            # a cancelled rows_queue is ready, but has no rows left to return
+            def is_ready(self):
+                return True
+
+        streaming_result = _CancelledStreamingResult()
+        req = _FakeAsyncStreamingRequest(asyncio.get_running_loop(),
+                                         streaming_result=streaming_result,
+                                         rows_per_fetch=128)
+        req._streaming_executor = _NoExecutor()
+        enable_loop_delivery(req)
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(stream_anext(req), 2)
+        assert req._done_streaming is True
+        assert req.finalize_calls == [None]
+
+    @pytest.mark.asyncio
+    async def test_loop_delivery_rows_queued_before_registration(self):
+        streaming_result = _FakeNotifyingStreamingResult()
+        streaming_result.put('row-1')
+        req = _FakeAsyncStreamingRequest(asyncio.get_running_loop(), streaming_result=streaming_result)
+        req._streaming_executor = _NoExecutor()
+        enable_loop_delivery(req)
+        assert await asyncio.wait_for(stream_anext(req), 2) == 'row-1'
+
+    @pytest.mark.asyncio
+    async def test_loop_delivery_fetches_rows_in_batches(self):
+        streaming_result = _FakeNotifyingStreamingResult()
+        for row in ('row-1', 'row-2', 'row-3', None, 'metadata'):
+            streaming_result.put(row)
+        req = _FakeAsyncStreamingRequest(asyncio.get_running_loop(),
+                                         streaming_result=streaming_result,
+                                         rows_per_fetch=128)
+        req._streaming_executor = _NoExecutor()
+        enable_loop_delivery(req)
+
+        rows = []
+        with pytest.raises(StopAsyncIteration):
+            while True:
+                rows.append(await asyncio.wait_for(stream_anext(req), 2))
+        assert rows == ['row-1', 'row-2', 'row-3']
+        assert streaming_result.next_batch_calls == 1
+        # the batch stops at the end-of-rows sentinel, metadata is left for _get_metadata
+        assert next(streaming_result) == 'metadata'
+        assert req.finalize_calls == [None]
+
+
+class RowBufferTestSuite:
+    TEST_MANIFEST = [
+        'test_empty_batch_returns_end_of_rows',
+        'test_fetches_rows_per_fetch_at_a_time',
+        'test_single_row_fetch_uses_next',
+    ]
+
+    def test_empty_batch_returns_end_of_rows(self):
+        class _Cancelled:
+            def next_batch(self, max_rows, max_wait=None):
+                return []
+
+        assert RowBuffer(16).next(_Cancelled()) is None
+
+    def test_fetches_rows_per_fetch_at_a_time(self):
+        class _Source:
+            def __init__(self):
+                self.calls = []
+                self._rows = list(range(5))
+
+            def next_batch(self, max_rows, max_wait=None):
+                self.calls.append((max_rows, max_wait))
+                batch, self._rows = self._rows[:max_rows], self._rows[max_rows:]
+                return batch
+
+        source = _Source()
+        buffer = RowBuffer(2, max_wait=10)
+        assert [buffer.next(source) for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert source.calls == [(2, 10), (2, 10), (2, 10)]
+        assert len(buffer) == 0
+        assert buffer.next(source) is None
+
+    def test_single_row_fetch_uses_next(self):
+        buffer = RowBuffer(1)
+        source = iter(['row-1'])
+        assert buffer.next(source) == 'row-1'
+        with pytest.raises(StopIteration):
+            buffer.next(source)
+
+
+class RowBufferTests(RowBufferTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(RowBufferTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(RowBufferTests) if valid_test_method(meth)]
+        test_list = set(RowBufferTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
+
 
 class AsyncStreamingAnextTests(StreamingAnextTestSuite):
     @pytest.fixture(scope='class', autouse=True)
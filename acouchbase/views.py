@@ -14,16 +14,16 @@
 #  limitations under the License.
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from typing import Awaitable
 
+from acouchbase.logic.streaming_executor import get_default_streaming_executor
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
                                   ErrorMapper,
                                   ExceptionMap)
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
-from couchbase.logic.streaming import stream_anext
+from couchbase.logic.streaming import enable_loop_delivery, stream_anext
 from couchbase.logic.views import ViewQuery  # noqa: F401
 from couchbase.logic.views import ViewRequestLogic, ViewRow
 
@@ -35,11 +35,14 @@ class AsyncViewRequest(ViewRequestLogic):
                  encoded_query,
                  **kwargs
                  ):
-        num_workers = kwargs.pop('num_workers', None) or 1
+        # num_workers is no longer used, rows are fetched on the cluster's shared streaming executor
+        kwargs.pop('num_workers', None)
+        streaming_executor = kwargs.pop('streaming_executor', None)
         super().__init__(connection, encoded_query, **kwargs)
         self._loop = loop
-        self._tp_executor = ThreadPoolExecutor(num_workers)
-        self._executor_shutdown = False
+        self._streaming_executor = streaming_executor or get_default_streaming_executor()
+        # set by enable_loop_delivery once the streaming op is submitted
+        self._row_ready = None
 
     @property
     def loop(self):
@@ -75,6 +78,7 @@ class AsyncViewRequest(ViewRequestLogic):
 
         if not self.started_streaming:
             self._submit_query()
+            enable_loop_delivery(self)
 
         return self
 
@@ -83,7 +87,7 @@ class AsyncViewRequest(ViewRequestLogic):
             return
 
         # this is a blocking operation
-        row = next(self._streaming_result)
+        row = self._row_buffer.next(self._streaming_result)
         if isinstance(row, PycbcCoreException):
             raise ErrorMapper.build_exception(row)
 
@@ -101,33 +105,23 @@ class AsyncViewRequest(ViewRequestLogic):
         else:
             return deserialized_row
 
-    def _shutdown_executor(self):
-        """
-        **INTERNAL**
-
-        Release the per-request streaming executor.  Safe to call multiple times.
-        """
-        if not self._executor_shutdown:
-            self._executor_shutdown = True
-            self._tp_executor.shutdown(wait=False)
-
     def _finalize(self, exc_val=None):
         """
         **INTERNAL**
 
-        Terminal cleanup for the streaming op: end the observability span/meter and release the
-        executor.  Invoked from every terminal branch of ``__anext__`` -- including cancellation --
-        so that ``asyncio.CancelledError`` (a ``BaseException``, not an ``Exception``) cannot bypass
-        teardown and leak the span/meter or orphan the streaming result and its executor thread.
+        Terminal cleanup for the streaming op: end the observability span/meter and, on error, cancel
+        the streaming result.  Invoked from every terminal branch of ``__anext__`` -- including
+        cancellation -- so that ``asyncio.CancelledError`` (a ``BaseException``, not an ``Exception``)
+        cannot bypass teardown and leak the span/meter or orphan the streaming result while it holds
+        a thread of the shared streaming executor.
         """
         self._process_core_span(exc_val=exc_val)
         if exc_val is not None and self._streaming_result is not None:
-            # Cancellation/error: unblock a worker still waiting on the C++ core so its executor
-            # thread is released promptly instead of waiting for the whole server-side operation
+            # Cancellation/error: unblock a worker still waiting on the C++ core so its shared
+            # executor thread is released promptly instead of waiting for the whole server-side operation
             # to finish.  Normal completion (exc_val is None) skips this so trailing metadata can
             # still be read from the streaming result.
             self._streaming_result.cancel()
-        self._shutdown_executor()
 
     async def __anext__(self):
         return await stream_anext(self)
@@ -61,6 +61,7 @@ import couchbase.logic.logging_config  # nopep8 # isort:skip # noqa: F401, E402
 from couchbase.logic.logging_config import (  # nopep8 # isort:skip # noqa: F401, E402
     configure_logging,
     enable_protocol_logger_to_save_network_traffic_to_file,
+    get_logging_sink_stats,
 )
 
 from couchbase.logic.pycbc_core.core_metadata import (  # nopep8 # isort:skip # noqa: F401, E402
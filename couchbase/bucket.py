@@ -77,6 +77,8 @@ class Bucket:
     def scope(self, name: str) -> Scope:
         """Creates a :class:`~couchbase.scope.Scope` instance of the specified scope.
 
+        The instance is cached, later calls for the same scope return the same instance.
+
         Args:
             name (str): Name of the scope to reference.
 
@@ -84,7 +86,7 @@ class Bucket:
             :class:`~couchbase.scope.Scope`: A :class:`~couchbase.scope.Scope` instance of the specified scope.
 
         """
-        return Scope(self, name)
+        return self._impl._client_adapter.handle_cache.get_or_create((self.name, name), lambda: Scope(self, name))
 
     def collection(self, collection_name: str) -> Collection:
         """Creates a :class:`~couchbase.collection.Collection` instance of the specified collection.
@@ -18,6 +18,8 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
+                    ContextManager,
+                    Optional,
                     Union)
 
 from couchbase.auth import (CertificateAuthenticator,
@@ -43,6 +45,7 @@ from couchbase.result import (AnalyticsResult,
 from couchbase.transactions import Transactions
 
 if TYPE_CHECKING:
+    from couchbase.logic.observability import HotPathStats
     from couchbase.options import (AnalyticsOptions,
                                    ClusterOptions,
                                    DiagnosticsOptions,
@@ -115,6 +118,9 @@ class Cluster:
     def bucket(self, bucket_name: str) -> Bucket:
         """Creates a Bucket instance to a specific bucket.
 
+        The instance is cached, later calls for the same bucket return the same instance (until the bucket or
+        this cluster is closed).
+
         .. seealso::
             :class:`.bucket.Bucket`
 
@@ -130,7 +136,8 @@ class Cluster:
                 be found.
 
         """
-        return Bucket(self, bucket_name)
+        return self._impl.client_adapter.handle_cache.get_or_create((bucket_name,),
+                                                                    lambda: Bucket(self, bucket_name))
 
     def cluster_info(self) -> ClusterInfoResult:
         """Retrieve the Couchbase cluster information
@@ -194,6 +201,54 @@ class Cluster:
         req = self._impl.request_builder.build_diagnostics_request(*opts, **kwargs)
         return self._impl.diagnostics(req)
 
+    def hot_path_profiling(self) -> ContextManager[None]:
+        """Enables hot path profiling for the KV operations started within the returned context manager.
+
+        Use it to profile some operations only, instead of every operation of the cluster (the
+        `enable_hot_path_profiling` :class:`~couchbase.options.ClusterOptions` option).  Profiling follows the
+        current context, so with acouchbase only the operations of the task entering the block are profiled.
+
+        Returns:
+            ContextManager[None]: A context manager enabling profiling while it is entered.
+
+        Examples:
+            Profile a single get::
+
+                with cluster.hot_path_profiling():
+                    res = collection.get('airline_10')
+                print(cluster.hot_path_stats()['get'])
+
+        """
+        return self._impl.cluster_settings.get_hot_path_profiler().profile()
+
+    def hot_path_stats(self, reset: Optional[bool] = None) -> HotPathStats:
+        """Returns the latency of the profiled KV operations, broken down by stage.
+
+        Each operation's stages (see :class:`~couchbase.logic.observability.HotPathStage`), from building the
+        request to decoding the result's content, are recorded in HDR histograms.  The stats cover every operation
+        profiled since profiling started, or since the last call with `reset` set to True.
+
+        Args:
+            reset (bool, optional): Set to True to clear the histograms once read. Defaults to False.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: The stats, keyed by operation name (e.g. ``get``, ``upsert_multi``)
+            and stage name.  Each stage has the ``total_count`` of recorded values and its ``percentiles_ns``, the
+            50th, 90th, 99th, 99.9th and 100th percentiles in nanoseconds.  Empty if profiling was never enabled.
+
+        Examples:
+            Find which stage regressed::
+
+                stats = cluster.hot_path_stats()
+                for stage, report in stats['get'].items():
+                    print(f'{stage}: p99={report["percentiles_ns"]["99.0"]}ns')
+
+        """
+        profiler = self._impl.observability_instruments.hot_path_profiler
+        if profiler is None:
+            return {}
+        return profiler.snapshot(reset=reset)
+
     def set_authenticator(
             self, authenticator: Union[CertificateAuthenticator, JwtAuthenticator, PasswordAuthenticator]
     ) -> None:
@@ -19,8 +19,10 @@ from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
                     Iterable,
+                    Iterator,
                     List,
                     Optional,
+                    Tuple,
                     Type,
                     Union)
 
@@ -30,12 +32,19 @@ from couchbase.datastructures import (CouchbaseList,
                                       CouchbaseQueue,
                                       CouchbaseSet,
                                       DatastructureCallable)
-from couchbase.exceptions import (DocumentExistsException,
+from couchbase.exceptions import (CouchbaseException,
+                                  DocumentExistsException,
                                   DocumentNotFoundException,
                                   PathExistsException,
                                   PathNotFoundException,
                                   QueueEmpty)
 from couchbase.logic.collection_impl import CollectionImpl
+from couchbase.logic.kv_range_scan import (SCAN_PARTITION_SAMPLE_SIZE,
+                                           SamplingScan,
+                                           ScanPartition,
+                                           build_scan_partitions,
+                                           get_scan_partition_bounds)
+from couchbase.logic.kv_stream import DEFAULT_STREAM_WINDOW, get_stream_window
 from couchbase.logic.observability import ObservableRequestHandler
 from couchbase.logic.operation_types import (DatastructureOperationType,
                                              KeyValueMultiOperationType,
@@ -1112,6 +1121,150 @@ class Collection:
         req = self._impl.request_builder.build_range_scan_request(self._impl.connection, scan_type, *opts, **kwargs)
         return self._impl.range_scan(req)
 
+    def scan_partitions(self,
+                        scan_type,  # type: ScanType
+                        partitions,  # type: int
+                        ) -> List[ScanPartition]:
+        """Splits a key-value range scan into disjoint partitions that can be scanned in parallel.
+
+        The key space of the scan is split into ranges that hold about the same number of documents, the split points
+        are picked from a (keys only) sampling scan of the collection.  If too few of the sampled keys fall in the
+        scanned range, e.g. a narrow :class:`~couchbase.kv_range_scan.PrefixScan`, the range is split evenly over the
+        printable ASCII characters instead.  Each partition is scanned independently by
+        passing its :attr:`~couchbase.kv_range_scan.ScanPartition.scan_type` to :meth:`scan`, e.g. from its own
+        thread or process.  Together the partitions return each document of the original scan exactly
+        once.
+
+        A partition is the unit of resumption: a consumer that fails can re-scan its partition, and
+        :attr:`~couchbase.kv_range_scan.ScanPartition.token` can be used to record, or hand over, the partitions that
+        still need to be scanned.
+
+        Args:
+            scan_type (:class:`~couchbase.kv_range_scan.ScanType`): Either a :class:`~couchbase.kv_range_scan.RangeScan`
+                or :class:`~couchbase.kv_range_scan.PrefixScan` instance.
+            partitions (int): The number of partitions to split the scan into.  Fewer partitions are returned when the
+                collection is small and does not have enough documents in the scanned range.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If scan_type is not either a RangeScan or
+                PrefixScan instance, or if partitions is not a positive int.
+
+        Returns:
+            List[:class:`~couchbase.kv_range_scan.ScanPartition`]: The partitions of the scan, ordered by key range.
+
+        Examples:
+
+            Export a collection from multiple processes::
+
+                from concurrent.futures import ProcessPoolExecutor
+
+                from couchbase.kv_range_scan import RangeScan
+
+                # ... other code ...
+
+                def export_partition(partition):
+                    collection = connect_to_collection()  # each process uses its own connection
+                    return sum(1 for _ in collection.scan(partition.scan_type))
+
+                partitions = collection.scan_partitions(RangeScan(), 8)
+                with ProcessPoolExecutor(max_workers=8) as pool:
+                    total = sum(pool.map(export_partition, partitions))
+
+        """
+        get_scan_partition_bounds(scan_type, partitions)
+        if partitions == 1:
+            return build_scan_partitions(scan_type, partitions, ())
+        sample_size = partitions * SCAN_PARTITION_SAMPLE_SIZE
+        sample = self.scan(SamplingScan(sample_size), ScanOptions(ids_only=True))
+        return build_scan_partitions(scan_type, partitions, (res.id for res in sample), sample_size=sample_size)
+
+    def with_cache(self,
+                   max_entries,  # type: int
+                   max_bytes=None,  # type: Optional[int]
+                   ttl=None,  # type: Optional[timedelta]
+                   revalidate=None,  # type: Optional[bool]
+                   ) -> Collection:
+        """Enables a client-side, read-through cache of the documents retrieved with :meth:`get`.
+
+        Meant for hot documents that rarely change (e.g. feature flags or configuration).  A cached document is
+        returned without a round trip to the server, the least recently used documents are evicted once the cache
+        is full.  Mutations (e.g. upsert, replace, remove or mutate_in) made through this collection invalidate the
+        cached document, mutations made by other clients are only seen once the cached document expires (see
+        ``ttl``), or on every get when ``revalidate`` is enabled.
+
+        Gets that request the document's expiry or a projection bypass the cache.  The collection returned by
+        :meth:`~couchbase.scope.Scope.collection` is shared by every caller that looks it up, and so is its cache.
+        Calling this method again with the same arguments keeps the cache and the documents cached so far, with
+        different arguments it replaces the cache.  When the cluster uses the default logging meter, the cache's hits,
+        misses and evictions are reported along with the operation metrics.
+
+        Args:
+            max_entries (int): The maximum number of cached documents.
+            max_bytes (Optional[int]): The maximum total size, in bytes, of the cached (encoded) documents.
+            ttl (Optional[timedelta]): How long a document is cached for.  Defaults to until it is evicted or
+                invalidated.
+            revalidate (Optional[bool]): If set to True, a cached document is only returned if its CAS still matches
+                the CAS on the server.  Checking the CAS is a round trip, but the document itself is not transferred.
+
+        Returns:
+            :class:`~couchbase.collection.Collection`: This collection, with the cache enabled.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If any of the provided arguments is invalid.
+
+        Examples:
+
+            Cache up to 100 documents for at most 30 seconds::
+
+                from datetime import timedelta
+
+                # ... other code ...
+
+                collection = bucket.scope('inventory').collection('airline').with_cache(100, ttl=timedelta(seconds=30))
+                res = collection.get('airline_10')
+
+        """
+        self._impl.enable_document_cache(max_entries, max_bytes=max_bytes, ttl=ttl, revalidate=revalidate)
+        return self
+
+    def with_single_flight(self) -> Collection:
+        """Enables the sharing of identical reads of a document that are in flight at the same time.
+
+        Meant for hot documents read by many threads at once, e.g. when the document expires from an application
+        cache.  A :meth:`get`, :meth:`exists`, :meth:`lookup_in` or :meth:`get_any_replica` issued while an identical
+        read (same document, operation and options) is in flight does not send a request, it waits for the read in
+        flight and gets its own result built from the same response, or the same exception.  Mutations made through
+        this collection are seen by the reads issued once they complete.
+
+        The number of requests that were not sent is available as :attr:`single_flight_saved`.  When the cluster
+        uses the default logging meter, it is also reported along with the operation metrics.  Calling this method
+        again keeps the reads in flight and the count.
+
+        Returns:
+            :class:`~couchbase.collection.Collection`: This collection, with single-flight enabled.
+
+        Examples:
+
+            Share the concurrent gets of a hot document::
+
+                collection = bucket.scope('inventory').collection('airline').with_single_flight()
+                with ThreadPoolExecutor(max_workers=32) as executor:
+                    results = list(executor.map(lambda _: collection.get('airline_10'), range(100)))
+                print(f'Requests saved: {collection.single_flight_saved}')
+
+        """
+        self._impl.enable_single_flight()
+        return self
+
+    @property
+    def single_flight_saved(self) -> int:
+        """
+            int: The number of reads that shared an identical read in flight instead of sending a request, see
+            :meth:`with_single_flight`.
+        """
+        single_flight = self._impl.single_flight
+        return single_flight.saved if single_flight is not None else 0
+
     def binary(self) -> BinaryCollection:
         """Creates a BinaryCollection instance, allowing access to various binary operations
         possible against a collection.
@@ -1879,6 +2032,53 @@ class Collection:
             req = self._impl.multi_request_builder.build_get_multi_request(keys, obs_handler, *opts, **kwargs)
             return self._impl.get_multi(req, obs_handler)
 
+    def get_stream(self,
+                   keys,  # type: Iterable[str]
+                   *opts,  # type: GetOptions
+                   window=DEFAULT_STREAM_WINDOW,  # type: int
+                   **kwargs,  # type: Any
+                   ) -> Iterator[Tuple[str, Union[GetResult, CouchbaseException]]]:
+        """Retrieves the document of each key of the provided iterable, keeping at most ``window`` operations in
+        flight, and yields the results as they arrive.
+
+        Unlike :meth:`get_multi`, which returns once every document has been retrieved, each result is handed back
+        as soon as its response arrives, so processing can start with the first document instead of waiting for the
+        slowest one.  Keys are pulled from ``keys`` only as in-flight operations complete, so memory use is bounded
+        by ``window`` regardless of the number of keys.
+
+        Args:
+            keys (Iterable[str]): The keys of the documents to retrieve.  Any iterable (e.g. a generator) is
+                accepted.
+            opts (:class:`~couchbase.options.GetOptions`): Optional parameters applied to every get operation.
+            window (int, optional): Maximum number of get operations in flight.  Defaults to 128.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetOptions`
+
+        Returns:
+            Iterator[Tuple[str, Union[:class:`~couchbase.result.GetResult`, :class:`~couchbase.exceptions.CouchbaseException`]]]:
+            The (key, result) pairs, in completion order.  If an operation failed (e.g. the document does not
+            exist), the exception is returned in place of the result.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the window is not a positive int, or if a
+                single key is provided instead of an iterable of keys.
+
+        Examples:
+
+            Process documents as they are retrieved::
+
+                collection = bucket.default_collection()
+                keys = (f'doc{i}' for i in range(50_000))
+                for key, res in collection.get_stream(keys, window=512):
+                    if isinstance(res, CouchbaseException):
+                        print(f'Failed to get doc: key={key}, error={res}')
+                        continue
+                    process(res.content_as[dict])
+
+        """  # noqa: E501
+        window = get_stream_window(window)
+        return self._impl.get_stream(keys, window, *opts, **kwargs)
+
     def get_any_replica_multi(self,
                               keys,  # type: List[str]
                               *opts,  # type: GetAnyReplicaMultiOptions
@@ -2349,6 +2549,18 @@ class Collection:
                 for k, v in res.results.items():
                     print(f'Doc upserted: key={k}, cas={v.cas}')
 
+            Large upsert_multi operation, encode the documents on a pool of 4 workers::
+
+                from couchbase.options import UpsertMultiOptions
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                keys_and_docs = {f'doc{i}': {'id': i} for i in range(10000)}
+                res = collection.upsert_multi(keys_and_docs,
+                                              UpsertMultiOptions(encode_parallelism=4))
+                print(f'All docs upserted: {res.all_ok}')
+
         """  # noqa: E501
         instruments = self._impl.observability_instruments
         with ObservableRequestHandler.create(KeyValueMultiOperationType.UpsertMulti, instruments) as obs_handler:
@@ -2358,6 +2570,54 @@ class Collection:
                                                                               **kwargs)
             return self._impl.upsert_multi(req, obs_handler)
 
+    def upsert_stream(self,
+                      keys_and_docs,  # type: Union[Iterable[Tuple[str, JSONType]], Dict[str, JSONType]]
+                      *opts,  # type: UpsertOptions
+                      window=DEFAULT_STREAM_WINDOW,  # type: int
+                      **kwargs,  # type: Any
+                      ) -> Iterator[Tuple[str, Union[MutationResult, CouchbaseException]]]:
+        """Upserts each (key, document) pair of the provided iterable, keeping at most ``window`` operations in
+        flight.
+
+        Unlike :meth:`upsert_multi`, the input is consumed lazily: a document is pulled from ``keys_and_docs``, and
+        encoded, only once an in-flight operation completes, so memory use is bounded by ``window`` regardless of
+        the size of the input.
+
+        Args:
+            keys_and_docs (Union[Iterable[Tuple[str, JSONType]], Dict[str, JSONType]]): The (key, document) pairs to
+                upsert.  Any iterable (e.g. a generator) of pairs, or a dict, is accepted.
+            opts (:class:`~couchbase.options.UpsertOptions`): Optional parameters applied to every upsert operation.
+            window (int, optional): Maximum number of upsert operations in flight.  Defaults to 128.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.UpsertOptions`
+
+        Returns:
+            Iterator[Tuple[str, Union[:class:`~couchbase.result.MutationResult`, :class:`~couchbase.exceptions.CouchbaseException`]]]:
+            The (key, result) pairs, in completion order.  If an operation failed, the exception is returned in place of
+            the result.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the window is not a positive int.
+
+        Examples:
+
+            Load documents from a file, one JSON document per line::
+
+                def docs():
+                    with open('docs.jsonl') as f:
+                        for line in f:
+                            doc = json.loads(line)
+                            yield doc['id'], doc
+
+                collection = bucket.default_collection()
+                for key, res in collection.upsert_stream(docs(), window=256):
+                    if isinstance(res, CouchbaseException):
+                        print(f'Failed to upsert doc: key={key}, error={res}')
+
+        """  # noqa: E501
+        window = get_stream_window(window)
+        return self._impl.upsert_stream(keys_and_docs, window, *opts, **kwargs)
+
     def replace_multi(self,
                       keys_and_docs,  # type: Dict[str, JSONType]
                       *opts,  # type: ReplaceMultiOptions
@@ -25,6 +25,7 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
 from couchbase.logic.kv_range_scan import PrefixScan  # noqa: F401
 from couchbase.logic.kv_range_scan import RangeScan  # noqa: F401
 from couchbase.logic.kv_range_scan import SamplingScan  # noqa: F401
+from couchbase.logic.kv_range_scan import ScanPartition  # noqa: F401
 from couchbase.logic.kv_range_scan import ScanTerm  # noqa: F401
 from couchbase.logic.kv_range_scan import ScanType  # noqa: F401
 from couchbase.logic.kv_range_scan import RangeScanRequestLogic
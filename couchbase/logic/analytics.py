@@ -27,6 +27,7 @@ from couchbase.exceptions import ErrorMapper, InvalidArgumentException
 from couchbase.logic.observability import ObservableRequestHandler, SpanProtocol
 from couchbase.logic.options import AnalyticsOptionsBase
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
+from couchbase.logic.streaming import DEFAULT_ROWS_PER_FETCH, RowBuffer
 from couchbase.options import AnalyticsOptions, UnsignedInt64
 from couchbase.serializer import DefaultJsonSerializer, Serializer
 
@@ -171,6 +172,7 @@ class AnalyticsQuery:
         'priority': {'priority': lambda x: x},
         'query_context': {'query_context': lambda x: x},
         'serializer': {'serializer': lambda x: x},
+        'rows_per_fetch': {'rows_per_fetch': lambda x: x},
         'raw': {'raw': lambda x: x},
         'positional_parameters': {},
         'named_parameters': {},
@@ -315,6 +317,17 @@ class AnalyticsQuery:
             raise InvalidArgumentException('Serializer should implement Serializer interface.')
         self._params["serializer"] = value
 
+    @property
+    def rows_per_fetch(self) -> Optional[int]:
+        return self._params.get('rows_per_fetch', None)
+
+    @rows_per_fetch.setter
+    def rows_per_fetch(self, value  # type: int
+                       ) -> None:
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise InvalidArgumentException('rows_per_fetch must be a positive int.')
+        self._params['rows_per_fetch'] = value
+
     @property
     def raw(self) -> Optional[Dict[str, Any]]:
         return self._params.get('raw', None)
@@ -408,6 +421,7 @@ class AnalyticsRequestLogic:
         self._metadata = None
         self._obs_handler: Optional[ObservableRequestHandler] = kwargs.pop('obs_handler', None)
         self._processed_core_span = False
+        self._row_buffer = RowBuffer(self.params.get('rows_per_fetch', DEFAULT_ROWS_PER_FETCH))
 
     @property
     def params(self) -> Dict[str, Any]:
@@ -17,17 +17,20 @@ from __future__ import annotations
 
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
                     Dict,
                     List,
                     Optional,
                     Union)
 
-from couchbase.exceptions import (CouchbaseException,
+from couchbase.exceptions import (BucketNotFoundException,
+                                  CouchbaseException,
                                   ErrorMapper,
                                   InternalSDKException)
 from couchbase.logic.binding_map import BindingMap
 from couchbase.logic.bucket_types import CloseBucketRequest, OpenBucketRequest
 from couchbase.logic.cluster_types import CloseConnectionRequest
+from couchbase.logic.handle_cache import HandleCache
 from couchbase.logic.observability import ObservableRequestHandler
 from couchbase.logic.operation_types import KeyValueMultiOperationCode, KeyValueOperationCode
 from couchbase.logic.pycbc_core import pycbc_connection
@@ -43,11 +46,17 @@ if TYPE_CHECKING:
 class ClientAdapter:
 
     def __init__(self, connect_req: CreateConnectionRequest, **kwargs: Any) -> None:
+        connection_opts = {}
         num_io_threads = connect_req.options.get('num_io_threads', None)
-        self._connection = pycbc_connection(num_io_threads) if num_io_threads is not None else pycbc_connection()
+        if num_io_threads is not None:
+            connection_opts['num_io_threads'] = num_io_threads
+        if connect_req.options.get('enable_zero_copy_values', False) is True:
+            connection_opts['zero_copy_values'] = True
+        self._connection = pycbc_connection(**connection_opts)
         self._closed = False
         self._connect_req = connect_req
         self._binding_map = BindingMap(self._connection)
+        self._handle_cache = HandleCache()
         # for testing we sometimes want to skip the actual C++ core connection
         if not (kwargs.get('skip_connect', None) == 'TEST_SKIP_CONNECT'):
             self._execute_connect_request()
@@ -67,6 +76,11 @@ class ClientAdapter:
         """**INTERNAL**"""
         return self._connection
 
+    @property
+    def handle_cache(self) -> HandleCache:
+        """**INTERNAL**"""
+        return self._handle_cache
+
     def _ensure_not_closed(self) -> None:
         if self._closed:
             raise RuntimeError(
@@ -78,6 +92,7 @@ class ClientAdapter:
 
     def close_bucket(self, bucket_name: str) -> None:
         """**INTERNAL**"""
+        self._handle_cache.invalidate(bucket_name)
         self._ensure_not_closed()
         self._ensure_connected()
         self.execute_bucket_request(CloseBucketRequest(bucket_name))
@@ -87,6 +102,7 @@ class ClientAdapter:
         if self._closed:
             return  # Already closed, idempotent behavior
 
+        self._handle_cache.clear()
         if not self.connected:
             # Not currently connected, but mark as closed anyway
             self._closed = True
@@ -102,7 +118,11 @@ class ClientAdapter:
         req_dict = req.req_to_dict()
         ret = self._execute_req(req.op_name, req_dict)
         if isinstance(ret, PycbcCoreException):
-            raise ErrorMapper.build_exception(ret)
+            exc = ErrorMapper.build_exception(ret)
+            if isinstance(exc, BucketNotFoundException):
+                # the bucket is gone, its handles must not be handed out anymore
+                self._handle_cache.invalidate(req.bucket_name)
+            raise exc
         return ret
 
     def execute_collection_request(self,
@@ -111,8 +131,13 @@ class ClientAdapter:
                                    obs_handler: Optional[ObservableRequestHandler] = None) -> Any:
         """**INTERNAL**"""
         self._ensure_not_closed()
+        stage_timer = obs_handler.stage_timer if obs_handler else None
         try:
+            if stage_timer is not None:
+                stage_timer.dispatched()
             ret = self._binding_map.kv_ops[opcode](req)
+            if stage_timer is not None:
+                stage_timer.completed(ret)
             # pycbc_result and pycbc_exception have a core_span member
             if obs_handler and hasattr(ret, 'core_span'):
                 obs_handler.process_core_span(ret.core_span)
@@ -124,6 +149,49 @@ class ClientAdapter:
         except Exception as ex:
             raise InternalSDKException(message=str(ex)) from None
 
+    def submit_collection_request(self,  # noqa: C901
+                                  opcode: Union[KeyValueOperationCode, KeyValueMultiOperationCode],
+                                  req: Union[List[PycbcCoreKeyValueRequest], PycbcCoreKeyValueRequest],
+                                  callback: Callable[[Any], None],
+                                  errback: Callable[[CouchbaseException], None],
+                                  obs_handler: Optional[ObservableRequestHandler] = None) -> None:
+        """**INTERNAL**
+
+        Non-blocking variant of :meth:`execute_collection_request`.  The request is dispatched and, once it
+        completes, ``callback`` is called with the result (or ``errback`` with the exception) from a C++ core
+        IO thread.  A multi operation (list of requests) completes through a single callback for the whole batch.
+        """
+        self._ensure_not_closed()
+        stage_timer = obs_handler.stage_timer if obs_handler else None
+
+        def _callback(result) -> None:
+            if stage_timer is not None:
+                stage_timer.completed(result)
+            if obs_handler and hasattr(result, 'core_span'):
+                obs_handler.process_core_span(result.core_span)
+            callback(result)
+
+        def _errback(exc) -> None:
+            if stage_timer is not None:
+                stage_timer.completed(exc)
+            if obs_handler and hasattr(exc, 'core_span'):
+                obs_handler.process_core_span(exc.core_span)
+            errback(ErrorMapper.build_exception(exc))
+
+        try:
+            if stage_timer is not None:
+                stage_timer.dispatched()
+            if isinstance(req, list):
+                self._binding_map.kv_ops[opcode]((req, _callback, _errback))
+            else:
+                req.callback = _callback
+                req.errback = _errback
+                self._binding_map.kv_ops[opcode](req)
+        except CouchbaseException:
+            raise
+        except Exception as ex:
+            raise InternalSDKException(message=str(ex)) from None
+
     def execute_cluster_request(self, req: ClusterRequest) -> Any:
         """**INTERNAL**"""
         self._ensure_not_closed()
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import warnings
 from dataclasses import dataclass
+from threading import Lock
 from typing import (Any,
                     Callable,
                     Dict,
@@ -31,7 +32,9 @@ from urllib.parse import parse_qs, urlparse
 from couchbase import USER_AGENT_EXTRA
 from couchbase.auth import CertificateAuthenticator, PasswordAuthenticator
 from couchbase.exceptions import InvalidArgumentException
-from couchbase.logic.observability import (LegacyTracerProtocol,
+from couchbase.logic.observability import (HotPathProfiler,
+                                           LegacyTracerProtocol,
+                                           LoggingMeter,
                                            MeterProtocol,
                                            NoOpMeter,
                                            NoOpTracer,
@@ -46,9 +49,14 @@ from couchbase.options import (ClusterMetricsOptions,
                                TLSVerifyMode,
                                TransactionConfig,
                                get_valid_args)
-from couchbase.serializer import DefaultJsonSerializer, Serializer
+from couchbase.serializer import (DefaultJsonSerializer,
+                                  Serializer,
+                                  get_fastest_serializer)
 from couchbase.transcoder import JSONTranscoder, Transcoder
 
+# guards the lazy creation of a cluster's hot path profiler
+_HOT_PATH_PROFILER_LOCK = Lock()
+
 LEGACY_CONNSTR_QUERY_ARGS = {
     'ssl': {'tls_verify': TLSVerifyMode.to_str},
     'certpath': {'cert_path': lambda x: x},
@@ -250,6 +258,13 @@ def build_metrics_options(cluster_opts: Dict[str, Any]) -> Tuple[Dict[str, Any],
     return metrics_opts, meter
 
 
+def build_hot_path_profiler(meter: MeterProtocol, enabled: Optional[bool] = None) -> HotPathProfiler:
+    profiler = HotPathProfiler(enabled=enabled)
+    if isinstance(meter, LoggingMeter):
+        meter.add_hot_path_profiler(profiler)
+    return profiler
+
+
 def build_timeout_options(cluster_opts: Dict[str, Any]) -> Dict[str, Any]:
     timeout_opts = {}
     for key in ClusterTimeoutOptions.get_allowed_option_keys(use_transform_keys=True):
@@ -349,6 +364,15 @@ class ClusterSettings:
     def set_observability_cluster_labels_callable(self, callable: Callable[[], Mapping[str, str]]) -> None:
         self.observability_instruments.get_cluster_labels_fn = callable
 
+    def get_hot_path_profiler(self) -> HotPathProfiler:
+        """Returns the cluster's hot path profiler, creating a disabled one (for per-operation profiling) if needed."""
+        instruments = self.observability_instruments
+        if instruments.hot_path_profiler is None:
+            with _HOT_PATH_PROFILER_LOCK:
+                if instruments.hot_path_profiler is None:
+                    instruments.hot_path_profiler = build_hot_path_profiler(instruments.meter)
+        return instruments.hot_path_profiler
+
     @classmethod
     def build_cluster_settings(cls,
                                connstr,  # type: str
@@ -370,12 +394,19 @@ class ClusterSettings:
         # options/kwargs), separate into cluster options, timeout options and tracing options and txns config.
 
         default_serializer = cluster_opts.pop('serializer', None)
-        if not default_serializer:
+        use_fastest_serializer = isinstance(default_serializer, str)
+        if use_fastest_serializer:
+            if default_serializer != 'fastest':
+                raise InvalidArgumentException(("Invalid serializer value provided.  "
+                                                "Expected a Serializer instance or 'fastest'."))
+            default_serializer = get_fastest_serializer()
+        elif not default_serializer:
             default_serializer = DefaultJsonSerializer()
 
         default_transcoder = cluster_opts.pop('transcoder', None)
         if not default_transcoder:
-            default_transcoder = JSONTranscoder()
+            # with serializer='fastest' KV operations also use the selected serializer
+            default_transcoder = JSONTranscoder(default_serializer) if use_fastest_serializer else JSONTranscoder()
 
         timeout_opts = build_timeout_options(cluster_opts)
         streaming_timeouts: StreamingTimeouts = {
@@ -387,6 +418,9 @@ class ClusterSettings:
         }
         tracing_opts, orphan_opts, tracer = build_tracing_and_orphan_options(cluster_opts)
         metrics_opts, meter = build_metrics_options(cluster_opts)
+        hot_path_profiler = None
+        if cluster_opts.pop('enable_hot_path_profiling', None) is True:
+            hot_path_profiler = build_hot_path_profiler(meter, enabled=True)
         transaction_cfg = cluster_opts.pop('transaction_config', TransactionConfig())
         cluster_opts['user_agent_extra'] = USER_AGENT_EXTRA
         return cls(connection_str,
@@ -405,4 +439,5 @@ class ClusterSettings:
                        tracer,
                        meter,
                        # allow ops can skip handler construction in no-op case
-                       is_noop=isinstance(tracer.tracer, NoOpTracer) and isinstance(meter, NoOpMeter)))
+                       is_noop=isinstance(tracer.tracer, NoOpTracer) and isinstance(meter, NoOpMeter),
+                       hot_path_profiler=hot_path_profiler))
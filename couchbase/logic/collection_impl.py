@@ -15,22 +15,37 @@
 
 from __future__ import annotations
 
+import queue
+from functools import partial
 from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
                     Iterable,
                     Iterator,
-                    Optional)
-
-from couchbase.exceptions import (ErrorMapper,
+                    Mapping,
+                    Optional,
+                    Tuple,
+                    Union)
+
+from couchbase.exceptions import (CouchbaseException,
+                                  DocumentNotFoundException,
+                                  ErrorMapper,
                                   InvalidArgumentException,
                                   UnAmbiguousTimeoutException)
 from couchbase.logic.collection_multi_req_builder import CollectionMultiRequestBuilder
+from couchbase.logic.collection_multi_types import KeyValueMultiChunkedRequest
 from couchbase.logic.collection_req_builder import CollectionRequestBuilder
 from couchbase.logic.collection_types import CollectionDetails
+from couchbase.logic.document_cache import DocumentCache, build_cas_lookup_request
+from couchbase.logic.encoding_pool import (cancel_encode_chunks,
+                                           merge_multi_results,
+                                           set_encoded_values)
+from couchbase.logic.kv_stream import keys_as_stream_items, stream_kv_ops
 from couchbase.logic.observability import ObservabilityInstruments, ObservableRequestHandler
+from couchbase.logic.operation_types import KeyValueOperationCode, KeyValueOperationType
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
 from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
+from couchbase.logic.single_flight import SingleFlight
 from couchbase.result import (CounterResult,
                               ExistsResult,
                               GetReplicaResult,
@@ -48,9 +63,13 @@ from couchbase.result import (CounterResult,
 from couchbase.transcoder import Transcoder
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from couchbase._utils import JSONType
     from couchbase.kv_range_scan import RangeScanRequest
     from couchbase.logic.collection_multi_types import KeyValueMultiRequest, KeyValueMultiWithTranscoderRequest
     from couchbase.logic.pycbc_core import pycbc_connection
+    from couchbase.options import GetOptions, UpsertOptions
     from couchbase.scope import Scope
 
 
@@ -65,6 +84,8 @@ class CollectionImpl:
                                                      self._scope._impl.cluster_settings.default_transcoder)
         self._multi_request_builder = CollectionMultiRequestBuilder(self._collection_details)
         self._request_builder = CollectionRequestBuilder(self._collection_details)
+        self._document_cache = None  # type: Optional[DocumentCache]
+        self._single_flight = None  # type: Optional[SingleFlight]
 
     @property
     def bucket_name(self) -> str:
@@ -107,28 +128,58 @@ class CollectionImpl:
         """**INTERNAL**"""
         return self._scope._impl.cluster_settings.observability_instruments
 
+    @property
+    def document_cache(self) -> Optional[DocumentCache]:
+        """**INTERNAL**"""
+        return self._document_cache
+
+    def enable_document_cache(self,
+                              max_entries: int,
+                              max_bytes: Optional[int] = None,
+                              ttl: Optional[timedelta] = None,
+                              revalidate: Optional[bool] = None) -> None:
+        """**INTERNAL**"""
+        cache = DocumentCache(max_entries,
+                              max_bytes=max_bytes,
+                              ttl=ttl,
+                              revalidate=revalidate,
+                              meter=self.observability_instruments.meter)
+        # the collection handle is shared, e.g. looked up again for every request, the cached documents are kept
+        if self._document_cache is None or not self._document_cache.has_same_settings(cache):
+            self._document_cache = cache
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        """**INTERNAL**"""
+        return self._single_flight
+
+    def enable_single_flight(self) -> None:
+        """**INTERNAL**"""
+        if self._single_flight is None:
+            self._single_flight = SingleFlight(meter=self.observability_instruments.meter)
+
     def append(self,
                req: PycbcCoreKeyValueRequest,
                obs_handler: ObservableRequestHandler) -> MutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
     def append_multi(self, req: KeyValueMultiRequest, obs_handler: ObservableRequestHandler) -> MultiMutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
     def decrement(self,
                   req: PycbcCoreKeyValueRequest,
                   obs_handler: ObservableRequestHandler) -> CounterResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return CounterResult(ret, key=req.key)
 
     def decrement_multi(self, req: KeyValueMultiRequest, obs_handler: ObservableRequestHandler) -> MultiCounterResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiCounterResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
     def exists(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> ExistsResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_read(req, obs_handler)
         return ExistsResult(ret, key=req.key)
 
     def exists_multi(self, req: KeyValueMultiRequest, obs_handler: ObservableRequestHandler) -> MultiExistsResult:
@@ -239,7 +290,7 @@ class CollectionImpl:
                         req: PycbcCoreKeyValueRequest,
                         transcoder: Transcoder,
                         obs_handler: ObservableRequestHandler) -> GetReplicaResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_read(req, obs_handler)
         return GetReplicaResult(ret, transcoder=transcoder, key=req.key)
 
     def get_any_replica_multi(self,
@@ -255,7 +306,11 @@ class CollectionImpl:
             req: PycbcCoreKeyValueRequest,
             transcoder: Transcoder,
             obs_handler: ObservableRequestHandler) -> GetResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        cache = self._document_cache
+        # projections and expiry are not cached
+        if cache is not None and req.opcode == KeyValueOperationCode.Get.value:
+            return self._get_through_cache(cache, req, transcoder, obs_handler)
+        ret = self._execute_read(req, obs_handler)
         return GetResult(ret, transcoder=transcoder, key=req.key)
 
     def get_multi(self,
@@ -270,30 +325,30 @@ class CollectionImpl:
     def increment(self,
                   req: PycbcCoreKeyValueRequest,
                   obs_handler: ObservableRequestHandler) -> CounterResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return CounterResult(ret, key=req.key)
 
     def increment_multi(self,
                         req: KeyValueMultiRequest,
                         obs_handler: ObservableRequestHandler) -> MultiCounterResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiCounterResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
     def insert(self,
                req: PycbcCoreKeyValueRequest,
                obs_handler: ObservableRequestHandler) -> MutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
     def insert_multi(self, req: KeyValueMultiRequest, obs_handler: ObservableRequestHandler) -> MultiMutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
     def lookup_in(self,
                   req: PycbcCoreKeyValueRequest,
                   transcoder: Transcoder,
                   obs_handler: ObservableRequestHandler) -> LookupInResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_read(req, obs_handler)
         return LookupInResult(ret, transcoder=transcoder, is_subdoc=True, key=req.key)
 
     def lookup_in_all_replicas(self,
@@ -329,18 +384,18 @@ class CollectionImpl:
     def mutate_in(self,
                   req: PycbcCoreKeyValueRequest,
                   obs_handler: ObservableRequestHandler) -> MutateInResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         transcoder = self._collection_details.default_transcoder
         return MutateInResult(ret, transcoder=transcoder, is_subdoc=True, key=req.key)
 
     def prepend(self,
                 req: PycbcCoreKeyValueRequest,
                 obs_handler: ObservableRequestHandler) -> MutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
     def prepend_multi(self, req: KeyValueMultiRequest, obs_handler: ObservableRequestHandler) -> MultiMutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
     def range_scan(self, req: RangeScanRequest) -> ScanResultIterable:
@@ -349,21 +404,21 @@ class CollectionImpl:
     def remove(self,
                req: PycbcCoreKeyValueRequest,
                obs_handler: ObservableRequestHandler) -> MutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
     def remove_multi(self, req: KeyValueMultiRequest, obs_handler: ObservableRequestHandler) -> MultiMutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
     def replace(self,
                 req: PycbcCoreKeyValueRequest,
                 obs_handler: ObservableRequestHandler) -> MutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
     def replace_multi(self, req: KeyValueMultiRequest, obs_handler: ObservableRequestHandler) -> MultiMutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
     def touch(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> MutationResult:
@@ -406,15 +461,207 @@ class CollectionImpl:
     def upsert(self,
                req: PycbcCoreKeyValueRequest,
                obs_handler: ObservableRequestHandler) -> MutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        ret = self._execute_mutation(req, obs_handler)
         return MutationResult(ret, key=req.key)
 
     def upsert_multi(self,
                      req: KeyValueMultiRequest,
                      obs_handler: ObservableRequestHandler) -> MultiMutationResult:
-        ret = self._client_adapter.execute_collection_request(req.opcode, req.request_list, obs_handler=obs_handler)
+        ret = self._execute_multi_mutation(req, obs_handler)
         return MultiMutationResult(ret, return_exceptions=req.return_exceptions, obs_handler=obs_handler)
 
+    def upsert_stream(self,
+                      keys_and_docs: Union[Iterable[Tuple[str, JSONType]], Mapping[str, JSONType]],
+                      window: int,
+                      *opts: UpsertOptions,
+                      **kwargs: Any) -> Iterator[Tuple[str, Union[MutationResult, CouchbaseException]]]:
+        def _submit(key, value, on_done):
+            obs_handler = ObservableRequestHandler.create_or_none(KeyValueOperationType.Upsert,
+                                                                  self.observability_instruments)
+
+            def _callback(ret):
+                self._invalidate_cached(key)
+                if obs_handler is not None:
+                    obs_handler.__exit__(None, None, None)
+                on_done(key, MutationResult(ret, key=key))
+
+            def _errback(exc):
+                self._invalidate_cached(key)
+                if obs_handler is not None:
+                    obs_handler.__exit__(type(exc), exc, exc.__traceback__)
+                on_done(key, exc)
+
+            try:
+                # the document is encoded here, just before the request is dispatched
+                req = self._request_builder.build_upsert_request(key, value, obs_handler, *opts, **kwargs)
+                self._client_adapter.submit_collection_request(req.opcode,
+                                                               req,
+                                                               _callback,
+                                                               _errback,
+                                                               obs_handler=obs_handler)
+            except CouchbaseException as ex:
+                _errback(ex)
+            except Exception as ex:
+                if obs_handler is not None:
+                    obs_handler.__exit__(type(ex), ex, ex.__traceback__)
+                raise
+
+        return stream_kv_ops(_submit, keys_and_docs, window)
+
+    def get_stream(self,  # noqa: C901
+                   keys: Iterable[str],
+                   window: int,
+                   *opts: GetOptions,
+                   **kwargs: Any) -> Iterator[Tuple[str, Union[GetResult, CouchbaseException]]]:
+        def _submit(key, _, on_done):
+            obs_handler = ObservableRequestHandler.create_or_none(KeyValueOperationType.Get,
+                                                                  self.observability_instruments)
+            fill_token = None
+
+            def _callback(ret):
+                if fill_token is not None:
+                    self._document_cache.put(key, ret, fill_token)
+                if obs_handler is not None:
+                    obs_handler.__exit__(None, None, None)
+                on_done(key, GetResult(ret, transcoder=transcoder, key=key))
+
+            def _errback(exc):
+                if obs_handler is not None:
+                    obs_handler.__exit__(type(exc), exc, exc.__traceback__)
+                on_done(key, exc)
+
+            try:
+                req, transcoder = self._request_builder.build_get_request(key, obs_handler, *opts, **kwargs)
+                cached, fill_token = self._lookup_cached_get(req, transcoder)
+                if cached is not None:
+                    if obs_handler is not None:
+                        obs_handler.__exit__(None, None, None)
+                    on_done(key, cached)
+                    return
+                self._client_adapter.submit_collection_request(req.opcode,
+                                                               req,
+                                                               _callback,
+                                                               _errback,
+                                                               obs_handler=obs_handler)
+            except CouchbaseException as ex:
+                _errback(ex)
+            except Exception as ex:
+                if obs_handler is not None:
+                    obs_handler.__exit__(type(ex), ex, ex.__traceback__)
+                raise
+
+        return stream_kv_ops(_submit, keys_as_stream_items(keys), window)
+
+    def _get_through_cache(self,
+                           cache: DocumentCache,
+                           req: PycbcCoreKeyValueRequest,
+                           transcoder: Transcoder,
+                           obs_handler: ObservableRequestHandler) -> GetResult:
+        entry = cache.lookup(req.key)
+        if entry is not None:
+            if not cache.revalidate or self._cached_cas_matches(req.key, entry.cas):
+                cache.record_hit()
+                return GetResult(entry.result, transcoder=transcoder, key=req.key)
+            cache.mark_stale(req.key)
+
+        token = cache.fill_token()
+        ret = self._execute_read(req, obs_handler)
+        cache.put(req.key, ret, token)
+        return GetResult(ret, transcoder=transcoder, key=req.key)
+
+    def _lookup_cached_get(self,
+                           req: PycbcCoreKeyValueRequest,
+                           transcoder: Transcoder) -> Tuple[Optional[GetResult], Optional[int]]:
+        """Returns the cached result of a get that does not need to be revalidated, or the token to cache the
+        result with once the get completes.  Neither when the get is not cached.
+        """
+        cache = self._document_cache
+        # projections and expiry are not cached
+        if cache is None or req.opcode != KeyValueOperationCode.Get.value:
+            return None, None
+        entry = cache.lookup(req.key)
+        # there is no blocking revalidation in a stream, an entry that needs revalidating is fetched again
+        if entry is not None and not cache.revalidate:
+            cache.record_hit()
+            return GetResult(entry.result, transcoder=transcoder, key=req.key), None
+        return None, cache.fill_token()
+
+    def _cached_cas_matches(self, key: str, cas: int) -> bool:
+        lookup_req = build_cas_lookup_request(self._request_builder, key)
+        try:
+            ret = self._client_adapter.execute_collection_request(lookup_req.opcode, lookup_req)
+        except DocumentNotFoundException:
+            # the get that follows raises the exception
+            return False
+        return ret.raw_result.get('cas', None) == cas
+
+    def _invalidate_cached(self, key: str) -> None:
+        if self._document_cache is not None:
+            self._document_cache.invalidate(key)
+        if self._single_flight is not None:
+            self._single_flight.forget(key)
+
+    def _invalidate_cached_keys(self, keys: Iterable[str]) -> None:
+        if self._document_cache is not None:
+            self._document_cache.invalidate_keys(keys)
+        if self._single_flight is not None:
+            self._single_flight.forget_keys(keys)
+
+    def _execute_read(self, req: PycbcCoreKeyValueRequest, obs_handler: Optional[ObservableRequestHandler]) -> Any:
+        single_flight = self._single_flight
+        if single_flight is not None and single_flight.accepts(req):
+            return single_flight.execute(req, partial(self._client_adapter.execute_collection_request,
+                                                      req.opcode,
+                                                      req,
+                                                      obs_handler=obs_handler))
+        return self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+
+    def _execute_mutation(self, req: PycbcCoreKeyValueRequest, obs_handler: ObservableRequestHandler) -> Any:
+        try:
+            return self._client_adapter.execute_collection_request(req.opcode, req, obs_handler=obs_handler)
+        finally:
+            # also on failure, an ambiguous failure might have mutated the document
+            self._invalidate_cached(req.key)
+
+    def _execute_multi_mutation(self,
+                                req: KeyValueMultiRequest,
+                                obs_handler: ObservableRequestHandler) -> Any:
+        try:
+            return self._dispatch_multi_mutation(req, obs_handler)
+        finally:
+            self._invalidate_cached_keys([r.key for r in req.request_list])
+
+    def _dispatch_multi_mutation(self,
+                                 req: KeyValueMultiRequest,
+                                 obs_handler: ObservableRequestHandler) -> Any:
+        if not isinstance(req, KeyValueMultiChunkedRequest):
+            return self._client_adapter.execute_collection_request(req.opcode,
+                                                                   req.request_list,
+                                                                   obs_handler=obs_handler)
+
+        # each chunk is dispatched as soon as it is encoded, while the encoding pool works on the next chunks
+        completed = queue.SimpleQueue()
+        dispatched = 0
+        chunk_exc = None
+        for requests, encoded in req.chunks:
+            try:
+                set_encoded_values(requests, encoded.result())
+                self._client_adapter.submit_collection_request(req.opcode,
+                                                               requests,
+                                                               completed.put_nowait,
+                                                               completed.put_nowait)
+            except Exception as ex:
+                chunk_exc = ex
+                cancel_encode_chunks(req.chunks)
+                break
+            dispatched += 1
+
+        # wait for the chunks already in flight before surfacing an encoding (or dispatch) error
+        results = [completed.get() for _ in range(dispatched)]
+        if chunk_exc is not None:
+            raise chunk_exc
+        return merge_multi_results(results, obs_handler=obs_handler)
+
     def _set_default_transcoder(self, transcoder: Transcoder) -> None:
         if not issubclass(transcoder.__class__, Transcoder):
             raise InvalidArgumentException('Cannot set default transcoder to non Transcoder type.')
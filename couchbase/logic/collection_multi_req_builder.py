@@ -28,8 +28,16 @@ from typing import (TYPE_CHECKING,
 from couchbase.constants import FMT_BYTES
 from couchbase.durability import DurabilityLevel
 from couchbase.exceptions import InvalidArgumentException
-from couchbase.logic.collection_multi_types import KeyValueMultiRequest, KeyValueMultiWithTranscoderRequest
+from couchbase.logic.collection_multi_types import (KeyValueMultiChunkedRequest,
+                                                    KeyValueMultiRequest,
+                                                    KeyValueMultiRequestList,
+                                                    KeyValueMultiWithTranscoderRequest,
+                                                    get_max_in_flight)
 from couchbase.logic.collection_types import CollectionDetails
+from couchbase.logic.encoding_pool import (MIN_ENCODE_CHUNK_SIZE,
+                                           get_encode_executor_kind,
+                                           get_encode_parallelism,
+                                           submit_encode_chunks)
 from couchbase.logic.observability import ObservableRequestHandler
 from couchbase.logic.operation_types import KeyValueMultiOperationCode
 from couchbase.logic.options import DeltaValueBase, SignedInt64Base
@@ -107,6 +115,11 @@ class CollectionMultiRequestBuilder:
             req.with_metrics = obs_handler.with_metrics
         return req
 
+    def _create_request_list(self, args: Dict[str, Any]) -> KeyValueMultiRequestList:
+        """**INTERNAL**"""
+        return KeyValueMultiRequestList(max_in_flight=get_max_in_flight(args.pop('max_in_flight', None)),
+                                        group_by_node=args.pop('group_by_node', False))
+
     def _get_delta_and_initial(self, args: Dict[str, Any]) -> Tuple[int, Optional[int]]:
         """**INTERNAL**"""
         initial = args.pop('initial', None)
@@ -154,7 +167,7 @@ class CollectionMultiRequestBuilder:
         return_exceptions = final_args.pop('return_exceptions', True)
         req_opcode = opcode.get_single_op_code()
 
-        requests = []
+        requests = self._create_request_list(final_args)
         for k, v in keys_and_docs.items():
             if isinstance(v, str):
                 value = v.encode('utf-8')
@@ -222,7 +235,7 @@ class CollectionMultiRequestBuilder:
         if global_initial is not None:
             final_args['initial_value'] = int(global_initial)
 
-        requests = []
+        requests = self._create_request_list(final_args)
         for k in keys:
             req = self._create_kv_request(req_opcode, k, obs_handler)
             if isinstance(durability, dict):
@@ -276,11 +289,16 @@ class CollectionMultiRequestBuilder:
 
         per_key_args = final_args.pop('per_key_options', None)
         return_exceptions = final_args.pop('return_exceptions', True)
+        encode_parallelism = get_encode_parallelism(final_args.pop('encode_parallelism', None))
+        encode_executor = get_encode_executor_kind(final_args.pop('encode_executor', None))
         req_opcode = opcode.get_single_op_code()
 
         transcoder = self._collection_dtls.get_request_transcoder(final_args)
+        # small batches are not worth handing to the encoding pool
+        encode_in_pool = encode_parallelism > 1 and len(keys_and_docs) > MIN_ENCODE_CHUNK_SIZE
 
-        requests = []
+        requests = self._create_request_list(final_args)
+        to_encode = []
         for key, value in keys_and_docs.items():
             req = self._create_kv_request(req_opcode, key, obs_handler)
             if isinstance(durability, dict):
@@ -293,22 +311,18 @@ class CollectionMultiRequestBuilder:
 
             if per_key_args and key in per_key_args:
                 key_transcoder: Transcoder = per_key_args[key].pop('transcoder', transcoder)
-                if not obs_handler or obs_handler.is_noop:
-                    transcoded_value, flags = key_transcoder.encode_value(value)
-                else:
-                    transcoded_value, flags = obs_handler.maybe_create_encoding_span(
-                        lambda tc=key_transcoder, v=value: tc.encode_value(v)
-                    )
             else:
-                if not obs_handler or obs_handler.is_noop:
-                    transcoded_value, flags = transcoder.encode_value(value)
-                else:
-                    transcoded_value, flags = obs_handler.maybe_create_encoding_span(
-                        lambda tc=transcoder, v=value: tc.encode_value(v)
-                    )
+                key_transcoder = transcoder
 
-            req.value = transcoded_value
-            req.flags = flags
+            if encode_in_pool:
+                # encoded on the pool, the value and flags are set once the request's chunk is encoded
+                to_encode.append((key_transcoder, value))
+            elif not obs_handler or obs_handler.is_noop:
+                req.value, req.flags = key_transcoder.encode_value(value)
+            else:
+                req.value, req.flags = obs_handler.maybe_create_encoding_span(
+                    lambda tc=key_transcoder, v=value: tc.encode_value(v)
+                )
 
             for arg_k, arg_v in final_args.items():
                 if arg_v is not None:
@@ -319,6 +333,9 @@ class CollectionMultiRequestBuilder:
                         setattr(req, arg_k, arg_v)
             requests.append(req)
 
+        if encode_in_pool:
+            chunks = submit_encode_chunks(requests, to_encode, encode_parallelism, encode_executor)
+            return KeyValueMultiChunkedRequest(opcode, requests, return_exceptions, chunks)
         return KeyValueMultiRequest(opcode, requests, return_exceptions)
 
     def _get_multi_op_non_value_req(self,  # noqa: C901
@@ -354,7 +371,7 @@ class CollectionMultiRequestBuilder:
         return_exceptions = final_args.pop('return_exceptions', True)
         req_opcode = opcode.get_single_op_code()
 
-        requests = []
+        requests = self._create_request_list(final_args)
         key_transcoders = {}
         for k in keys:
             req = self._create_kv_request(req_opcode, k, obs_handler)
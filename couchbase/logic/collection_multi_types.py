@@ -15,14 +15,57 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import (Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
 
+from couchbase.exceptions import InvalidArgumentException
 from couchbase.logic.operation_types import KeyValueMultiOperationCode
 from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
 from couchbase.transcoder import Transcoder
 
 
+def get_max_in_flight(max_in_flight: Optional[int]) -> int:
+    """**INTERNAL**"""
+    if max_in_flight is None:
+        return 0
+    if not isinstance(max_in_flight, int) or isinstance(max_in_flight, bool) or max_in_flight < 1:
+        raise InvalidArgumentException(message='Expected max_in_flight to be an int greater than 0.')
+    return max_in_flight
+
+
+class KeyValueMultiRequestList(list):
+    """**INTERNAL**
+
+    The requests of a multi operation as handed to the binding, along with the settings of the binding's
+    dispatcher (see the max_in_flight and group_by_node multi options).  A max_in_flight of 0 means every
+    request is dispatched at once.
+    """
+
+    def __init__(self,
+                 requests: Iterable[PycbcCoreKeyValueRequest] = (),
+                 max_in_flight: int = 0,
+                 group_by_node: bool = False) -> None:
+        super().__init__(requests)
+        self.max_in_flight = max_in_flight
+        self.group_by_node = group_by_node
+
+    def chunk(self, start: int, stop: int, num_chunks: int) -> KeyValueMultiRequestList:
+        """**INTERNAL**
+
+        Returns the requests[start:stop] chunk of a multi operation dispatched in num_chunks chunks.  The chunks
+        are in flight at the same time, so the window is split between them.
+        """
+        max_in_flight = self.max_in_flight
+        if max_in_flight > 0:
+            max_in_flight = max(1, max_in_flight // num_chunks)
+        return KeyValueMultiRequestList(self[start:stop], max_in_flight, self.group_by_node)
+
+
 @dataclass
 class KeyValueMultiRequest:
     opcode: KeyValueMultiOperationCode
@@ -33,3 +76,9 @@ class KeyValueMultiRequest:
 @dataclass
 class KeyValueMultiWithTranscoderRequest(KeyValueMultiRequest):
     key_transcoders: Dict[str, Transcoder]
+
+
+@dataclass
+class KeyValueMultiChunkedRequest(KeyValueMultiRequest):
+    # the requests of each chunk along with the future for the chunk's encoded (value, flags) pairs
+    chunks: List[Tuple[List[PycbcCoreKeyValueRequest], Future]]
@@ -52,6 +52,7 @@ from couchbase.transcoder import Transcoder
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
 
+    from acouchbase.logic.streaming_executor import StreamingExecutor
     from couchbase._utils import JSONType
     from couchbase.logic.pycbc_core import pycbc_connection
     from couchbase.subdocument import Spec
@@ -271,6 +272,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_get_and_lock_request(self,
@@ -292,6 +295,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_get_and_touch_request(self,
@@ -313,6 +318,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_get_any_replica_request(self,
@@ -331,6 +338,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_get_request(self,
@@ -359,6 +368,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_increment_request(self,
@@ -450,6 +461,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_lookup_in_any_replica_request(self,
@@ -473,6 +486,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_lookup_in_request(self,
@@ -496,6 +511,8 @@ class CollectionRequestBuilder:
         for k, v in final_args.items():
             if v is not None:
                 setattr(req, k, v)
+        if obs_handler:
+            transcoder = obs_handler.maybe_time_decoding(transcoder)
         return req, transcoder
 
     def build_mutate_in_request(self,  # noqa: C901
@@ -616,14 +633,17 @@ class CollectionRequestBuilder:
         if 'concurrency' in orchestrator_opts and orchestrator_opts['concurrency'] < 1:
             raise InvalidArgumentException('Concurrency option must be positive')
 
+        if 'rows_per_fetch' in orchestrator_opts and orchestrator_opts['rows_per_fetch'] < 1:
+            raise InvalidArgumentException('rows_per_fetch option must be positive')
+
         consistent_with = orchestrator_opts.pop('consistent_with', None)
-        if consistent_with:
-            if not (isinstance(consistent_with, MutationState) and len(consistent_with._sv) > 0):
+        if consistent_with is not None:
+            if not (isinstance(consistent_with, MutationState) and len(consistent_with) > 0):
                 raise InvalidArgumentException('Passed empty or invalid mutation state')
             else:
                 # The C++ binding expects a mutation_state dict ({'tokens': [...]}), not a bare list.
                 orchestrator_opts['consistent_with'] = {
-                    'tokens': list(token.as_dict() for token in consistent_with._sv)
+                    'tokens': consistent_with._as_token_dicts()
                 }
 
     def _get_scan_config(self, scan_type: ScanType) -> Dict[str, Any]:  # noqa: C901
@@ -675,6 +695,7 @@ class CollectionRequestBuilder:
                                        connection: pycbc_connection,
                                        scan_type: ScanType,
                                        *opts: object,
+                                       streaming_executor: Optional[StreamingExecutor] = None,
                                        **kwargs: object) -> AsyncRangeScanRequest:
         if not self._loop:
             raise RuntimeError('Cannot create a range scan request if an event loop is not running.')
@@ -692,7 +713,7 @@ class CollectionRequestBuilder:
             'scan_config': scan_config,
             'orchestrator_options': orchestrator_opts,
         })
-        return AsyncRangeScanRequest(connection, self._loop, **scan_args)
+        return AsyncRangeScanRequest(connection, self._loop, streaming_executor=streaming_executor, **scan_args)
 
     def build_remove_request(self,
                              key: str,
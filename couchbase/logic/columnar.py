@@ -0,0 +1,245 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import (TYPE_CHECKING,
+                    Any,
+                    AsyncIterable,
+                    AsyncIterator,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional)
+
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.serializer import Serializer
+
+# Optional columnar backend (only available if installed)
+try:
+    import pyarrow
+    import pyarrow.json as pyarrow_json
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+if TYPE_CHECKING:
+    from couchbase.result import ScanResult
+
+# Rows parsed into each record batch, unless the caller provides batch_rows
+DEFAULT_BATCH_ROWS = 10000
+
+# Column holding the document ids of a scan
+DEFAULT_SCAN_ID_COLUMN = 'meta_id'
+
+# Parsing block size lower bound, a row must fit in a single block
+_MIN_BLOCK_SIZE = 1 << 20
+
+
+class RawRowSerializer(Serializer):
+    """**INTERNAL**
+
+    Passes the JSON encoded rows of a streaming request through, so they can be parsed into columns.
+    """
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+        raise InvalidArgumentException('The raw row serializer only passes JSON encoded rows through, it cannot '
+                                       'serialize values.')
+
+    def deserialize(self,
+                    value  # type: bytes
+                    ) -> bytes:
+        return value
+
+
+def use_raw_rows(request: Any) -> Any:
+    """**INTERNAL**
+
+    Has a query or analytics request return its rows JSON encoded, instead of deserialized.
+    """
+    request._serializer = RawRowSerializer()
+    return request
+
+
+class RecordBatchBuilder:
+    """**INTERNAL**
+
+    Collects JSON encoded rows and parses them, ``batch_rows`` at a time, straight into an Arrow record batch, so
+    rows are never deserialized into Python objects.  Rows that are not JSON objects (e.g. a ``SELECT RAW`` query)
+    are put in a ``value`` column.
+
+    Without a schema, the schema is inferred from the first batch and later batches must match it (an error is
+    raised on new fields or conflicting types).  With a schema, fields that are not part of it are ignored.
+    """
+
+    def __init__(self,
+                 batch_rows: Optional[int] = None,
+                 schema: Optional[pyarrow.Schema] = None) -> None:
+        if not HAS_PYARROW:
+            raise ImportError('pyarrow is not installed. Please install with: pip install couchbase[arrow]')
+        if batch_rows is None:
+            batch_rows = DEFAULT_BATCH_ROWS
+        if not isinstance(batch_rows, int) or isinstance(batch_rows, bool) or batch_rows < 1:
+            raise InvalidArgumentException('Expected batch_rows to be an int greater than 0.')
+        if schema is not None and not isinstance(schema, pyarrow.Schema):
+            raise InvalidArgumentException('Expected schema to be a pyarrow.Schema.')
+        self._batch_rows = batch_rows
+        self._schema = schema
+        self._ignore_unexpected = schema is not None
+        self._rows = []  # type: List[bytes]
+
+    @property
+    def schema(self) -> Optional[pyarrow.Schema]:
+        """**INTERNAL**
+
+        The schema of the record batches, once known.
+        """
+        return self._schema
+
+    def add(self, row: bytes) -> Optional[pyarrow.RecordBatch]:
+        """**INTERNAL**
+
+        Adds a row, returns the record batch once ``batch_rows`` rows have been added.
+        """
+        self._rows.append(row)
+        if len(self._rows) >= self._batch_rows:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[pyarrow.RecordBatch]:
+        """**INTERNAL**
+
+        Returns the record batch of the rows added since the last batch, if any.
+        """
+        if not self._rows:
+            return None
+        rows, self._rows = self._rows, []
+        return self._to_batch(self._parse(rows))
+
+    def _to_batch(self, table: pyarrow.Table) -> pyarrow.RecordBatch:
+        batches = table.combine_chunks().to_batches()
+        if not batches:
+            return pyarrow.RecordBatch.from_pylist([], schema=table.schema)
+        return batches[0]
+
+    def _parse(self, rows: List[bytes]) -> pyarrow.Table:
+        data = b'\n'.join(_as_object(bytes(row)) for row in rows)
+        parse_options = pyarrow_json.ParseOptions(
+            explicit_schema=self._schema,
+            newlines_in_values=True,
+            unexpected_field_behavior='ignore' if self._ignore_unexpected else 'error'
+        )
+        read_options = pyarrow_json.ReadOptions(block_size=max(len(data) + 1, _MIN_BLOCK_SIZE))
+        table = pyarrow_json.read_json(BytesIO(data), read_options=read_options, parse_options=parse_options)
+        if self._schema is None:
+            self._schema = table.schema
+        return table
+
+
+class ScanRecordBatchBuilder(RecordBatchBuilder):
+    """**INTERNAL**
+
+    Builds record batches from the results of a range scan: the document ids, in ``id_column``, followed by the
+    (JSON) documents' fields.  A scan that only returns ids only has the ``id_column``.
+    """
+
+    def __init__(self,
+                 batch_rows: Optional[int] = None,
+                 schema: Optional[pyarrow.Schema] = None,
+                 id_column: Optional[str] = None) -> None:
+        super().__init__(batch_rows, schema)
+        if id_column is None:
+            id_column = DEFAULT_SCAN_ID_COLUMN
+        if not isinstance(id_column, str):
+            raise InvalidArgumentException('Expected id_column to be a str.')
+        self._id_column = id_column
+        if schema is not None and id_column in schema.names:
+            # the ids are not part of the documents
+            self._schema = pyarrow.schema([f for f in schema if f.name != id_column], metadata=schema.metadata)
+        self._ids = []  # type: List[str]
+        self._ids_only = False
+
+    def add(self, res: ScanResult) -> Optional[pyarrow.RecordBatch]:
+        """**INTERNAL**"""
+        self._ids.append(res.id)
+        if res.ids_only:
+            self._ids_only = True
+            self._rows.append(b'')
+        else:
+            value, _ = res._encoded_value()
+            self._rows.append(value if value is not None else b'null')
+        if len(self._rows) >= self._batch_rows:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[pyarrow.RecordBatch]:
+        """**INTERNAL**"""
+        if not self._rows:
+            return None
+        rows, self._rows = self._rows, []
+        ids, self._ids = self._ids, []
+        id_array = pyarrow.array(ids, type=pyarrow.string())
+        if self._ids_only:
+            return pyarrow.RecordBatch.from_arrays([id_array], names=[self._id_column])
+        return self._to_batch(self._parse(rows).add_column(0, self._id_column, id_array))
+
+
+def _as_object(row: bytes) -> bytes:
+    if row.lstrip()[:1] == b'{':
+        return row
+    return b'{"value":' + row + b'}'
+
+
+def iter_record_batches(builder: RecordBatchBuilder, rows: Iterable[Any]) -> Iterator[pyarrow.RecordBatch]:
+    """**INTERNAL**"""
+    for row in rows:
+        batch = builder.add(row)
+        if batch is not None:
+            yield batch
+    batch = builder.flush()
+    if batch is not None:
+        yield batch
+
+
+async def aiter_record_batches(builder: RecordBatchBuilder,
+                               rows: AsyncIterable[Any]) -> AsyncIterator[pyarrow.RecordBatch]:
+    """**INTERNAL**"""
+    async for row in rows:
+        batch = builder.add(row)
+        if batch is not None:
+            yield batch
+    batch = builder.flush()
+    if batch is not None:
+        yield batch
+
+
+def to_table(builder: RecordBatchBuilder, rows: Iterable[Any]) -> pyarrow.Table:
+    """**INTERNAL**"""
+    return _batches_to_table(builder, list(iter_record_batches(builder, rows)))
+
+
+async def ato_table(builder: RecordBatchBuilder, rows: AsyncIterable[Any]) -> pyarrow.Table:
+    """**INTERNAL**"""
+    return _batches_to_table(builder, [batch async for batch in aiter_record_batches(builder, rows)])
+
+
+def _batches_to_table(builder: RecordBatchBuilder, batches: List[pyarrow.RecordBatch]) -> pyarrow.Table:
+    if not batches:
+        schema = builder.schema if builder.schema is not None else pyarrow.schema([])
+        return pyarrow.Table.from_batches([], schema=schema)
+    return pyarrow.Table.from_batches(batches)
@@ -0,0 +1,133 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import timedelta
+from typing import (TYPE_CHECKING,
+                    Any,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.subdocument import Spec, count
+from couchbase.subdocument import get as subdoc_get
+from couchbase.subdocument import parse_subdocument_content_as, remove
+
+if TYPE_CHECKING:
+    from couchbase.result import LookupInResult
+
+# The KV service allows at most 16 specs in a single lookup_in/mutate_in
+MAX_SUBDOC_SPECS = 16
+
+DEFAULT_DATASTRUCTURE_TIMEOUT = timedelta(seconds=10)
+
+# CAS retry delays, the delay ceiling doubles per attempt up to the max
+CAS_RETRY_INITIAL_DELAY = 0.005
+CAS_RETRY_MAX_DELAY = 1.0
+
+
+class CasRetryBackoff:
+    """**INTERNAL**
+
+    Jittered exponential backoff for the CAS retries of the datastructures' read-modify-write operations.
+
+    Each delay is drawn uniformly from ``[0, min(max_delay, initial_delay * 2**attempt)]`` so clients contending for
+    the same document spread their retries out instead of retrying in lockstep.  No delay extends past the timeout.
+    """
+
+    def __init__(self,
+                 timeout: Optional[timedelta] = None,
+                 initial_delay: float = CAS_RETRY_INITIAL_DELAY,
+                 max_delay: float = CAS_RETRY_MAX_DELAY) -> None:
+        if timeout is None:
+            timeout = DEFAULT_DATASTRUCTURE_TIMEOUT
+        self._deadline = time.monotonic() + timeout.total_seconds()
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._attempt = 0
+
+    def next_delay(self) -> Optional[float]:
+        """**INTERNAL**
+
+        Returns the number of seconds to wait before the next attempt, or ``None`` once the timeout has elapsed.
+        """
+        time_left = self._deadline - time.monotonic()
+        if time_left <= 0:
+            return None
+        ceiling = self._max_delay
+        if self._initial_delay * (1 << self._attempt) < ceiling:
+            ceiling = self._initial_delay * (1 << self._attempt)
+            self._attempt += 1
+        return min(random.uniform(0, ceiling), time_left)
+
+
+def validate_item_count(name: str, value: Any, max_value: Optional[int] = None) -> int:
+    """**INTERNAL**"""
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise InvalidArgumentException(message=f'Expected {name} to be an int greater than 0.')
+    if max_value is not None and value > max_value:
+        raise InvalidArgumentException(message=f'Expected {name} to be at most {max_value}.')
+    return value
+
+
+def build_pop_lookup_specs(n: int) -> Tuple[Spec, ...]:
+    """**INTERNAL**
+
+    Specs reading the queue's size and its last (i.e. front) ``n`` items, at most ``MAX_SUBDOC_SPECS - 1``.
+    """
+    n = min(n, MAX_SUBDOC_SPECS - 1)
+    return (count(''),) + tuple(subdoc_get(f'[-{idx}]') for idx in range(1, n + 1))
+
+
+def parse_popped_values(key: str, sd_res: LookupInResult) -> List[Any]:
+    """**INTERNAL**
+
+    The values read by the specs from :func:`build_pop_lookup_specs`, in pop order.
+    """
+    size = parse_subdocument_content_as(sd_res.value, 0, key)
+    return [entry.get('value', None) for entry in sd_res.value[1:size + 1]]
+
+
+def build_pop_remove_specs(n: int) -> Tuple[Spec, ...]:
+    """**INTERNAL**
+
+    Specs removing the queue's last (i.e. front) ``n`` items.
+    """
+    return tuple(remove('[-1]') for _ in range(n))
+
+
+def build_page_lookup_specs(start: int, page_size: int) -> Tuple[Spec, ...]:
+    """**INTERNAL**
+
+    Specs reading the list's items from index ``start`` to ``start + page_size - 1``.
+    """
+    return tuple(subdoc_get(f'[{idx}]') for idx in range(start, start + page_size))
+
+
+def parse_page_values(sd_res: LookupInResult) -> List[Any]:
+    """**INTERNAL**
+
+    The values read by the specs from :func:`build_page_lookup_specs`, up to the end of the list.
+    """
+    values = []
+    for entry in sd_res.value:
+        if entry.get('status', None) != 0:
+            break
+        values.append(entry.get('value', None))
+    return values
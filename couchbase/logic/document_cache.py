@@ -0,0 +1,220 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import (TYPE_CHECKING,
+                    Iterable,
+                    Optional)
+
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.observability.logging_meter import LoggingMeter
+from couchbase.subdocument import LookupInMacro
+from couchbase.subdocument import get as subdoc_get
+
+if TYPE_CHECKING:
+    from couchbase.logic.collection_req_builder import CollectionRequestBuilder
+    from couchbase.logic.observability.observability_types import MeterProtocol
+    from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
+    from couchbase.logic.pycbc_core import pycbc_result
+
+# Counter names reported by the LoggingMeter
+DOCUMENT_CACHE_HITS = 'document_cache.hits'
+DOCUMENT_CACHE_MISSES = 'document_cache.misses'
+DOCUMENT_CACHE_EVICTIONS = 'document_cache.evictions'
+
+
+class DocumentCacheEntry:
+    """**INTERNAL**"""
+    __slots__ = ('result', 'cas', 'size', 'expires_at')
+
+    def __init__(self, result: pycbc_result, cas: int, size: int, expires_at: Optional[float]) -> None:
+        self.result = result
+        self.cas = cas
+        self.size = size
+        self.expires_at = expires_at
+
+
+class DocumentCache:
+    """**INTERNAL**
+
+    Thread-safe, read-through cache of the get results of a collection, bounded by a number of entries and
+    (optionally) by the total size of the cached document bodies.  The least recently used entries are evicted
+    first.
+
+    The binding's result is cached as returned by the server (encoded value, flags and CAS), so every hit
+    builds a new :class:`~couchbase.result.GetResult` and decodes with the transcoder of the request.  An
+    entry is invalidated by any mutation made through the collection.  Invalidating also bumps an epoch and
+    a get that was dispatched before the epoch changed does not fill the cache, so an in-flight get can't
+    cache a document that a concurrent mutation has since changed.
+    """
+
+    def __init__(self,
+                 max_entries: int,
+                 max_bytes: Optional[int] = None,
+                 ttl: Optional[timedelta] = None,
+                 revalidate: Optional[bool] = None,
+                 meter: Optional[MeterProtocol] = None) -> None:
+        if not isinstance(max_entries, int) or isinstance(max_entries, bool) or max_entries < 1:
+            raise InvalidArgumentException(message='Expected max_entries to be an int greater than 0.')
+        if max_bytes is not None and (not isinstance(max_bytes, int)
+                                      or isinstance(max_bytes, bool)
+                                      or max_bytes < 1):
+            raise InvalidArgumentException(message='Expected max_bytes to be an int greater than 0.')
+        if ttl is not None and (not isinstance(ttl, timedelta) or ttl.total_seconds() <= 0):
+            raise InvalidArgumentException(message='Expected ttl to be a positive timedelta.')
+        if revalidate is not None and not isinstance(revalidate, bool):
+            raise InvalidArgumentException(message='Expected revalidate to be a bool.')
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl.total_seconds() if ttl is not None else None
+        self._revalidate = revalidate is True
+        self._entries = OrderedDict()  # type: OrderedDict[str, DocumentCacheEntry]
+        self._size = 0
+        self._epoch = 0
+        self._lock = threading.Lock()
+        # the hit/miss/eviction counters are only reported by the LoggingMeter
+        if isinstance(meter, LoggingMeter):
+            self._hits = meter.counter(DOCUMENT_CACHE_HITS)
+            self._misses = meter.counter(DOCUMENT_CACHE_MISSES)
+            self._evictions = meter.counter(DOCUMENT_CACHE_EVICTIONS)
+        else:
+            self._hits = self._misses = self._evictions = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def revalidate(self) -> bool:
+        """**INTERNAL**"""
+        return self._revalidate
+
+    @property
+    def size(self) -> int:
+        """**INTERNAL**
+
+        The total size, in bytes, of the cached document bodies.
+        """
+        return self._size
+
+    def has_same_settings(self, other: DocumentCache) -> bool:
+        """**INTERNAL**"""
+        return ((self._max_entries, self._max_bytes, self._ttl, self._revalidate)
+                == (other._max_entries, other._max_bytes, other._ttl, other._revalidate))
+
+    def fill_token(self) -> int:
+        """**INTERNAL**
+
+        Returns the token to pass to :meth:`put` once the get, dispatched after this call, completes.
+        """
+        return self._epoch
+
+    def lookup(self, key: str) -> Optional[DocumentCacheEntry]:
+        """**INTERNAL**
+
+        Returns the entry for the key, if it is cached and has not expired.  A missing entry is counted as a miss,
+        the caller records the hit (see :meth:`record_hit`) once it trusts the entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None and self._misses is not None:
+            self._misses.add()
+        return entry
+
+    def record_hit(self) -> None:
+        """**INTERNAL**"""
+        if self._hits is not None:
+            self._hits.add()
+
+    def mark_stale(self, key: str) -> None:
+        """**INTERNAL**
+
+        Drops an entry that failed revalidation, counted as a miss.
+        """
+        self.invalidate(key)
+        if self._misses is not None:
+            self._misses.add()
+
+    def put(self, key: str, result: pycbc_result, token: int) -> None:
+        """**INTERNAL**
+
+        Caches the binding's result of a get, unless the cache was invalidated since the token was taken or
+        the document alone is larger than the cache.
+        """
+        raw = result.raw_result
+        value = raw.get('value', None)
+        size = len(value) if value is not None else 0
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        evicted = 0
+        with self._lock:
+            if token != self._epoch:
+                return
+            self._remove(key)
+            self._entries[key] = DocumentCacheEntry(result, raw.get('cas', 0), size, expires_at)
+            self._size += size
+            while (len(self._entries) > self._max_entries
+                   or (self._max_bytes is not None and self._size > self._max_bytes)):
+                _, entry = self._entries.popitem(last=False)
+                self._size -= entry.size
+                evicted += 1
+        if evicted and self._evictions is not None:
+            self._evictions.add(evicted)
+
+    def invalidate(self, key: str) -> None:
+        """**INTERNAL**"""
+        with self._lock:
+            self._epoch += 1
+            self._remove(key)
+
+    def invalidate_keys(self, keys: Iterable[str]) -> None:
+        """**INTERNAL**"""
+        with self._lock:
+            self._epoch += 1
+            for key in keys:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """**INTERNAL**"""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+
+def build_cas_lookup_request(request_builder: CollectionRequestBuilder, key: str) -> PycbcCoreKeyValueRequest:
+    """**INTERNAL**
+
+    Builds the lookup_in request used to revalidate a cached entry, it only fetches the document's CAS (via the
+    ``$document.CAS`` virtual xattr) so the document body is not sent again.
+    """
+    req, _ = request_builder.build_lookup_in_request(key, (subdoc_get(LookupInMacro.cas(), xattr=True),), None)
+    return req
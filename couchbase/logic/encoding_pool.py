@@ -0,0 +1,205 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import (Executor,
+                                Future,
+                                ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import ErrorMapper, InvalidArgumentException
+from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
+from couchbase.logic.pycbc_core import pycbc_result
+
+if TYPE_CHECKING:
+    from couchbase.logic.collection_multi_types import KeyValueMultiRequestList
+    from couchbase.logic.observability import ObservableRequestHandler
+    from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
+    from couchbase.transcoder import Transcoder
+
+# Multi mutation operations (insert_multi, replace_multi and upsert_multi) can encode their documents in
+# chunks on a shared pool (see the encode_parallelism option).  Each chunk is dispatched to the C++ core
+# as soon as it is encoded, so the first keys are in flight while the later chunks are still being encoded.
+#
+# A 'thread' pool only speeds up serializers that release the GIL, a 'process' pool works for any picklable
+# transcoder but pays for pickling the documents to, and the encoded values back from, the worker processes.
+
+ENCODE_EXECUTOR_KINDS = ('thread', 'process')
+DEFAULT_ENCODE_EXECUTOR = 'thread'
+# Each worker gets a few chunks so the first chunks can be dispatched early.
+CHUNKS_PER_WORKER = 4
+# Below this many documents per chunk, handing the chunk to a pool costs more than encoding it.
+MIN_ENCODE_CHUNK_SIZE = 32
+
+EncodeChunk = Tuple[List['PycbcCoreKeyValueRequest'], 'Future[List[Tuple[bytes, int]]]']
+
+_executors = {}  # type: Dict[Tuple[str, int], Executor]
+_executors_lock = threading.Lock()
+
+
+def get_encode_parallelism(parallelism: Optional[int]) -> int:
+    """**INTERNAL**"""
+    if parallelism is None:
+        return 1
+    if not isinstance(parallelism, int) or isinstance(parallelism, bool) or parallelism < 1:
+        raise InvalidArgumentException(message='Expected encode_parallelism to be an int greater than 0.')
+    return parallelism
+
+
+def get_encode_executor_kind(kind: Optional[str]) -> str:
+    """**INTERNAL**"""
+    if kind is None:
+        return DEFAULT_ENCODE_EXECUTOR
+    if kind not in ENCODE_EXECUTOR_KINDS:
+        raise InvalidArgumentException(message=('Expected encode_executor to be one of '
+                                                f'{", ".join(ENCODE_EXECUTOR_KINDS)}.'))
+    return kind
+
+
+def get_encode_executor(kind: str, workers: int) -> Executor:
+    """**INTERNAL**
+
+    Returns the shared pool for the provided kind and number of workers, the pool is created on first use.
+    """
+    key = (kind, workers)
+    with _executors_lock:
+        executor = _executors.get(key, None)
+        if executor is None:
+            if kind == 'process':
+                executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pycbc-encode')
+            _executors[key] = executor
+        return executor
+
+
+def shutdown_encode_executors() -> None:
+    """**INTERNAL**"""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+def get_encode_chunk_size(num_docs: int, parallelism: int) -> int:
+    """**INTERNAL**"""
+    return max(MIN_ENCODE_CHUNK_SIZE, -(-num_docs // (parallelism * CHUNKS_PER_WORKER)))
+
+
+def encode_values(transcoders_and_values: List[Tuple[Transcoder, Any]]) -> List[Tuple[bytes, int]]:
+    """**INTERNAL**
+
+    Encodes a chunk on a pool worker.  Module level so it can be pickled for a process pool.
+    """
+    return [transcoder.encode_value(value) for transcoder, value in transcoders_and_values]
+
+
+def submit_encode_chunks(requests: KeyValueMultiRequestList,
+                         transcoders_and_values: List[Tuple[Transcoder, Any]],
+                         parallelism: int,
+                         kind: str) -> List[EncodeChunk]:
+    """**INTERNAL**
+
+    Splits the requests, and the (transcoder, value) pairs to encode for them, into chunks and submits
+    the encoding of each chunk to the shared pool.
+
+    Returns:
+        List[Tuple[List[pycbc_kv_request], Future]]: The requests of each chunk along with the future for
+        the chunk's encoded (value, flags) pairs, in submission order.
+    """
+    executor = get_encode_executor(kind, parallelism)
+    chunk_size = get_encode_chunk_size(len(requests), parallelism)
+    num_chunks = -(-len(requests) // chunk_size)
+    chunks = []
+    for i in range(0, len(requests), chunk_size):
+        chunks.append((requests.chunk(i, i + chunk_size, num_chunks),
+                       executor.submit(encode_values, transcoders_and_values[i:i + chunk_size])))
+    return chunks
+
+
+def cancel_encode_chunks(chunks: List[EncodeChunk]) -> None:
+    """**INTERNAL**"""
+    for _, encoded in chunks:
+        encoded.cancel()
+
+
+def set_encoded_values(requests: List[PycbcCoreKeyValueRequest],
+                       encoded: List[Tuple[bytes, int]]) -> None:
+    """**INTERNAL**"""
+    for req, (value, flags) in zip(requests, encoded):
+        req.value = value
+        req.flags = flags
+
+
+def merge_multi_results(results: List[Any],
+                        obs_handler: Optional[ObservableRequestHandler] = None) -> pycbc_result:
+    """**INTERNAL**
+
+    Merges the multi results of the dispatched chunks into a single result.  If a chunk failed as a whole,
+    the first such exception is raised once every chunk's
+    result has been processed.
+    """
+    merged = pycbc_result()
+    all_okay = True
+    error = None
+    dispatch_stats = None
+    for res in results:
+        # pycbc_result and pycbc_exception have a core_span member
+        if obs_handler and hasattr(res, 'core_span'):
+            obs_handler.process_core_span(res.core_span)
+        if isinstance(res, PycbcCoreException):
+            res = ErrorMapper.build_exception(res)
+        if isinstance(res, BaseException):
+            error = error or res
+            continue
+        all_okay = res.raw_result.get('all_okay', False) and all_okay
+        # the chunk's all_okay is overwritten once every chunk is merged
+        merged.raw_result.update(res.raw_result)
+        chunk_stats = getattr(res, 'dispatch_stats', None)
+        if chunk_stats is not None:
+            dispatch_stats = merge_dispatch_stats(dispatch_stats or {}, chunk_stats)
+    if error is not None:
+        raise error
+    merged.raw_result['all_okay'] = all_okay
+    merged.dispatch_stats = dispatch_stats
+    return merged
+
+
+def merge_dispatch_stats(merged: Dict[str, Dict[str, int]],
+                         chunk_stats: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """**INTERNAL**
+
+    Merges the per-node dispatch stats of a chunk into the stats of the chunks merged so far.  The chunks are
+    in flight at the same time, so the peak in flight requests (and the elapsed time) of a node is approximated
+    by the sum (and the maximum) across chunks.
+    """
+    for node, stats in chunk_stats.items():
+        node_stats = merged.get(node, None)
+        if node_stats is None:
+            merged[node] = dict(stats)
+            continue
+        node_stats['dispatched'] += stats['dispatched']
+        node_stats['peak_in_flight'] += stats['peak_in_flight']
+        node_stats['elapsed_us'] = max(node_stats['elapsed_us'], stats['elapsed_us'])
+    return merged
@@ -0,0 +1,80 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import threading
+from typing import (Callable,
+                    Dict,
+                    Optional,
+                    Tuple,
+                    TypeVar,
+                    Union)
+
+T = TypeVar('T')
+
+# (bucket_name,), (bucket_name, scope_name) or (bucket_name, scope_name, collection_name)
+HandleKey = Union[Tuple[str], Tuple[str, str], Tuple[str, str, str]]
+
+
+class HandleCache:
+    """**INTERNAL**
+
+    Thread-safe cache of the bucket, scope and collection handles of a cluster.  A handle is created once
+    per key and every later lookup returns the same instance, so the bucket is not reopened and the request
+    builders are not rebuilt.  The handles of a bucket are dropped when the bucket is closed (or is not
+    found anymore) and all handles are dropped when the cluster is closed.
+    """
+
+    def __init__(self) -> None:
+        self._handles = {}  # type: Dict[HandleKey, object]
+        # reentrant, creating a handle may look up its parent handle
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def get_or_create(self, key: HandleKey, create: Callable[[], T]) -> T:
+        """**INTERNAL**
+
+        Returns the cached handle for the key, the handle is created (once) if it is not cached.  If creating the
+        handle raises, nothing is cached.
+        """
+        # lock-free for the common case, a dict lookup is atomic
+        handle = self._handles.get(key, None)
+        if handle is not None:
+            return handle
+        with self._lock:
+            handle = self._handles.get(key, None)
+            if handle is None:
+                handle = create()
+                self._handles[key] = handle
+            return handle
+
+    def invalidate(self, bucket_name: Optional[str]) -> None:
+        """**INTERNAL**
+
+        Drops the bucket's handle along with the handles of its scopes and collections.
+        """
+        if bucket_name is None:
+            return
+        with self._lock:
+            for key in [k for k in self._handles if k[0] == bucket_name]:
+                del self._handles[key]
+
+    def clear(self) -> None:
+        """**INTERNAL**"""
+        with self._lock:
+            self._handles.clear()
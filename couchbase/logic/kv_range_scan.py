@@ -15,14 +15,21 @@
 
 from __future__ import annotations
 
+import json
 from abc import ABC
 from typing import (TYPE_CHECKING,
                     Any,
-                    Optional)
-
-from couchbase.exceptions import ErrorMapper, InvalidArgumentException
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import (ErrorMapper,
+                                  InvalidArgumentException,
+                                  RangeScanCompletedException)
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
-from couchbase.result import ScanResult
+from couchbase.logic.streaming import RowBuffer
+from couchbase.result import ScanResult, decode_result_values
 
 if TYPE_CHECKING:
     from couchbase.logic.pycbc_core import pycbc_connection
@@ -45,6 +52,14 @@ class ScanTerm:
 
         self._exclusive = exclusive
 
+    @property
+    def term(self) -> str:
+        return self._term
+
+    @property
+    def exclusive(self) -> Optional[bool]:
+        return self._exclusive
+
     def to_dict(self):
         return {
             'term': self._term,
@@ -111,6 +126,208 @@ class SamplingScan(ScanType):
         return self._seed
 
 
+# the split points of a partitioned scan are picked from a sample of this many keys per partition
+SCAN_PARTITION_SAMPLE_SIZE = 64
+
+# a key range with too few sampled keys is split over the printable ASCII characters keys are usually made of
+_SPLIT_FIRST_CHAR = 0x20
+_SPLIT_LAST_CHAR = 0x7E
+
+
+class ScanPartition:
+    """A disjoint part of a :class:`RangeScan` or :class:`PrefixScan`, see ``Collection.scan_partitions()``.
+
+    A partition is consumed by passing its :attr:`scan_type` to ``Collection.scan()``.  Partitions can be pickled, or
+    exported as a string with :attr:`token` (see :meth:`from_token`), so they can be handed to other threads, tasks or
+    processes and re-scanned if their consumer fails.
+    """
+
+    def __init__(self,
+                 index,  # type: int
+                 count,  # type: int
+                 scan_type,  # type: RangeScan
+                 ) -> None:
+        self._index = index
+        self._count = count
+        self._scan_type = scan_type
+
+    @property
+    def index(self) -> int:
+        """
+            int: The partition's position in the key space, starting at 0.
+        """
+        return self._index
+
+    @property
+    def count(self) -> int:
+        """
+            int: The number of partitions the scan was split into.
+        """
+        return self._count
+
+    @property
+    def scan_type(self) -> RangeScan:
+        """
+            :class:`RangeScan`: The range of keys of the partition.
+        """
+        return self._scan_type
+
+    @property
+    def token(self) -> str:
+        """
+            str: The partition encoded as a string, see :meth:`from_token`.
+        """
+        return json.dumps({'index': self._index,
+                           'count': self._count,
+                           'start': _term_to_json(self._scan_type.start),
+                           'end': _term_to_json(self._scan_type.end)},
+                          separators=(',', ':'))
+
+    @classmethod
+    def from_token(cls, token  # type: str
+                   ) -> ScanPartition:
+        """Creates a partition from its :attr:`token`.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the token is not a valid partition token.
+        """
+        try:
+            data = json.loads(token)
+            return cls(int(data['index']),
+                       int(data['count']),
+                       RangeScan(_term_from_json(data['start']), _term_from_json(data['end'])))
+        except (KeyError, TypeError, ValueError, InvalidArgumentException):
+            raise InvalidArgumentException('Invalid scan partition token.') from None
+
+    def __eq__(self, other):
+        if not isinstance(other, ScanPartition):
+            return False
+        return self.token == other.token
+
+    def __hash__(self):
+        return hash(self.token)
+
+    def __repr__(self):
+        return f'ScanPartition({self.token})'
+
+
+def _term_to_json(term: Optional[ScanTerm]) -> Optional[List[Any]]:
+    if term is None:
+        return None
+    return [term.term, term.exclusive]
+
+
+def _term_from_json(value: Optional[List[Any]]) -> Optional[ScanTerm]:
+    if value is None:
+        return None
+    term, exclusive = value
+    return ScanTerm(term, exclusive)
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    # the smallest string greater than every string starting with the prefix, keys are ordered by their UTF-8
+    # encoding which has the same order as the code points
+    chars = list(prefix)
+    while chars:
+        code_point = ord(chars.pop()) + 1
+        if code_point == 0xD800:
+            code_point = 0xE000
+        if code_point <= 0x10FFFF:
+            chars.append(chr(code_point))
+            return ''.join(chars)
+    return None
+
+
+def get_scan_partition_bounds(scan_type: ScanType,
+                              count: int) -> Tuple[Optional[ScanTerm], Optional[ScanTerm]]:
+    """
+    ** INTERNAL **
+
+    Validates a partitioned scan and returns the (start, end) terms of the scanned key space.
+    """
+    if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+        raise InvalidArgumentException('Expected the number of partitions to be an int greater than 0.')
+    if isinstance(scan_type, RangeScan):
+        return scan_type.start, scan_type.end
+    if isinstance(scan_type, PrefixScan):
+        upper_bound = _prefix_upper_bound(scan_type.prefix)
+        return (ScanTerm(scan_type.prefix),
+                ScanTerm(upper_bound, exclusive=True) if upper_bound is not None else None)
+    raise InvalidArgumentException('Only a RangeScan or PrefixScan can be split into disjoint partitions.')
+
+
+def _term_admits(key: str, start: Optional[ScanTerm], end: Optional[ScanTerm]) -> bool:
+    if start is not None and (key < start.term or (start.exclusive is True and key == start.term)):
+        return False
+    if end is not None and (key > end.term or (end.exclusive is True and key == end.term)):
+        return False
+    return True
+
+
+def _split_key_range(start_key: str, end_key: Optional[str], count: int) -> List[str]:
+    # evenly spaced keys between start_key and end_key (None if unbounded), split at the first character position
+    # that has room for a key in between
+    pos = 0
+    if end_key is not None:
+        while pos < len(start_key) and pos < len(end_key) and start_key[pos] == end_key[pos]:
+            pos += 1
+    while True:
+        low = ord(start_key[pos]) if pos < len(start_key) else _SPLIT_FIRST_CHAR - 1
+        high = _SPLIT_LAST_CHAR + 1
+        if end_key is not None and pos < len(end_key):
+            high = min(high, ord(end_key[pos]))
+        room = high - low - 1
+        if room > 0:
+            break
+        if pos >= len(start_key):
+            return []
+        # every key starting with start_key[:pos + 1] is below end_key
+        pos += 1
+        end_key = None
+
+    prefix = start_key[:pos]
+    split_keys = []
+    for i in range(1, count):
+        key = prefix + chr(low + 1 + i * room // count)
+        if not split_keys or split_keys[-1] != key:
+            split_keys.append(key)
+    return split_keys
+
+
+def build_scan_partitions(scan_type: ScanType,
+                          count: int,
+                          sample_keys: Iterable[str],
+                          sample_size: Optional[int] = None) -> List[ScanPartition]:
+    """
+    ** INTERNAL **
+
+    Splits the key space of the scan into (at most) count disjoint ranges holding about the same number of the
+    sampled keys.  When fewer than count distinct sampled keys fall in the key space, e.g. a narrow PrefixScan, the
+    key space is split evenly instead.  A sample smaller than sample_size, the number of keys requested, holds
+    every key of the collection, fewer partitions are then returned if it does not have enough keys in the key space.
+    """
+    start, end = get_scan_partition_bounds(scan_type, count)
+    sample_keys = list(sample_keys)
+    keys = sorted({key for key in sample_keys if _term_admits(key, start, end)})
+    if len(keys) < count and (sample_size is None or len(sample_keys) >= sample_size):
+        candidates = _split_key_range(start.term if start is not None else '',
+                                      end.term if end is not None else None,
+                                      count)
+    else:
+        candidates = [keys[i * len(keys) // count] for i in range(1, count)] if keys else []
+
+    split_keys = []
+    for key in candidates:
+        # a split key equal to the start of the range would give an empty first partition
+        if (not split_keys or split_keys[-1] != key) and (start is None or key != start.term):
+            split_keys.append(key)
+
+    bounds = [start] + [ScanTerm(key) for key in split_keys]
+    ends = [ScanTerm(key, exclusive=True) for key in split_keys] + [end]
+    return [ScanPartition(idx, len(bounds), RangeScan(lower, upper))
+            for idx, (lower, upper) in enumerate(zip(bounds, ends))]
+
+
 class RangeScanRequestLogic:
     """
     ** INTERNAL **
@@ -123,7 +340,13 @@ class RangeScanRequestLogic:
         if not self._transcoder:
             raise InvalidArgumentException('No transcoder provided.')
         self._ids_only = kwargs['orchestrator_options'].get('ids_only', False)
+        # SDK-side option, the C++ core scan orchestrator does not need it
+        self._row_buffer = RowBuffer(kwargs['orchestrator_options'].pop('rows_per_fetch', 1),
+                                     max_wait=None,
+                                     on_batch=self._to_scan_results)
         self._scan_args = kwargs
+        # the columnar (Arrow) results read the encoded values
+        self._decode_values = True
         self._scan_iterator = None
         self._started_streaming = False
         self._done_streaming = False
@@ -155,8 +378,21 @@ class RangeScanRequestLogic:
         if self.done_streaming is True:
             return
 
-        resp = next(self._scan_iterator)
+        resp = self._row_buffer.next(self._scan_iterator)
+        if resp is None:
+            # an empty batch, the scan was cancelled
+            raise RangeScanCompletedException()
         if isinstance(resp, PycbcCoreException):
             raise ErrorMapper.build_exception(resp)
+        if isinstance(resp, ScanResult):
+            return resp
 
         return ScanResult(resp, self._ids_only, self.transcoder)
+
+    def _to_scan_results(self, rows):
+        # a fetched batch is decoded at once, the format decision is made per distinct flags value
+        results = [row if isinstance(row, PycbcCoreException) else ScanResult(row, self._ids_only, self.transcoder)
+                   for row in rows]
+        if not self._ids_only and self._decode_values:
+            decode_result_values(res for res in results if isinstance(res, ScanResult))
+        return results
@@ -0,0 +1,195 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import queue
+from collections.abc import Mapping
+from typing import (Any,
+                    AsyncIterable,
+                    AsyncIterator,
+                    Awaitable,
+                    Callable,
+                    Iterable,
+                    Iterator,
+                    Set,
+                    Tuple,
+                    TypeVar,
+                    Union)
+
+from couchbase.exceptions import CouchbaseException, InvalidArgumentException
+
+T = TypeVar('T')
+
+# Streaming KV operations (e.g. Collection.upsert_stream) keep at most ``window`` operations in flight.
+# Documents are pulled from the input, and encoded, only when a slot frees up and results are handed
+# back in completion order, so memory use depends on the window and not on the size of the input.
+
+DEFAULT_STREAM_WINDOW = 128
+
+StreamItem = Tuple[str, Any]
+
+
+def get_stream_window(window: int) -> int:
+    """**INTERNAL**"""
+    if not isinstance(window, int) or isinstance(window, bool) or window < 1:
+        raise InvalidArgumentException(message='Expected window to be an int greater than 0.')
+    return window
+
+
+def iter_stream_items(keys_and_docs: Union[Iterable[StreamItem], Mapping[str, Any]]) -> Iterator[StreamItem]:
+    """**INTERNAL**"""
+    if isinstance(keys_and_docs, Mapping):
+        return iter(keys_and_docs.items())
+    return iter(keys_and_docs)
+
+
+def keys_as_stream_items(keys: Union[Iterable[str], AsyncIterable[str]]
+                         ) -> Union[Iterator[StreamItem], AsyncIterator[StreamItem]]:
+    """**INTERNAL**
+
+    Adapts the keys of a streaming read (e.g. Collection.get_stream) to the (key, doc) pairs expected by
+    :func:`stream_kv_ops` and :func:`stream_kv_ops_async`, without consuming them.
+    """
+    if isinstance(keys, (str, bytes)):
+        raise InvalidArgumentException(message='Expected keys to be an iterable of str, not a single key.')
+    if hasattr(keys, '__aiter__'):
+        return _async_keys_as_stream_items(keys)
+    return ((key, None) for key in keys)
+
+
+async def _async_keys_as_stream_items(keys: AsyncIterable[str]) -> AsyncIterator[StreamItem]:
+    async for key in keys:
+        yield key, None
+
+
+def stream_kv_ops(submit: Callable[[str, Any, Callable[[str, Union[T, CouchbaseException]], None]], None],
+                  keys_and_docs: Union[Iterable[StreamItem], Mapping[str, Any]],
+                  window: int) -> Iterator[Tuple[str, Union[T, CouchbaseException]]]:
+    """**INTERNAL**
+
+    Drives a streaming KV operation for the blocking API.
+
+    Args:
+        submit (Callable): Dispatches the operation for a (key, doc) pair without blocking.  It must call the
+            provided completion callback exactly once, with the key and the result or exception.  The callback
+            is thread-safe, it is usually called from a C++ core IO thread.
+        keys_and_docs (Union[Iterable[Tuple[str, Any]], Mapping[str, Any]]): The (key, doc) pairs.
+        window (int): Maximum number of operations in flight.
+
+    Returns:
+        Iterator[Tuple[str, Union[T, CouchbaseException]]]: The (key, result or exception) pairs, in completion order.
+    """
+    window = get_stream_window(window)
+    items = iter_stream_items(keys_and_docs)
+    completed = queue.SimpleQueue()
+    on_done = completed.put_nowait
+
+    def _on_done(key: str, res: Union[T, CouchbaseException]) -> None:
+        on_done((key, res))
+
+    in_flight = 0
+    exhausted = False
+    while True:
+        while not exhausted and in_flight < window:
+            try:
+                key, doc = next(items)
+            except StopIteration:
+                exhausted = True
+                break
+            in_flight += 1
+            submit(key, doc, _on_done)
+        if in_flight == 0:
+            return
+        key, res = completed.get()
+        in_flight -= 1
+        yield key, res
+
+
+def _get_async_next_item(keys_and_docs: Union[Iterable[StreamItem], AsyncIterable[StreamItem], Mapping[str, Any]]
+                         ) -> Callable[[], Awaitable[StreamItem]]:
+    if hasattr(keys_and_docs, '__aiter__'):
+        return keys_and_docs.__aiter__().__anext__
+
+    items = iter_stream_items(keys_and_docs)
+
+    async def _next_item() -> StreamItem:
+        try:
+            return next(items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    return _next_item
+
+
+async def _run_kv_op(op: Callable[[str, Any], Awaitable[T]],
+                     key: str,
+                     doc: Any) -> Tuple[str, Union[T, CouchbaseException]]:
+    try:
+        return key, await op(key, doc)
+    except CouchbaseException as ex:
+        return key, ex
+
+
+async def _fill_window(op: Callable[[str, Any], Awaitable[T]],
+                       next_item: Callable[[], Awaitable[StreamItem]],
+                       pending: Set[asyncio.Future],
+                       window: int) -> bool:
+    # starts operations until the window is full, returns True once the input is exhausted
+    while len(pending) < window:
+        try:
+            key, doc = await next_item()
+        except StopAsyncIteration:
+            return True
+        pending.add(asyncio.ensure_future(_run_kv_op(op, key, doc)))
+    return False
+
+
+async def stream_kv_ops_async(op: Callable[[str, Any], Awaitable[T]],
+                              keys_and_docs: Union[Iterable[StreamItem], AsyncIterable[StreamItem], Mapping[str, Any]],
+                              window: int) -> AsyncIterator[Tuple[str, Union[T, CouchbaseException]]]:
+    """**INTERNAL**
+
+    Drives a streaming KV operation for the asyncio API.
+
+    Args:
+        op (Callable): Coroutine function performing the operation for a (key, doc) pair.
+        keys_and_docs (Union[Iterable[Tuple[str, Any]], AsyncIterable[Tuple[str, Any]], Mapping[str, Any]]): The
+            (key, doc) pairs.
+        window (int): Maximum number of operations in flight.
+
+    Returns:
+        AsyncIterator[Tuple[str, Union[T, CouchbaseException]]]: The (key, result or exception) pairs, in completion
+        order.
+    """
+    window = get_stream_window(window)
+    next_item = _get_async_next_item(keys_and_docs)
+
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            if not exhausted:
+                exhausted = await _fill_window(op, next_item, pending, window)
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # the caller stopped iterating (or an error was raised), do not leave operations behind
+        for task in pending:
+            task.cancel()
@@ -53,7 +53,10 @@ For detailed logging documentation, see LOGGING.md in the repository root.
 import atexit
 import logging
 from functools import partial, partialmethod
-from typing import Any, Optional
+from threading import Event, Thread
+from typing import (Any,
+                    Dict,
+                    Optional)
 
 from couchbase.logic.pycbc_core import pycbc_logger, shutdown_logger
 from couchbase.logic.pycbc_core.core_metadata import get_metadata
@@ -61,6 +64,12 @@ from couchbase.logic.pycbc_core.core_metadata import get_metadata
 # Initialize global logger instance
 _PYCBC_LOGGER = pycbc_logger()
 
+# Asynchronous logging sink defaults, see configure_logging()
+_ASYNC_SINK_QUEUE_SIZE = 65536
+_ASYNC_SINK_BATCH_SIZE = 1024
+_ASYNC_SINK_FLUSH_INTERVAL_MS = 100
+_ASYNC_SINK_DRAINER: Optional['AsyncLoggingSinkDrainer'] = None
+
 # Add TRACE level to Python's logging module
 logging.TRACE = 5
 logging.addLevelName(logging.TRACE, 'TRACE')
@@ -142,6 +151,84 @@ def _configure_python_logging_for_console(log_level_str: str,
     couchbase_logger.debug(get_metadata(as_str=True))
 
 
+class AsyncLoggingSinkDrainer(Thread):
+    """
+    **INTERNAL** Hands the messages queued by the C++ core's asynchronous logging sink to Python's logging system.
+
+    The C++ IO threads only copy each message into a bounded queue, this thread takes the GIL to create the
+    LogRecords and call the logger's handlers, in batches.  It also keeps the C++ level filter in sync with the
+    logger's effective level and reports messages dropped because the queue was full.
+    """
+
+    def __init__(self,
+                 core_logger: pycbc_logger,
+                 logger: logging.Logger,
+                 batch_size: int = _ASYNC_SINK_BATCH_SIZE,
+                 flush_interval_ms: int = _ASYNC_SINK_FLUSH_INTERVAL_MS) -> None:
+        super().__init__(name='PycbcAsyncLoggingSinkDrainer')
+        self.daemon = True
+        self._finished = Event()
+        self._stopped = False
+        self._core_logger = core_logger
+        self._logger = logger
+        self._batch_size = batch_size
+        self._flush_interval_ms = flush_interval_ms
+        self._level: Optional[int] = None
+        self._dropped = 0
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def sync_level(self) -> None:
+        """Pushes the logger's effective level down to the sink, which discards the messages below it."""
+        level = self._logger.getEffectiveLevel() if not self._logger.disabled else logging.CRITICAL + 1
+        if level != self._level:
+            self._core_logger.set_logging_sink_level(level)
+            self._level = level
+
+    def run(self):
+        while not self._finished.is_set():
+            try:
+                self.sync_level()
+                # waits (without the GIL) up to the flush interval when nothing is queued
+                drained = self._core_logger.drain_logging_sink(self._batch_size, self._flush_interval_ms)
+                if drained < self._batch_size:
+                    self._report_dropped()
+            except Exception as e:
+                self._logger.error(f'Failed to drain the asynchronous logging sink: {e}')
+                self._finished.wait(self._flush_interval_ms / 1000)
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Hands every queued message to the logger, without waiting for more."""
+        try:
+            while self._core_logger.drain_logging_sink(self._batch_size, 0) > 0:
+                pass
+            self._report_dropped()
+        except Exception as e:
+            self._logger.error(f'Failed to drain the asynchronous logging sink: {e}')
+
+    def stop(self) -> None:
+        if self._stopped:
+            return
+
+        self._stopped = True
+        if self.is_alive():
+            self._finished.set()
+            self.join(self._flush_interval_ms / 1000 + 0.5)
+            if self.is_alive():
+                self._logger.warning('AsyncLoggingSinkDrainer unable to shutdown.')
+
+    def _report_dropped(self) -> None:
+        dropped = self._core_logger.logging_sink_stats()['dropped']
+        if dropped > self._dropped:
+            self._logger.warning(f'Dropped {dropped - self._dropped} C++ SDK log message(s), the asynchronous '
+                                 'logging queue was full.  Consider a larger async_queue_size or a higher log level.')
+            self._dropped = dropped
+
+
 def configure_console_logger():
     """
     **INTERNAL** Configure logging based on PYCBC_LOG_LEVEL environment variable.
@@ -178,7 +265,11 @@ def configure_console_logger():
         )
 
 
-def configure_logging(name, level=logging.INFO, parent_logger=None):
+def configure_logging(name,
+                      level=logging.INFO,
+                      parent_logger=None,
+                      async_sink: Optional[bool] = None,
+                      async_queue_size: Optional[int] = None):
     """
     Configure the Python SDK to route C++ logs through Python's logging system.
 
@@ -203,15 +294,27 @@ def configure_logging(name, level=logging.INFO, parent_logger=None):
         couchbase_logger.addHandler(your_handler)
         couchbase_logger.setLevel(logging.INFO)
 
+    By default, each C++ log message is handed to the logger on the C++ IO thread that logged it, holding the
+    GIL while the logger's handlers run.  At debug or trace level this slows down the IO threads, and so the
+    operations.  With ``async_sink=True`` the IO threads only copy the messages into a bounded, lock-free queue
+    and a background thread hands them to the logger in batches.  Messages below the logger's effective level
+    are discarded before being queued, and messages logged while the queue is full are dropped, which is
+    reported as a warning on the logger.
+
     Args:
         name: Name for the logger
         level: Python logging level (default: logging.INFO)
         parent_logger: Optional parent logger
+        async_sink: Hand the C++ log messages to the logger from a background thread (default: False)
+        async_queue_size: Capacity of the asynchronous sink's queue, rounded up to a power of two
+            (default: 65536)
 
     Raises:
         RuntimeError: If PYCBC_LOG_LEVEL environment variable is already set.
                      Cannot use both configuration methods simultaneously.
+        InvalidArgumentException: If async_queue_size is not a positive integer.
     """
+    global _ASYNC_SINK_DRAINER
     if parent_logger:
         name = f'{parent_logger.name}.{name}'
     logger = logging.getLogger(name)
@@ -219,10 +322,34 @@ def configure_logging(name, level=logging.INFO, parent_logger=None):
         raise RuntimeError(('Cannot create logger.  Another logger has already been '
                             'initialized. Make sure the PYCBC_LOG_LEVEL and PYCBC_LOG_FILE env '
                             'variable are not set if using configure_logging.'))
-    _PYCBC_LOGGER.configure_logging_sink(logger, level)
+    if async_sink is True:
+        if async_queue_size is None:
+            async_queue_size = _ASYNC_SINK_QUEUE_SIZE
+        elif not isinstance(async_queue_size, int) or isinstance(async_queue_size, bool) or async_queue_size < 1:
+            from couchbase.exceptions import InvalidArgumentException
+            raise InvalidArgumentException('async_queue_size must be a positive integer.')
+        _PYCBC_LOGGER.configure_logging_sink(logger, level, queue_size=async_queue_size)
+        _ASYNC_SINK_DRAINER = AsyncLoggingSinkDrainer(_PYCBC_LOGGER, logger)
+        _ASYNC_SINK_DRAINER.sync_level()
+        _ASYNC_SINK_DRAINER.start()
+    else:
+        _PYCBC_LOGGER.configure_logging_sink(logger, level)
     logger.debug(get_metadata(as_str=True))
 
 
+def get_logging_sink_stats() -> Dict[str, Any]:
+    """
+    **VOLATILE** This API is subject to change at any time.
+
+    Returns the state of the logging sink set up by :func:`configure_logging`.
+
+    Returns:
+        Dict[str, Any]: ``async`` (whether the asynchronous sink is used), ``queue_capacity`` (0 for the
+        synchronous sink) and ``dropped``, the number of messages dropped because the queue was full.
+    """
+    return _PYCBC_LOGGER.logging_sink_stats()
+
+
 def enable_protocol_logger_to_save_network_traffic_to_file(filename: str) -> None:
     """
     **VOLATILE** This API is subject to change at any time.
@@ -241,7 +368,11 @@ def enable_protocol_logger_to_save_network_traffic_to_file(filename: str) -> Non
 
 def _pycbc_teardown(**kwargs: Any) -> None:
     """**INTERNAL** Cleanup function called at interpreter shutdown."""
-    global _PYCBC_LOGGER
+    global _PYCBC_LOGGER, _ASYNC_SINK_DRAINER
+    # hand whatever is still queued to the logger while the interpreter can still run its handlers
+    if _ASYNC_SINK_DRAINER is not None:
+        _ASYNC_SINK_DRAINER.stop()
+        _ASYNC_SINK_DRAINER = None
     # if using a console logger we let the natural course of shutdown happen, if using Python logging
     # we need a cleaner mechanism to shutdown the C++ logger prior to the Python interpreter starting to finalize
     if (_PYCBC_LOGGER
@@ -268,4 +399,5 @@ configure_console_logger()
 __all__ = [
     'configure_logging',
     'enable_protocol_logger_to_save_network_traffic_to_file',
+    'get_logging_sink_stats',
 ]
@@ -32,6 +32,7 @@ from couchbase.exceptions import ErrorMapper, InvalidArgumentException
 from couchbase.logic.observability import ObservableRequestHandler, SpanProtocol
 from couchbase.logic.options import QueryOptionsBase
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
+from couchbase.logic.streaming import DEFAULT_ROWS_PER_FETCH, RowBuffer
 from couchbase.options import QueryOptions, UnsignedInt64
 from couchbase.serializer import DefaultJsonSerializer, Serializer
 
@@ -335,6 +336,7 @@ class N1QLQuery:
         "preserve_expiry": {"preserve_expiry": lambda x: x},
         "use_replica": {"use_replica": lambda x: x},
         "serializer": {"serializer": lambda x: x},
+        "rows_per_fetch": {"rows_per_fetch": lambda x: x},
         "positional_parameters": {},
         "named_parameters": {},
         "span": {"span": lambda x: x},
@@ -493,11 +495,11 @@ class N1QLQuery:
 
         # avoid circular import
         from couchbase.mutation_state import MutationState  # noqa: F811
-        if not (isinstance(value, MutationState) and len(value._sv) > 0):
+        if not (isinstance(value, MutationState) and len(value) > 0):
             raise TypeError('Passed empty or invalid state')
         # 3.x SDK had to set the consistency, couchbase++ will take care of that for us
         self._params.pop('scan_consistency', None)
-        self.set_option('mutation_state', list(mt.as_dict() for mt in value._sv))
+        self.set_option('mutation_state', value._as_token_dicts())
 
     @property
     def adhoc(self) -> bool:
@@ -687,6 +689,17 @@ class N1QLQuery:
             raise InvalidArgumentException(message='Serializer should implement Serializer interface.')
         self.set_option('serializer', value)
 
+    @property
+    def rows_per_fetch(self) -> Optional[int]:
+        return self._params.get('rows_per_fetch', None)
+
+    @rows_per_fetch.setter
+    def rows_per_fetch(self, value  # type: int
+                       ):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise InvalidArgumentException(message='rows_per_fetch must be a positive int.')
+        self.set_option('rows_per_fetch', value)
+
     @classmethod
     def create_query_object(cls, statement, *options, **kwargs):
         # lets make a copy of the options, and update with kwargs...
@@ -749,6 +762,7 @@ class QueryRequestLogic:
         self._streaming_timeout = kwargs.pop('streaming_timeout', None)
         self._obs_handler: Optional[ObservableRequestHandler] = kwargs.pop('obs_handler', None)
         self._processed_core_span = False
+        self._row_buffer = RowBuffer(self.params.get('rows_per_fetch', DEFAULT_ROWS_PER_FETCH))
 
     @property
     def params(self) -> Dict[str, Any]:
@@ -16,6 +16,9 @@
 from .handler import (CollectionDetails,
                       ObservableRequestHandler,
                       WrappedSpan)
+from .hot_path import (HotPathProfiler,
+                       HotPathStage,
+                       HotPathStats)
 from .logging_meter import LoggingMeter
 from .no_op import (NoOpMeter,
                     NoOpSpan,
@@ -39,6 +42,9 @@ from .threshold_logging import ThresholdLoggingTracer
 __all__ = [
     'CollectionDetails',
     'DispatchAttributeName',
+    'HotPathProfiler',
+    'HotPathStage',
+    'HotPathStats',
     'LegacySpanProtocol',
     'LegacyTracerProtocol',
     'LoggingMeter',
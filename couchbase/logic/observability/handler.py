@@ -76,10 +76,12 @@ from couchbase.logic.supportability import Supportability
 from couchbase.observability.tracing import SpanAttributeValue, SpanStatusCode
 
 if TYPE_CHECKING:
+    from couchbase.logic.observability.hot_path import HotPathTimer
     from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
     from couchbase.logic.pycbc_core import pycbc_result as PycbcCoreResult
     from couchbase.logic.pycbc_core import pycbc_streamed_result as PycbcCoreStreamedResult
     from couchbase.logic.pycbc_core.binding_cpp_types import CppWrapperSdkChildSpan, CppWrapperSdkSpan
+    from couchbase.transcoder import Transcoder
 
 
 class CollectionDetails(TypedDict):
@@ -109,6 +111,11 @@ _KV_SERVICE_VALUE = ServiceType.KeyValue.value
 _NOOP_OBS_HANDLER_CTX = contextlib.nullcontext()
 
 
+def _is_profiling(observability_instruments: ObservabilityInstruments) -> bool:
+    profiler = observability_instruments.hot_path_profiler
+    return profiler is not None and profiler.is_active()
+
+
 def get_attributes_for_kv_op(op_name: str,
                              collection_details: CollectionDetails) -> Mapping[str, str]:
     return {
@@ -160,6 +167,10 @@ class ObservableRequestHandler:
                  op_type_toggle: Optional[bool] = None) -> None:
         self._op_type = op_type
         self._processed_kv_get_all_replicas_core_span = False
+        self._hot_path_profiler = observability_instruments.hot_path_profiler
+        self._stage_timer: Optional[HotPathTimer] = None
+        if self._hot_path_profiler is not None and self._hot_path_profiler.is_active():
+            self._stage_timer = self._hot_path_profiler.start(op_type)
 
         # Capture a single timestamp and share it between tracer and meter impls,
         # eliminating redundant time.time_ns() calls.
@@ -180,7 +191,8 @@ class ObservableRequestHandler:
 
         if _cached_tracer is not False:
             self._tracer_impl = _cached_tracer
-            self.is_noop = True
+            # when profiling, encoding goes through the handler so it can be timed
+            self.is_noop = self._stage_timer is None
         else:
             self._tracer_impl = ObservableRequestHandlerTracerImpl(op_type,
                                                                    observability_instruments,
@@ -205,6 +217,8 @@ class ObservableRequestHandler:
                                                                  start_time=now)
 
         self._with_metrics = isinstance(self._meter_impl, ObservableRequestHandlerNoOpMeterImpl) is False
+        # the C++ core only reports when it started and finished a request sent with metrics
+        self._request_with_metrics = self._with_metrics or self._stage_timer is not None
 
     @property
     def is_legacy_tracer(self) -> bool:
@@ -218,13 +232,17 @@ class ObservableRequestHandler:
     def op_type(self) -> OpType:
         return self._op_type
 
+    @property
+    def stage_timer(self) -> Optional[HotPathTimer]:
+        return self._stage_timer
+
     @property
     def tracer_processed_kv_get_all_replicas_core_span(self) -> bool:
         return self._processed_kv_get_all_replicas_core_span
 
     @property
     def with_metrics(self) -> bool:
-        return self._with_metrics
+        return self._request_with_metrics
 
     @property
     def wrapper_span_name(self) -> str:
@@ -254,10 +272,27 @@ class ObservableRequestHandler:
         self._meter_impl.add_http_attributes(**options)
 
     def maybe_add_encoding_span(self, encoding_fn: Callable[..., Tuple[bytes, int]]) -> Tuple[bytes, int]:
-        return self._tracer_impl.maybe_add_encoding_span(encoding_fn)
+        if self._stage_timer is None:
+            return self._tracer_impl.maybe_add_encoding_span(encoding_fn)
+        start = time.perf_counter_ns()
+        try:
+            return self._tracer_impl.maybe_add_encoding_span(encoding_fn)
+        finally:
+            self._stage_timer.add_encoding(time.perf_counter_ns() - start)
 
     def maybe_create_encoding_span(self, encoding_fn: Callable[..., Tuple[bytes, int]]) -> Tuple[bytes, int]:
-        return self._tracer_impl.maybe_create_encoding_span(encoding_fn)
+        if self._stage_timer is None:
+            return self._tracer_impl.maybe_create_encoding_span(encoding_fn)
+        start = time.perf_counter_ns()
+        try:
+            return self._tracer_impl.maybe_create_encoding_span(encoding_fn)
+        finally:
+            self._stage_timer.add_encoding(time.perf_counter_ns() - start)
+
+    def maybe_time_decoding(self, transcoder: Transcoder) -> Transcoder:
+        if self._stage_timer is None:
+            return transcoder
+        return self._stage_timer.wrap_transcoder(transcoder)
 
     def process_core_span(self,
                           core_span: Optional[CppWrapperSdkSpan] = None,
@@ -296,12 +331,15 @@ class ObservableRequestHandler:
                                cluster_name=self._tracer_impl.cluster_name,
                                cluster_uuid=self._tracer_impl.cluster_uuid,
                                exc_val=exc_val)
+        if self._stage_timer is not None:
+            self._stage_timer.finished()
+            self._stage_timer = self._hot_path_profiler.start(op_type)
 
     @staticmethod
     def create(op_type: OpType,
                observability_instruments: ObservabilityInstruments,
                op_type_toggle: Optional[bool] = None) -> Union[ObservableRequestHandler, contextlib.nullcontext[None]]:
-        if observability_instruments.is_noop:
+        if observability_instruments.is_noop and not _is_profiling(observability_instruments):
             return _NOOP_OBS_HANDLER_CTX
         return ObservableRequestHandler(op_type, observability_instruments, op_type_toggle=op_type_toggle)
 
@@ -309,7 +347,7 @@ class ObservableRequestHandler:
     def create_or_none(op_type: OpType,
                        observability_instruments: ObservabilityInstruments,
                        op_type_toggle: Optional[bool] = None) -> Optional[ObservableRequestHandler]:
-        if observability_instruments.is_noop:
+        if observability_instruments.is_noop and not _is_profiling(observability_instruments):
             return None
         handler = ObservableRequestHandler(op_type, observability_instruments, op_type_toggle=op_type_toggle)
         handler.__enter__()
@@ -363,6 +401,8 @@ class ObservableRequestHandler:
         self._meter_impl.process_end(cluster_name=self._tracer_impl.cluster_name,
                                      cluster_uuid=self._tracer_impl.cluster_uuid,
                                      exc_val=exc_val)
+        if self._stage_timer is not None:
+            self._stage_timer.finished()
         return False
 
     # --- Async Context Manager Protocol ---
@@ -0,0 +1,307 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from threading import Lock
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Mapping,
+                    Optional,
+                    Tuple,
+                    TypedDict)
+
+from couchbase.logic.observability.observability_types import _DISP_SERVER_DURATION
+from couchbase.logic.operation_types import KeyValueMultiOperationType, KeyValueOperationType
+from couchbase.logic.pycbc_core import pycbc_hdr_histogram
+from couchbase.transcoder import Transcoder
+
+if TYPE_CHECKING:
+    from couchbase.logic.observability.observability_types import OpType
+
+_perf_counter_ns = time.perf_counter_ns
+_time_ns = time.time_ns
+
+
+class HotPathStage(Enum):
+    """The stages of a key-value operation timed by the :class:`HotPathProfiler`.
+
+    The ``dispatch`` and ``resume`` stages are only recorded when the C++ core reports when it started and
+    finished the request, which it does for single key operations.  Otherwise the whole call into the bindings
+    is recorded as ``core``.
+    """
+    # option parsing (forward_args), building the request and its spans, encoding excluded
+    Build = 'build'
+    # transcoding the document(s) of a mutation
+    Encode = 'encode'
+    # from the call into the bindings to the C++ core starting the request
+    Dispatch = 'dispatch'
+    # the C++ core: queueing, network, server, reacquiring the GIL and converting the response
+    Core = 'core'
+    # server side duration, as reported by the server (only recorded when tracing)
+    Server = 'server'
+    # from the C++ core finishing the request to Python resuming (the event loop's handoff with acouchbase)
+    Resume = 'resume'
+    # building the result object and mapping errors
+    Result = 'result'
+    # decoding the document's content, on first access of the result's value
+    Decode = 'decode'
+    # the whole operation
+    Total = 'total'
+
+
+_STAGE_BUILD = HotPathStage.Build.value
+_STAGE_ENCODE = HotPathStage.Encode.value
+_STAGE_DISPATCH = HotPathStage.Dispatch.value
+_STAGE_CORE = HotPathStage.Core.value
+_STAGE_SERVER = HotPathStage.Server.value
+_STAGE_RESUME = HotPathStage.Resume.value
+_STAGE_RESULT = HotPathStage.Result.value
+_STAGE_DECODE = HotPathStage.Decode.value
+_STAGE_TOTAL = HotPathStage.Total.value
+
+# only KV operations are profiled, keyed by op type to skip the Enum.value descriptor on every operation
+_PROFILED_OP_NAMES: Dict[OpType, str] = {op: op.value for op in KeyValueOperationType}
+_PROFILED_OP_NAMES.update({op: op.value for op in KeyValueMultiOperationType})
+
+
+class StagePercentileReport(TypedDict):
+    total_count: int
+    percentiles_ns: Mapping[str, int]
+
+
+# operation name -> stage name -> percentiles
+HotPathStats = Mapping[str, Mapping[str, StagePercentileReport]]
+
+
+class _StageRecorder:
+
+    # 1 ns to 30 s, 2 significant figures keeps each histogram small enough to have one per (operation, stage)
+    LOWEST_DISCERNIBLE_VALUE = 1
+    HIGHEST_TRACKABLE_VALUE = 30_000_000_000
+    SIGNIFICANT_FIGURES = 2
+
+    def __init__(self) -> None:
+        self._histogram = pycbc_hdr_histogram(lowest_discernible_value=self.LOWEST_DISCERNIBLE_VALUE,
+                                              highest_trackable_value=self.HIGHEST_TRACKABLE_VALUE,
+                                              significant_figures=self.SIGNIFICANT_FIGURES)
+        self._count = 0
+
+    def record(self, value_ns: int) -> None:
+        if value_ns < self.LOWEST_DISCERNIBLE_VALUE:
+            value_ns = self.LOWEST_DISCERNIBLE_VALUE
+        elif value_ns > self.HIGHEST_TRACKABLE_VALUE:
+            value_ns = self.HIGHEST_TRACKABLE_VALUE
+        self._histogram.record_value(value_ns)
+        self._count += 1
+
+    def report(self, percentiles: List[float]) -> StagePercentileReport:
+        return {
+            'total_count': self._count,
+            'percentiles_ns': {str(p): self._histogram.value_at_percentile(p) for p in percentiles}
+        }
+
+    def close(self) -> None:
+        self._histogram.close()
+
+
+class HotPathProfiler:
+    """**INTERNAL**
+
+    Aggregates the per-stage latencies of a cluster's key-value operations into HDR histograms, one per
+    (operation, :class:`HotPathStage`).  Profiling is either enabled for every operation of the cluster
+    (the ``enable_hot_path_profiling`` cluster option) or only for the operations started within
+    :meth:`profile`.
+    """
+
+    PERCENTILES = [50.0, 90.0, 99.0, 99.9, 100.0]
+
+    def __init__(self, enabled: Optional[bool] = None) -> None:
+        self._enabled = enabled is True
+        self._scoped: ContextVar[bool] = ContextVar('hot_path_profiling', default=False)
+        # number of open profile() blocks, across threads and tasks, so the ContextVar is only read while one is open
+        self._open_scopes = 0
+        self._lock = Lock()
+        self._recorders: Dict[Tuple[str, str], _StageRecorder] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def is_active(self) -> bool:
+        return self._enabled or (self._open_scopes > 0 and self._scoped.get())
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        token = self._scoped.set(True)
+        with self._lock:
+            self._open_scopes += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._open_scopes -= 1
+            self._scoped.reset(token)
+
+    def start(self, op_type: OpType) -> Optional[HotPathTimer]:
+        op_name = _PROFILED_OP_NAMES.get(op_type, None)
+        if op_name is None:
+            return None
+        return HotPathTimer(self, op_name)
+
+    def record(self, op_name: str, durations: Iterable[Tuple[str, int]]) -> None:
+        with self._lock:
+            for stage, value_ns in durations:
+                recorder = self._recorders.get((op_name, stage), None)
+                if recorder is None:
+                    recorder = self._recorders[(op_name, stage)] = _StageRecorder()
+                recorder.record(value_ns)
+
+    def snapshot(self, reset: Optional[bool] = None) -> HotPathStats:
+        stats: Dict[str, Dict[str, StagePercentileReport]] = {}
+        with self._lock:
+            for (op_name, stage), recorder in self._recorders.items():
+                stats.setdefault(op_name, {})[stage] = recorder.report(self.PERCENTILES)
+            if reset is True:
+                self._reset()
+        return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        for recorder in self._recorders.values():
+            recorder.close()
+        self._recorders = {}
+
+
+class HotPathTimer:
+    """**INTERNAL**
+
+    Timestamps the stage boundaries of a single operation and hands the stage durations to the
+    :class:`HotPathProfiler` once the operation ends.
+    """
+
+    __slots__ = ('_profiler', '_op_name', '_start', '_encode_ns', '_dispatched', '_dispatched_wall', '_resumed',
+                 '_durations')
+
+    def __init__(self, profiler: HotPathProfiler, op_name: str) -> None:
+        self._profiler = profiler
+        self._op_name = op_name
+        self._start = _perf_counter_ns()
+        self._encode_ns = 0
+        self._dispatched: Optional[int] = None
+        self._dispatched_wall: Optional[int] = None
+        self._resumed: Optional[int] = None
+        self._durations: List[Tuple[str, int]] = []
+
+    def add_encoding(self, duration_ns: int) -> None:
+        self._encode_ns += duration_ns
+
+    def dispatched(self) -> None:
+        self._dispatched = _perf_counter_ns()
+        # the C++ core reports its timestamps with the system clock, the boundaries with the core use it as well
+        self._dispatched_wall = _time_ns()
+
+    def completed(self, result: Any) -> None:
+        """Called once the result of the call into the bindings is back in Python."""
+        if self._dispatched is None or self._resumed is not None:
+            return
+        self._resumed = _perf_counter_ns()
+        resumed_wall = _time_ns()
+        durations = self._durations
+        # pycbc_result and pycbc_exception carry the core's timestamps when the request was sent with_metrics
+        core_start = getattr(result, 'start_time', None)
+        core_end = getattr(result, 'end_time', None)
+        if core_start is not None and core_end is not None:
+            durations.append((_STAGE_DISPATCH, core_start - self._dispatched_wall))
+            durations.append((_STAGE_CORE, core_end - core_start))
+            durations.append((_STAGE_RESUME, resumed_wall - core_end))
+        else:
+            durations.append((_STAGE_CORE, self._resumed - self._dispatched))
+        server_ns = _server_duration_ns(getattr(result, 'core_span', None))
+        if server_ns is not None:
+            durations.append((_STAGE_SERVER, server_ns))
+
+    def finished(self) -> None:
+        end = _perf_counter_ns()
+        durations = self._durations
+        if self._dispatched is not None:
+            durations.append((_STAGE_BUILD, self._dispatched - self._start - self._encode_ns))
+        if self._encode_ns:
+            durations.append((_STAGE_ENCODE, self._encode_ns))
+        if self._resumed is not None:
+            durations.append((_STAGE_RESULT, end - self._resumed))
+        durations.append((_STAGE_TOTAL, end - self._start))
+        self._profiler.record(self._op_name, durations)
+
+    def wrap_transcoder(self, transcoder: Transcoder) -> Transcoder:
+        return DecodeTimingTranscoder(transcoder, self._profiler, self._op_name)
+
+
+class DecodeTimingTranscoder(Transcoder):
+    """**INTERNAL**
+
+    Times the decoding done by the wrapped transcoder.  Results decode their value lazily, on first access,
+    so the decode stage is recorded after the operation itself has been recorded.
+    """
+
+    def __init__(self, transcoder: Transcoder, profiler: HotPathProfiler, op_name: str) -> None:
+        self._transcoder = transcoder
+        self._profiler = profiler
+        self._op_name = op_name
+
+    def encode_value(self, value: Any) -> Tuple[bytes, int]:
+        return self._transcoder.encode_value(value)
+
+    def decode_value(self, value: bytes, flags: int) -> Any:
+        start = _perf_counter_ns()
+        try:
+            return self._transcoder.decode_value(value, flags)
+        finally:
+            self._profiler.record(self._op_name, ((_STAGE_DECODE, _perf_counter_ns() - start),))
+
+    def decode_values(self, values: Iterable[Tuple[bytes, int]]) -> List[Any]:
+        start = _perf_counter_ns()
+        try:
+            return self._transcoder.decode_values(values)
+        finally:
+            self._profiler.record(self._op_name, ((_STAGE_DECODE, _perf_counter_ns() - start),))
+
+
+def _server_duration_ns(core_span: Optional[Mapping[str, Any]]) -> Optional[int]:
+    """Sums the server durations of the core span's dispatch spans, one per attempt."""
+    if not core_span:
+        return None
+    total = None
+    pending = list(core_span.get('children', None) or ())
+    while pending:
+        span = pending.pop()
+        duration = span.get('attributes', {}).get(_DISP_SERVER_DURATION, None)
+        if duration is not None:
+            total = (total or 0) + int(duration)
+        children = span.get('children', None)
+        if children:
+            pending.extend(children)
+    return total
@@ -20,7 +20,8 @@ import logging
 from threading import (Event,
                        Lock,
                        Thread)
-from typing import (Callable,
+from typing import (TYPE_CHECKING,
+                    Callable,
                     Dict,
                     Generic,
                     Mapping,
@@ -36,6 +37,9 @@ from couchbase.logic.observability.observability_types import (_ATTR_OPERATION_N
 from couchbase.logic.pycbc_core import pycbc_hdr_histogram
 from couchbase.observability.metrics import Meter, ValueRecorder
 
+if TYPE_CHECKING:
+    from couchbase.logic.observability.hot_path import HotPathProfiler, HotPathStats
+
 logger = logging.getLogger('couchbase.metrics')
 
 K = TypeVar('K')
@@ -109,11 +113,18 @@ class PercentileReport(TypedDict):
     percentiles_us: Mapping[str, int]
 
 
-class LoggingMeterReport(TypedDict):
+class _LoggingMeterReportBase(TypedDict):
     meta: Mapping[str, int]
     operations: Mapping[str, Mapping[str, PercentileReport]]
 
 
+class LoggingMeterReport(_LoggingMeterReportBase, total=False):
+    # only present when a counter was incremented since the last report
+    counters: Mapping[str, int]
+    # only present when hot path profiling recorded operations, cumulated since profiling started (or was reset)
+    hot_path: HotPathStats
+
+
 class LoggingMeterReporter(Thread):
 
     def __init__(self, *, logging_meter: LoggingMeter, interval: float) -> None:
@@ -200,6 +211,23 @@ class LoggingValueRecorder(ValueRecorder):
         self._histogram.reset()
 
 
+class LoggingCounter:
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._count = 0
+
+    def add(self, value: int = 1) -> None:
+        with self._lock:
+            self._count += value
+
+    def get_and_reset(self) -> int:
+        with self._lock:
+            count = self._count
+            self._count = 0
+            return count
+
+
 class LoggingMeter(Meter):
 
     def __init__(self, emit_interval_ms: Optional[int] = None) -> None:
@@ -222,6 +250,9 @@ class LoggingMeter(Meter):
         # ServiceType() enum construction on every value_recorder() call. There
         # are only ~8 KV op combinations so this fills up after the first ops.
         self._recorder_cache: Dict[Tuple[str, str], LoggingValueRecorder] = {}
+        # SDK-side counters (e.g. the document cache's hits and misses), reported alongside the operations
+        self._counters: ConcurrentMap[str, LoggingCounter] = ConcurrentMap(factory=lambda name: LoggingCounter())
+        self._hot_path_profiler: Optional[HotPathProfiler] = None
         self._reporter = LoggingMeterReporter(logging_meter=self, interval=self._emit_interval_s)
         self._reporter.start()
 
@@ -242,6 +273,14 @@ class LoggingMeter(Meter):
             self._recorder_cache[(svc_str, op_str)] = lvr
         return lvr
 
+    def counter(self, name: str) -> LoggingCounter:
+        return self._counters.get_or_create(name)
+
+    def add_hot_path_profiler(self, profiler: HotPathProfiler) -> None:
+        # a meter shared by several clusters reports the hot path of the first one
+        if self._hot_path_profiler is None:
+            self._hot_path_profiler = profiler
+
     def create_report(self) -> LoggingMeterReport:
         report: LoggingMeterReport = {
             'meta': {'emit_interval_s': self._emit_interval_s},
@@ -255,6 +294,17 @@ class LoggingMeter(Meter):
                     svc_report[op_name.value] = percentile_report
             if svc_report:
                 report['operations'][svc_type.value] = svc_report
+        counters = {}
+        for name, counter in self._counters.items():
+            count = counter.get_and_reset()
+            if count:
+                counters[name] = count
+        if counters:
+            report['counters'] = counters
+        if self._hot_path_profiler is not None:
+            hot_path = self._hot_path_profiler.snapshot()
+            if hot_path:
+                report['hot_path'] = hot_path
         return report
 
     def close(self) -> None:
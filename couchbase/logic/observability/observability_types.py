@@ -17,7 +17,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import (Any,
+from typing import (TYPE_CHECKING,
+                    Any,
                     Callable,
                     Mapping,
                     Optional,
@@ -40,6 +41,9 @@ from couchbase.logic.operation_types import (AnalyticsMgmtOperationType,
                                              UserMgmtOperationType,
                                              ViewIndexMgmtOperationType)
 
+if TYPE_CHECKING:
+    from couchbase.logic.observability.hot_path import HotPathProfiler
+
 
 @runtime_checkable
 class LegacySpanProtocol(Protocol):
@@ -130,6 +134,8 @@ class ObservabilityInstruments:
     get_cluster_labels_fn: Optional[Callable[[], Mapping[str, str]]] = None
     # set to True when both tracer and meter or no-op
     is_noop: bool = False
+    # set once hot path profiling is enabled for the cluster or one of its operations
+    hot_path_profiler: Optional[HotPathProfiler] = None
 
 
 class ServiceType(Enum):
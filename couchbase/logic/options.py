@@ -124,9 +124,16 @@ VALID_MULTI_OPTS = {
     'initial': lambda x: x,
     'read_preference': lambda x: x.value,
     'per_key_options': lambda x: x,
-    'return_exceptions': validate_bool
+    'return_exceptions': validate_bool,
+    'encode_parallelism': lambda x: x,
+    'encode_executor': lambda x: x,
+    'max_in_flight': lambda x: x,
+    'group_by_node': validate_bool
 }
 
+# options that apply to the multi operation as a whole, they are ignored within per_key_options
+GLOBAL_ONLY_MULTI_OPTS = ['encode_parallelism', 'encode_executor', 'max_in_flight', 'group_by_node']
+
 
 def _get_valid_global_multi_opts(
     temp_options,  # type: Dict[str, Any]
@@ -158,7 +165,7 @@ def _get_per_key_opts(
             raise InvalidArgumentException(message=f'Expected options to be of type Union[{opt_type.__name__}, dict]')
         key_opts = {}
         for opt_key, opt_value in opts.items():
-            if opt_key not in valid_opt_keys:
+            if opt_key not in valid_opt_keys or opt_key in GLOBAL_ONLY_MULTI_OPTS:
                 continue
             transform = VALID_MULTI_OPTS.get(opt_key, None)
             if transform:
@@ -683,7 +690,11 @@ class ClusterOptionsBase(dict):
         "app_telemetry_ping_interval": {"app_telemetry_ping_interval": timedelta_as_milliseconds},
         "app_telemetry_ping_timeout": {"app_telemetry_ping_timeout": timedelta_as_milliseconds},
         "allow_enterprise_analytics": {"allow_enterprise_analytics": validate_bool},
-        "enable_lazy_connections": {"enable_lazy_connections": validate_bool}
+        "enable_lazy_connections": {"enable_lazy_connections": validate_bool},
+        "streaming_executor_max_workers": {"streaming_executor_max_workers": validate_int},
+        "streaming_executor_queue_depth": {"streaming_executor_queue_depth": validate_int},
+        "enable_zero_copy_values": {"enable_zero_copy_values": validate_bool},
+        "enable_hot_path_profiling": {"enable_hot_path_profiling": validate_bool}
     }
 
     @overload
@@ -708,7 +719,7 @@ class ClusterOptionsBase(dict):
         enable_orphan_reporting=None,    # type: Optional[bool]
         network=None,    # type: Optional[str]
         tls_verify=None,    # type: Optional[Union[TLSVerifyMode, str]]
-        serializer=None,  # type: Optional[Serializer]
+        serializer=None,  # type: Optional[Union[Serializer, str]]
         transcoder=None,  # type: Optional[Transcoder]
         tcp_keep_alive_interval=None,  # type: Optional[timedelta]
         config_poll_interval=None,  # type: Optional[timedelta]
@@ -735,7 +746,11 @@ class ClusterOptionsBase(dict):
         app_telemetry_ping_interval=None,  # type: Optional[timedelta]
         app_telemetry_ping_timeout=None,  # type: Optional[timedelta]
         allow_enterprise_analytics=None,  # type: Optional[bool]
-        enable_lazy_connections=None  # type: Optional[bool]
+        enable_lazy_connections=None,  # type: Optional[bool]
+        streaming_executor_max_workers=None,  # type: Optional[int]
+        streaming_executor_queue_depth=None,  # type: Optional[int]
+        enable_zero_copy_values=None,  # type: Optional[bool]
+        enable_hot_path_profiling=None  # type: Optional[bool]
     ):
         """ClusterOptions instance."""
 
@@ -968,6 +983,7 @@ class ScanOptionsBase(OptionsTimeoutBase):
             batch_time_limit=None,  # type: Optional[timedelta]
             transcoder=None,  # type: Optional[Transcoder]
             concurrency=None,  # type: Optional[int]
+            rows_per_fetch=None,  # type: Optional[int]
             span=None,  # type: Optional[SpanProtocol]
             parent_span=None,  # type: Optional[SpanProtocol]
     ):
@@ -985,6 +1001,7 @@ class ScanOptionsBase(OptionsTimeoutBase):
                 'batch_byte_limit',
                 'batch_item_limit',
                 'concurrency',
+                'rows_per_fetch',
                 'transcoder',
                 'span',
                 'parent_span']
@@ -1305,7 +1322,8 @@ class QueryOptionsBase(dict):
         raw=None,  # type: Optional[Dict[str,Any]]
         span=None,  # type: Optional[SpanProtocol]
         parent_span=None,  # type: Optional[SpanProtocol]
-        serializer=None  # type: Optional[Serializer]
+        serializer=None,  # type: Optional[Serializer]
+        rows_per_fetch=None  # type: Optional[int]
     ):
         pass
 
@@ -1336,6 +1354,7 @@ class AnalyticsOptionsBase(OptionsTimeoutBase):
                  query_context=None,  # type: Optional[str]
                  raw=None,              # type: Optional[Dict[str, Any]]
                  serializer=None,  # type: Optional[Serializer]
+                 rows_per_fetch=None,  # type: Optional[int]
                  span=None,  # type: Optional[SpanProtocol]
                  parent_span=None,  # type: Optional[SpanProtocol]
                  ):
@@ -1374,6 +1393,7 @@ class SearchOptionsBase(OptionsTimeoutBase):
                  include_locations=None,  # type: Optional[bool]
                  client_context_id=None,  # type: Optional[str]
                  serializer=None,  # type: Optional[Serializer]
+                 rows_per_fetch=None,  # type: Optional[int]
                  show_request=None,      # type: Optional[bool]
                  log_request=None,      # type: Optional[bool]
                  log_response=None,      # type: Optional[bool]
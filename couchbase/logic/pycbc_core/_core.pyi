@@ -68,6 +68,7 @@ class pycbc_result(Generic[T]):
     core_span: Optional[Any]
     start_time: Optional[int]
     end_time: Optional[int]
+    dispatch_stats: Optional[Dict[str, Dict[str, int]]]
 
     def __init__(self) -> None: ...
 
@@ -86,6 +87,17 @@ class pycbc_streamed_result(Generic[T]):
 
     def is_cancelled(self) -> bool: ...
 
+    def set_notifier(self, notifier: Optional[Callable[[], Any]]) -> None: ...
+
+    def is_ready(self) -> bool: ...
+
+    def next_batch(self, max_rows: int, max_wait: Optional[int] = None) -> List[Union[T, pycbc_exception, None]]: ...
+
+
+class pycbc_value_buffer:
+    # exposes the buffer protocol (read-only); KV results hold a memoryview over it
+    ...
+
 
 class pycbc_scan_iterator(Generic[T]):
 
@@ -97,6 +109,8 @@ class pycbc_scan_iterator(Generic[T]):
 
     def is_cancelled(self) -> bool: ...
 
+    def next_batch(self, max_rows: int, max_wait: Optional[int] = None) -> List[Union[T, pycbc_exception]]: ...
+
 
 class pycbc_exception:
 
@@ -316,7 +330,7 @@ class pycbc_connection:
     def connected(self) -> bool:
         ...
 
-    def __init__(self, num_io_threads: int = 1) -> None:
+    def __init__(self, num_io_threads: int = 1, zero_copy_values: bool = False) -> None:
         ...
 
     # ==========================================================================================
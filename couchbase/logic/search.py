@@ -34,6 +34,7 @@ from couchbase.exceptions import ErrorMapper, InvalidArgumentException
 from couchbase.logic.observability import ObservableRequestHandler, SpanProtocol
 from couchbase.logic.options import SearchOptionsBase
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
+from couchbase.logic.streaming import DEFAULT_ROWS_PER_FETCH, RowBuffer
 from couchbase.logic.supportability import Supportability
 from couchbase.logic.vector_search import VectorQueryCombination
 from couchbase.options import (SearchOptions,
@@ -926,6 +927,7 @@ class SearchQueryBuilder:
         "include_locations": {"include_locations": lambda x: x},
         "client_context_id": {"client_context_id": lambda x: x},
         "serializer": {"serializer": lambda x: x},
+        "rows_per_fetch": {"rows_per_fetch": lambda x: x},
         "facets": {},
         "sort": {},
         "show_request": {"show_request": lambda x: x},
@@ -1204,11 +1206,11 @@ class SearchQueryBuilder:
 
         # avoid circular import
         from couchbase.mutation_state import MutationState  # noqa: F811
-        if not (isinstance(value, MutationState) and len(value._sv) > 0):
+        if not (isinstance(value, MutationState) and len(value) > 0):
             raise TypeError('Passed empty or invalid state')
         # 3.x SDK had to set the consistency, couchbase++ will take care of that for us
         self._params.pop('scan_consistency', None)
-        self.set_option('mutation_state', list(mt.as_dict() for mt in value._sv))
+        self.set_option('mutation_state', value._as_token_dicts())
 
     @property
     def scope_name(self) -> Optional[str]:
@@ -1281,6 +1283,17 @@ class SearchQueryBuilder:
             raise InvalidArgumentException(message='Serializer should implement Serializer interface.')
         self.set_option('serializer', value)
 
+    @property
+    def rows_per_fetch(self) -> Optional[int]:
+        return self._params.get('rows_per_fetch', None)
+
+    @rows_per_fetch.setter
+    def rows_per_fetch(self, value  # type: int
+                       ):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise InvalidArgumentException(message='rows_per_fetch must be a positive int.')
+        self.set_option('rows_per_fetch', value)
+
     @property
     def show_request(self) -> bool:
         return self._params.get('show_request', False)
@@ -1450,6 +1463,7 @@ class FullTextSearchRequestLogic:
         self._scope_name = kwargs.pop('scope_name', None)
         self._obs_handler: Optional[ObservableRequestHandler] = kwargs.pop('obs_handler', None)
         self._processed_core_span = False
+        self._row_buffer = RowBuffer(self.encoded_query.get('rows_per_fetch', DEFAULT_ROWS_PER_FETCH))
 
     @property
     def encoded_query(self) -> Dict[str, Any]:
@@ -0,0 +1,192 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import copy
+import threading
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Dict,
+                    Hashable,
+                    Iterable,
+                    Optional)
+
+from couchbase.logic.observability.logging_meter import LoggingMeter
+from couchbase.logic.operation_types import KeyValueOperationCode
+
+if TYPE_CHECKING:
+    from couchbase.logic.observability.observability_types import MeterProtocol
+    from couchbase.logic.pycbc_core import pycbc_kv_request as PycbcCoreKeyValueRequest
+
+# Counter name reported by the LoggingMeter
+SINGLE_FLIGHT_SAVED = 'single_flight.saved'
+
+# the reads that are shared
+SINGLE_FLIGHT_OPCODES = frozenset([
+    KeyValueOperationCode.Get.value,
+    KeyValueOperationCode.GetProjected.value,
+    KeyValueOperationCode.Exists.value,
+    KeyValueOperationCode.LookupIn.value,
+    KeyValueOperationCode.GetAnyReplica.value,
+])
+
+# the options of a read that change what the server returns
+_REQUEST_OPTIONS = ('access_deleted', 'projections', 'with_expiry', 'read_preference', 'timeout')
+
+
+def single_flight_key(req: PycbcCoreKeyValueRequest) -> Optional[Hashable]:
+    """**INTERNAL**
+
+    Returns what identifies the read among the reads of the same document, or None if the read is not shared.
+    """
+    if req.opcode not in SINGLE_FLIGHT_OPCODES:
+        return None
+    options = []
+    for name in _REQUEST_OPTIONS:
+        value = getattr(req, name, None)
+        options.append(tuple(value) if isinstance(value, list) else value)
+    specs = getattr(req, 'specs', None)
+    if specs:
+        options.append(tuple((spec['opcode'], spec['path'], spec['flags']) for spec in specs))
+    return (req.opcode, *options)
+
+
+def copy_shared_exception(exc: BaseException) -> BaseException:
+    """**INTERNAL**
+
+    Returns a copy of the exception of a shared read, for one of its callers.  Raising the shared instance from
+    several callers would have them all extend, and race on, the same traceback.
+    """
+    try:
+        return copy.copy(exc)
+    except Exception:
+        # e.g. the exception's constructor does not accept its args
+        return exc
+
+
+class SingleFlightBase:
+    """**INTERNAL**
+
+    Shares one request among the identical reads of a document that are in flight at the same time.  The reads
+    are identical if they have the same operation and options (see :func:`single_flight_key`).  The callers share
+    the binding's result, each builds its own result object from it.  If the read fails, each caller raises its own
+    copy of the exception, chained to the shared one.
+
+    A mutation made through the collection forgets the reads of the document in flight, so a read issued once the
+    mutation completed does not join a read that might have been served before it.
+    """
+
+    def __init__(self, meter: Optional[MeterProtocol] = None) -> None:
+        self._saved = 0
+        # the saved counter is only reported by the LoggingMeter
+        if isinstance(meter, LoggingMeter):
+            self._saved_counter = meter.counter(SINGLE_FLIGHT_SAVED)
+        else:
+            self._saved_counter = None
+
+    @property
+    def saved(self) -> int:
+        """**INTERNAL**
+
+        The number of requests that were not sent because an identical read was in flight.
+        """
+        return self._saved
+
+    @staticmethod
+    def accepts(req: PycbcCoreKeyValueRequest) -> bool:
+        """**INTERNAL**"""
+        return req.opcode in SINGLE_FLIGHT_OPCODES
+
+    def _record_saved(self) -> None:
+        self._saved += 1
+        if self._saved_counter is not None:
+            self._saved_counter.add()
+
+
+class _SingleFlightCall:
+    __slots__ = ('done', 'result', 'exception')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None  # type: Any
+        self.exception = None  # type: Optional[BaseException]
+
+
+class SingleFlight(SingleFlightBase):
+    """**INTERNAL**
+
+    Thread-safe single-flight of the blocking API.  The first caller of a read sends the request, the callers of
+    an identical read block until it completes.
+    """
+
+    def __init__(self, meter: Optional[MeterProtocol] = None) -> None:
+        super().__init__(meter=meter)
+        self._calls = {}  # type: Dict[str, Dict[Hashable, _SingleFlightCall]]
+        self._lock = threading.Lock()
+
+    def execute(self, req: PycbcCoreKeyValueRequest, fn: Callable[[], Any]) -> Any:
+        """**INTERNAL**
+
+        Returns the result of ``fn``, the call sending the request, or of the identical read in flight.
+        """
+        flight_key = single_flight_key(req)
+        if flight_key is None:
+            return fn()
+        with self._lock:
+            calls = self._calls.setdefault(req.key, {})
+            call = calls.get(flight_key, None)
+            leader = call is None
+            if leader:
+                call = calls[flight_key] = _SingleFlightCall()
+            else:
+                self._record_saved()
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise copy_shared_exception(call.exception) from call.exception
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as ex:
+            call.exception = ex
+            raise
+        finally:
+            self._remove(req.key, flight_key, call)
+            call.done.set()
+
+    def forget(self, key: str) -> None:
+        """**INTERNAL**"""
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def forget_keys(self, keys: Iterable[str]) -> None:
+        """**INTERNAL**"""
+        with self._lock:
+            for key in keys:
+                self._calls.pop(key, None)
+
+    def _remove(self, key: str, flight_key: Hashable, call: _SingleFlightCall) -> None:
+        with self._lock:
+            calls = self._calls.get(key, None)
+            # the read might have been forgotten, and an identical one started since
+            if calls is not None and calls.get(flight_key, None) is call:
+                del calls[flight_key]
+                if not calls:
+                    del self._calls[key]
@@ -13,6 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+from collections import deque
+from functools import partial
+
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   CouchbaseException,
                                   ExceptionMap)
@@ -26,15 +30,27 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
 #   * ``_process_core_span(exc_val=None)`` -- end the observability span/meter (idempotent)
 #   * ``_get_metadata()``                  -- read trailing metadata once streaming completes
 #   * ``_done_streaming``                  -- terminal-state flag
+#   * ``_row_buffer``                      -- ``RowBuffer`` the rows are fetched through
 # and, for the async helper additionally:
-#   * ``_loop`` / ``_tp_executor``         -- event loop + executor used to offload the blocking fetch
-#   * ``_finalize(exc_val=None)``          -- end observability *and* release the executor
+#   * ``_loop`` / ``_streaming_executor``  -- event loop + shared executor used to offload the blocking fetch
+#   * ``_row_ready``                       -- ``asyncio.Event`` set by the streaming result once a row is
+#                                             available (event loop delivery), or None to use the executor
+#   * ``_finalize(exc_val=None)``          -- end observability *and* cancel the streaming result on error
+#
+# Event loop delivery (see ``enable_loop_delivery``) registers a notifier on the C++ streamed result so
+# the core signals the request's loop directly when rows are queued.  ``stream_anext`` then awaits that
+# signal and fetches the row inline, as it no longer blocks, instead of doing an executor round trip
+# (thread handoff plus two context switches) for every row.
+#
+# Rows are fetched from the C++ streamed result in batches (see ``RowBuffer``): one ``next_batch`` call
+# drains whatever rows are already queued (up to ``rows_per_fetch``), so the per-row cost of crossing
+# into C++ and releasing/re-acquiring the GIL is paid once per batch instead of once per row.
 #
 # The crucial detail: ``asyncio.CancelledError`` (and ``KeyboardInterrupt`` / ``SystemExit``)
 # derive from ``BaseException``, not ``Exception``.  The explicit ``except BaseException`` branch
-# ensures cancellation never bypasses teardown -- the span/meter are always ended and the executor
-# is always released -- while the exception is re-raised unchanged to preserve cancellation
-# semantics.
+# ensures cancellation never bypasses teardown -- the span/meter are always ended and the streaming
+# result is cancelled so it does not keep holding a shared executor thread -- while the exception
+# is re-raised unchanged to preserve cancellation semantics.
 
 
 def _internal_exception(message):
@@ -42,6 +58,88 @@ def _internal_exception(message):
     return exc_cls(message)
 
 
+# Number of rows requested per fetch from the C++ streamed result.  Only rows that are already queued
+# are returned, so a larger batch never delays the first row.
+DEFAULT_ROWS_PER_FETCH = 128
+
+
+class RowBuffer:
+    """
+    **INTERNAL**
+
+    Fetches rows from a ``pycbc_streamed_result`` or ``pycbc_scan_iterator`` ``rows_per_fetch`` at a
+    time (see their ``next_batch``) and hands them out one by one.
+
+    Args:
+        rows_per_fetch (int): Maximum number of rows per fetch.  1 fetches row by row (plain ``next()``).
+        max_wait (int, optional): Milliseconds to wait, after the first row, for a fetch to fill up.
+            None waits until ``rows_per_fetch`` rows are available (or the stream ends).
+        on_batch (Callable, optional): Called with each fetched batch (a list of rows), returns the rows to
+            buffer.  Not called when fetching row by row.
+    """
+
+    def __init__(self, rows_per_fetch, max_wait=0, on_batch=None):
+        self._rows_per_fetch = rows_per_fetch
+        self._max_wait = max_wait
+        self._on_batch = on_batch
+        self._rows = deque()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def next(self, source):
+        """
+        **INTERNAL**
+
+        Return the next row of ``source``, fetching a new batch if none are buffered.  Returns None, the
+        end-of-rows sentinel, when a batch comes back empty because ``source`` has nothing left to return
+        (e.g. it was cancelled).
+        """
+        if self._rows:
+            return self._rows.popleft()
+        if self._rows_per_fetch <= 1:
+            return next(source)
+        batch = source.next_batch(self._rows_per_fetch, self._max_wait)
+        if self._on_batch is not None:
+            batch = self._on_batch(batch)
+        self._rows.extend(batch)
+        if not self._rows:
+            return None
+        return self._rows.popleft()
+
+
+def _notify_loop(loop, row_ready):
+    # called by the streamed result (with the GIL held), usually from a C++ core IO thread
+    try:
+        loop.call_soon_threadsafe(row_ready.set)
+    except RuntimeError:
+        # the event loop has been closed, nothing is waiting on the rows anymore
+        pass
+
+
+def enable_loop_delivery(req):
+    """
+    **INTERNAL**
+
+    Have ``req``'s streaming result signal ``req._loop`` whenever rows become available so that
+    ``stream_anext`` can await rows without offloading the fetch to the streaming executor.  Must be
+    called from the event loop once the streaming op has been submitted.
+    """
+    req._row_ready = asyncio.Event()
+    req._streaming_result.set_notifier(partial(_notify_loop, req._loop, req._row_ready))
+
+
+async def _wait_for_row(req):
+    streaming_result = req._streaming_result
+    # rows left over from the previous fetch can be handed out right away
+    while not (len(req._row_buffer) or streaming_result.is_ready()):
+        req._row_ready.clear()
+        # re-check after clearing, the notifier may have fired in-between
+        if streaming_result.is_ready():
+            break
+        await req._row_ready.wait()
+
+
 async def stream_anext(req):
     """
     **INTERNAL**
@@ -49,8 +147,13 @@ async def stream_anext(req):
     Drive a single async streaming iteration for ``req`` and apply uniform teardown/error handling.
     """
     try:
-        # this is a blocking operation, so it is offloaded to the request's executor
-        row = await req._loop.run_in_executor(req._tp_executor, req._get_next_row)
+        if req._row_ready is not None:
+            # event loop delivery: once the streaming result is ready, the fetch does not block
+            await _wait_for_row(req)
+            row = req._get_next_row()
+        else:
+            # this is a blocking operation, so it is offloaded to the cluster's shared streaming executor
+            row = await req._streaming_executor.run(req._loop, req._get_next_row)
         # We want to end the streaming op span once we have a response from the C++ core.
         # Unfortunately right now, that means we need to wait until we have the first row (or we
         # have an error).  As this is idempotent, it is safe to call for each row (it will only do
@@ -31,6 +31,7 @@ from couchbase.exceptions import ErrorMapper, InvalidArgumentException
 from couchbase.logic.observability import ObservableRequestHandler, SpanProtocol
 from couchbase.logic.options import ViewOptionsBase
 from couchbase.logic.pycbc_core import pycbc_exception as PycbcCoreException
+from couchbase.logic.streaming import DEFAULT_ROWS_PER_FETCH, RowBuffer
 from couchbase.management.views import DesignDocumentNamespace
 from couchbase.options import UnsignedInt64, ViewOptions
 from couchbase.serializer import DefaultJsonSerializer, Serializer
@@ -538,6 +539,7 @@ class ViewRequestLogic:
         self._metadata = None
         self._obs_handler: Optional[ObservableRequestHandler] = kwargs.pop('obs_handler', None)
         self._processed_core_span = False
+        self._row_buffer = RowBuffer(DEFAULT_ROWS_PER_FETCH)
 
     @property
     def encoded_query(self) -> Dict[str, Any]:
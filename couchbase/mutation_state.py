@@ -13,29 +13,56 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+import struct
 from typing import (TYPE_CHECKING,
                     Any,
-                    Optional)
+                    Dict,
+                    Iterator,
+                    List,
+                    Mapping,
+                    Optional,
+                    Tuple,
+                    Union)
 
-from couchbase.exceptions import MissingTokenException
-from couchbase.result import MutationToken
+from couchbase.exceptions import InvalidArgumentException, MissingTokenException
+from couchbase.result import MultiMutationResult, MutationToken
 
 if TYPE_CHECKING:
     from couchbase.result import MutationResult
 
+# binary format: version, bucket count, then per bucket: name length, name, entry count and the entries
+_BINARY_VERSION = 1
+_HEADER = struct.Struct('>BH')
+_BUCKET_HEADER = struct.Struct('>H')
+_ENTRY = struct.Struct('>HQQ')
+
+# partition_id -> (partition_uuid, sequence_number)
+PartitionVector = Dict[int, Tuple[int, int]]
+
 
 class MutationState:
-    def __init__(self, *docs,  # type: MutationResult
+    """Tracks the mutations a query, search or scan should be consistent with.
+
+    Only the highest sequence number of each partition (vbucket) of a bucket matters to the services, so the state
+    keeps a single (partition uuid, sequence number) entry per partition.  Its size is bounded by the number of
+    partitions of the buckets, no matter how many mutations were added.
+
+    The state can be exported (see :meth:`to_json` and :meth:`to_bytes`) and imported (see :meth:`from_json` and
+    :meth:`from_bytes`), e.g. to pass a session's consistency requirement between services.
+    """
+
+    def __init__(self, *docs,  # type: Union[MutationResult, MultiMutationResult]
                  **kwargs  # type: Any
                  ):
-        self._sv = set()
+        self._vectors = {}  # type: Dict[str, PartitionVector]
         if docs:
             self.add_results(*docs, **kwargs)
 
     def add_mutation_token(self, mut_token  # type: Optional[MutationToken]
                            ) -> None:
         if isinstance(mut_token, MutationToken):
-            self._sv.add(mut_token)
+            self._add_raw_token(mut_token.as_dict())
 
     def _add_scanvec(self, mut_token  # type: MutationToken
                      ) -> bool:
@@ -45,12 +72,29 @@ class MutationState:
             `(vbucket id, vbucket uuid, mutation sequence)`
         """
         if isinstance(mut_token, MutationToken):
-            self._sv.add(mut_token)
+            self._add_raw_token(mut_token.as_dict())
             return True
 
         return False
 
-    def add_results(self, *rvs,  # type: MutationResult
+    def _add_raw_token(self, token  # type: Mapping[str, Union[str, int]]
+                       ) -> None:
+        vector = self._vectors.get(token['bucket_name'], None)
+        if vector is None:
+            vector = self._vectors[token['bucket_name']] = {}
+        self._add_entry(vector, token['partition_id'], token['partition_uuid'], token['sequence_number'])
+
+    @staticmethod
+    def _add_entry(vector,  # type: PartitionVector
+                   partition_id,  # type: int
+                   partition_uuid,  # type: int
+                   sequence_number  # type: int
+                   ) -> None:
+        current = vector.get(partition_id, None)
+        if current is None or current[1] < sequence_number:
+            vector[partition_id] = (partition_uuid, sequence_number)
+
+    def add_results(self, *rvs,  # type: Union[MutationResult, MultiMutationResult]
                     **kwargs  # type: Any
                     ) -> bool:
         """
@@ -62,7 +106,9 @@ class MutationState:
         must have been successful.
 
         :param rvs: One or more :class:`~.OperationResult` which have been
-            returned from mutations
+            returned from mutations, or :class:`~.MultiMutationResult` which
+            have been returned from multi mutations (only the successful
+            results are added)
         :param quiet: Suppress errors if one of the results does not
             contain a convertible state.
         :return: `True` if the result was valid and added, `False` if not
@@ -73,16 +119,36 @@ class MutationState:
         if not rvs:
             raise MissingTokenException(message='No results passed')
         for rv in rvs:
-            mut_token = rv.mutation_token()
-            if not isinstance(mut_token, MutationToken):
-                if kwargs.get('quiet', False) is True:
-                    return False
-                raise MissingTokenException(
-                    message='Result does not contain token')
-            if not self._add_scanvec(mut_token):
-                return False
+            results = rv.results.values() if isinstance(rv, MultiMutationResult) else (rv,)
+            for res in results:
+                # avoid building a MutationToken per result
+                raw_token = getattr(res, '_raw_mutation_token', None)
+                if raw_token is None:
+                    if kwargs.get('quiet', False) is True:
+                        return False
+                    raise MissingTokenException(
+                        message='Result does not contain token')
+                self._add_raw_token(raw_token)
         return True
 
+    def add_mutation_state(self, other  # type: MutationState
+                           ) -> None:
+        """
+        Merges another state into this state, keeping the highest sequence
+        number of each partition.
+
+        :param other: The :class:`MutationState` to merge.
+        """
+        if not isinstance(other, MutationState):
+            raise InvalidArgumentException(message='Expected a MutationState.')
+        for bucket_name, other_vector in other._vectors.items():
+            vector = self._vectors.get(bucket_name, None)
+            if vector is None:
+                self._vectors[bucket_name] = dict(other_vector)
+                continue
+            for partition_id, (partition_uuid, sequence_number) in other_vector.items():
+                self._add_entry(vector, partition_id, partition_uuid, sequence_number)
+
     def add_all(self, bucket, quiet=False):
         """
         Ensures the query result is consistent with all prior
@@ -103,5 +169,115 @@ class MutationState:
         """
         raise NotImplementedError("Feature currently not implemented in 4.x series of the Python SDK")
 
+    def tokens(self) -> Iterator[MutationToken]:
+        """
+        Returns an iterator over the state's mutation tokens, one per
+        bucket partition.
+        """
+        for bucket_name, vector in self._vectors.items():
+            for partition_id, (partition_uuid, sequence_number) in vector.items():
+                yield MutationToken({'partition_id': partition_id,
+                                     'partition_uuid': partition_uuid,
+                                     'sequence_number': sequence_number,
+                                     'bucket_name': bucket_name})
+
+    def _as_token_dicts(self) -> List[Dict[str, Union[str, int]]]:
+        """
+        **INTERNAL**
+        """
+        return [{'partition_id': partition_id,
+                 'partition_uuid': partition_uuid,
+                 'sequence_number': sequence_number,
+                 'bucket_name': bucket_name}
+                for bucket_name, vector in self._vectors.items()
+                for partition_id, (partition_uuid, sequence_number) in vector.items()]
+
+    def export(self) -> Dict[str, Dict[str, List[Union[int, str]]]]:
+        """
+        Exports the state as a JSON compatible dict, in the scan vector
+        format of the query service: ``{bucket: {partition_id: [sequence_number, partition_uuid]}}``.
+        The partition uuid is exported as a string.
+        """
+        return {bucket_name: {str(partition_id): [sequence_number, str(partition_uuid)]
+                              for partition_id, (partition_uuid, sequence_number) in vector.items()}
+                for bucket_name, vector in self._vectors.items()}
+
+    def to_json(self) -> str:
+        """
+        Returns the state, as exported by :meth:`export`, encoded as a JSON string.
+        """
+        return json.dumps(self.export(), separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, value  # type: Union[str, bytes, Mapping[str, Any]]
+                  ) -> 'MutationState':
+        """
+        Creates a state from the output of :meth:`to_json` (or :meth:`export`).
+
+        :raise: :exc:`~.InvalidArgumentException` if the value is not a valid
+            exported state.
+        """
+        try:
+            exported = json.loads(value) if isinstance(value, (str, bytes)) else value
+            state = cls()
+            for bucket_name, entries in exported.items():
+                vector = state._vectors[bucket_name] = {}
+                for partition_id, (sequence_number, partition_uuid) in entries.items():
+                    cls._add_entry(vector, int(partition_id), int(partition_uuid), int(sequence_number))
+        except (AttributeError, TypeError, ValueError) as ex:
+            raise InvalidArgumentException(message=f'Invalid exported MutationState: {ex}') from None
+        return state
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the state encoded in a compact binary format, 18 bytes per
+        bucket partition.  Use :meth:`from_bytes` to decode it.
+        """
+        parts = [_HEADER.pack(_BINARY_VERSION, len(self._vectors))]
+        for bucket_name, vector in self._vectors.items():
+            name = bucket_name.encode('utf-8')
+            parts.append(_BUCKET_HEADER.pack(len(name)))
+            parts.append(name)
+            parts.append(_BUCKET_HEADER.pack(len(vector)))
+            parts.extend(_ENTRY.pack(partition_id, partition_uuid, sequence_number)
+                         for partition_id, (partition_uuid, sequence_number) in vector.items())
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, value  # type: bytes
+                   ) -> 'MutationState':
+        """
+        Creates a state from the output of :meth:`to_bytes`.
+
+        :raise: :exc:`~.InvalidArgumentException` if the value is not a valid
+            encoded state.
+        """
+        state = cls()
+        try:
+            version, bucket_count = _HEADER.unpack_from(value, 0)
+            if version != _BINARY_VERSION:
+                raise ValueError(f'unsupported version {version}')
+            offset = _HEADER.size
+            for _ in range(bucket_count):
+                name_len, = _BUCKET_HEADER.unpack_from(value, offset)
+                offset += _BUCKET_HEADER.size
+                bucket_name = bytes(value[offset:offset + name_len]).decode('utf-8')
+                offset += name_len
+                entry_count, = _BUCKET_HEADER.unpack_from(value, offset)
+                offset += _BUCKET_HEADER.size
+                vector = state._vectors[bucket_name] = {}
+                for partition_id, partition_uuid, sequence_number in _ENTRY.iter_unpack(
+                        value[offset:offset + entry_count * _ENTRY.size]):
+                    vector[partition_id] = (partition_uuid, sequence_number)
+                offset += entry_count * _ENTRY.size
+            if offset != len(value):
+                raise ValueError('unexpected trailing data')
+        except (struct.error, UnicodeDecodeError, ValueError) as ex:
+            raise InvalidArgumentException(message=f'Invalid encoded MutationState: {ex}') from None
+        return state
+
+    def __len__(self) -> int:
+        return sum(len(vector) for vector in self._vectors.values())
+
     def __repr__(self):
-        return "MutationState:{}".format(self._sv)
+        return "MutationState:{}".format(self._vectors)
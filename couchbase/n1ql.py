@@ -73,10 +73,10 @@ class N1QLRequest(QueryRequestLogic):
             return
 
         try:
-            row = next(self._streaming_result)
+            row = self._row_buffer.next(self._streaming_result)
         except StopIteration:
             # @TODO:  PYCBC-1524
-            row = next(self._streaming_result)
+            row = self._row_buffer.next(self._streaming_result)
 
         if isinstance(row, PycbcCoreException):
             raise ErrorMapper.build_exception(row)
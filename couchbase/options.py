@@ -372,8 +372,10 @@ class ClusterOptions(ClusterOptionsBase):
             TLSVerifyMode.PEER.
         disable_mozilla_ca_certificates (bool, optional): Set to True to disable loading Mozilla's list of CA
             certificates for TLS verification. Defaults to False (enabled).
-        serializer (:class:`~.serializer.Serializer`, optional): Global serializer to translate JSON to Python objects.
-            Defaults to :class:`~.serializer.DefaultJsonSerializer`.
+        serializer (Union[:class:`~.serializer.Serializer`, str], optional): Global serializer to translate JSON to
+            Python objects. Set to ``'fastest'`` to use the fastest installed JSON backend (see
+            :func:`~.serializer.get_fastest_serializer`); unless an explicit ``transcoder`` is provided, KV operations
+            then also use it. Defaults to :class:`~.serializer.DefaultJsonSerializer`.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Global transcoder to use for kv-operations.
             Defaults to :class:`~.transcoder.JsonTranscoder`.
         tcp_keep_alive_interval (timedelta, optional): TCP keep-alive interval. Defaults to None.
@@ -406,6 +408,10 @@ class ClusterOptions(ClusterOptionsBase):
         app_telemetry_ping_interval (timedelta, optional): Specifies the time to wait between sending consecutive websocket PING commands to the server. Defaults to 30 seconds.
         app_telemetry_ping_timeout (timedelta, optional): Specifies the time allowed for the server to respond to websocket PING command. Defaults to 2 seconds.
         enable_lazy_connections (bool, optional): Set to True to enable the C++ core to lazily establish bucket connections. Defaults to False (disabled).
+        streaming_executor_max_workers (int, optional): **acouchbase only** Maximum number of threads, shared by all async query, analytics, search, view and range scan results of the cluster, used to fetch streamed rows. Defaults to min(32, os.cpu_count() + 4).
+        streaming_executor_queue_depth (int, optional): **acouchbase only** Maximum number of row fetches waiting for a streaming executor thread.  Once reached, further fetches wait on the event loop until a fetch completes. Defaults to 4 * `streaming_executor_max_workers`.
+        enable_zero_copy_values (bool, optional): Set to True to have KV reads (get, get_and_lock, get_and_touch, get_any_replica, and get with projections) hand the document body to the transcoder as a read-only ``memoryview`` over the C++ core's response buffer instead of a ``bytes`` copy. The built-in transcoders and serializers accept memoryviews; custom transcoders must as well. Binary documents read with the :class:`~couchbase.transcoder.RawBinaryTranscoder` are returned as memoryviews. Defaults to False (disabled).
+        enable_hot_path_profiling (bool, optional): Set to True to time the stages of every KV operation (building the request, encoding, dispatch, the C++ core, resuming in Python, building the result and decoding) into per-stage histograms, see :meth:`~couchbase.cluster.Cluster.hot_path_stats`. Profiling can also be enabled for some operations only, with :meth:`~couchbase.cluster.Cluster.hot_path_profiling`. Defaults to False (disabled).
     """  # noqa: E501
 
     def apply_profile(self,
@@ -734,6 +740,9 @@ class ScanOptions(ScanOptionsBase):
             to use for this specific operation. Defaults to :class:`~couchbase.transcoder.JsonTranscoder`.
         concurrency (int, optional): The upper bound on the number of vbuckets that should be scanned in parallel.
             Defaults to 1.
+        rows_per_fetch (int, optional): The number of scan items the SDK retrieves from the underlying scan at a time
+            before handing them out. Each fetch waits until that many items are available (or the scan completes), so
+            values above 1 trade latency for throughput. Defaults to 1.
     """  # noqa: E501
 
 
@@ -909,6 +918,11 @@ class GetAllReplicasMultiOptions(dict):
             :class:`.GetAllReplicasOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -918,7 +932,9 @@ class GetAllReplicasMultiOptions(dict):
         transcoder=None,        # type: Optional[Transcoder]
         read_preference=None,   # type: Optional[ReadPreference]
         per_key_options=None,   # type: Dict[str, GetAllReplicasOptions]
-        return_exceptions=None  # type: Optional[bool]
+        return_exceptions=None,  # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -928,7 +944,8 @@ class GetAllReplicasMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'transcoder', 'read_preference', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'transcoder', 'read_preference', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class GetAnyReplicaMultiOptions(dict):
@@ -949,6 +966,11 @@ class GetAnyReplicaMultiOptions(dict):
             :class:`.GetAnyReplicaOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -958,7 +980,9 @@ class GetAnyReplicaMultiOptions(dict):
         transcoder=None,        # type: Optional[Transcoder]
         read_preference=None,   # type: Optional[ReadPreference]
         per_key_options=None,   # type: Dict[str, GetAnyReplicaOptions]
-        return_exceptions=None  # type: Optional[bool]
+        return_exceptions=None,  # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -968,7 +992,8 @@ class GetAnyReplicaMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'transcoder', 'read_preference', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'transcoder', 'read_preference', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class GetMultiOptions(dict):
@@ -991,6 +1016,11 @@ class GetMultiOptions(dict):
         per_key_options (Dict[str, :class:`.GetOptions`], optional): Specify :class:`.GetOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1001,7 +1031,9 @@ class GetMultiOptions(dict):
         project=None,  # type: Iterable[str]
         transcoder=None,  # type: Transcoder
         per_key_options=None,       # type: Dict[str, GetOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1012,7 +1044,8 @@ class GetMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'parent_span', 'with_expiry', 'project', 'transcoder',
-                'per_key_options', 'return_exceptions']
+                'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class ExistsMultiOptions(dict):
@@ -1028,6 +1061,11 @@ class ExistsMultiOptions(dict):
         per_key_options (Dict[str, :class:`.ExistsOptions`], optional): Specify :class:`.ExistsOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1035,7 +1073,9 @@ class ExistsMultiOptions(dict):
         timeout=None,  # type: timedelta
         parent_span=None,  # type: Optional[RequestSpan]
         per_key_options=None,       # type: Dict[str, ExistsOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1045,7 +1085,8 @@ class ExistsMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class UpsertMultiOptions(dict):
@@ -1067,6 +1108,17 @@ class UpsertMultiOptions(dict):
         per_key_options (Dict[str, :class:`.UpsertOptions`], optional): Specify :class:`.UpsertOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        encode_parallelism (int, optional): If greater than 1, the documents are encoded in chunks on a shared pool
+            with this many workers and each chunk is dispatched as soon as it is encoded.  Encoding spans are not
+            created for the documents when set.  Defaults to 1 (documents are encoded on the calling thread).
+        encode_executor (str, optional): The pool used when *encode_parallelism* is greater than 1.  Use ``'thread'``
+            for serializers that release the GIL or ``'process'`` for CPU-bound serializers (the transcoder and the
+            documents must be picklable).  Defaults to ``'thread'``.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1078,7 +1130,11 @@ class UpsertMultiOptions(dict):
         durability=None,  # type: DurabilityType
         transcoder=None,  # type: Transcoder
         per_key_options=None,       # type: Dict[str, UpsertOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,      # type: Optional[bool]
+        encode_parallelism=None,     # type: Optional[int]
+        encode_executor=None,        # type: Optional[str]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1089,7 +1145,9 @@ class UpsertMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'parent_span', 'expiry', 'preserve_expiry', 'durability',
-                'transcoder', 'per_key_options', 'return_exceptions']
+                'transcoder', 'per_key_options', 'return_exceptions',
+                'encode_parallelism', 'encode_executor',
+                'max_in_flight', 'group_by_node']
 
 
 class InsertMultiOptions(dict):
@@ -1110,6 +1168,17 @@ class InsertMultiOptions(dict):
         per_key_options (Dict[str, :class:`.InsertOptions`], optional): Specify :class:`.InsertOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        encode_parallelism (int, optional): If greater than 1, the documents are encoded in chunks on a shared pool
+            with this many workers and each chunk is dispatched as soon as it is encoded.  Encoding spans are not
+            created for the documents when set.  Defaults to 1 (documents are encoded on the calling thread).
+        encode_executor (str, optional): The pool used when *encode_parallelism* is greater than 1.  Use ``'thread'``
+            for serializers that release the GIL or ``'process'`` for CPU-bound serializers (the transcoder and the
+            documents must be picklable).  Defaults to ``'thread'``.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1120,7 +1189,11 @@ class InsertMultiOptions(dict):
         durability=None,  # type: DurabilityType
         transcoder=None,  # type: Transcoder
         per_key_options=None,       # type: Dict[str, InsertOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,      # type: Optional[bool]
+        encode_parallelism=None,     # type: Optional[int]
+        encode_executor=None,        # type: Optional[str]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1130,7 +1203,9 @@ class InsertMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'expiry', 'durability', 'transcoder', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'expiry', 'durability', 'transcoder', 'per_key_options', 'return_exceptions',
+                'encode_parallelism', 'encode_executor',
+                'max_in_flight', 'group_by_node']
 
 
 class ReplaceMultiOptions(dict):
@@ -1154,6 +1229,17 @@ class ReplaceMultiOptions(dict):
         per_key_options (Dict[str, :class:`.ReplaceOptions`], optional): Specify :class:`.ReplaceOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        encode_parallelism (int, optional): If greater than 1, the documents are encoded in chunks on a shared pool
+            with this many workers and each chunk is dispatched as soon as it is encoded.  Encoding spans are not
+            created for the documents when set.  Defaults to 1 (documents are encoded on the calling thread).
+        encode_executor (str, optional): The pool used when *encode_parallelism* is greater than 1.  Use ``'thread'``
+            for serializers that release the GIL or ``'process'`` for CPU-bound serializers (the transcoder and the
+            documents must be picklable).  Defaults to ``'thread'``.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1166,7 +1252,11 @@ class ReplaceMultiOptions(dict):
         durability=None,  # type: DurabilityType
         transcoder=None,  # type: Transcoder
         per_key_options=None,       # type: Dict[str, ReplaceOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,      # type: Optional[bool]
+        encode_parallelism=None,     # type: Optional[int]
+        encode_executor=None,        # type: Optional[str]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1177,7 +1267,9 @@ class ReplaceMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'parent_span', 'expiry', 'cas', 'preserve_expiry',
-                'durability', 'transcoder', 'per_key_options', 'return_exceptions']
+                'durability', 'transcoder', 'per_key_options', 'return_exceptions',
+                'encode_parallelism', 'encode_executor',
+                'max_in_flight', 'group_by_node']
 
 
 class RemoveMultiOptions(dict):
@@ -1199,6 +1291,11 @@ class RemoveMultiOptions(dict):
         per_key_options (Dict[str, :class:`.RemoveOptions`], optional): Specify :class:`.RemoveOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1209,7 +1306,9 @@ class RemoveMultiOptions(dict):
         durability=None,  # type: DurabilityType
         transcoder=None,  # type: Transcoder
         per_key_options=None,       # type: Dict[str, RemoveOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1219,7 +1318,8 @@ class RemoveMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'cas', 'durability', 'transcoder', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'cas', 'durability', 'transcoder', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class TouchMultiOptions(dict):
@@ -1235,6 +1335,11 @@ class TouchMultiOptions(dict):
         per_key_options (Dict[str, :class:`.TouchOptions`], optional): Specify :class:`.TouchOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1242,7 +1347,9 @@ class TouchMultiOptions(dict):
         timeout=None,  # type: timedelta
         parent_span=None,  # type: Optional[RequestSpan]
         per_key_options=None,       # type: Dict[str, TouchOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1252,7 +1359,8 @@ class TouchMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'expiry', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'expiry', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class GetAndLockMultiOptions(dict):
@@ -1269,6 +1377,11 @@ class GetAndLockMultiOptions(dict):
             key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1277,7 +1390,9 @@ class GetAndLockMultiOptions(dict):
         parent_span=None,  # type: Optional[RequestSpan]
         transcoder=None,  # type: Transcoder
         per_key_options=None,       # type: Dict[str, GetAndLockOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1287,7 +1402,8 @@ class GetAndLockMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'transcoder', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'transcoder', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 LockMultiOptions = GetAndLockMultiOptions
@@ -1307,6 +1423,11 @@ class UnlockMultiOptions(dict):
             key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1314,7 +1435,9 @@ class UnlockMultiOptions(dict):
         timeout=None,  # type: timedelta
         parent_span=None,  # type: Optional[RequestSpan]
         per_key_options=None,       # type: Dict[str, UnlockOptions]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1324,7 +1447,8 @@ class UnlockMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'parent_span', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'parent_span', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class IncrementMultiOptions(dict):
@@ -1346,6 +1470,11 @@ class IncrementMultiOptions(dict):
             key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1356,7 +1485,9 @@ class IncrementMultiOptions(dict):
         initial=None,      # type: Optional[SignedInt64]
         parent_span=None,         # type: Optional[RequestSpan]
         per_key_options=None,       # type: Optional[Dict[str, IncrementOptions]]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1367,7 +1498,8 @@ class IncrementMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'durability', 'delta',
-                'initial', 'parent_span', 'per_key_options', 'return_exceptions']
+                'initial', 'parent_span', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class DecrementMultiOptions(dict):
@@ -1389,6 +1521,11 @@ class DecrementMultiOptions(dict):
             key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1399,7 +1536,9 @@ class DecrementMultiOptions(dict):
         initial=None,      # type: Optional[SignedInt64]
         parent_span=None,         # type: Optional[RequestSpan]
         per_key_options=None,       # type: Optional[Dict[str, DecrementOptions]]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1410,7 +1549,8 @@ class DecrementMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'durability', 'delta',
-                'initial', 'parent_span', 'per_key_options', 'return_exceptions']
+                'initial', 'parent_span', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class AppendMultiOptions(dict):
@@ -1430,6 +1570,11 @@ class AppendMultiOptions(dict):
         per_key_options (Dict[str, :class:`.AppendOptions`], optional): Specify :class:`.AppendOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1439,7 +1584,9 @@ class AppendMultiOptions(dict):
         cas=None,          # type: Optional[int]
         parent_span=None,         # type: Optional[RequestSpan]
         per_key_options=None,       # type: Optional[Dict[str, AppendOptions]]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1450,7 +1597,8 @@ class AppendMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'durability', 'cas',
-                'parent_span', 'per_key_options', 'return_exceptions']
+                'parent_span', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 class PrependMultiOptions(dict):
@@ -1470,6 +1618,11 @@ class PrependMultiOptions(dict):
         per_key_options (Dict[str, :class:`.PrependOptions`], optional): Specify :class:`.PrependOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
+        max_in_flight (int, optional): The maximum number of the operation's requests in flight at once, the next
+            request is dispatched as soon as a response arrives.  Applies per node when *group_by_node* is set.
+            Defaults to no limit (every request is dispatched at once).
+        group_by_node (bool, optional): If True, the keys are grouped by the node hosting their vbucket so each
+            node gets its own pipeline of at most *max_in_flight* requests.  Defaults to False.
     """  # noqa: E501
     @overload
     def __init__(
@@ -1479,7 +1632,9 @@ class PrependMultiOptions(dict):
         cas=None,          # type: Optional[int]
         parent_span=None,         # type: Optional[RequestSpan]
         per_key_options=None,       # type: Optional[Dict[str, PrependOptions]]
-        return_exceptions=None      # type: Optional[bool]
+        return_exceptions=None,     # type: Optional[bool]
+        max_in_flight=None,  # type: Optional[int]
+        group_by_node=None  # type: Optional[bool]
     ):
         pass
 
@@ -1490,7 +1645,8 @@ class PrependMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'durability', 'cas',
-                'parent_span', 'per_key_options', 'return_exceptions']
+                'parent_span', 'per_key_options', 'return_exceptions',
+                'max_in_flight', 'group_by_node']
 
 
 NoValueMultiOptions = Union[GetMultiOptions, ExistsMultiOptions,
@@ -1556,6 +1712,9 @@ class QueryOptions(QueryOptionsBase):
         serializer (:class:`~couchbase.serializer.Serializer`, optional): Specifies an explicit serializer
             to use for this specific N1QL operation. Defaults to
             :class:`~couchbase.serializer.DefaultJsonSerializer`.
+        rows_per_fetch (int, optional): The maximum number of rows the SDK retrieves at a time from the
+            query results it has received. Only rows that have already arrived are fetched, so this does not
+            delay any row. Defaults to 128.
         raw (Dict[str, Any], optional): Specifies any additional parameters which should be passed to the query engine
             when executing the query. Defaults to None.
     """
@@ -1587,6 +1746,9 @@ class AnalyticsOptions(AnalyticsOptionsBase):
         serializer (:class:`~couchbase.serializer.Serializer`, optional): Specifies an explicit serializer
             to use for this specific analytics query. Defaults to
             :class:`~couchbase.serializer.DefaultJsonSerializer`.
+        rows_per_fetch (int, optional): The maximum number of rows the SDK retrieves at a time from the
+            analytics results it has received. Only rows that have already arrived are fetched, so this does not
+            delay any row. Defaults to 128.
         raw (Dict[str, Any], optional): Specifies any additional parameters which should be passed to the analytics
             query engine when executing the analytics query. Defaults to None.
     """
@@ -1634,6 +1796,9 @@ class SearchOptions(SearchOptionsBase):
         serializer (:class:`~couchbase.serializer.Serializer`, optional): Specifies an explicit serializer
             to use for this specific search query. Defaults to
             :class:`~couchbase.serializer.DefaultJsonSerializer`.
+        rows_per_fetch (int, optional): The maximum number of rows the SDK retrieves at a time from the
+            search results it has received. Only rows that have already arrived are fetched, so this does not
+            delay any row. Defaults to 128.
         raw (Dict[str, Any], optional): Specifies any additional parameters which should be passed to the search query
             engine when executing the search query. Defaults to None.
         show_request (bool, optional): Specifies if the search response should contain the request for the search query. Defaults to False.
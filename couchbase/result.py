@@ -18,8 +18,10 @@ from __future__ import annotations
 import json
 from copy import copy
 from datetime import datetime
-from typing import (Any,
+from typing import (TYPE_CHECKING,
+                    Any,
                     Dict,
+                    Iterable,
                     List,
                     Optional,
                     Tuple,
@@ -44,8 +46,13 @@ from couchbase.logic.pycbc_core import pycbc_result
 from couchbase.subdocument import parse_subdocument_content_as, parse_subdocument_exists
 from couchbase.transcoder import Transcoder
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 class Result:
+    __slots__ = ('_orig', '_raw', '_transcoder', '_decoded_value', '_is_subdoc', '_key', '_is_scan_result')
+
     def __init__(
         self,
         orig,            # type: pycbc_result
@@ -55,6 +62,8 @@ class Result:
         is_scan_result=None,  # type: Optional[bool]
     ):
         self._orig = orig
+        # the binding's raw_result dict is read on every attribute access, resolve it once
+        self._raw = orig.raw_result
         self._transcoder = transcoder
         self._decoded_value: Optional[Any] = None
         self._is_subdoc = is_subdoc if is_subdoc is not None else False
@@ -76,21 +85,21 @@ class Result:
         """
             int: The CAS of the document.
         """
-        return self._orig.raw_result.get("cas", 0)
+        return self._raw.get("cas", 0)
 
     @property
     def flags(self) -> Optional[int]:
         """
             Optional[int]: Flags associated with the document.  Used for transcoding.
         """
-        return self._orig.raw_result.get("flags", 0)
+        return self._raw.get("flags", 0)
 
     @property
     def key(self) -> Optional[str]:
         """
             Optional[str]: Key for the operation, if it exists.
         """
-        # return self._orig.raw_result.get("key", None)
+        # return self._raw.get("key", None)
         return self._key
 
     @property
@@ -104,16 +113,10 @@ class Result:
         if self._transcoder is None:
             return
 
-        if self._is_scan_result is True:
-            value = self._orig.raw_result.get('scan_item', {}).get('body', {}).get('value', None)
-            flags = self._orig.raw_result.get('scan_item', {}).get('body', {}).get('flags', None)
-            self._decoded_value = self._transcoder.decode_value(value, flags)
-        elif self._is_subdoc is False:
-            value = self._orig.raw_result.get('value', None)
-            flags = self._orig.raw_result.get('flags', None)
-            self._decoded_value = self._transcoder.decode_value(value, flags)
+        if self._is_subdoc is False:
+            self._decoded_value = self._transcoder.decode_value(*self._encoded_value())
         else:
-            value = self._orig.raw_result.get('fields', None)
+            value = self._raw.get('fields', None)
             self._decoded_value = []
             for f in value:
                 if 'value' in f:
@@ -126,6 +129,39 @@ class Result:
                 else:
                     self._decoded_value.append(f)
 
+    def _encoded_value(self) -> Tuple[Any, Optional[int]]:
+        if self._is_scan_result is True:
+            body = self._scan_body
+            return body.get('value', None), body.get('flags', None)
+        return self._raw.get('value', None), self._raw.get('flags', None)
+
+
+def decode_result_values(results  # type: Iterable[Result]
+                         ) -> None:
+    """**INTERNAL**
+
+    Decodes the document values of ``results`` up front, with a single
+    :meth:`~couchbase.transcoder.Transcoder.decode_values` call per transcoder.  Results of
+    subdocument operations, results that are already decoded and results whose transcoder fails to
+    decode the batch are left to be decoded lazily, so any error is raised when that result's value is accessed.
+    """
+    pending = {}
+    for res in results:
+        if res._transcoder is None or res._is_subdoc is True or res._decoded_value is not None:
+            continue
+        batch = pending.get(id(res._transcoder))
+        if batch is None:
+            batch = pending[id(res._transcoder)] = (res._transcoder, [])
+        batch[1].append(res)
+
+    for transcoder, batch in pending.values():
+        try:
+            values = transcoder.decode_values([res._encoded_value() for res in batch])
+        except Exception:  # nosec
+            continue
+        for res, value in zip(batch, values):
+            res._decoded_value = value
+
 
 class ContentProxy:
     """
@@ -171,13 +207,14 @@ class ContentSubdocProxy:
 
 
 class DiagnosticsResult(Result):
+    __slots__ = ('_endpoints',)
 
     def __init__(
         self,
         orig,  # type: pycbc_result
     ):
         super().__init__(orig)
-        svc_endpoints = self._orig.raw_result.get('services', None)
+        svc_endpoints = self._raw.get('services', None)
         self._endpoints = {}
         if svc_endpoints:
             for service, endpoints in svc_endpoints.items():
@@ -192,21 +229,21 @@ class DiagnosticsResult(Result):
         """
             str: The unique identifier for this report.
         """
-        return self._orig.raw_result.get("id", None)
+        return self._raw.get("id", None)
 
     @property
     def version(self) -> int:
         """
             int: The version number of this report.
         """
-        return self._orig.raw_result.get("version", None)
+        return self._raw.get("version", None)
 
     @property
     def sdk(self) -> str:
         """
             str: The name of the SDK which generated this report.
         """
-        return self._orig.raw_result.get("sdk", None)
+        return self._raw.get("sdk", None)
 
     @property
     def endpoints(self) -> Dict[ServiceType, List[EndpointDiagnosticsReport]]:
@@ -254,13 +291,14 @@ class DiagnosticsResult(Result):
 
 
 class PingResult(Result):
+    __slots__ = ('_endpoints',)
 
     def __init__(
         self,
         orig,  # type: pycbc_result
     ):
         super().__init__(orig)
-        svc_endpoints = self._orig.raw_result.get('services', None)
+        svc_endpoints = self._raw.get('services', None)
         self._endpoints = {}
         if svc_endpoints:
             for service, endpoints in svc_endpoints.items():
@@ -275,21 +313,21 @@ class PingResult(Result):
         """
             str: The unique identifier for this report.
         """
-        return self._orig.raw_result.get("id", None)
+        return self._raw.get("id", None)
 
     @property
     def version(self) -> int:
         """
             int: The version number of this report.
         """
-        return self._orig.raw_result.get("version", None)
+        return self._raw.get("version", None)
 
     @property
     def sdk(self) -> str:
         """
             str: The name of the SDK which generated this report.
         """
-        return self._orig.raw_result.get("sdk", None)
+        return self._raw.get("sdk", None)
 
     @property
     def endpoints(self) -> Dict[ServiceType, List[EndpointPingReport]]:
@@ -318,6 +356,7 @@ class PingResult(Result):
 
 
 class GetReplicaResult(Result):
+    __slots__ = ()
 
     @property
     def is_active(self) -> bool:
@@ -326,14 +365,14 @@ class GetReplicaResult(Result):
 
         bool: True if the result is the active document, False otherwise.
         """
-        return not self._orig.raw_result.get('replica')
+        return not self._raw.get('replica')
 
     @property
     def is_replica(self) -> bool:
         """
             bool: True if the result is a replica, False otherwise.
         """
-        return self._orig.raw_result.get('replica')
+        return self._raw.get('replica')
 
     @property
     def content_as(self) -> Any:
@@ -353,13 +392,14 @@ class GetReplicaResult(Result):
 
 
 class GetResult(Result):
+    __slots__ = ()
 
     @property
     def expiry_time(self) -> Optional[datetime]:
         """
             Optional[datetime]: The expiry of the document, if it was requested.
         """
-        time_ms = self._orig.raw_result.get("expiry", None)
+        time_ms = self._raw.get("expiry", None)
         if time_ms:
             return datetime.fromtimestamp(time_ms)
         return None
@@ -372,7 +412,7 @@ class GetResult(Result):
         Optional[datetime]: The expiry of the document, if it was requested.
         """
         # make this a datetime!
-        time_ms = self._orig.raw_result.get("expiry", None)
+        time_ms = self._raw.get("expiry", None)
         if time_ms:
             return datetime.fromtimestamp(time_ms)
         return None
@@ -440,6 +480,18 @@ class MultiResult:
         """
         return self._all_ok
 
+    @property
+    def dispatch_stats(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+            Optional[Dict[str, Dict[str, int]]]: Map of nodes (``host:port``) to the dispatch stats of the operation's
+                requests sent to the node: ``dispatched`` (number of requests), ``peak_in_flight`` (highest number
+                of requests in flight at once) and ``elapsed_us`` (microseconds from the node's first dispatch to
+                its last response).  Requests are not grouped by node unless *group_by_node* is set, they are then
+                reported under the ``'*'`` key (as are requests with an unknown node).  None if neither the
+                *max_in_flight* nor the *group_by_node* option was set.
+        """
+        return getattr(self._orig, 'dispatch_stats', None)
+
     @property
     def exceptions(self) -> Dict[str, CouchbaseException]:
         """
@@ -492,6 +544,7 @@ class MultiGetResult(MultiResult):
                  obs_handler=None  # type: Optional[ObservableRequestHandler]
                  ):
         super().__init__(orig, GetResult, return_exceptions, transcoders, obs_handler=obs_handler)
+        self._values_decoded = False
 
     @property
     def results(self) -> Dict[str, GetResult]:
@@ -503,6 +556,9 @@ class MultiGetResult(MultiResult):
         for k, v in self._results.items():
             if isinstance(v, GetResult):
                 res[k] = v
+        if not self._values_decoded:
+            decode_result_values(res.values())
+            self._values_decoded = True
         return res
 
     def __repr__(self):
@@ -514,13 +570,14 @@ class MultiGetResult(MultiResult):
 
 
 class ExistsResult(Result):
+    __slots__ = ()
 
     @property
     def exists(self) -> bool:
         """
             bool: True if the document exists, false otherwise.
         """
-        return self._orig.raw_result.get('document_exists', False)
+        return self._raw.get('document_exists', False)
 
     def __repr__(self):
         return "ExistsResult:{}".format(self._orig)
@@ -563,6 +620,18 @@ class MultiExistsResult:
         """
         return self._all_ok
 
+    @property
+    def dispatch_stats(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+            Optional[Dict[str, Dict[str, int]]]: Map of nodes (``host:port``) to the dispatch stats of the operation's
+                requests sent to the node: ``dispatched`` (number of requests), ``peak_in_flight`` (highest number
+                of requests in flight at once) and ``elapsed_us`` (microseconds from the node's first dispatch to
+                its last response).  Requests are not grouped by node unless *group_by_node* is set, they are then
+                reported under the ``'*'`` key (as are requests with an unknown node).  None if neither the
+                *max_in_flight* nor the *group_by_node* option was set.
+        """
+        return getattr(self._orig, 'dispatch_stats', None)
+
     @property
     def exceptions(self) -> Dict[str, CouchbaseException]:
         """
@@ -596,6 +665,8 @@ class MultiExistsResult:
 
 
 class MutationResult(Result):
+    __slots__ = ('_raw_mutation_token', '_mutation_token')
+
     def __init__(self,
                  orig,  # type: pycbc_result
                  key=None,        # type: Optional[str]
@@ -603,7 +674,7 @@ class MutationResult(Result):
                  is_subdoc=None,  # type: Optional[bool]
                  ):
         super().__init__(orig, key=key, transcoder=transcoder, is_subdoc=is_subdoc)
-        self._raw_mutation_token = self._orig.raw_result.get('token', None)
+        self._raw_mutation_token = self._raw.get('token', None)
         self._mutation_token = None
 
     def mutation_token(self) -> Optional[MutationToken]:
@@ -657,6 +728,18 @@ class MultiMutationResult:
         """
         return self._all_ok
 
+    @property
+    def dispatch_stats(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+            Optional[Dict[str, Dict[str, int]]]: Map of nodes (``host:port``) to the dispatch stats of the operation's
+                requests sent to the node: ``dispatched`` (number of requests), ``peak_in_flight`` (highest number
+                of requests in flight at once) and ``elapsed_us`` (microseconds from the node's first dispatch to
+                its last response).  Requests are not grouped by node unless *group_by_node* is set, they are then
+                reported under the ``'*'`` key (as are requests with an unknown node).  None if neither the
+                *max_in_flight* nor the *group_by_node* option was set.
+        """
+        return getattr(self._orig, 'dispatch_stats', None)
+
     @property
     def exceptions(self) -> Dict[str, CouchbaseException]:
         """
@@ -693,6 +776,8 @@ MultiResultType = Union[MultiGetResult, MultiMutationResult]
 
 
 class MutationToken:
+    __slots__ = ('_token',)
+
     def __init__(self, token  # type: Dict[str, Union[str, int]]
                  ):
         self._token = token
@@ -748,6 +833,8 @@ class MutationToken:
 
 
 class LookupInResult(Result):
+    __slots__ = ()
+
     def exists(self,  # type: LookupInResult
                index  # type: int
                ) -> bool:
@@ -778,6 +865,8 @@ class LookupInResult(Result):
 
 
 class LookupInReplicaResult(Result):
+    __slots__ = ()
+
     def exists(self,  # type: LookupInReplicaResult
                index  # type: int
                ) -> bool:
@@ -808,13 +897,14 @@ class LookupInReplicaResult(Result):
         """
             bool: True if the result is a replica, False otherwise.
         """
-        return self._orig.raw_result.get('is_replica')
+        return self._raw.get('is_replica')
 
     def __repr__(self):
         return "LookupInReplicaResult:{}".format(self._orig)
 
 
 class MutateInResult(MutationResult):
+    __slots__ = ()
 
     @property
     def content_as(self) -> ContentSubdocProxy:
@@ -834,6 +924,7 @@ class MutateInResult(MutationResult):
 
 
 class CounterResult(MutationResult):
+    __slots__ = ()
 
     # Uncomment and delete previous property when ready to remove cas CounterResult.
     # cas = RemoveProperty('cas')
@@ -846,20 +937,20 @@ class CounterResult(MutationResult):
 
             int: **DEPRECATED** The CAS of the document.
         """
-        return self._orig.raw_result.get("cas", 0)
+        return self._raw.get("cas", 0)
 
     @property
     def content(self) -> Optional[int]:
         """
             Optional[int]: The value of the document after the operation completed.
         """
-        return self._orig.raw_result.get("content", None)
+        return self._raw.get("content", None)
 
     def __repr__(self):
         # Uncomment and delete previous return when ready to remove cas from CounterResult. Or, ideally,
         # remove cas from the cxx client's response.
-        # return "CounterResult:{}".format({k:v for k,v in self._orig.raw_result.items() if k != 'cas'})
-        return "CounterResult:{}".format(self._orig.raw_result)
+        # return "CounterResult:{}".format({k:v for k,v in self._raw.items() if k != 'cas'})
+        return "CounterResult:{}".format(self._raw)
 
 
 class MultiCounterResult:
@@ -899,6 +990,18 @@ class MultiCounterResult:
         """
         return self._all_ok
 
+    @property
+    def dispatch_stats(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+            Optional[Dict[str, Dict[str, int]]]: Map of nodes (``host:port``) to the dispatch stats of the operation's
+                requests sent to the node: ``dispatched`` (number of requests), ``peak_in_flight`` (highest number
+                of requests in flight at once) and ``elapsed_us`` (microseconds from the node's first dispatch to
+                its last response).  Requests are not grouped by node unless *group_by_node* is set, they are then
+                reported under the ``'*'`` key (as are requests with an unknown node).  None if neither the
+                *max_in_flight* nor the *group_by_node* option was set.
+        """
+        return getattr(self._orig, 'dispatch_stats', None)
+
     @property
     def exceptions(self) -> Dict[str, CouchbaseException]:
         """
@@ -1052,17 +1155,20 @@ class HttpResult:
 
 
 class ScanResult(Result):
+    __slots__ = ('_ids_only', '_scan_item', '_scan_body')
 
     def __init__(self, orig, ids_only, transcoder):
         super().__init__(orig, transcoder=transcoder, is_scan_result=True)
         self._ids_only = ids_only
+        self._scan_item = self._raw.get('scan_item', {})
+        self._scan_body = self._scan_item.get('body', {})
 
     @property
     def id(self) -> Optional[str]:
         """
             Optional[str]: Id for the operation, if it exists.
         """
-        return self._orig.raw_result.get('scan_item', {}).get('key', None)
+        return self._scan_item.get('key', None)
 
     @property
     def ids_only(self) -> bool:
@@ -1079,7 +1185,7 @@ class ScanResult(Result):
         if self.ids_only:
             raise InvalidArgumentException(("No cas available when scan is requested with "
                                             "`ScanOptions` ids_only set to True."))
-        return self._orig.raw_result.get('scan_item', {}).get('body', {}).get('cas', 0)
+        return self._scan_body.get('cas', 0)
 
     @property
     def expiry_time(self) -> Optional[datetime]:
@@ -1089,7 +1195,7 @@ class ScanResult(Result):
         if self.ids_only:
             raise InvalidArgumentException(("No expiry_time available when scan is requested with "
                                             "`ScanOptions` ids_only set to True."))
-        time_ms = self._orig.raw_result.get('scan_item', {}).get('body', {}).get('expiry', None)
+        time_ms = self._scan_body.get('expiry', None)
         if time_ms:
             return datetime.fromtimestamp(time_ms)
         return None
@@ -1115,7 +1221,7 @@ class ScanResult(Result):
         return ContentProxy(self.value)
 
     def __repr__(self):
-        return f"ScanResult:{self._orig.raw_result['scan_item']}"
+        return f"ScanResult:{self._scan_item}"
 
 
 class ScanResultIterable:
@@ -1140,6 +1246,83 @@ class ScanResultIterable:
             return self.__aiter__()
         return self.__iter__()
 
+    def iter_record_batches(self,
+                            batch_rows=None,  # type: Optional[int]
+                            schema=None,  # type: Optional[pyarrow.Schema]
+                            id_column=None,  # type: Optional[str]
+                            ):
+        """The documents which have been returned by the scan, as Arrow record batches.
+
+        Each record batch has the document ids, in ``id_column``, followed by the fields of the documents.  The
+        documents are parsed as JSON straight into columns, ``batch_rows`` documents at a time, without decoding them
+        with the scan's transcoder.  The memory used is bounded by the batch size rather than by the size of the
+        collection.  A scan with ``ids_only`` only has the ``id_column``.  Requires ``pyarrow``
+        (``pip install couchbase[arrow]``).
+
+        .. note::
+            If using the *acouchbase* API be sure to use ``async for`` when looping over the record batches.
+
+        Args:
+            batch_rows (int, optional): The number of documents per record batch.  Defaults to 10000.
+            schema (``pyarrow.Schema``, optional): The schema of the documents, fields that are not part of the
+                schema are ignored.  Defaults to the schema of the first batch, later batches must then match it.
+            id_column (str, optional): The name of the document id column.  Defaults to ``meta_id``.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If batch_rows, schema or id_column is invalid.
+
+        Returns:
+            Iterable[``pyarrow.RecordBatch``]: Either an iterable or async iterable.
+        """
+        # pyarrow is only imported once the documents are converted
+        from couchbase.logic.columnar import (ScanRecordBatchBuilder,
+                                              aiter_record_batches,
+                                              iter_record_batches)
+        builder = ScanRecordBatchBuilder(batch_rows, schema, id_column)
+        self._request._decode_values = False
+        # avoid circular import
+        from acouchbase.kv_range_scan import AsyncRangeScanRequest  # noqa: F811
+        if isinstance(self._request, AsyncRangeScanRequest):
+            return aiter_record_batches(builder, self)
+        return iter_record_batches(builder, self)
+
+    def to_arrow(self,
+                 batch_rows=None,  # type: Optional[int]
+                 schema=None,  # type: Optional[pyarrow.Schema]
+                 id_column=None,  # type: Optional[str]
+                 ):
+        """The documents which have been returned by the scan, as an Arrow table.
+
+        The documents are parsed in batches, see :meth:`iter_record_batches`.
+
+        .. note::
+            If using the *acouchbase* API be sure to ``await`` the table.
+
+        Args:
+            batch_rows (int, optional): The number of documents parsed at a time.  Defaults to 10000.
+            schema (``pyarrow.Schema``, optional): The schema of the documents, see :meth:`iter_record_batches`.
+            id_column (str, optional): The name of the document id column.  Defaults to ``meta_id``.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If batch_rows, schema or id_column is invalid.
+
+        Returns:
+            ``pyarrow.Table``: The table, or an awaitable returning it.
+        """
+        # pyarrow is only imported once the documents are converted
+        from couchbase.logic.columnar import (ScanRecordBatchBuilder,
+                                              ato_table,
+                                              to_table)
+        builder = ScanRecordBatchBuilder(batch_rows, schema, id_column)
+        self._request._decode_values = False
+        # avoid circular import
+        from acouchbase.kv_range_scan import AsyncRangeScanRequest  # noqa: F811
+        if isinstance(self._request, AsyncRangeScanRequest):
+            return ato_table(builder, self)
+        return to_table(builder, self)
+
     def cancel_scan(self):
         self._request.cancel_scan()
 
@@ -1190,6 +1373,77 @@ class QueryResult:
         """
         return self._request.execute()
 
+    def iter_record_batches(self,
+                            batch_rows=None,  # type: Optional[int]
+                            schema=None,  # type: Optional[pyarrow.Schema]
+                            ):
+        """The rows which have been returned by the query, as Arrow record batches.
+
+        The JSON rows are parsed straight into columns, ``batch_rows`` rows at a time, without deserializing them into
+        Python objects (the ``serializer`` of the :class:`~couchbase.options.QueryOptions` is not used).  The memory
+        used is bounded by the batch size rather than by the size of the result.  Rows that are not JSON objects (e.g.
+        ``SELECT RAW``) are put in a ``value`` column.  Requires ``pyarrow`` (``pip install couchbase[arrow]``).
+
+        .. note::
+            If using the *acouchbase* API be sure to use ``async for`` when looping over the record batches.
+
+        Args:
+            batch_rows (int, optional): The number of rows per record batch.  Defaults to 10000.
+            schema (``pyarrow.Schema``, optional): The schema of the record batches, row fields that are not part of
+                the schema are ignored.  Defaults to the schema of the first batch, later batches must then match it.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If batch_rows or schema is invalid.
+
+        Returns:
+            Iterable[``pyarrow.RecordBatch``]: Either an iterable or async iterable.
+        """
+        # pyarrow is only imported once the rows are converted
+        from couchbase.logic.columnar import (RecordBatchBuilder,
+                                              aiter_record_batches,
+                                              iter_record_batches,
+                                              use_raw_rows)
+        builder = RecordBatchBuilder(batch_rows, schema)
+        use_raw_rows(self._request)
+        if isinstance(self._request, AsyncN1QLRequest):
+            return aiter_record_batches(builder, self)
+        return iter_record_batches(builder, self)
+
+    def to_arrow(self,
+                 batch_rows=None,  # type: Optional[int]
+                 schema=None,  # type: Optional[pyarrow.Schema]
+                 ):
+        """The rows which have been returned by the query, as an Arrow table.
+
+        The rows are parsed in batches, see :meth:`iter_record_batches`.  Use ``to_pandas()`` on the returned table
+        to get a DataFrame.
+
+        .. note::
+            If using the *acouchbase* API be sure to ``await`` the table.
+
+        Args:
+            batch_rows (int, optional): The number of rows parsed at a time.  Defaults to 10000.
+            schema (``pyarrow.Schema``, optional): The schema of the table, see :meth:`iter_record_batches`.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If batch_rows or schema is invalid.
+
+        Returns:
+            ``pyarrow.Table``: The table, or an awaitable returning it.
+        """
+        # pyarrow is only imported once the rows are converted
+        from couchbase.logic.columnar import (RecordBatchBuilder,
+                                              ato_table,
+                                              to_table,
+                                              use_raw_rows)
+        builder = RecordBatchBuilder(batch_rows, schema)
+        use_raw_rows(self._request)
+        if isinstance(self._request, AsyncN1QLRequest):
+            return ato_table(builder, self)
+        return to_table(builder, self)
+
     def metadata(self):
         """The meta-data which has been returned by the query.
 
@@ -1236,6 +1490,77 @@ class AnalyticsResult:
             return self.__aiter__()
         return self.__iter__()
 
+    def iter_record_batches(self,
+                            batch_rows=None,  # type: Optional[int]
+                            schema=None,  # type: Optional[pyarrow.Schema]
+                            ):
+        """The rows which have been returned by the analytics query, as Arrow record batches.
+
+        The JSON rows are parsed straight into columns, ``batch_rows`` rows at a time, without deserializing them into
+        Python objects (the ``serializer`` of the :class:`~couchbase.options.AnalyticsOptions` is not used).  The memory
+        used is bounded by the batch size rather than by the size of the result.  Rows that are not JSON objects (e.g.
+        ``SELECT RAW``) are put in a ``value`` column.  Requires ``pyarrow`` (``pip install couchbase[arrow]``).
+
+        .. note::
+            If using the *acouchbase* API be sure to use ``async for`` when looping over the record batches.
+
+        Args:
+            batch_rows (int, optional): The number of rows per record batch.  Defaults to 10000.
+            schema (``pyarrow.Schema``, optional): The schema of the record batches, row fields that are not part of
+                the schema are ignored.  Defaults to the schema of the first batch, later batches must then match it.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If batch_rows or schema is invalid.
+
+        Returns:
+            Iterable[``pyarrow.RecordBatch``]: Either an iterable or async iterable.
+        """
+        # pyarrow is only imported once the rows are converted
+        from couchbase.logic.columnar import (RecordBatchBuilder,
+                                              aiter_record_batches,
+                                              iter_record_batches,
+                                              use_raw_rows)
+        builder = RecordBatchBuilder(batch_rows, schema)
+        use_raw_rows(self._request)
+        if isinstance(self._request, AsyncAnalyticsRequest):
+            return aiter_record_batches(builder, self)
+        return iter_record_batches(builder, self)
+
+    def to_arrow(self,
+                 batch_rows=None,  # type: Optional[int]
+                 schema=None,  # type: Optional[pyarrow.Schema]
+                 ):
+        """The rows which have been returned by the analytics query, as an Arrow table.
+
+        The rows are parsed in batches, see :meth:`iter_record_batches`.  Use ``to_pandas()`` on the returned table
+        to get a DataFrame.
+
+        .. note::
+            If using the *acouchbase* API be sure to ``await`` the table.
+
+        Args:
+            batch_rows (int, optional): The number of rows parsed at a time.  Defaults to 10000.
+            schema (``pyarrow.Schema``, optional): The schema of the table, see :meth:`iter_record_batches`.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If batch_rows or schema is invalid.
+
+        Returns:
+            ``pyarrow.Table``: The table, or an awaitable returning it.
+        """
+        # pyarrow is only imported once the rows are converted
+        from couchbase.logic.columnar import (RecordBatchBuilder,
+                                              ato_table,
+                                              to_table,
+                                              use_raw_rows)
+        builder = RecordBatchBuilder(batch_rows, schema)
+        use_raw_rows(self._request)
+        if isinstance(self._request, AsyncAnalyticsRequest):
+            return ato_table(builder, self)
+        return to_table(builder, self)
+
     def metadata(self):
         """The meta-data which has been returned by the analytics query.
 
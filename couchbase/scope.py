@@ -55,13 +55,16 @@ class Scope:
     def collection(self, name: str) -> Collection:
         """Creates a :class:`~.collection.Collection` instance of the specified collection.
 
+        The instance is cached, later calls for the same collection return the same instance.
+
         Args:
             name (str): Name of the collection to reference.
 
         Returns:
             :class:`~.collection.Collection`: A :class:`~.collection.Collection` instance of the specified collection.
         """
-        return Collection(self, name)
+        return self._impl._client_adapter.handle_cache.get_or_create((self.bucket_name, self.name, name),
+                                                                     lambda: Collection(self, name))
 
     def query(self,
               statement,  # type: str
@@ -14,9 +14,29 @@
 #  limitations under the License.
 
 import json
+import math
 from abc import ABC, abstractmethod
 from typing import Any
 
+# Optional high-performance JSON backends (only available if installed)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
 
 class Serializer(ABC):
     """Interface a Custom Serializer must implement
@@ -32,6 +52,9 @@ class Serializer(ABC):
     def deserialize(self,
                     value  # type: bytes
                     ) -> Any:
+        """Deserializes ``value``.  ``value`` is a read-only ``memoryview`` when zero copy values are enabled
+        (see the ``enable_zero_copy_values`` :class:`~couchbase.options.ClusterOptions` option).
+        """
         raise NotImplementedError()
 
     @classmethod
@@ -53,4 +76,156 @@ class DefaultJsonSerializer(Serializer):
                     value  # type: bytes
                     ) -> Any:
 
-        return json.loads(value.decode('utf-8'))
+        # str(value, 'utf-8') also decodes memoryviews
+        return json.loads(str(value, 'utf-8'))
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in value)
+    return False
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    # the stdlib writes NaN and (-)Infinity as is, with the separators of the fast backends
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _stdlib_loads(value: Any) -> Any:
+    return json.loads(str(value, 'utf-8'))
+
+
+class OrjsonSerializer(Serializer):
+    """Serializer backed by `orjson <https://github.com/ijl/orjson>`_.
+
+    Encodes straight to UTF-8 ``bytes`` and decodes from ``bytes`` without an intermediate ``str``.  The output
+    is compact JSON, i.e. the same document as :class:`DefaultJsonSerializer` produces, without the whitespace
+    after separators.  Integers must fit in 64 bits.  orjson does not support ``NaN`` and ``(-)Infinity``, the
+    documents with such values are encoded and decoded with the stdlib instead, as by :class:`DefaultJsonSerializer`.
+
+    Raises:
+        ImportError: If orjson is not installed (``pip install couchbase[orjson]``).
+    """
+
+    def __init__(self):
+        if not HAS_ORJSON:
+            raise ImportError('orjson is not installed. Please install with: pip install couchbase[orjson]')
+        # non-str keys are converted to str, as json.dumps does
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+
+        encoded = orjson.dumps(value, option=self._option)
+        # orjson writes NaN and (-)Infinity as null
+        if b'null' in encoded and _has_non_finite_float(value):
+            return _stdlib_dumps(value)
+        return encoded
+
+    def deserialize(self,
+                    value  # type: bytes
+                    ) -> Any:
+
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # e.g. NaN, the stdlib raises if the document is not valid JSON either
+            return _stdlib_loads(value)
+
+
+class MsgspecSerializer(Serializer):
+    """Serializer backed by `msgspec <https://jcristharif.com/msgspec/>`_'s JSON encoder/decoder.
+
+    Encodes straight to UTF-8 ``bytes`` and decodes from ``bytes`` without an intermediate ``str``.  The output
+    is compact JSON, i.e. the same document as :class:`DefaultJsonSerializer` produces, without the whitespace
+    after separators.  msgspec does not support ``NaN`` and ``(-)Infinity``, the documents with such values are
+    encoded and decoded with the stdlib instead, as by :class:`DefaultJsonSerializer`.
+
+    Raises:
+        ImportError: If msgspec is not installed (``pip install couchbase[msgspec]``).
+    """
+
+    def __init__(self):
+        if not HAS_MSGSPEC:
+            raise ImportError('msgspec is not installed. Please install with: pip install couchbase[msgspec]')
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+
+        encoded = self._encoder.encode(value)
+        # msgspec writes NaN and (-)Infinity as null
+        if b'null' in encoded and _has_non_finite_float(value):
+            return _stdlib_dumps(value)
+        return encoded
+
+    def deserialize(self,
+                    value  # type: bytes
+                    ) -> Any:
+
+        try:
+            return self._decoder.decode(value)
+        except msgspec.DecodeError:
+            # e.g. NaN, the stdlib raises if the document is not valid JSON either
+            return _stdlib_loads(value)
+
+
+class UjsonSerializer(Serializer):
+    """Serializer backed by `ujson <https://github.com/ultrajson/ultrajson>`_.
+
+    The output is compact JSON, i.e. the same document as :class:`DefaultJsonSerializer` produces, without the
+    whitespace after separators.  If ujson rejects ``NaN`` or ``(-)Infinity``, the document is encoded with the
+    stdlib instead, as by :class:`DefaultJsonSerializer`.
+
+    Raises:
+        ImportError: If ujson is not installed (``pip install couchbase[ujson]``).
+    """
+
+    def __init__(self):
+        if not HAS_UJSON:
+            raise ImportError('ujson is not installed. Please install with: pip install couchbase[ujson]')
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+
+        try:
+            return ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+        except OverflowError:
+            # ujson versions that reject NaN and (-)Infinity
+            if _has_non_finite_float(value):
+                return _stdlib_dumps(value)
+            raise
+
+    def deserialize(self,
+                    value  # type: bytes
+                    ) -> Any:
+
+        if isinstance(value, memoryview):
+            value = str(value, 'utf-8')
+        return ujson.loads(value)
+
+
+def get_fastest_serializer() -> Serializer:
+    """Returns an instance of the fastest JSON serializer that is installed.
+
+    The backends are tried in order: orjson, msgspec, ujson.  If none of them is installed,
+    :class:`DefaultJsonSerializer` is returned.
+
+    Returns:
+        :class:`Serializer`: The serializer instance.
+    """
+    if HAS_ORJSON:
+        return OrjsonSerializer()
+    if HAS_MSGSPEC:
+        return MsgspecSerializer()
+    if HAS_UJSON:
+        return UjsonSerializer()
+    return DefaultJsonSerializer()
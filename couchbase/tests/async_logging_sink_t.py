@@ -0,0 +1,172 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+import time
+from collections import deque
+from threading import Lock
+
+import pytest
+
+from couchbase.logic.logging_config import AsyncLoggingSinkDrainer
+
+
+class FakeCoreLogger:
+    """Stands in for the pycbc_logger's asynchronous sink: a bounded queue drained into the logger."""
+
+    def __init__(self, logger, capacity=8):
+        self._logger = logger
+        self._capacity = capacity
+        self._queue = deque()
+        self._lock = Lock()
+        self.level = 0
+        self.dropped = 0
+        self.drain_calls = 0
+
+    def log(self, level, msg):
+        with self._lock:
+            if level < self.level:
+                return
+            if len(self._queue) >= self._capacity:
+                self.dropped += 1
+                return
+            self._queue.append((level, msg))
+
+    def drain_logging_sink(self, max_messages, timeout_ms=0):
+        self.drain_calls += 1
+        with self._lock:
+            batch = [self._queue.popleft() for _ in range(min(max_messages, len(self._queue)))]
+        if not batch and timeout_ms > 0:
+            time.sleep(min(timeout_ms, 5) / 1000)
+        for level, msg in batch:
+            self._logger.handle(logging.LogRecord(self._logger.name, level, 'core.cxx', 1, msg, None, None))
+        return len(batch)
+
+    def set_logging_sink_level(self, level):
+        self.level = level
+
+    def logging_sink_stats(self):
+        return {'async': True, 'queue_capacity': self._capacity, 'dropped': self.dropped}
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class AsyncLoggingSinkTestSuite:
+    TEST_MANIFEST = [
+        'test_drains_in_batches',
+        'test_flush_on_stop',
+        'test_get_logging_sink_stats',
+        'test_reports_dropped_messages',
+        'test_stop_is_idempotent',
+        'test_syncs_effective_level',
+    ]
+
+    @pytest.fixture()
+    def logger(self):
+        logger = logging.getLogger('couchbase.tests.async_logging_sink')
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        handler = ListHandler()
+        logger.addHandler(handler)
+        yield logger
+        logger.removeHandler(handler)
+
+    def test_drains_in_batches(self, logger):
+        core_logger = FakeCoreLogger(logger, capacity=16)
+        for i in range(10):
+            core_logger.log(logging.INFO, f'message {i}')
+        drainer = AsyncLoggingSinkDrainer(core_logger, logger, batch_size=4, flush_interval_ms=1)
+        drainer.flush()
+        records = logger.handlers[0].records
+        assert [r.getMessage() for r in records] == [f'message {i}' for i in range(10)]
+        # 3 batches of at most 4, then an empty one
+        assert core_logger.drain_calls == 4
+
+    def test_flush_on_stop(self, logger):
+        core_logger = FakeCoreLogger(logger, capacity=16)
+        drainer = AsyncLoggingSinkDrainer(core_logger, logger, flush_interval_ms=1)
+        drainer.start()
+        for i in range(5):
+            core_logger.log(logging.INFO, f'message {i}')
+        drainer.stop()
+        assert drainer.stopped is True
+        assert drainer.is_alive() is False
+        assert len(logger.handlers[0].records) == 5
+
+    def test_get_logging_sink_stats(self):
+        from couchbase import get_logging_sink_stats
+        stats = get_logging_sink_stats()
+        assert set(stats.keys()) == {'async', 'queue_capacity', 'dropped'}
+
+    def test_reports_dropped_messages(self, logger):
+        core_logger = FakeCoreLogger(logger, capacity=2)
+        for i in range(5):
+            core_logger.log(logging.INFO, f'message {i}')
+        drainer = AsyncLoggingSinkDrainer(core_logger, logger)
+        drainer.flush()
+        records = logger.handlers[0].records
+        assert len(records) == 3
+        assert records[-1].levelno == logging.WARNING
+        assert 'Dropped 3' in records[-1].getMessage()
+        # dropped messages are only reported once
+        drainer.flush()
+        assert len(records) == 3
+
+    def test_stop_is_idempotent(self, logger):
+        drainer = AsyncLoggingSinkDrainer(FakeCoreLogger(logger), logger, flush_interval_ms=1)
+        drainer.start()
+        drainer.stop()
+        drainer.stop()
+        assert drainer.stopped is True
+
+    def test_syncs_effective_level(self, logger):
+        core_logger = FakeCoreLogger(logger)
+        drainer = AsyncLoggingSinkDrainer(core_logger, logger)
+        drainer.sync_level()
+        assert core_logger.level == logging.DEBUG
+        logger.setLevel(logging.WARNING)
+        drainer.sync_level()
+        assert core_logger.level == logging.WARNING
+        core_logger.log(logging.INFO, 'discarded')
+        core_logger.log(logging.ERROR, 'kept')
+        drainer.flush()
+        assert [r.getMessage() for r in logger.handlers[0].records] == ['kept']
+        logger.disabled = True
+        try:
+            drainer.sync_level()
+            assert core_logger.level > logging.CRITICAL
+        finally:
+            logger.disabled = False
+
+
+class ClassicAsyncLoggingSinkTests(AsyncLoggingSinkTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicAsyncLoggingSinkTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicAsyncLoggingSinkTests) if valid_test_method(meth)]
+        test_list = set(AsyncLoggingSinkTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -43,6 +43,8 @@ class ClusterDiagnosticsTestSuite:
         'test_diagnostics',
         'test_diagnostics_after_query',
         'test_diagnostics_as_json',
+        'test_handle_cache',
+        'test_handle_cache_cleared_on_close',
         'test_multiple_close_cluster',
         'test_operations_after_close',
         'test_connected_property_after_close',
@@ -142,6 +144,34 @@ class ClusterDiagnosticsTestSuite:
                 assert data[0]['local'] is not None
                 assert data[0]['state'] is not None
 
+    def test_handle_cache(self, cb_env):
+        cluster = cb_env.cluster
+        bucket = cluster.bucket(cb_env.bucket.name)
+        assert cluster.bucket(cb_env.bucket.name) is bucket
+        scope = bucket.default_scope()
+        assert bucket.scope(scope.name) is scope
+        collection = bucket.default_collection()
+        assert cluster.bucket(cb_env.bucket.name).default_scope().collection(collection.name) is collection
+
+    @pytest.mark.flaky(reruns=5, reruns_delay=1)
+    def test_handle_cache_cleared_on_close(self, cb_env):
+        conn_string = cb_env.config.get_connection_string()
+        username, pw = cb_env.config.get_username_and_pw()
+        auth = PasswordAuthenticator(username, pw)
+        opts = ClusterOptions(auth)
+        cluster = Cluster.connect(conn_string, opts)
+        bucket = cluster.bucket(cb_env.bucket.name)
+        bucket.default_collection()
+        handle_cache = cluster._impl.client_adapter.handle_cache
+        # the bucket, the default scope and the default collection
+        assert len(handle_cache) == 3
+        bucket.close()
+        assert len(handle_cache) == 0
+        bucket = cluster.bucket(cb_env.bucket.name)
+        assert len(handle_cache) == 1
+        cluster.close()
+        assert len(handle_cache) == 0
+
     # TODO: really we could use a separate test class to test things like opening/closing buckets, cluster, etc...
     #    i.e. things that are not query, diagnostics, etc...  For now, lets just have this here
     # creating a new connection, allow retries
@@ -51,6 +51,8 @@ from tests.test_features import EnvironmentFeatures
 class CollectionMultiTestSuite:
 
     TEST_MANIFEST = [
+        'test_get_stream',
+        'test_get_stream_invalid_input',
         'test_multi_exists_invalid_input',
         'test_multi_exists_not_exist',
         'test_multi_exists_simple',
@@ -84,10 +86,14 @@ class CollectionMultiTestSuite:
         'test_multi_touch_invalid_input',
         'test_multi_touch_simple',
         'test_multi_unlock_invalid_input',
+        'test_multi_upsert_encode_parallelism',
+        'test_multi_upsert_encode_parallelism_invalid',
         'test_multi_upsert_global_opts',
         'test_multi_upsert_invalid_input',
         'test_multi_upsert_key_opts',
         'test_multi_upsert_simple',
+        'test_upsert_stream',
+        'test_upsert_stream_invalid_window',
     ]
 
     @pytest.fixture(scope='class')
@@ -141,6 +147,25 @@ class CollectionMultiTestSuite:
         for r in res.results.values():
             assert r.exists is False
 
+    def test_get_stream(self, cb_env):
+        keys_and_docs = cb_env.get_docs(10)
+        missing_key = 'not-a-key'
+        # a generator, the stream never needs all the keys
+        keys = (k for k in [*keys_and_docs.keys(), missing_key])
+        results = dict(cb_env.collection.get_stream(keys, window=3))
+        assert set(results.keys()) == {*keys_and_docs.keys(), missing_key}
+        assert isinstance(results.pop(missing_key), DocumentNotFoundException)
+        assert all(map(lambda r: isinstance(r, GetResult), results.values())) is True
+        for k, v in results.items():
+            assert v.content_as[dict] == keys_and_docs[k]
+
+    def test_get_stream_invalid_input(self, cb_env):
+        keys = list(cb_env.get_docs(1).keys())
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.get_stream(keys, window=0)
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.get_stream(keys[0])
+
     def test_multi_exists_invalid_input(self, cb_env):
         keys_and_docs = {
             'test-key1': {'what': 'a test doc!', 'id': 'test-key1'},
@@ -539,6 +564,27 @@ class CollectionMultiTestSuite:
         with pytest.raises(InvalidArgumentException):
             cb_env.collection.unlock_multi(list(keys_and_docs.keys()))
 
+    @pytest.mark.parametrize('encode_executor', ['thread', 'process'])
+    def test_multi_upsert_encode_parallelism(self, cb_env, encode_executor):
+        # enough documents to be encoded in several chunks
+        keys_and_docs = cb_env.get_new_docs(100)
+        opts = UpsertMultiOptions(encode_parallelism=2, encode_executor=encode_executor)
+        res = cb_env.collection.upsert_multi(keys_and_docs, opts)
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+        assert res.exceptions == {}
+        assert set(res.results.keys()) == set(keys_and_docs.keys())
+        assert all(map(lambda r: isinstance(r, MutationResult), res.results.values())) is True
+        for k, v in keys_and_docs.items():
+            assert cb_env.collection.get(k).content_as[dict] == v
+
+    def test_multi_upsert_encode_parallelism_invalid(self, cb_env):
+        keys_and_docs = cb_env.get_docs(4)
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.upsert_multi(keys_and_docs, UpsertMultiOptions(encode_parallelism=0))
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.upsert_multi(keys_and_docs, encode_parallelism=2, encode_executor='fibers')
+
     def test_multi_upsert_global_opts(self, cb_env):
         keys_and_docs = cb_env.get_docs(4)
         opts = UpsertMultiOptions(expiry=timedelta(seconds=2))
@@ -580,6 +626,21 @@ class CollectionMultiTestSuite:
         assert res.exceptions == {}
         assert all(map(lambda r: isinstance(r, MutationResult), res.results.values())) is True
 
+    def test_upsert_stream(self, cb_env):
+        keys_and_docs = cb_env.get_docs(10)
+        # a generator, the stream never needs the whole input
+        results = dict(cb_env.collection.upsert_stream(((k, v) for k, v in keys_and_docs.items()), window=3))
+        assert set(results.keys()) == set(keys_and_docs.keys())
+        assert all(map(lambda r: isinstance(r, MutationResult), results.values())) is True
+        assert all(map(lambda r: r.cas != 0, results.values())) is True
+        for k, v in keys_and_docs.items():
+            assert cb_env.collection.get(k).content_as[dict] == v
+
+    def test_upsert_stream_invalid_window(self, cb_env):
+        keys_and_docs = cb_env.get_docs(1)
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.upsert_stream(keys_and_docs, window=0)
+
 
 class ClassicCollectionMultiTests(CollectionMultiTestSuite):
 
@@ -93,6 +93,9 @@ class CollectionTestSuite:
         'test_upsert',
         'test_upsert_preserve_expiry',
         'test_upsert_preserve_expiry_not_used',
+        'test_with_cache',
+        'test_with_cache_interned_handle',
+        'test_with_cache_revalidate',
     ]
 
     @pytest.fixture(scope='class')
@@ -149,6 +152,12 @@ class CollectionTestSuite:
         if cb_env.is_mock_server and cb_env.mock_server_type == MockServerType.GoCAVES:
             pytest.skip("GoCAVES does not like this operation.")
 
+    @pytest.fixture()
+    def disable_document_cache(self, cb_env):
+        yield
+        # the collection instance is shared with the other tests
+        cb_env.collection._impl._document_cache = None
+
     @pytest.mark.usefixtures('check_xattr_supported')
     @pytest.mark.parametrize("expiry", [FIFTY_YEARS + 1,
                                         FIFTY_YEARS,
@@ -677,6 +686,60 @@ class CollectionTestSuite:
         assert isinstance(result, GetResult)
         assert result.content_as[dict] == value1
 
+    @pytest.mark.usefixtures('disable_document_cache')
+    def test_with_cache(self, cb_env):
+        key, value = cb_env.get_new_doc()
+        cb_env.collection.upsert(key, value)
+        collection = cb_env.collection.with_cache(10, ttl=timedelta(seconds=30))
+        cache = collection._impl.document_cache
+        result = collection.get(key)
+        assert cache.lookup(key) is not None
+        cached = collection.get(key)
+        assert cached.cas == result.cas
+        assert cached.content_as[dict] == value
+        # a get with the document's expiry bypasses the cache
+        assert collection.get(key, GetOptions(with_expiry=True)).expiry_time is None
+
+        # mutations through the collection invalidate the cached document
+        value['cached'] = False
+        collection.upsert(key, value)
+        assert cache.lookup(key) is None
+        result = collection.get(key)
+        assert result.content_as[dict] == value
+        collection.mutate_in(key, (SD.upsert('cached', True),))
+        assert collection.get(key).content_as[dict]['cached'] is True
+        collection.remove(key)
+        with pytest.raises(DocumentNotFoundException):
+            collection.get(key)
+
+    @pytest.mark.usefixtures('disable_document_cache')
+    def test_with_cache_interned_handle(self, cb_env):
+        key, value = cb_env.get_new_doc()
+        cb_env.collection.upsert(key, value)
+        collection = cb_env.scope.collection(cb_env.collection.name).with_cache(10, ttl=timedelta(seconds=30))
+        cache = collection._impl.document_cache
+        collection.get(key)
+        # e.g. the collection is looked up again for every request
+        again = cb_env.scope.collection(cb_env.collection.name).with_cache(10, ttl=timedelta(seconds=30))
+        assert again is collection
+        assert again._impl.document_cache is cache
+        assert cache.lookup(key) is not None
+        # different settings replace the cache
+        assert again.with_cache(20)._impl.document_cache is not cache
+
+    @pytest.mark.usefixtures('check_xattr_supported')
+    @pytest.mark.usefixtures('disable_document_cache')
+    def test_with_cache_revalidate(self, cb_env):
+        key, value = cb_env.get_new_doc()
+        cb_env.collection.upsert(key, value)
+        collection = cb_env.collection.with_cache(10, revalidate=True)
+        result = collection.get(key)
+        assert collection.get(key).cas == result.cas
+        # stand in for a mutation from another client
+        collection._impl.document_cache.lookup(key).cas = result.cas + 1
+        assert collection.get(key).cas == result.cas
+        assert collection._impl.document_cache.lookup(key).cas == result.cas
+
 
 class ClassicCollectionTests(CollectionTestSuite):
 
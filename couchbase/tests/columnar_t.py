@@ -0,0 +1,166 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.columnar import (RawRowSerializer,
+                                      RecordBatchBuilder,
+                                      ScanRecordBatchBuilder,
+                                      aiter_record_batches,
+                                      iter_record_batches,
+                                      to_table,
+                                      use_raw_rows)
+
+pyarrow = pytest.importorskip('pyarrow')
+
+
+class _FakeScanResult:
+    """Stand-in for a ScanResult, only the id and the encoded value are read."""
+
+    def __init__(self, key, value=None, ids_only=False):
+        self.id = key
+        self.ids_only = ids_only
+        self._value = value
+
+    def _encoded_value(self):
+        return self._value, 0x02000006
+
+
+class _FakeRequest:
+    _serializer = None
+
+
+async def _arows(rows):
+    for row in rows:
+        yield row
+
+
+class ColumnarTestSuite:
+    TEST_MANIFEST = [
+        'test_async_batches',
+        'test_batch_rows',
+        'test_empty_rows',
+        'test_explicit_schema',
+        'test_invalid_args',
+        'test_non_object_rows',
+        'test_raw_rows',
+        'test_result_imports_pyarrow_lazily',
+        'test_scan_batches',
+        'test_scan_ids_only',
+        'test_schema_conflict',
+    ]
+
+    def test_async_batches(self):
+        builder = RecordBatchBuilder(batch_rows=2)
+
+        async def collect():
+            return [b async for b in aiter_record_batches(builder, _arows([b'{"a":1}', b'{"a":2}', b'{"a":3}']))]
+
+        batches = asyncio.run(collect())
+        assert [b.num_rows for b in batches] == [2, 1]
+
+    def test_batch_rows(self):
+        rows = [f'{{"a":{i},"b":"s{i}"}}'.encode() for i in range(7)]
+        batches = list(iter_record_batches(RecordBatchBuilder(batch_rows=3), rows))
+        assert [b.num_rows for b in batches] == [3, 3, 1]
+        table = pyarrow.Table.from_batches(batches)
+        assert table.column('a').to_pylist() == list(range(7))
+        assert table.column('b').to_pylist() == [f's{i}' for i in range(7)]
+
+    def test_empty_rows(self):
+        schema = pyarrow.schema([('a', pyarrow.int64())])
+        table = to_table(RecordBatchBuilder(schema=schema), [])
+        assert table.num_rows == 0
+        assert table.schema == schema
+        assert to_table(RecordBatchBuilder(), []).num_columns == 0
+
+    def test_explicit_schema(self):
+        schema = pyarrow.schema([('a', pyarrow.float64())])
+        rows = [b'{"a":1,"ignored":true}', b'{"a":2.5}', b'{}']
+        table = to_table(RecordBatchBuilder(schema=schema), rows)
+        assert table.schema == schema
+        assert table.column('a').to_pylist() == [1.0, 2.5, None]
+
+    def test_invalid_args(self):
+        for batch_rows in (0, -1, 1.5, True, '10'):
+            with pytest.raises(InvalidArgumentException):
+                RecordBatchBuilder(batch_rows=batch_rows)
+        with pytest.raises(InvalidArgumentException):
+            RecordBatchBuilder(schema={'a': 'int64'})
+        with pytest.raises(InvalidArgumentException):
+            ScanRecordBatchBuilder(id_column=1)
+
+    def test_non_object_rows(self):
+        table = to_table(RecordBatchBuilder(), [b'1', b' 2', b'null'])
+        assert table.column_names == ['value']
+        assert table.column('value').to_pylist() == [1, 2, None]
+
+    def test_raw_rows(self):
+        req = use_raw_rows(_FakeRequest())
+        assert isinstance(req._serializer, RawRowSerializer)
+        assert req._serializer.deserialize(b'{"a":1}') == b'{"a":1}'
+        with pytest.raises(InvalidArgumentException):
+            req._serializer.serialize({'a': 1})
+
+    def test_result_imports_pyarrow_lazily(self):
+        # checked in a new interpreter, this one already imported pyarrow
+        code = ('import sys, couchbase.result; '
+                'assert "pyarrow" not in sys.modules and "couchbase.logic.columnar" not in sys.modules')
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+    def test_scan_batches(self):
+        schema = pyarrow.schema([('meta_id', pyarrow.string()), ('a', pyarrow.int64())])
+        results = [_FakeScanResult(f'doc-{i}', f'{{"a":{i},"b":1}}'.encode()) for i in range(5)]
+        builder = ScanRecordBatchBuilder(batch_rows=2, schema=schema)
+        batches = list(iter_record_batches(builder, results))
+        assert [b.num_rows for b in batches] == [2, 2, 1]
+        table = pyarrow.Table.from_batches(batches)
+        assert table.column_names == ['meta_id', 'a']
+        assert table.column('meta_id').to_pylist() == [f'doc-{i}' for i in range(5)]
+        assert table.column('a').to_pylist() == list(range(5))
+
+        table = to_table(ScanRecordBatchBuilder(id_column='key'), results[:2])
+        assert table.column_names == ['key', 'a', 'b']
+
+    def test_scan_ids_only(self):
+        results = [_FakeScanResult(f'doc-{i}', ids_only=True) for i in range(3)]
+        table = to_table(ScanRecordBatchBuilder(), results)
+        assert table.column_names == ['meta_id']
+        assert table.column('meta_id').to_pylist() == ['doc-0', 'doc-1', 'doc-2']
+
+    def test_schema_conflict(self):
+        # the schema inferred from the first batch is used for later batches
+        builder = RecordBatchBuilder(batch_rows=1)
+        batches = iter_record_batches(builder, [b'{"a":1}', b'{"a":1,"b":2}'])
+        assert next(batches).schema.names == ['a']
+        with pytest.raises(pyarrow.ArrowInvalid):
+            next(batches)
+
+
+class ClassicColumnarTests(ColumnarTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicColumnarTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicColumnarTests) if valid_test_method(meth)]
+        test_list = set(ColumnarTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
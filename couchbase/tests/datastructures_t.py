@@ -30,8 +30,10 @@ class DatastructuresTestSuite:
 
     TEST_MANIFEST = [
         'test_list',
+        'test_list_iter_items',
         'test_map',
         'test_queue',
+        'test_queue_batch',
         'test_sets',
     ]
 
@@ -78,6 +80,23 @@ class DatastructuresTestSuite:
 
         assert 0 == cb_list.size()
 
+    def test_list_iter_items(self, cb_env):
+        key = cb_env.get_existing_doc(key_only=True)
+        cb_list = cb_env.collection.couchbase_list(key)
+        assert list(cb_list.iter_items()) == []
+
+        for v in range(35):
+            cb_list.append(v)
+
+        assert list(cb_list.iter_items()) == list(range(35))
+        assert list(cb_list.iter_items(page_size=5)) == list(range(35))
+        assert list(cb_list.iter_items(page_size=1)) == list(range(35))
+        for page_size in (0, 17, 'a'):
+            with pytest.raises(InvalidArgumentException):
+                cb_list.iter_items(page_size=page_size)
+
+        cb_list.clear()
+
     def test_map(self, cb_env):
         key = cb_env.get_existing_doc(key_only=True)
         cb_map = cb_env.collection.couchbase_map(key)
@@ -177,6 +196,26 @@ class DatastructuresTestSuite:
 
         assert 0 == cb_queue.size()
 
+    def test_queue_batch(self, cb_env):
+        key = cb_env.get_existing_doc(key_only=True)
+        cb_queue = cb_env.collection.couchbase_queue(key)
+
+        cb_queue.push_many([])
+        cb_queue.push_many(range(20))
+        cb_queue.push(20)
+        assert cb_queue.size() == 21
+
+        assert cb_queue.pop() == 0
+        assert cb_queue.pop_many(3) == [1, 2, 3]
+        # more than a single round trip's worth of items
+        assert cb_queue.pop_many(16) == list(range(4, 20))
+        assert cb_queue.pop_many(5) == [20]
+        assert cb_queue.pop_many(5) == []
+        with pytest.raises(InvalidArgumentException):
+            cb_queue.pop_many(0)
+
+        cb_queue.clear()
+
 
 class LegacyDatastructuresTestSuite:
 
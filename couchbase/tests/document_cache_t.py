@@ -0,0 +1,152 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.document_cache import (DOCUMENT_CACHE_EVICTIONS,
+                                            DOCUMENT_CACHE_HITS,
+                                            DOCUMENT_CACHE_MISSES,
+                                            DocumentCache)
+from couchbase.logic.observability.logging_meter import LoggingMeter
+
+
+class _FakeResult:
+    """Stand-in for the binding's pycbc_result of a get."""
+
+    def __init__(self, value, cas=1):
+        self.raw_result = {'value': value, 'flags': 0, 'cas': cas}
+
+
+class DocumentCacheTestSuite:
+    TEST_MANIFEST = [
+        'test_counters',
+        'test_has_same_settings',
+        'test_invalid_args',
+        'test_invalidate',
+        'test_invalidate_discards_in_flight_fill',
+        'test_lru_eviction',
+        'test_max_bytes_eviction',
+        'test_ttl',
+    ]
+
+    def test_counters(self):
+        meter = LoggingMeter()
+        meter.close()
+        cache = DocumentCache(1, meter=meter)
+        assert cache.lookup('key-1') is None
+        cache.put('key-1', _FakeResult(b'1'), cache.fill_token())
+        assert cache.lookup('key-1') is not None
+        cache.record_hit()
+        cache.put('key-2', _FakeResult(b'2'), cache.fill_token())
+        cache.mark_stale('key-2')
+        report = meter.create_report()
+        assert report['counters'] == {DOCUMENT_CACHE_HITS: 1, DOCUMENT_CACHE_MISSES: 2, DOCUMENT_CACHE_EVICTIONS: 1}
+        # the counters are reset once reported
+        assert 'counters' not in meter.create_report()
+
+    def test_has_same_settings(self):
+        cache = DocumentCache(10, max_bytes=1024, ttl=timedelta(seconds=30))
+        assert cache.has_same_settings(DocumentCache(10, max_bytes=1024, ttl=timedelta(milliseconds=30000)))
+        assert not cache.has_same_settings(DocumentCache(20, max_bytes=1024, ttl=timedelta(seconds=30)))
+        assert not cache.has_same_settings(DocumentCache(10, ttl=timedelta(seconds=30)))
+        assert not cache.has_same_settings(DocumentCache(10, max_bytes=1024, ttl=timedelta(seconds=30),
+                                                         revalidate=True))
+
+    def test_invalid_args(self):
+        for max_entries in (0, -1, 1.5, True, None):
+            with pytest.raises(InvalidArgumentException):
+                DocumentCache(max_entries)
+        for max_bytes in (0, 1.5, False):
+            with pytest.raises(InvalidArgumentException):
+                DocumentCache(1, max_bytes=max_bytes)
+        for ttl in (10, timedelta(seconds=0)):
+            with pytest.raises(InvalidArgumentException):
+                DocumentCache(1, ttl=ttl)
+        with pytest.raises(InvalidArgumentException):
+            DocumentCache(1, revalidate='yes')
+
+    def test_invalidate(self):
+        cache = DocumentCache(10)
+        for key in ('key-1', 'key-2', 'key-3'):
+            cache.put(key, _FakeResult(b'abc'), cache.fill_token())
+        cache.invalidate('key-1')
+        assert cache.lookup('key-1') is None
+        cache.invalidate_keys(['key-2', 'key-4'])
+        assert len(cache) == 1
+        assert cache.size == 3
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_invalidate_discards_in_flight_fill(self):
+        cache = DocumentCache(10)
+        token = cache.fill_token()
+        # a mutation completes while the get is in flight
+        cache.invalidate('key-1')
+        cache.put('key-1', _FakeResult(b'old'), token)
+        assert cache.lookup('key-1') is None
+        cache.put('key-1', _FakeResult(b'new', cas=2), cache.fill_token())
+        assert cache.lookup('key-1').cas == 2
+
+    def test_lru_eviction(self):
+        cache = DocumentCache(2)
+        cache.put('key-1', _FakeResult(b'1'), cache.fill_token())
+        cache.put('key-2', _FakeResult(b'2'), cache.fill_token())
+        # key-1 is now the most recently used
+        assert cache.lookup('key-1') is not None
+        cache.put('key-3', _FakeResult(b'3'), cache.fill_token())
+        assert cache.lookup('key-2') is None
+        assert cache.lookup('key-1') is not None
+        assert cache.lookup('key-3') is not None
+
+    def test_max_bytes_eviction(self):
+        cache = DocumentCache(10, max_bytes=10)
+        cache.put('key-1', _FakeResult(b'12345'), cache.fill_token())
+        cache.put('key-2', _FakeResult(b'12345'), cache.fill_token())
+        assert cache.size == 10
+        cache.put('key-3', _FakeResult(b'123'), cache.fill_token())
+        assert cache.lookup('key-1') is None
+        assert cache.size == 8
+        # larger than the whole cache, not cached and nothing is evicted
+        cache.put('key-4', _FakeResult(b'12345678901'), cache.fill_token())
+        assert cache.lookup('key-4') is None
+        assert len(cache) == 2
+        # replacing an entry accounts for the size of the previous document
+        cache.put('key-3', _FakeResult(b'1'), cache.fill_token())
+        assert cache.size == 6
+
+    def test_ttl(self):
+        cache = DocumentCache(10, ttl=timedelta(milliseconds=20))
+        cache.put('key-1', _FakeResult(b'1'), cache.fill_token())
+        assert cache.lookup('key-1') is not None
+        time.sleep(0.05)
+        assert cache.lookup('key-1') is None
+        assert len(cache) == 0
+
+
+class ClassicDocumentCacheTests(DocumentCacheTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicDocumentCacheTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicDocumentCacheTests) if valid_test_method(meth)]
+        test_list = set(DocumentCacheTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
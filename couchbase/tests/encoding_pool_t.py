@@ -0,0 +1,163 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pickle
+
+import pytest
+
+from couchbase.constants import FMT_JSON
+from couchbase.exceptions import DocumentExistsException, InvalidArgumentException
+from couchbase.logic.collection_multi_types import KeyValueMultiRequestList
+from couchbase.logic.encoding_pool import (MIN_ENCODE_CHUNK_SIZE,
+                                           get_encode_chunk_size,
+                                           get_encode_executor_kind,
+                                           get_encode_parallelism,
+                                           merge_multi_results,
+                                           set_encoded_values,
+                                           shutdown_encode_executors,
+                                           submit_encode_chunks)
+from couchbase.logic.options import get_valid_multi_args
+from couchbase.options import UpsertMultiOptions
+from couchbase.transcoder import JSONTranscoder, RawStringTranscoder
+
+
+class _FakeRequest:
+    """Stand-in for the binding's pycbc_kv_request."""
+
+    def __init__(self, key):
+        self.key = key
+        self.value = None
+        self.flags = None
+
+
+class _FakeMultiResult:
+    """Stand-in for the binding's pycbc_result of a multi operation."""
+
+    def __init__(self, raw_result, dispatch_stats=None):
+        self.raw_result = raw_result
+        self.dispatch_stats = dispatch_stats
+
+
+class EncodingPoolTestSuite:
+    TEST_MANIFEST = [
+        'test_chunk_size',
+        'test_encode_chunks',
+        'test_invalid_options',
+        'test_merge_multi_results',
+        'test_merge_multi_results_chunk_failed',
+        'test_merge_multi_results_dispatch_stats',
+        'test_per_key_options_ignore_encode_options',
+        'test_transcoder_is_picklable',
+    ]
+
+    @pytest.fixture(scope='class', autouse=True)
+    def encode_executors(self):
+        yield
+        shutdown_encode_executors()
+
+    def test_chunk_size(self):
+        assert get_encode_chunk_size(10, 4) == MIN_ENCODE_CHUNK_SIZE
+        # several chunks per worker, so the first chunks are dispatched while the others are encoded
+        assert get_encode_chunk_size(10000, 4) == 625
+        assert get_encode_chunk_size(10001, 4) == 626
+
+    @pytest.mark.parametrize('encode_executor', ['thread', 'process'])
+    def test_encode_chunks(self, encode_executor):
+        json_tc = JSONTranscoder()
+        string_tc = RawStringTranscoder()
+        docs = {f'key-{i}': {'id': i} for i in range(200)}
+        docs['key-5'] = 'a raw string'
+        requests = KeyValueMultiRequestList((_FakeRequest(k) for k in docs), max_in_flight=16)
+        to_encode = [(string_tc if k == 'key-5' else json_tc, v) for k, v in docs.items()]
+
+        chunks = submit_encode_chunks(requests, to_encode, 2, encode_executor)
+        assert len(chunks) == -(-200 // get_encode_chunk_size(200, 2))
+        assert [r for chunk_requests, _ in chunks for r in chunk_requests] == requests
+        # the chunks are in flight at the same time, they share the window
+        assert all(chunk_requests.max_in_flight == 16 // len(chunks) for chunk_requests, _ in chunks)
+        for chunk_requests, encoded in chunks:
+            set_encoded_values(chunk_requests, encoded.result())
+
+        for req, (tc, value) in zip(requests, to_encode):
+            assert (req.value, req.flags) == tc.encode_value(value)
+
+    def test_invalid_options(self):
+        assert get_encode_parallelism(None) == 1
+        assert get_encode_parallelism(4) == 4
+        for parallelism in (0, -1, 1.5, True, '2'):
+            with pytest.raises(InvalidArgumentException):
+                get_encode_parallelism(parallelism)
+        assert get_encode_executor_kind(None) == 'thread'
+        assert get_encode_executor_kind('process') == 'process'
+        with pytest.raises(InvalidArgumentException):
+            get_encode_executor_kind('fibers')
+
+    def test_merge_multi_results(self):
+        results = [_FakeMultiResult({'key-1': 'res-1', 'all_okay': True}),
+                   _FakeMultiResult({'key-2': 'res-2', 'key-3': 'res-3', 'all_okay': False})]
+        merged = merge_multi_results(results)
+        assert merged.raw_result == {'key-1': 'res-1', 'key-2': 'res-2', 'key-3': 'res-3', 'all_okay': False}
+
+        merged = merge_multi_results(results[:1])
+        assert merged.raw_result['all_okay'] is True
+        assert merged.dispatch_stats is None
+
+    def test_merge_multi_results_dispatch_stats(self):
+        results = [_FakeMultiResult({'key-1': 'res-1', 'all_okay': True},
+                                    {'node-1:11210': {'dispatched': 4, 'peak_in_flight': 2, 'elapsed_us': 100}}),
+                   _FakeMultiResult({'key-2': 'res-2', 'all_okay': True},
+                                    {'node-1:11210': {'dispatched': 3, 'peak_in_flight': 1, 'elapsed_us': 300},
+                                     'node-2:11210': {'dispatched': 1, 'peak_in_flight': 1, 'elapsed_us': 50}})]
+        merged = merge_multi_results(results)
+        assert merged.dispatch_stats == {
+            'node-1:11210': {'dispatched': 7, 'peak_in_flight': 3, 'elapsed_us': 300},
+            'node-2:11210': {'dispatched': 1, 'peak_in_flight': 1, 'elapsed_us': 50},
+        }
+        # the chunk's stats are left untouched
+        assert results[0].dispatch_stats['node-1:11210']['dispatched'] == 4
+
+    def test_merge_multi_results_chunk_failed(self):
+        results = [_FakeMultiResult({'key-1': 'res-1', 'all_okay': True}), DocumentExistsException()]
+        with pytest.raises(DocumentExistsException):
+            merge_multi_results(results)
+
+    def test_per_key_options_ignore_encode_options(self):
+        opts = UpsertMultiOptions(encode_parallelism=4,
+                                  encode_executor='process',
+                                  per_key_options={'key-1': {'encode_parallelism': 8}})
+        final_args = get_valid_multi_args(UpsertMultiOptions, {}, opts)
+        assert final_args['encode_parallelism'] == 4
+        assert final_args['encode_executor'] == 'process'
+        assert final_args['per_key_options'] == {'key-1': {}}
+
+    def test_transcoder_is_picklable(self):
+        tc = JSONTranscoder()
+        # make sure the memoized decoders are not an issue
+        assert tc.decode_value(b'{"a": 1}', FMT_JSON) == {'a': 1}
+        copied = pickle.loads(pickle.dumps(tc))
+        assert copied.encode_value({'a': 1}) == tc.encode_value({'a': 1})
+        assert copied.decode_value(b'{"a": 1}', FMT_JSON) == {'a': 1}
+
+
+class ClassicEncodingPoolTests(EncodingPoolTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicEncodingPoolTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicEncodingPoolTests) if valid_test_method(meth)]
+        test_list = set(EncodingPoolTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
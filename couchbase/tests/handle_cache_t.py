@@ -0,0 +1,105 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from couchbase.exceptions import BucketNotFoundException
+from couchbase.logic.handle_cache import HandleCache
+
+
+class HandleCacheTestSuite:
+    TEST_MANIFEST = [
+        'test_clear',
+        'test_concurrent_lookups_create_once',
+        'test_failed_create_is_not_cached',
+        'test_get_or_create',
+        'test_invalidate_bucket',
+    ]
+
+    def test_clear(self):
+        cache = HandleCache()
+        cache.get_or_create(('b1',), object)
+        cache.get_or_create(('b1', 's1', 'c1'), object)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_concurrent_lookups_create_once(self):
+        cache = HandleCache()
+        created = []
+        lock = threading.Lock()
+
+        def _create():
+            # slow, as opening a bucket is
+            time.sleep(0.01)
+            with lock:
+                created.append(object())
+                return created[-1]
+
+        with ThreadPoolExecutor(8) as executor:
+            handles = list(executor.map(lambda _: cache.get_or_create(('b1',), _create), range(32)))
+        assert len(created) == 1
+        assert all(h is created[0] for h in handles)
+
+    def test_failed_create_is_not_cached(self):
+        cache = HandleCache()
+
+        def _create():
+            raise BucketNotFoundException()
+
+        with pytest.raises(BucketNotFoundException):
+            cache.get_or_create(('b1',), _create)
+        assert len(cache) == 0
+        handle = cache.get_or_create(('b1',), object)
+        assert cache.get_or_create(('b1',), object) is handle
+
+    def test_get_or_create(self):
+        cache = HandleCache()
+        bucket = cache.get_or_create(('b1',), object)
+        scope = cache.get_or_create(('b1', 's1'), object)
+        collection = cache.get_or_create(('b1', 's1', 'c1'), object)
+        assert len({id(bucket), id(scope), id(collection)}) == 3
+        assert cache.get_or_create(('b1',), object) is bucket
+        assert cache.get_or_create(('b1', 's1'), object) is scope
+        assert cache.get_or_create(('b1', 's1', 'c1'), object) is collection
+        assert len(cache) == 3
+
+    def test_invalidate_bucket(self):
+        cache = HandleCache()
+        for key in (('b1',), ('b1', 's1'), ('b1', 's1', 'c1'), ('b2',), ('b2', 'b1')):
+            cache.get_or_create(key, object)
+        cache.invalidate('b1')
+        assert len(cache) == 2
+        # the handles of other buckets are kept, even when their scope has the same name as the bucket
+        cache.invalidate(None)
+        assert len(cache) == 2
+        handle = cache.get_or_create(('b2', 'b1'), object)
+        assert cache.get_or_create(('b2', 'b1'), object) is handle
+        assert len(cache) == 2
+
+
+class ClassicHandleCacheTests(HandleCacheTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicHandleCacheTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicHandleCacheTests) if valid_test_method(meth)]
+        test_list = set(HandleCacheTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
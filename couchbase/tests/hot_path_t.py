@@ -0,0 +1,223 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from couchbase.logic.observability.hot_path import (DecodeTimingTranscoder,
+                                                    HotPathProfiler,
+                                                    HotPathStage,
+                                                    _server_duration_ns)
+from couchbase.logic.observability.logging_meter import LoggingMeter
+from couchbase.logic.observability.observability_types import _DISP_SERVER_DURATION
+from couchbase.logic.operation_types import KeyValueOperationType, StreamingOperationType
+from couchbase.transcoder import JSONTranscoder
+
+
+class FakeReporter:
+
+    def stop(self):
+        pass
+
+    def start(self):
+        pass
+
+
+class FakeCoreResult:
+    """Mimics a pycbc_result of a request sent with metrics."""
+
+    def __init__(self, start_time=None, end_time=None, core_span=None):
+        if start_time is not None:
+            self.start_time = start_time
+        if end_time is not None:
+            self.end_time = end_time
+        self.core_span = core_span
+
+
+class HotPathTestSuite:
+    TEST_MANIFEST = [
+        'test_decode_timing_transcoder',
+        'test_disabled_profiler_is_inactive',
+        'test_enabled_profiler_is_active',
+        'test_logging_meter_report',
+        'test_non_kv_operation_not_profiled',
+        'test_profile_scope',
+        'test_profile_scope_is_per_thread',
+        'test_server_duration',
+        'test_snapshot_reset',
+        'test_timer_stages_with_core_timestamps',
+        'test_timer_stages_without_core_timestamps',
+        'test_timer_without_dispatch',
+    ]
+
+    def test_decode_timing_transcoder(self):
+        profiler = HotPathProfiler(enabled=True)
+        transcoder = JSONTranscoder()
+        timed = DecodeTimingTranscoder(transcoder, profiler, KeyValueOperationType.Get.value)
+        value, flags = timed.encode_value({'a': 1})
+        assert (value, flags) == transcoder.encode_value({'a': 1})
+        assert timed.decode_value(value, flags) == {'a': 1}
+        stats = profiler.snapshot()
+        assert list(stats[KeyValueOperationType.Get.value].keys()) == [HotPathStage.Decode.value]
+        assert stats[KeyValueOperationType.Get.value][HotPathStage.Decode.value]['total_count'] == 1
+
+    def test_disabled_profiler_is_inactive(self):
+        profiler = HotPathProfiler()
+        assert profiler.enabled is False
+        assert profiler.is_active() is False
+
+    def test_enabled_profiler_is_active(self):
+        profiler = HotPathProfiler(enabled=True)
+        assert profiler.enabled is True
+        assert profiler.is_active() is True
+
+    def test_logging_meter_report(self):
+        meter = LoggingMeter()
+        meter._reporter.stop()
+        meter._reporter = FakeReporter()
+        profiler = HotPathProfiler(enabled=True)
+        meter.add_hot_path_profiler(profiler)
+        # nothing recorded yet, the report does not have a hot_path section
+        assert 'hot_path' not in meter.create_report()
+
+        timer = profiler.start(KeyValueOperationType.Get)
+        timer.dispatched()
+        timer.completed(None)
+        timer.finished()
+
+        report = meter.create_report()
+        assert report['hot_path'][KeyValueOperationType.Get.value][HotPathStage.Total.value]['total_count'] == 1
+        # the hot path stats are cumulative, unlike the operation histograms
+        report = meter.create_report()
+        assert report['hot_path'][KeyValueOperationType.Get.value][HotPathStage.Total.value]['total_count'] == 1
+        meter.close()
+
+    def test_non_kv_operation_not_profiled(self):
+        profiler = HotPathProfiler(enabled=True)
+        assert profiler.start(StreamingOperationType.Query) is None
+
+    def test_profile_scope(self):
+        profiler = HotPathProfiler()
+        with profiler.profile():
+            assert profiler.is_active() is True
+            with profiler.profile():
+                assert profiler.is_active() is True
+            assert profiler.is_active() is True
+        assert profiler.is_active() is False
+
+    def test_profile_scope_is_per_thread(self):
+        profiler = HotPathProfiler()
+        results = []
+
+        def check():
+            results.append(profiler.is_active())
+
+        with profiler.profile():
+            t = threading.Thread(target=check)
+            t.start()
+            t.join()
+        assert results == [False]
+
+    def test_server_duration(self):
+        assert _server_duration_ns(None) is None
+        assert _server_duration_ns({'name': 'get', 'children': []}) is None
+        core_span = {
+            'name': 'get',
+            'children': [
+                {'name': 'dispatch_to_server', 'attributes': {_DISP_SERVER_DURATION: 1500}},
+                {'name': 'dispatch_to_server', 'attributes': {_DISP_SERVER_DURATION: 500},
+                 'children': [{'name': 'nested', 'attributes': {_DISP_SERVER_DURATION: 250}}]},
+            ]
+        }
+        assert _server_duration_ns(core_span) == 2250
+
+    def test_snapshot_reset(self):
+        profiler = HotPathProfiler(enabled=True)
+        profiler.record(KeyValueOperationType.Get.value, [(HotPathStage.Total.value, 1000)])
+        stats = profiler.snapshot()
+        report = stats[KeyValueOperationType.Get.value][HotPathStage.Total.value]
+        assert report['total_count'] == 1
+        assert set(report['percentiles_ns'].keys()) == {'50.0', '90.0', '99.0', '99.9', '100.0'}
+        # snapshots are not destructive unless asked to be
+        assert profiler.snapshot(reset=True) == stats
+        assert profiler.snapshot() == {}
+
+        profiler.record(KeyValueOperationType.Get.value, [(HotPathStage.Total.value, 1000)])
+        profiler.reset()
+        assert profiler.snapshot() == {}
+
+    def test_timer_stages_with_core_timestamps(self):
+        profiler = HotPathProfiler(enabled=True)
+        timer = profiler.start(KeyValueOperationType.Upsert)
+        timer.add_encoding(100)
+        timer.dispatched()
+        core_start = time.time_ns()
+        core_span = {'children': [{'attributes': {_DISP_SERVER_DURATION: 1000}}]}
+        result = FakeCoreResult(start_time=core_start, end_time=core_start + 5000, core_span=core_span)
+        timer.completed(result)
+        # only the first completion counts
+        timer.completed(result)
+        timer.finished()
+
+        stats = profiler.snapshot()[KeyValueOperationType.Upsert.value]
+        assert set(stats.keys()) == {HotPathStage.Build.value,
+                                     HotPathStage.Encode.value,
+                                     HotPathStage.Dispatch.value,
+                                     HotPathStage.Core.value,
+                                     HotPathStage.Server.value,
+                                     HotPathStage.Resume.value,
+                                     HotPathStage.Result.value,
+                                     HotPathStage.Total.value}
+        assert all(s['total_count'] == 1 for s in stats.values())
+        core_ns = stats[HotPathStage.Core.value]['percentiles_ns']['100.0']
+        assert 4900 <= core_ns <= 5100
+
+    def test_timer_stages_without_core_timestamps(self):
+        profiler = HotPathProfiler(enabled=True)
+        timer = profiler.start(KeyValueOperationType.Get)
+        timer.dispatched()
+        timer.completed(FakeCoreResult())
+        timer.finished()
+
+        stats = profiler.snapshot()[KeyValueOperationType.Get.value]
+        # without the core's timestamps the whole call into the bindings is recorded as core
+        assert set(stats.keys()) == {HotPathStage.Build.value,
+                                     HotPathStage.Core.value,
+                                     HotPathStage.Result.value,
+                                     HotPathStage.Total.value}
+
+    def test_timer_without_dispatch(self):
+        profiler = HotPathProfiler(enabled=True)
+        timer = profiler.start(KeyValueOperationType.Get)
+        # e.g. the options failed validation before the request was sent
+        timer.completed(FakeCoreResult())
+        timer.finished()
+        stats = profiler.snapshot()[KeyValueOperationType.Get.value]
+        assert list(stats.keys()) == [HotPathStage.Total.value]
+
+
+class ClassicHotPathTests(HotPathTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicHotPathTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicHotPathTests) if valid_test_method(meth)]
+        test_list = set(HotPathTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -25,9 +25,11 @@ from couchbase.exceptions import (AlreadyQueriedException,
 from couchbase.kv_range_scan import (PrefixScan,
                                      RangeScan,
                                      SamplingScan,
+                                     ScanPartition,
                                      ScanTerm)
 from couchbase.logic.collection_req_builder import CollectionRequestBuilder
 from couchbase.logic.collection_types import CollectionDetails
+from couchbase.logic.kv_range_scan import build_scan_partitions
 from couchbase.mutation_state import MutationState
 from couchbase.options import ScanOptions
 from couchbase.result import (MutationToken,
@@ -44,6 +46,7 @@ class RangeScanTestSuite:
         'test_range_scan_ids_only',
         'test_range_scan_default_terms',
         'test_prefix_scan',
+        'test_prefix_scan_partitions',
         'test_range_scan_cancel',
         'test_sampling_scan',
         'test_sampling_scan_with_seed',
@@ -170,6 +173,21 @@ class RangeScanTestSuite:
         res = cb_env.collection.scan(scan_type, ids_only=True)
         self._validate_result(res, len(test_ids), ids_only=True)
 
+    @pytest.mark.usefixtures('check_range_scan_supported')
+    def test_prefix_scan_partitions(self, cb_env, test_id, test_ids, test_mutation_state):
+        partitions = cb_env.collection.scan_partitions(PrefixScan(f'{test_id}'), 4)
+        assert 1 <= len(partitions) <= 4
+        ids = []
+        for partition in partitions:
+            res = cb_env.collection.scan(partition.scan_type, ScanOptions(timeout=timedelta(seconds=10),
+                                                                          ids_only=True,
+                                                                          consistent_with=test_mutation_state))
+            ids.extend(r.id for r in res)
+        # every document is returned by exactly one partition
+        assert sorted(ids) == sorted(test_ids)
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.scan_partitions(SamplingScan(10), 4)
+
     @pytest.mark.usefixtures('check_range_scan_supported')
     def test_range_scan_cancel(self, cb_env, test_id, test_ids, test_mutation_state):
         scan_type = RangeScan(ScanTerm(f'{test_id}'))
@@ -422,3 +440,87 @@ class RangeScanRequestBuilderUnitTests:
         opts = {'concurrency': 0}
         with pytest.raises(InvalidArgumentException):
             self._builder()._process_scan_orchestrator_ops(opts)
+
+
+class ScanPartitionUnitTests:
+    """Cluster-free unit tests for splitting a scan into partitions."""
+
+    @staticmethod
+    def _partition_of(partitions, key):
+        matches = []
+        for partition in partitions:
+            start, end = partition.scan_type.start, partition.scan_type.end
+            if start is not None and (key < start.term or (start.exclusive and key == start.term)):
+                continue
+            if end is not None and (key > end.term or (end.exclusive and key == end.term)):
+                continue
+            matches.append(partition.index)
+        return matches
+
+    def test_partitions_are_disjoint(self):
+        keys = [f'doc-{i:04}' for i in range(1000)]
+        partitions = build_scan_partitions(RangeScan(), 4, keys[::10])
+        assert len(partitions) == 4
+        assert partitions[0].scan_type.start is None
+        assert partitions[-1].scan_type.end is None
+        counts = [0] * 4
+        for key in keys + ['', 'a', 'zzz']:
+            matches = self._partition_of(partitions, key)
+            assert len(matches) == 1
+            if key.startswith('doc-'):
+                counts[matches[0]] += 1
+        assert counts == [250] * 4
+
+    def test_prefix_scan_partitions(self):
+        keys = [f'doc-{i:04}' for i in range(100)] + ['doc.', 'doc', 'do', 'other']
+        partitions = build_scan_partitions(PrefixScan('doc-'), 3, keys)
+        assert len(partitions) == 3
+        assert partitions[0].scan_type.start.term == 'doc-'
+        assert partitions[-1].scan_type.end.term == 'doc.'
+        assert partitions[-1].scan_type.end.exclusive is True
+        for key in keys:
+            assert len(self._partition_of(partitions, key)) == (1 if key.startswith('doc-') else 0)
+
+    def test_narrow_range_split(self):
+        # a sample of the whole collection with fewer distinct keys in the range than partitions
+        sample = [f'other-{i:04}' for i in range(256)] + ['user::12']
+        partitions = build_scan_partitions(PrefixScan('user::'), 4, sample, sample_size=256)
+        assert [p.count for p in partitions] == [4] * 4
+        assert partitions[0].scan_type.start.term == 'user::'
+        assert partitions[-1].scan_type.end.term == 'user:;'
+        keys = ['user::', 'user:: ', 'user::12', 'user::A', 'user::a', 'user::zz', 'user::~~', 'user::\u00e9']
+        found = set()
+        for key in keys + ['user:', 'user:;', 'other-0001']:
+            matches = self._partition_of(partitions, key)
+            assert len(matches) == (1 if key.startswith('user::') else 0)
+            found.update(matches)
+        assert found == {0, 1, 2, 3}
+
+        partitions = build_scan_partitions(RangeScan(ScanTerm('a'), ScanTerm('b', exclusive=True)), 3, [])
+        assert len(partitions) == 3
+        assert all('a' < p.scan_type.end.term < 'b' for p in partitions[:-1])
+
+    def test_small_sample(self):
+        # the sample has every key of the collection, there are fewer distinct keys than partitions
+        partitions = build_scan_partitions(RangeScan(ScanTerm('a'), ScanTerm('b')),
+                                           8,
+                                           ['a', 'a0', 'a0', 'c'],
+                                           sample_size=512)
+        assert [p.count for p in partitions] == [2, 2]
+        assert partitions[0].scan_type.end.term == 'a0'
+        assert len(build_scan_partitions(RangeScan(), 8, [], sample_size=512)) == 1
+
+    def test_token_round_trip(self):
+        partitions = build_scan_partitions(PrefixScan('doc-'), 2, ['doc-1', 'doc-2', 'doc-3'])
+        for partition in partitions:
+            assert ScanPartition.from_token(partition.token) == partition
+        assert len({p for p in partitions} | {ScanPartition.from_token(p.token) for p in partitions}) == 2
+        with pytest.raises(InvalidArgumentException):
+            ScanPartition.from_token('{"index": 0}')
+
+    def test_invalid_args(self):
+        for count in (0, -1, 1.5, True):
+            with pytest.raises(InvalidArgumentException):
+                build_scan_partitions(RangeScan(), count, [])
+        with pytest.raises(InvalidArgumentException):
+            build_scan_partitions(SamplingScan(10), 2, [])
@@ -0,0 +1,152 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from couchbase.exceptions import DocumentExistsException, InvalidArgumentException
+from couchbase.logic.kv_stream import keys_as_stream_items, stream_kv_ops
+
+
+class _FakeSubmitter:
+    """Completes each operation on a worker thread, as the C++ core IO threads would."""
+
+    def __init__(self, fail_keys=None):
+        self._executor = ThreadPoolExecutor(4)
+        self._fail_keys = fail_keys or set()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.submitted = []
+
+    def __call__(self, key, doc, on_done):
+        with self._lock:
+            self.submitted.append(key)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self._executor.submit(self._complete, key, doc, on_done)
+
+    def _complete(self, key, doc, on_done):
+        with self._lock:
+            self.in_flight -= 1
+        if key in self._fail_keys:
+            on_done(key, DocumentExistsException())
+        else:
+            on_done(key, doc)
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+
+class KeyValueStreamTestSuite:
+    TEST_MANIFEST = [
+        'test_accepts_mapping',
+        'test_errors_are_returned',
+        'test_input_consumed_lazily',
+        'test_invalid_window',
+        'test_keys_as_stream_items',
+        'test_window_is_bounded',
+    ]
+
+    def test_accepts_mapping(self):
+        submitter = _FakeSubmitter()
+        try:
+            docs = {f'key-{i}': {'id': i} for i in range(10)}
+            assert dict(stream_kv_ops(submitter, docs, 4)) == docs
+        finally:
+            submitter.shutdown()
+
+    def test_errors_are_returned(self):
+        submitter = _FakeSubmitter(fail_keys={'key-3', 'key-7'})
+        try:
+            results = dict(stream_kv_ops(submitter, ((f'key-{i}', i) for i in range(10)), 2))
+            assert len(results) == 10
+            assert isinstance(results['key-3'], DocumentExistsException)
+            assert isinstance(results['key-7'], DocumentExistsException)
+            assert results['key-4'] == 4
+        finally:
+            submitter.shutdown()
+
+    def test_input_consumed_lazily(self):
+        submitter = _FakeSubmitter()
+        pulled = []
+
+        def _docs():
+            for i in range(100):
+                pulled.append(i)
+                yield f'key-{i}', i
+
+        try:
+            stream = stream_kv_ops(submitter, _docs(), 5)
+            next(stream)
+            # only the window (plus the document replacing the completed operation) has been pulled
+            assert len(pulled) <= 6
+            assert len(list(stream)) == 99
+            assert len(pulled) == 100
+        finally:
+            submitter.shutdown()
+
+    def test_invalid_window(self):
+        for window in (0, -1, 1.5, True, None):
+            with pytest.raises(InvalidArgumentException):
+                list(stream_kv_ops(lambda key, doc, on_done: None, [('key', 'doc')], window))
+
+    def test_keys_as_stream_items(self):
+        submitter = _FakeSubmitter()
+        pulled = []
+
+        def _keys():
+            for i in range(50):
+                pulled.append(i)
+                yield f'key-{i}'
+
+        try:
+            stream = stream_kv_ops(submitter, keys_as_stream_items(_keys()), 4)
+            next(stream)
+            assert len(pulled) <= 5
+            results = dict(stream)
+            assert len(results) == 49
+            assert all(r is None for r in results.values())
+        finally:
+            submitter.shutdown()
+
+        for keys in ('key', b'key'):
+            with pytest.raises(InvalidArgumentException):
+                keys_as_stream_items(keys)
+
+    def test_window_is_bounded(self):
+        submitter = _FakeSubmitter()
+        try:
+            results = list(stream_kv_ops(submitter, ((f'key-{i}', i) for i in range(1000)), 8))
+            assert len(results) == 1000
+            assert sorted(r for _, r in results) == list(range(1000))
+            assert submitter.peak_in_flight <= 8
+            assert len(submitter.submitted) == 1000
+        finally:
+            submitter.shutdown()
+
+
+class ClassicKeyValueStreamTests(KeyValueStreamTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicKeyValueStreamTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicKeyValueStreamTests) if valid_test_method(meth)]
+        test_list = set(KeyValueStreamTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
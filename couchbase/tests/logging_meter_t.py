@@ -52,6 +52,7 @@ class LoggingMeterTestSuite:
         'test_emit_interval_config',
         'test_concurrent_recording_and_reporting',
         'test_percentile_accuracy',
+        'test_counters',
     ]
 
     def test_report_structure(self):
@@ -535,6 +536,23 @@ class LoggingMeterTestSuite:
         # Clean up
         meter.close()
 
+    def test_counters(self):
+        """Counters should be reported, and reset, alongside the operations."""
+        meter = LoggingMeter()
+        meter._reporter.stop()
+        meter._reporter = FakeReporter()
+
+        counter = meter.counter('document_cache.hits')
+        assert meter.counter('document_cache.hits') is counter
+        counter.add()
+        counter.add(2)
+        meter.counter('document_cache.misses')
+
+        report = meter.create_report()
+        # counters that were not incremented are not reported
+        assert report['counters'] == {'document_cache.hits': 3}
+        assert 'counters' not in meter.create_report()
+
 
 class ClassicLoggingMeterTests(LoggingMeterTestSuite):
 
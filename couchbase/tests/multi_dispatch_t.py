@@ -0,0 +1,178 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from couchbase.diagnostics import ServiceType
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.collection_multi_req_builder import CollectionMultiRequestBuilder
+from couchbase.logic.collection_multi_types import KeyValueMultiRequestList, get_max_in_flight
+from couchbase.logic.collection_types import CollectionDetails
+from couchbase.logic.options import get_valid_multi_args
+from couchbase.options import (GetMultiOptions,
+                               PingOptions,
+                               UpsertMultiOptions)
+from couchbase.result import MultiGetResult, MultiMutationResult
+from couchbase.transcoder import JSONTranscoder
+from tests.environments import CollectionType
+from tests.environments.collection_multi_environment import CollectionMultiTestEnvironment
+from tests.test_features import EnvironmentFeatures
+
+
+class _FakeMultiResult:
+    """Stand-in for the binding's pycbc_result of a multi operation."""
+
+    def __init__(self, raw_result, dispatch_stats=None):
+        self.raw_result = raw_result
+        self.dispatch_stats = dispatch_stats
+
+
+class MultiDispatchTestSuite:
+    TEST_MANIFEST = [
+        'test_chunk_splits_window',
+        'test_default_dispatch',
+        'test_dispatch_options',
+        'test_invalid_max_in_flight',
+        'test_multi_result_dispatch_stats',
+        'test_per_key_options_ignore_dispatch_options',
+    ]
+
+    @pytest.fixture(scope='class')
+    def builder(self):
+        details = CollectionDetails('default', '_default', '_default', JSONTranscoder())
+        return CollectionMultiRequestBuilder(details)
+
+    def test_chunk_splits_window(self):
+        requests = KeyValueMultiRequestList(range(10), max_in_flight=8, group_by_node=True)
+        chunk = requests.chunk(0, 4, 3)
+        assert isinstance(chunk, KeyValueMultiRequestList)
+        assert chunk == [0, 1, 2, 3]
+        assert chunk.max_in_flight == 2
+        assert chunk.group_by_node is True
+        # every chunk keeps at least one request in flight
+        assert requests.chunk(4, 8, 16).max_in_flight == 1
+        # no limit stays no limit
+        assert KeyValueMultiRequestList(range(10)).chunk(0, 5, 2).max_in_flight == 0
+
+    def test_default_dispatch(self, builder):
+        req = builder.build_get_multi_request(['key-1', 'key-2'], None)
+        assert isinstance(req.request_list, KeyValueMultiRequestList)
+        assert [r.key for r in req.request_list] == ['key-1', 'key-2']
+        assert req.request_list.max_in_flight == 0
+        assert req.request_list.group_by_node is False
+
+    def test_dispatch_options(self, builder):
+        req = builder.build_get_multi_request(['key-1', 'key-2'],
+                                              None,
+                                              GetMultiOptions(max_in_flight=8, group_by_node=True))
+        assert req.request_list.max_in_flight == 8
+        assert req.request_list.group_by_node is True
+
+        req = builder.build_upsert_multi_request({'key-1': {'a': 1}}, None, max_in_flight=4)
+        assert req.request_list.max_in_flight == 4
+        assert req.request_list.group_by_node is False
+
+    def test_invalid_max_in_flight(self, builder):
+        assert get_max_in_flight(None) == 0
+        assert get_max_in_flight(16) == 16
+        for max_in_flight in (0, -1, 1.5, True, '2'):
+            with pytest.raises(InvalidArgumentException):
+                get_max_in_flight(max_in_flight)
+        with pytest.raises(InvalidArgumentException):
+            builder.build_get_multi_request(['key-1'], None, GetMultiOptions(max_in_flight=0))
+
+    def test_multi_result_dispatch_stats(self):
+        res = MultiMutationResult(_FakeMultiResult({'all_okay': True}), return_exceptions=True)
+        assert res.dispatch_stats is None
+        stats = {'node-1:11210': {'dispatched': 3, 'peak_in_flight': 2, 'elapsed_us': 120}}
+        res = MultiMutationResult(_FakeMultiResult({'all_okay': True}, stats), return_exceptions=True)
+        assert res.dispatch_stats == stats
+        assert res.all_ok is True
+
+    def test_per_key_options_ignore_dispatch_options(self):
+        opts = UpsertMultiOptions(max_in_flight=32,
+                                  group_by_node=True,
+                                  per_key_options={'key-1': {'max_in_flight': 1, 'group_by_node': False}})
+        final_args = get_valid_multi_args(UpsertMultiOptions, {}, opts)
+        assert final_args['max_in_flight'] == 32
+        assert final_args['group_by_node'] is True
+        assert final_args['per_key_options'] == {'key-1': {}}
+
+
+class ClassicMultiDispatchTests(MultiDispatchTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicMultiDispatchTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicMultiDispatchTests) if valid_test_method(meth)]
+        test_list = set(MultiDispatchTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
+
+
+class MultiDispatchNodeTestSuite:
+    TEST_MANIFEST = [
+        'test_grouped_dispatch_stats_keys',
+    ]
+
+    @pytest.fixture(scope='class')
+    def check_diagnostics_supported(self, cb_env):
+        EnvironmentFeatures.check_if_feature_supported('diagnostics',
+                                                       cb_env.server_version_short,
+                                                       cb_env.mock_server_type)
+
+    @pytest.mark.usefixtures('check_diagnostics_supported')
+    def test_grouped_dispatch_stats_keys(self, cb_env):
+        keys_and_docs = cb_env.get_docs(20)
+        res = cb_env.collection.get_multi(list(keys_and_docs.keys()), GetMultiOptions(group_by_node=True))
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is True
+        # the ports the SDK is connected to, i.e. the TLS ones on a couchbases:// cluster
+        ping = cb_env.bucket.ping(PingOptions(service_types=[ServiceType.KeyValue]))
+        kv_ports = {report.remote.rpartition(':')[2] for report in ping.endpoints[ServiceType.KeyValue]}
+        assert res.dispatch_stats is not None
+        for node, stats in res.dispatch_stats.items():
+            if node == '*':
+                continue
+            host, _, port = node.rpartition(':')
+            assert host != ''
+            assert port in kv_ports
+        assert sum(stats['dispatched'] for stats in res.dispatch_stats.values()) == len(keys_and_docs)
+
+
+class ClassicMultiDispatchNodeTests(MultiDispatchNodeTestSuite):
+
+    @pytest.fixture(scope='class')
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicMultiDispatchNodeTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicMultiDispatchNodeTests) if valid_test_method(meth)]
+        compare = set(MultiDispatchNodeTestSuite.TEST_MANIFEST).difference(method_list)
+        return compare
+
+    @pytest.fixture(scope='class', name='cb_env', params=[CollectionType.DEFAULT])
+    def couchbase_test_environment(self, cb_base_env, manifest_validated, request):
+        if manifest_validated:
+            pytest.fail(f'Test manifest not validated.  Missing tests: {manifest_validated}.')
+
+        cb_env = CollectionMultiTestEnvironment.from_environment(cb_base_env)
+        cb_env.enable_bucket_mgmt()
+        cb_env.setup(request.param)
+
+        yield cb_env
+
+        cb_env.teardown(request.param)
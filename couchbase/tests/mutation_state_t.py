@@ -0,0 +1,132 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from couchbase.exceptions import InvalidArgumentException, MissingTokenException
+from couchbase.mutation_state import MutationState
+from couchbase.result import MutationToken
+
+
+def _token(partition_id, sequence_number, partition_uuid=3004, bucket_name='default'):
+    return MutationToken({'partition_id': partition_id,
+                          'partition_uuid': partition_uuid,
+                          'sequence_number': sequence_number,
+                          'bucket_name': bucket_name})
+
+
+def _tokens(state):
+    return sorted(t.as_tuple() for t in state.tokens())
+
+
+class _FakeMutationResult:
+    """Stand-in for a MutationResult, only the raw token is read."""
+
+    def __init__(self, token):
+        self._raw_mutation_token = token.as_dict() if token is not None else None
+
+
+class MutationStateTestSuite:
+    TEST_MANIFEST = [
+        'test_add_keeps_highest_sequence_number',
+        'test_add_mutation_state',
+        'test_add_results_missing_token',
+        'test_bytes_round_trip',
+        'test_hashable',
+        'test_invalid_exports',
+        'test_json_round_trip',
+    ]
+
+    def test_add_keeps_highest_sequence_number(self):
+        state = MutationState()
+        for seqno in (3, 10, 7):
+            state.add_mutation_token(_token(42, seqno))
+        state.add_mutation_token(_token(42, 1, bucket_name='other'))
+        state.add_mutation_token(None)
+        assert len(state) == 2
+        assert _tokens(state) == [(42, 3004, 1, 'other'), (42, 3004, 10, 'default')]
+        assert _token(42, 10).as_dict() in state._as_token_dicts()
+
+    def test_add_mutation_state(self):
+        state = MutationState()
+        state.add_mutation_token(_token(1, 5))
+        state.add_mutation_token(_token(2, 8))
+        other = MutationState()
+        other.add_mutation_token(_token(1, 9))
+        other.add_mutation_token(_token(2, 4))
+        other.add_mutation_token(_token(1, 2, bucket_name='other'))
+        state.add_mutation_state(other)
+        assert _tokens(state) == [(1, 3004, 2, 'other'),
+                                  (1, 3004, 9, 'default'),
+                                  (2, 3004, 8, 'default')]
+        # the merged state does not share its vectors with the other state
+        other.add_mutation_token(_token(1, 20, bucket_name='other'))
+        assert (1, 3004, 2, 'other') in [t.as_tuple() for t in state.tokens()]
+        with pytest.raises(InvalidArgumentException):
+            state.add_mutation_state([_token(1, 1)])
+
+    def test_add_results_missing_token(self):
+        state = MutationState(_FakeMutationResult(_token(1, 1)))
+        assert len(state) == 1
+        with pytest.raises(MissingTokenException):
+            state.add_results(_FakeMutationResult(None))
+        assert state.add_results(_FakeMutationResult(None), quiet=True) is False
+        with pytest.raises(MissingTokenException):
+            state.add_results()
+
+    def test_bytes_round_trip(self):
+        state = MutationState()
+        for vbid in range(1024):
+            state.add_mutation_token(_token(vbid, vbid + 1, partition_uuid=2**64 - 1 - vbid))
+        state.add_mutation_token(_token(7, 1, bucket_name='travel-sample'))
+        encoded = state.to_bytes()
+        assert len(encoded) < 1025 * 18 + 64
+        assert _tokens(MutationState.from_bytes(encoded)) == _tokens(state)
+        assert _tokens(MutationState.from_bytes(MutationState().to_bytes())) == []
+
+    def test_hashable(self):
+        state = MutationState(_FakeMutationResult(_token(1, 1)))
+        states = {state}
+        state.add_mutation_token(_token(1, 2))
+        assert state in states
+
+    def test_invalid_exports(self):
+        encoded = MutationState(_FakeMutationResult(_token(1, 1))).to_bytes()
+        for value in (b'', encoded[:-1], encoded + b'\x00', b'\x02' + encoded[1:]):
+            with pytest.raises(InvalidArgumentException):
+                MutationState.from_bytes(value)
+        for value in ('not json', '{"default": {"1": [1]}}', '{"default": {"x": [1, "2"]}}', '[]'):
+            with pytest.raises(InvalidArgumentException):
+                MutationState.from_json(value)
+
+    def test_json_round_trip(self):
+        state = MutationState()
+        state.add_mutation_token(_token(42, 3, partition_uuid=2**63))
+        state.add_mutation_token(_token(7, 1, bucket_name='other'))
+        assert state.export() == {'default': {'42': [3, str(2**63)]}, 'other': {'7': [1, '3004']}}
+        assert _tokens(MutationState.from_json(state.to_json())) == _tokens(state)
+        assert _tokens(MutationState.from_json(state.export())) == _tokens(state)
+
+
+class ClassicMutationStateTests(MutationStateTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicMutationStateTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicMutationStateTests) if valid_test_method(meth)]
+        test_list = set(MutationStateTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -0,0 +1,140 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+
+import pytest
+
+from couchbase.constants import FMT_JSON
+from couchbase.exceptions import InvalidArgumentException, ValueFormatException
+from couchbase.result import (CounterResult,
+                              GetResult,
+                              MutationResult,
+                              MutationToken,
+                              ScanResult,
+                              decode_result_values)
+from couchbase.transcoder import JSONTranscoder, RawBinaryTranscoder
+
+
+class _FakeResult:
+    """Stand-in for the binding's pycbc_result."""
+
+    def __init__(self, raw_result):
+        self.raw_result = raw_result
+
+
+TOKEN = {'partition_id': 12, 'partition_uuid': 34, 'sequence_number': 56, 'bucket_name': 'default'}
+
+
+class ResultTestSuite:
+    TEST_MANIFEST = [
+        'test_counter_result',
+        'test_decode_result_values',
+        'test_get_result',
+        'test_mutation_result',
+        'test_results_are_slotted',
+        'test_scan_result',
+        'test_scan_result_ids_only',
+    ]
+
+    def test_counter_result(self):
+        res = CounterResult(_FakeResult({'cas': 11, 'content': 10, 'token': TOKEN}))
+        assert res.content == 10
+        assert res.cas == 11
+        assert res.mutation_token() == MutationToken(TOKEN)
+
+    def test_decode_result_values(self):
+        tc = JSONTranscoder()
+        results = [GetResult(_FakeResult({'cas': i, 'flags': FMT_JSON, 'value': json.dumps({'id': i}).encode('utf-8')}),
+                             transcoder=tc)
+                   for i in range(3)]
+        results.append(ScanResult(_FakeResult({'scan_item': {'key': 'k',
+                                                             'body': {'flags': FMT_JSON, 'value': b'[1, 2]'}}}),
+                                  False,
+                                  tc))
+        decode_result_values(results)
+        assert [res._decoded_value for res in results] == [{'id': 0}, {'id': 1}, {'id': 2}, [1, 2]]
+
+        # a transcoder that cannot decode its batch leaves the error to the result's value
+        res = GetResult(_FakeResult({'cas': 1, 'flags': FMT_JSON, 'value': b'{}'}), transcoder=RawBinaryTranscoder())
+        decode_result_values([res])
+        assert res._decoded_value is None
+        with pytest.raises(ValueFormatException):
+            res.value
+
+    def test_get_result(self):
+        raw = {'cas': 123, 'flags': FMT_JSON, 'value': json.dumps({'a': 1}).encode('utf-8'), 'expiry': 1700000000}
+        res = GetResult(_FakeResult(raw), transcoder=JSONTranscoder(), key='doc-key')
+        assert res.cas == 123
+        assert res.flags == FMT_JSON
+        assert res.key == 'doc-key'
+        assert res.success is True
+        assert res.content_as[dict] == {'a': 1}
+        assert res.expiry_time is not None
+
+    def test_mutation_result(self):
+        res = MutationResult(_FakeResult({'cas': 99, 'token': TOKEN}), key='doc-key')
+        assert res.cas == 99
+        token = res.mutation_token()
+        assert token.as_tuple() == (12, 34, 56, 'default')
+        # the token is only materialised once
+        assert res.mutation_token() is token
+
+        res = MutationResult(_FakeResult({'cas': 99}))
+        assert res.mutation_token() is None
+
+    @pytest.mark.parametrize('result', [GetResult(_FakeResult({'cas': 1})),
+                                        MutationResult(_FakeResult({'cas': 1})),
+                                        CounterResult(_FakeResult({'cas': 1})),
+                                        ScanResult(_FakeResult({'scan_item': {'key': 'k'}}), True, None),
+                                        MutationToken(TOKEN)])
+    def test_results_are_slotted(self, result):
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(AttributeError):
+            result.not_an_attribute = True
+
+    def test_scan_result(self):
+        raw = {'scan_item': {'key': 'doc-key',
+                             'body': {'cas': 7,
+                                      'expiry': 1700000000,
+                                      'flags': FMT_JSON,
+                                      'value': json.dumps({'a': 1}).encode('utf-8')}}}
+        res = ScanResult(_FakeResult(raw), False, JSONTranscoder())
+        assert res.id == 'doc-key'
+        assert res.ids_only is False
+        assert res.cas == 7
+        assert res.expiry_time is not None
+        assert res.content_as[dict] == {'a': 1}
+
+    def test_scan_result_ids_only(self):
+        res = ScanResult(_FakeResult({'scan_item': {'key': 'doc-key'}}), True, JSONTranscoder())
+        assert res.id == 'doc-key'
+        assert res.ids_only is True
+        with pytest.raises(InvalidArgumentException):
+            res.cas
+        with pytest.raises(InvalidArgumentException):
+            res.content_as
+
+
+class ClassicResultTests(ResultTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicResultTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicResultTests) if valid_test_method(meth)]
+        test_list = set(ResultTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
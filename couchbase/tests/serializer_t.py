@@ -0,0 +1,197 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import math
+
+import pytest
+
+from couchbase.auth import PasswordAuthenticator
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.cluster_settings import ClusterSettings
+from couchbase.options import ClusterOptions
+from couchbase.serializer import (DefaultJsonSerializer,
+                                  MsgspecSerializer,
+                                  OrjsonSerializer,
+                                  Serializer,
+                                  UjsonSerializer,
+                                  get_fastest_serializer)
+from couchbase.transcoder import RawJSONTranscoder
+
+BACKENDS = {
+    'orjson': OrjsonSerializer,
+    'msgspec': MsgspecSerializer,
+    'ujson': UjsonSerializer,
+}
+
+# supported types: JSON objects/arrays (incl. tuples), str (incl. non-ASCII), int (64-bit), float, bool and None
+DOCUMENTS = [
+    {},
+    [],
+    'a plain string',
+    'non-ascii: ü, 日本語, 😀',
+    'escapes: " \\ / \n \t \u0001',
+    0,
+    -1,
+    2**63 - 1,
+    -2**63,
+    1.5,
+    0.1,
+    -1e-10,
+    True,
+    False,
+    None,
+    {'id': 1, 'name': 'Ünïcødé', 'tags': ['a', 'b'], 'nested': {'ratio': 0.25, 'ok': True, 'missing': None}},
+    [1, 'two', 3.0, [4, {'five': 5}], (6, 7)],
+    {1: 'int key', 'str': 'str key'},
+]
+
+# Floats with a large positive exponent are formatted differently by some backends (e.g. 1e300 vs. the stdlib's
+# 1e+300), the documents decode to the same values.
+EXPONENT_DOCUMENTS = [
+    1e300,
+    {'max': 1.7976931348623157e308},
+]
+
+NON_FINITE_DOCUMENTS = [
+    float('nan'),
+    float('inf'),
+    {'nan': float('nan'), 'values': [1.5, float('inf'), None, -float('inf')]},
+]
+
+
+def _assert_same_values(value, expected):
+    # NaN does not equal itself
+    if isinstance(value, float) and math.isnan(value):
+        assert isinstance(expected, float) and math.isnan(expected)
+    elif isinstance(value, dict):
+        assert isinstance(expected, dict) and value.keys() == expected.keys()
+        for k in value:
+            _assert_same_values(value[k], expected[k])
+    elif isinstance(value, list):
+        assert isinstance(expected, list) and len(value) == len(expected)
+        for v, e in zip(value, expected):
+            _assert_same_values(v, e)
+    else:
+        assert value == expected
+
+
+class SerializerTestSuite:
+    TEST_MANIFEST = [
+        'test_deserialize_matches_stdlib',
+        'test_deserialize_memoryview',
+        'test_fastest_cluster_option',
+        'test_fastest_cluster_option_keeps_explicit_transcoder',
+        'test_get_fastest_serializer',
+        'test_implements_serializer_interface',
+        'test_invalid_cluster_serializer_option',
+        'test_non_finite_floats',
+        'test_round_trip',
+        'test_serialize_matches_default',
+    ]
+
+    @pytest.fixture(scope='class', name='serializer', params=list(BACKENDS.keys()))
+    def get_serializer(self, request):
+        pytest.importorskip(request.param)
+        return BACKENDS[request.param]()
+
+    @pytest.mark.parametrize('value', DOCUMENTS + EXPONENT_DOCUMENTS)
+    def test_deserialize_matches_stdlib(self, serializer, value):
+        # the documents written by DefaultJsonSerializer read back the same
+        default = DefaultJsonSerializer()
+        encoded = default.serialize(value)
+        assert serializer.deserialize(encoded) == default.deserialize(encoded)
+
+    @pytest.mark.parametrize('value', DOCUMENTS)
+    def test_deserialize_memoryview(self, serializer, value):
+        # zero copy values (ClusterOptions.enable_zero_copy_values) hand the body over as a read-only memoryview
+        encoded = DefaultJsonSerializer().serialize(value)
+        expected = DefaultJsonSerializer().deserialize(encoded)
+        assert DefaultJsonSerializer().deserialize(memoryview(encoded).toreadonly()) == expected
+        assert serializer.deserialize(memoryview(encoded).toreadonly()) == expected
+
+    def test_fastest_cluster_option(self):
+        settings = ClusterSettings.build_cluster_settings('couchbase://localhost',
+                                                          ClusterOptions(PasswordAuthenticator('Administrator',
+                                                                                               'password')),
+                                                          serializer='fastest')
+        assert isinstance(settings.default_serializer, type(get_fastest_serializer()))
+        # KV operations use the selected serializer as well
+        assert settings.default_transcoder._serializer is settings.default_serializer
+
+    def test_fastest_cluster_option_keeps_explicit_transcoder(self):
+        transcoder = RawJSONTranscoder()
+        settings = ClusterSettings.build_cluster_settings('couchbase://localhost',
+                                                          ClusterOptions(PasswordAuthenticator('Administrator',
+                                                                                               'password')),
+                                                          serializer='fastest',
+                                                          transcoder=transcoder)
+        assert settings.default_transcoder is transcoder
+
+    def test_get_fastest_serializer(self):
+        serializer = get_fastest_serializer()
+        installed = []
+        for name, cls in BACKENDS.items():
+            try:
+                __import__(name)
+                installed.append(cls)
+            except ImportError:
+                pass
+        expected = installed[0] if installed else DefaultJsonSerializer
+        assert type(serializer) is expected
+
+    def test_implements_serializer_interface(self, serializer):
+        assert isinstance(serializer, Serializer)
+
+    def test_invalid_cluster_serializer_option(self):
+        with pytest.raises(InvalidArgumentException):
+            ClusterSettings.build_cluster_settings('couchbase://localhost',
+                                                   ClusterOptions(PasswordAuthenticator('Administrator', 'password')),
+                                                   serializer='not-a-serializer')
+
+    @pytest.mark.parametrize('value', NON_FINITE_DOCUMENTS)
+    def test_non_finite_floats(self, serializer, value):
+        # written as NaN and (-)Infinity, as by DefaultJsonSerializer, rather than as null
+        default = DefaultJsonSerializer()
+        encoded = serializer.serialize(value)
+        _assert_same_values(default.deserialize(encoded), default.deserialize(default.serialize(value)))
+        _assert_same_values(serializer.deserialize(default.serialize(value)), value)
+
+    @pytest.mark.parametrize('value', DOCUMENTS + EXPONENT_DOCUMENTS)
+    def test_round_trip(self, serializer, value):
+        # tuples come back as lists and non-str keys as str, as with the stdlib serializer
+        default = DefaultJsonSerializer()
+        assert serializer.deserialize(serializer.serialize(value)) == default.deserialize(default.serialize(value))
+
+    @pytest.mark.parametrize('value', DOCUMENTS + EXPONENT_DOCUMENTS)
+    def test_serialize_matches_default(self, serializer, value):
+        # The documents are not byte-for-byte the same: DefaultJsonSerializer writes a space after the ',' and ':'
+        # separators, the fast backends do not, and some format float exponents differently.  The documents, as
+        # read by DefaultJsonSerializer, are the same.
+        default = DefaultJsonSerializer()
+        encoded = serializer.serialize(value)
+        assert isinstance(encoded, bytes)
+        assert default.deserialize(encoded) == default.deserialize(default.serialize(value))
+
+
+class ClassicSerializerTests(SerializerTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicSerializerTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicSerializerTests) if valid_test_method(meth)]
+        test_list = set(SerializerTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -0,0 +1,188 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from couchbase.exceptions import DocumentNotFoundException
+from couchbase.logic.observability.logging_meter import LoggingMeter
+from couchbase.logic.operation_types import KeyValueOperationCode
+from couchbase.logic.single_flight import (SINGLE_FLIGHT_SAVED,
+                                           SingleFlight,
+                                           single_flight_key)
+
+
+class _FakeRequest:
+    """Stand-in for the binding's pycbc_kv_request."""
+
+    def __init__(self, opcode, key, **options):
+        self.opcode = opcode.value
+        self.key = key
+        for k, v in options.items():
+            setattr(self, k, v)
+
+
+class _BlockingRead:
+    """Sends a read that only completes once released."""
+
+    def __init__(self, result=None, exc=None):
+        self.calls = 0
+        self.released = threading.Event()
+        self._result = result
+        self._exc = exc
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        self.released.wait(5)
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+
+def _wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail('Timed out waiting for the reads to join the read in flight.')
+        time.sleep(0.001)
+
+
+class SingleFlightTestSuite:
+    TEST_MANIFEST = [
+        'test_completed_read_not_shared',
+        'test_counter',
+        'test_exception_shared',
+        'test_forget',
+        'test_identical_reads_shared',
+        'test_read_options_in_key',
+        'test_unsupported_operation',
+    ]
+
+    def test_completed_read_not_shared(self):
+        single_flight = SingleFlight()
+        req = _FakeRequest(KeyValueOperationCode.Get, 'key-1')
+        calls = []
+        for i in range(3):
+            assert single_flight.execute(req, lambda: calls.append(1) or len(calls)) == i + 1
+        assert single_flight.saved == 0
+
+    def test_counter(self):
+        meter = LoggingMeter()
+        meter.close()
+        single_flight = SingleFlight(meter=meter)
+        read = _BlockingRead(result='doc')
+        req = _FakeRequest(KeyValueOperationCode.Exists, 'key-1')
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.execute, req, read) for _ in range(3)]
+            _wait_for(lambda: single_flight.saved == 2)
+            read.released.set()
+            assert [f.result() for f in futures] == ['doc'] * 3
+        assert meter.create_report()['counters'] == {SINGLE_FLIGHT_SAVED: 2}
+
+    def test_exception_shared(self):
+        single_flight = SingleFlight()
+        exc = DocumentNotFoundException(message='not found', context='ctx')
+        read = _BlockingRead(exc=exc)
+        req = _FakeRequest(KeyValueOperationCode.Get, 'key-1')
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(single_flight.execute, req, read) for _ in range(4)]
+            _wait_for(lambda: single_flight.saved == 3)
+            read.released.set()
+            raised = []
+            for f in futures:
+                with pytest.raises(DocumentNotFoundException) as ex_info:
+                    f.result()
+                raised.append(ex_info.value)
+        assert read.calls == 1
+        # each caller raises its own exception, the callers that joined the read raise a copy
+        assert len({id(ex) for ex in raised}) == 4
+        copies = [ex for ex in raised if ex is not exc]
+        assert len(copies) == 3
+        assert all(ex.__cause__ is exc and ex.message == 'not found' for ex in copies)
+
+    def test_forget(self):
+        single_flight = SingleFlight()
+        first = _BlockingRead(result='before')
+        req = _FakeRequest(KeyValueOperationCode.Get, 'key-1')
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            in_flight = executor.submit(single_flight.execute, req, first)
+            _wait_for(lambda: first.calls == 1)
+            # e.g. the document was mutated through the collection
+            single_flight.forget('key-1')
+            assert single_flight.execute(req, lambda: 'after') == 'after'
+            first.released.set()
+            assert in_flight.result() == 'before'
+        assert single_flight.saved == 0
+
+    def test_identical_reads_shared(self):
+        single_flight = SingleFlight()
+        read = _BlockingRead(result='doc')
+        req = _FakeRequest(KeyValueOperationCode.Get, 'key-1')
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(single_flight.execute, req, read) for _ in range(8)]
+            _wait_for(lambda: single_flight.saved == 7)
+            read.released.set()
+            assert [f.result() for f in futures] == ['doc'] * 8
+        assert read.calls == 1
+        # every read completed, none is left in flight
+        assert single_flight.execute(req, lambda: 'next') == 'next'
+
+    def test_read_options_in_key(self):
+        get = single_flight_key(_FakeRequest(KeyValueOperationCode.Get, 'key-1'))
+        assert get == single_flight_key(_FakeRequest(KeyValueOperationCode.Get, 'key-2'))
+        assert get != single_flight_key(_FakeRequest(KeyValueOperationCode.Get, 'key-1', timeout=1000))
+        assert get != single_flight_key(_FakeRequest(KeyValueOperationCode.Exists, 'key-1'))
+        projected = single_flight_key(_FakeRequest(KeyValueOperationCode.GetProjected, 'key-1', projections=['a']))
+        assert projected != single_flight_key(_FakeRequest(KeyValueOperationCode.GetProjected,
+                                                           'key-1',
+                                                           projections=['b']))
+
+        def _lookup_in(*paths):
+            specs = [{'opcode': 1, 'path': p, 'value': None, 'flags': 0, 'original_index': i}
+                     for i, p in enumerate(paths)]
+            return _FakeRequest(KeyValueOperationCode.LookupIn, 'key-1', specs=specs)
+
+        assert single_flight_key(_lookup_in('a', 'b')) == single_flight_key(_lookup_in('a', 'b'))
+        assert single_flight_key(_lookup_in('a', 'b')) != single_flight_key(_lookup_in('b', 'a'))
+
+    def test_unsupported_operation(self):
+        single_flight = SingleFlight()
+        req = _FakeRequest(KeyValueOperationCode.GetAndLock, 'key-1')
+        assert single_flight.accepts(req) is False
+        assert single_flight_key(req) is None
+        read = _BlockingRead(result='doc')
+        read.released.set()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(single_flight.execute, req, read) for _ in range(4)]
+            assert [f.result() for f in futures] == ['doc'] * 4
+        assert read.calls == 4
+        assert single_flight.saved == 0
+
+
+class SingleFlightTests(SingleFlightTestSuite):
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(SingleFlightTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(SingleFlightTests) if valid_test_method(meth)]
+        test_list = set(SingleFlightTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -19,7 +19,10 @@ from typing import Any, Tuple
 
 import pytest
 
-from couchbase.constants import FMT_JSON
+from couchbase.constants import (FMT_BYTES,
+                                 FMT_JSON,
+                                 FMT_PICKLE,
+                                 FMT_UTF8)
 from couchbase.exceptions import (DocumentLockedException,
                                   DocumentNotFoundException,
                                   ValueFormatException)
@@ -32,7 +35,8 @@ from couchbase.transcoder import (JSONTranscoder,
                                   RawBinaryTranscoder,
                                   RawJSONTranscoder,
                                   RawStringTranscoder,
-                                  Transcoder)
+                                  Transcoder,
+                                  get_decode_format)
 from tests.environments import CollectionType
 from tests.environments.test_environment import TestEnvironment
 from tests.environments.transcoder_environment import FakeTestObj, TranscoderTestEnvironment
@@ -620,6 +624,114 @@ class RawStringTranscoderTestSuite:
         assert value == res.content_as[str]
 
 
+class TranscoderDispatchTestSuite:
+    TEST_MANIFEST = [
+        'test_custom_decode_value_used_by_decode_values',
+        'test_decode_values',
+        'test_decode_values_custom_transcoder',
+        'test_decode_values_raises',
+        'test_decoder_memoized_for_unseen_flags',
+        'test_dispatch_matches_decode_format',
+    ]
+
+    def test_custom_decode_value_used_by_decode_values(self):
+        class UpperStringTranscoder(RawStringTranscoder):
+            def decode_value(self, value, flags):
+                return super().decode_value(value, flags).upper()
+
+        tc = UpperStringTranscoder()
+        assert tc.decode_values([(b'abc', FMT_UTF8), (b'def', FMT_UTF8)]) == ['ABC', 'DEF']
+
+    def test_decode_values(self):
+        tc = LegacyTranscoder()
+        values = [{'a': 1}, 'a string', b'\x00\x01', FakeTestObj(), [1, 2, 3]]
+        decoded = tc.decode_values([tc.encode_value(v) for v in values])
+        assert decoded[0] == {'a': 1}
+        assert decoded[1] == 'a string'
+        assert decoded[2] == b'\x00\x01'
+        assert isinstance(decoded[3], FakeTestObj)
+        assert decoded[4] == [1, 2, 3]
+
+        tc = JSONTranscoder()
+        assert tc.decode_values([tc.encode_value({'id': i}) for i in range(3)]) == [{'id': i} for i in range(3)]
+        assert tc.decode_values([]) == []
+
+    def test_decode_values_custom_transcoder(self):
+        tc = ZeroFlagsTranscoder()
+        assert tc.decode_values([tc.encode_value({'id': i}) for i in range(3)]) == [{'id': i} for i in range(3)]
+
+    def test_decode_values_raises(self):
+        with pytest.raises(ValueFormatException):
+            JSONTranscoder().decode_values([(b'{}', FMT_JSON), (b'\x00', FMT_BYTES)])
+
+    def test_decoder_memoized_for_unseen_flags(self):
+        tc = LegacyTranscoder()
+        # common flags with extra (unknown) bits set
+        flags = FMT_UTF8 | 0x1234
+        assert flags not in tc._decoders
+        assert tc.decode_value(b'abc', flags) == 'abc'
+        assert flags in tc._decoders
+        assert tc.decode_value(b'def', flags) == 'def'
+
+    @pytest.mark.parametrize('flags', [None, 0, FMT_JSON, FMT_BYTES, FMT_UTF8, FMT_PICKLE,
+                                       FMT_JSON & 0x7, FMT_BYTES & 0x7, FMT_UTF8 & 0x7, 0x7FFFFFFF])
+    def test_dispatch_matches_decode_format(self, flags):
+        value = json.dumps({'a': 1}).encode('utf-8')
+        fmt = get_decode_format(flags)
+        expected = [
+            (JSONTranscoder(), {'a': 1} if fmt in [FMT_JSON, 0, None] else ValueFormatException),
+            (RawJSONTranscoder(), value if fmt == FMT_JSON else ValueFormatException),
+            (RawStringTranscoder(), value.decode('utf-8') if fmt == FMT_UTF8 else ValueFormatException),
+            (RawBinaryTranscoder(), value if fmt == FMT_BYTES else ValueFormatException),
+        ]
+        for tc, expected_res in expected:
+            try:
+                res = tc.decode_value(value, flags)
+            except ValueFormatException:
+                res = ValueFormatException
+            assert res == expected_res
+
+
+class ZeroCopyValueTranscoderTestSuite:
+    """With enable_zero_copy_values the transcoders receive the document body as a read-only memoryview."""
+    TEST_MANIFEST = [
+        'test_json_tc_decodes_memoryview',
+        'test_legacy_tc_decodes_memoryview',
+        'test_raw_binary_tc_encodes_memoryview',
+        'test_raw_binary_tc_returns_memoryview',
+        'test_raw_string_tc_decodes_memoryview',
+    ]
+
+    def test_json_tc_decodes_memoryview(self):
+        content = {'id': 1, 'name': 'zéro copy', 'tags': ['a', 'b']}
+        value, flags = JSONTranscoder().encode_value(content)
+        assert JSONTranscoder().decode_value(memoryview(value).toreadonly(), flags) == content
+
+    def test_legacy_tc_decodes_memoryview(self):
+        tc = LegacyTranscoder()
+        value, flags = tc.encode_value({'a': 1})
+        assert tc.decode_value(memoryview(value).toreadonly(), flags) == {'a': 1}
+        value, flags = tc.encode_value('a string')
+        assert tc.decode_value(memoryview(value).toreadonly(), flags) == 'a string'
+
+    def test_raw_binary_tc_encodes_memoryview(self):
+        value, flags = RawBinaryTranscoder().encode_value(memoryview(b'\x00\x01\x02'))
+        assert value == b'\x00\x01\x02'
+        assert isinstance(value, bytes)
+        assert flags == FMT_BYTES
+
+    def test_raw_binary_tc_returns_memoryview(self):
+        view = memoryview(b'\x00\x01\x02').toreadonly()
+        res = RawBinaryTranscoder().decode_value(view, FMT_BYTES)
+        # no copy is made
+        assert res is view
+        assert bytes(res) == b'\x00\x01\x02'
+
+    def test_raw_string_tc_decodes_memoryview(self):
+        value = 'zéro copy'.encode('utf-8')
+        assert RawStringTranscoder().decode_value(memoryview(value).toreadonly(), FMT_UTF8) == 'zéro copy'
+
+
 class ClassicDefaultTranscoderTests(DefaultTranscoderTestSuite):
 
     @pytest.fixture(scope='class')
@@ -778,3 +890,29 @@ class ClassicRawStringTranscoderTests(RawStringTranscoderTestSuite):
         cb_env.default_collection._impl._set_default_transcoder(JSONTranscoder())
         if cb_env.named_collection:
             cb_env.named_collection._impl._set_default_transcoder(JSONTranscoder())
+
+
+class ClassicZeroCopyValueTranscoderTests(ZeroCopyValueTranscoderTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicZeroCopyValueTranscoderTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicZeroCopyValueTranscoderTests) if valid_test_method(meth)]
+        test_list = set(ZeroCopyValueTranscoderTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
+
+
+class ClassicTranscoderDispatchTests(TranscoderDispatchTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicTranscoderDispatchTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicTranscoderDispatchTests) if valid_test_method(meth)]
+        test_list = set(TranscoderDispatchTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
@@ -20,6 +20,10 @@ import pickle  # nosec
 from abc import ABC, abstractmethod
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    List,
                     Optional,
                     Tuple,
                     Union)
@@ -47,6 +51,11 @@ for fl in UNIFIED_FORMATS:
     COMMON2UNIFIED[fl & FMT_COMMON_MASK] = fl
     LEGACY2UNIFIED[fl & FMT_LEGACY_MASK] = fl
 
+# flags values whose decoder is resolved when a built-in transcoder is created, any other flags value
+# is resolved (and memoized, up to MAX_MEMOIZED_FLAGS values) the first time it is seen
+PRECOMPUTED_FLAGS = (None, 0) + UNIFIED_FORMATS + LEGACY_FORMATS
+MAX_MEMOIZED_FLAGS = 1024
+
 
 def get_decode_format(flags,  # type: Optional[int]
                       ) -> Optional[int]:
@@ -91,6 +100,22 @@ class Transcoder(ABC):
                      ) -> Any:
         raise NotImplementedError()
 
+    def decode_values(self,
+                      values  # type: Iterable[Tuple[bytes, int]]
+                      ) -> List[Any]:
+        """Decode a batch of values.
+
+        Args:
+            values (Iterable[Tuple[bytes, int]]): The (value, flags) pairs to decode.
+
+        Returns:
+            List[Any]: The decoded values, in the same order as ``values``.
+
+        Raises:
+            :class:`~couchbase.exceptions.ValueFormatException`: If any of the values cannot be decoded.
+        """
+        return [self.decode_value(value, flags) for value, flags in values]
+
     @classmethod
     def __subclasshook__(cls, subclass):
         return (hasattr(subclass, 'encode_value') and
@@ -99,7 +124,81 @@ class Transcoder(ABC):
                 callable(subclass.decode_value))
 
 
-class JSONTranscoder(Transcoder):
+def _unsupported_format(message  # type: str
+                        ) -> Callable[[Any], Any]:
+    def decoder(value):
+        raise ValueFormatException(message)
+    return decoder
+
+
+class FlagsDispatchTranscoder(Transcoder):
+    """**INTERNAL**
+
+    Base of the built-in transcoders.  The format decision for a flags value is made once per
+    transcoder: the decoder for each flags value is looked up in a table, built when the transcoder
+    is created and extended for flags values that have not been seen before.
+    """
+
+    def __init__(self):
+        self._decoders = {}  # type: Dict[Optional[int], Callable[[Any], Any]]
+        for flags in PRECOMPUTED_FLAGS:
+            self._add_decoder(flags)
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags  # type: int
+                     ) -> Any:
+        return self._get_decoder(flags)(value)
+
+    def decode_values(self,
+                      values  # type: Iterable[Tuple[bytes, int]]
+                      ) -> List[Any]:
+        if type(self).decode_value is not FlagsDispatchTranscoder.decode_value:
+            # a subclass customized decode_value, honor it for every value
+            return super().decode_values(values)
+        get_decoder = self._get_decoder
+        return [get_decoder(flags)(value) for value, flags in values]
+
+    def __getstate__(self):
+        # the decoders are rebuilt on unpickling (e.g. when encoding on a process pool), some of them are closures
+        state = self.__dict__.copy()
+        state.pop('_decoders', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        FlagsDispatchTranscoder.__init__(self)
+
+    def _get_decoder(self,
+                     flags  # type: Optional[int]
+                     ) -> Callable[[Any], Any]:
+        try:
+            return self._decoders[flags]
+        except (AttributeError, KeyError):
+            # AttributeError: a subclass did not call FlagsDispatchTranscoder.__init__
+            return self._add_decoder(flags)
+
+    def _add_decoder(self,
+                     flags  # type: Optional[int]
+                     ) -> Callable[[Any], Any]:
+        decoder = self._make_decoder(get_decode_format(flags))
+        decoders = self.__dict__.setdefault('_decoders', {})
+        if len(decoders) < MAX_MEMOIZED_FLAGS:
+            decoders[flags] = decoder
+        return decoder
+
+    @abstractmethod
+    def _make_decoder(self,
+                      format  # type: Optional[int]
+                      ) -> Callable[[Any], Any]:
+        """**INTERNAL**
+
+        Returns the function that decodes a value of the provided format, as returned by :func:`get_decode_format`.
+        """
+        raise NotImplementedError()
+
+
+class JSONTranscoder(FlagsDispatchTranscoder):
 
     def __init__(self, serializer=None  # type: Serializer
                  ):
@@ -108,6 +207,7 @@ class JSONTranscoder(Transcoder):
             self._serializer = DefaultJsonSerializer()
         else:
             self._serializer = serializer
+        super().__init__()
 
     def encode_value(self,
                      value,  # type: Any
@@ -129,29 +229,31 @@ class JSONTranscoder(Transcoder):
 
         return self._serializer.serialize(value), FMT_JSON
 
-    def decode_value(self,
-                     value,  # type: bytes
-                     flags  # type: int
+    def _decode_json(self,
+                     value,  # type: Union[bytes, memoryview]
                      ) -> Any:
+        try:
+            # the serializer works on the memoryview directly when zero copy values are enabled
+            return self._serializer.deserialize(value)
+        except Exception:
+            # if error encountered, assume return bytes
+            return value
 
-        format = get_decode_format(flags)
-
+    def _make_decoder(self,
+                      format  # type: Optional[int]
+                      ) -> Callable[[Any], Any]:
         # flags=[0 | None] special case, attempt JSON deserialize
         if format in [FMT_JSON, 0, None]:
-            try:
-                return self._serializer.deserialize(value)
-            except Exception:
-                # if error encountered, assume return bytes
-                return value
+            return self._decode_json
         elif format == FMT_BYTES:
-            raise ValueFormatException("The JSONTranscoder (default transcoder) does not support binary format")
+            return _unsupported_format("The JSONTranscoder (default transcoder) does not support binary format")
         elif format == FMT_UTF8:
-            raise ValueFormatException("The JSONTranscoder (default transcoder) does not support string format")
+            return _unsupported_format("The JSONTranscoder (default transcoder) does not support string format")
         else:
-            raise ValueFormatException(f"Unrecognized format provided: {format}")
+            return _unsupported_format(f"Unrecognized format provided: {format}")
 
 
-class RawJSONTranscoder(Transcoder):
+class RawJSONTranscoder(FlagsDispatchTranscoder):
 
     def encode_value(self,
                      value  # type: Union[str,bytes,bytearray]
@@ -166,28 +268,29 @@ class RawJSONTranscoder(Transcoder):
         else:
             raise ValueFormatException("Only binary and string data supported by RawJSONTranscoder")
 
-    def decode_value(self,
-                     value,  # type: bytes
-                     flags  # type: int
+    @staticmethod
+    def _decode_json(value  # type: bytes
                      ) -> Union[str, bytes]:
-
-        format = get_decode_format(flags)
-
+        if isinstance(value, str):
+            value = value.decode('utf-8')
+        elif isinstance(value, bytearray):
+            value = bytes(value)
+        return value
+
+    def _make_decoder(self,
+                      format  # type: Optional[int]
+                      ) -> Callable[[Any], Any]:
         if format == FMT_BYTES:
-            raise ValueFormatException("Binary format type not supported by RawJSONTranscoder")
+            return _unsupported_format("Binary format type not supported by RawJSONTranscoder")
         elif format == FMT_UTF8:
-            raise ValueFormatException("String format type not supported by RawJSONTranscoder")
+            return _unsupported_format("String format type not supported by RawJSONTranscoder")
         elif format == FMT_JSON:
-            if isinstance(value, str):
-                value = value.decode('utf-8')
-            elif isinstance(value, bytearray):
-                value = bytes(value)
-            return value
+            return self._decode_json
         else:
-            raise ValueFormatException(f"Unrecognized format provided: {format}")
+            return _unsupported_format(f"Unrecognized format provided: {format}")
 
 
-class RawStringTranscoder(Transcoder):
+class RawStringTranscoder(FlagsDispatchTranscoder):
 
     def encode_value(self,
                      value  # type: str
@@ -198,55 +301,58 @@ class RawStringTranscoder(Transcoder):
         else:
             raise ValueFormatException("Only string data supported by RawStringTranscoder")
 
-    def decode_value(self,
-                     value,  # type: bytes
-                     flags  # type: int
-                     ) -> Union[str, bytes]:
-
-        format = get_decode_format(flags)
+    @staticmethod
+    def _decode_utf8(value  # type: bytes
+                     ) -> str:
+        return str(value, 'utf-8')
 
+    def _make_decoder(self,
+                      format  # type: Optional[int]
+                      ) -> Callable[[Any], Any]:
         if format == FMT_BYTES:
-            raise ValueFormatException("Binary format type not supported by RawStringTranscoder")
+            return _unsupported_format("Binary format type not supported by RawStringTranscoder")
         elif format == FMT_UTF8:
-            return value.decode('utf-8')
+            return self._decode_utf8
         elif format == FMT_JSON:
-            raise ValueFormatException("JSON format type not supported by RawStringTranscoder")
+            return _unsupported_format("JSON format type not supported by RawStringTranscoder")
         else:
-            raise ValueFormatException(f"Unrecognized format provided: {format}")
+            return _unsupported_format(f"Unrecognized format provided: {format}")
 
 
-class RawBinaryTranscoder(Transcoder):
+class RawBinaryTranscoder(FlagsDispatchTranscoder):
     def encode_value(self,
                      value  # type: Union[bytes,bytearray]
                      ) -> Tuple[bytes, int]:
 
-        if isinstance(value, (bytes, bytearray)):
-            if isinstance(value, bytearray):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            if isinstance(value, (bytearray, memoryview)):
                 value = bytes(value)
             return value, FMT_BYTES
         else:
             raise ValueFormatException("Only binary data supported by RawBinaryTranscoder")
 
-    def decode_value(self,
-                     value,  # type: bytes
-                     flags  # type: int
-                     ) -> bytes:
-
-        format = get_decode_format(flags)
-
+    @staticmethod
+    def _decode_bytes(value  # type: Union[bytes, memoryview]
+                      ) -> Union[bytes, memoryview]:
+        if isinstance(value, bytearray):
+            value = bytes(value)
+        # a (read-only) memoryview is returned as-is when zero copy values are enabled
+        return value
+
+    def _make_decoder(self,
+                      format  # type: Optional[int]
+                      ) -> Callable[[Any], Any]:
         if format == FMT_BYTES:
-            if isinstance(value, bytearray):
-                value = bytes(value)
-            return value
+            return self._decode_bytes
         elif format == FMT_UTF8:
-            raise ValueFormatException("String format type not supported by RawBinaryTranscoder")
+            return _unsupported_format("String format type not supported by RawBinaryTranscoder")
         elif format == FMT_JSON:
-            raise ValueFormatException("JSON format type not supported by RawBinaryTranscoder")
+            return _unsupported_format("JSON format type not supported by RawBinaryTranscoder")
         else:
-            raise ValueFormatException(f"Unrecognized format provided: {format}")
+            return _unsupported_format(f"Unrecognized format provided: {format}")
 
 
-class LegacyTranscoder(Transcoder):
+class LegacyTranscoder(FlagsDispatchTranscoder):
 
     def encode_value(self,
                      value  # type: Any
@@ -276,26 +382,40 @@ class LegacyTranscoder(Transcoder):
         else:  # default to JSON
             return json.dumps(value, ensure_ascii=False).encode('utf-8'), FMT_JSON
 
-    def decode_value(self,
-                     value,  # type: bytes
-                     flags  # type: int
+    @staticmethod
+    def _decode_json(value  # type: bytes
                      ) -> Any:
+        try:
+            return json.loads(str(value, 'utf-8'))
+        except Exception:
+            # if error encountered, assume bytes
+            return value
+
+    @staticmethod
+    def _decode_bytes(value  # type: bytes
+                      ) -> bytes:
+        return value
+
+    @staticmethod
+    def _decode_utf8(value  # type: bytes
+                     ) -> str:
+        return str(value, 'utf-8')
 
-        format = get_decode_format(flags)
+    @staticmethod
+    def _decode_pickle(value  # type: bytes
+                       ) -> Any:
+        return pickle.loads(value)  # nosec
 
+    def _make_decoder(self,
+                      format  # type: Optional[int]
+                      ) -> Callable[[Any], Any]:
         # flags=[0 | None] special case, attempt JSON deserialize
         if format in [FMT_JSON, 0, None]:
-            try:
-                return json.loads(value.decode('utf-8'))
-            except Exception:
-                # if error encountered, assume bytes
-                return value
-        elif format == FMT_BYTES:
-            return value
+            return self._decode_json
         elif format == FMT_UTF8:
-            return value.decode('utf-8')
+            return self._decode_utf8
         elif format == FMT_PICKLE:
-            return pickle.loads(value)  # nosec
+            return self._decode_pickle
         else:
-            # default to returning bytes
-            return value
+            # FMT_BYTES, default to returning bytes
+            return self._decode_bytes
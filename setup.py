@@ -55,6 +55,10 @@ extras_require = {
         'opentelemetry-api~=1.22',
         'opentelemetry-sdk~=1.22',
     ],
+    'orjson': ['orjson>=3.9'],
+    'msgspec': ['msgspec>=0.18'],
+    'ujson': ['ujson>=5.8'],
+    'arrow': ['pyarrow>=14.0'],
 }
 
 
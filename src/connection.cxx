@@ -28,11 +28,12 @@
 namespace pycbc
 {
 
-Connection::Connection(int num_io_threads)
+Connection::Connection(int num_io_threads, bool zero_copy_values)
   : io_()
   , cluster_(io_)
   , io_threads_()
   , connected_(false)
+  , zero_copy_values_(zero_copy_values)
 {
   for (int i = 0; i < num_io_threads; ++i) {
     io_threads_.emplace_back([this]() {
@@ -21,28 +21,45 @@
 #include "error_contexts.hxx"
 #include "exceptions.hxx"
 #include "gil_guard.hxx"
+#include "multi_dispatch.hxx"
 #include "operations_autogen.hxx"
 #include "pycbc_kv_request.hxx"
 #include "pytocbpp_defs.hxx"
 #include "result.hxx"
 #include "utils.hxx"
 #include <asio/io_context.hpp>
+#include <asio/post.hpp>
+#include <atomic>
 #include <core/cluster.hxx>
 #include <core/logger/logger.hxx>
+#include <core/topology/configuration.hxx>
 #include <future>
 #include <list>
 #include <memory>
 #include <stdexcept>
 #include <thread>
+#include <type_traits>
 #include <utility>
+#include <vector>
 
 namespace pycbc
 {
 
+// Responses that carry a document body (get, get_and_lock, get_and_touch, get_any_replica,
+// get_projected, ...), also used for the requests that carry one (upsert, insert, replace, ...)
+template<typename Response, typename = void>
+struct has_document_value : std::false_type {
+};
+
+template<typename Response>
+struct has_document_value<Response, std::void_t<decltype(std::declval<Response&>().value)>>
+  : std::is_same<std::decay_t<decltype(std::declval<Response&>().value)>, std::vector<std::byte>> {
+};
+
 class Connection
 {
 public:
-  Connection(int num_io_threads = 1);
+  Connection(int num_io_threads = 1, bool zero_copy_values = false);
   ~Connection();
 
   Connection(const Connection&) = delete;
@@ -97,6 +114,11 @@ public:
     std::shared_ptr<couchbase::core::tracing::wrapper_sdk_span> wrapper_span,
     std::optional<std::chrono::system_clock::time_point> start_time);
 
+  template<typename Request, typename Staging>
+  PyObject* build_multi_result(const std::vector<Staging>& staging,
+                               std::vector<PyObject*>& results,
+                               const multi_dispatch_state& dispatch);
+
 private:
   enum class connection_state_action {
     no_change,
@@ -109,6 +131,8 @@ private:
   std::list<std::thread> io_threads_;
 
   bool connected_;
+  // hand KV document bodies to Python as read-only memoryviews instead of bytes copies
+  bool zero_copy_values_;
 
   void handle_connection_operation_callback(
     std::error_code ec,
@@ -288,6 +312,45 @@ private:
     }
   }
 
+  template<typename Request, typename Staging>
+  bool stage_multi_request(pycbc_kv_request* request,
+                           std::vector<Staging>& staging,
+                           std::vector<multi_stage_input>& inputs);
+
+  template<typename Request, typename Staging>
+  void build_multi_requests(std::vector<Staging>& staging,
+                            const std::vector<multi_stage_input>& inputs);
+
+  template<typename Request, typename Staging>
+  PyObject* execute_multi_op_sync(std::shared_ptr<std::vector<Staging>> staging,
+                                  std::shared_ptr<multi_dispatch_state> dispatch);
+
+  template<typename Request, typename Staging>
+  void execute_multi_op_async(std::shared_ptr<std::vector<Staging>> staging,
+                              std::shared_ptr<multi_dispatch_state> dispatch,
+                              PyObject* pyObj_callback,
+                              PyObject* pyObj_errback);
+
+  template<typename Request, typename Staging>
+  void complete_multi_op(std::vector<Staging>& staging,
+                         const multi_dispatch_state& dispatch,
+                         PyObject* pyObj_callback,
+                         PyObject* pyObj_errback);
+
+  template<typename Request, typename Staging>
+  void start_multi_dispatch(std::shared_ptr<std::vector<Staging>> staging,
+                            std::shared_ptr<multi_dispatch_state> dispatch);
+
+  template<typename Request, typename Staging>
+  void launch_multi_lanes(std::shared_ptr<std::vector<Staging>> staging,
+                          std::shared_ptr<multi_dispatch_state> dispatch);
+
+  template<typename Request, typename Staging>
+  void dispatch_multi_request(std::shared_ptr<std::vector<Staging>> staging,
+                              std::shared_ptr<multi_dispatch_state> dispatch,
+                              multi_dispatch_lane* lane,
+                              std::size_t pos);
+
   template<typename PyType>
   void add_core_span(
     PyObject* pyObj,
@@ -427,7 +490,29 @@ Connection::finalize_kv_result(
       }
     }
   } else {
+    std::vector<std::byte> body;
+    bool zero_copy = false;
+    if constexpr (has_document_value<Response>::value) {
+      if (zero_copy_values_) {
+        // move the body out so the conversion below does not copy it into a bytes object
+        body = std::move(resp.value);
+        resp.value.clear();
+        zero_copy = true;
+      }
+    }
     result = cbpp_to_py(resp);
+    if (zero_copy && result != nullptr) {
+      PyObject* pyObj_value = create_pycbc_value_memoryview(std::move(body));
+      if (pyObj_value == nullptr ||
+          PyDict_SetItem(
+            reinterpret_cast<pycbc_result*>(result)->raw_result, pycbc::keys::value, pyObj_value) <
+            0) {
+        Py_XDECREF(pyObj_value);
+        Py_DECREF(result);
+        return nullptr;
+      }
+      Py_DECREF(pyObj_value);
+    }
     add_core_span<pycbc_result>(result, wrapper_span);
     if (start_time.has_value()) {
       maybe_add_start_and_end_time<pycbc_result>(
@@ -483,106 +568,390 @@ template<typename Request>
 PyObject*
 Connection::execute_multi_op(PyObject* arg)
 {
-  using Response = typename Request::response_type;
   using Staging = typename kv_staging_trait<Request>::staging_type;
 
-  size_t num_docs = static_cast<size_t>(PyList_Size(arg));
-  std::vector<Staging> staging;
-  staging.reserve(num_docs);
+  // Unchecked by contract, see validate_connection_and_multi_request: arg is either the request
+  // list (couchbase API) or a (requests, callback, errback) tuple (acouchbase API).
+  PyObject* pyObj_requests = arg;
+  PyObject* pyObj_callback = nullptr;
+  PyObject* pyObj_errback = nullptr;
+  if (PyTuple_Check(arg)) {
+    pyObj_requests = PyTuple_GET_ITEM(arg, 0);
+    pyObj_callback = PyTuple_GET_ITEM(arg, 1);
+    pyObj_errback = PyTuple_GET_ITEM(arg, 2);
+  }
 
-  PyObject* pyObj_multi_result = create_pycbc_result();
-  if (pyObj_multi_result == nullptr) {
+  multi_dispatch_options dispatch_options;
+  if (!get_multi_dispatch_options(pyObj_requests, dispatch_options)) {
     return nullptr;
   }
-  pycbc_result* multi_result = reinterpret_cast<pycbc_result*>(pyObj_multi_result);
+
+  size_t num_docs = static_cast<size_t>(PyList_Size(pyObj_requests));
+  // shared so the async path can keep the staged requests alive until the last response arrives
+  auto staging = std::make_shared<std::vector<Staging>>();
+  staging->reserve(num_docs);
+  std::vector<multi_stage_input> inputs;
+  inputs.reserve(num_docs);
 
   try {
+    // The batch goes through three stages so the GIL is only held for what needs Python: one
+    // pass reading the request objects (stage_multi_request), building the core requests without
+    // the GIL (build_multi_requests) and converting the responses as they arrive
+    // (execute_multi_op_sync).
     for (size_t i = 0; i < num_docs; ++i) {
-      PyObject* pyObj_binding = PyList_GetItem(arg, i); // Borrowed ref
+      PyObject* pyObj_binding = PyList_GetItem(pyObj_requests, i); // Borrowed ref
       // Unchecked by contract, see validate_connection_and_multi_request
       pycbc_kv_request* request = reinterpret_cast<pycbc_kv_request*>(pyObj_binding);
-      std::string key_str = py_to_cbpp<std::string>(request->key);
-      std::shared_ptr<couchbase::core::tracing::wrapper_sdk_span> wrapper_span;
-      std::string span_name;
-      extract_field(request->wrapper_span_name, span_name);
-      if (!span_name.empty()) {
-        wrapper_span = std::make_shared<couchbase::core::tracing::wrapper_sdk_span>(span_name);
-      }
-
-      auto req = py_to_cbpp<Request>(request, wrapper_span);
-      if (PyErr_Occurred()) {
-        Py_DECREF(pyObj_multi_result);
+      if (!stage_multi_request<Request>(request, *staging, inputs)) {
         return nullptr;
       }
+    }
 
-      // TODO(PYCBC-1746): Delete w/ removal of legacy tracing logic
-      if (wrapper_span == nullptr) {
-        add_cluster_labels(req);
-      }
+    {
+      gil_release_guard no_gil;
+      build_multi_requests<Request>(*staging, inputs);
+    }
+    // the document bodies have been copied into the requests
+    inputs.clear();
 
-      std::optional<std::chrono::system_clock::time_point> start_time;
-      if (request->with_metrics == Py_True) {
-        start_time = std::chrono::system_clock::now();
-      }
+    auto dispatch = std::make_shared<multi_dispatch_state>(dispatch_options, staging->size());
+    if (pyObj_callback != nullptr) {
+      execute_multi_op_async<Request>(
+        std::move(staging), std::move(dispatch), pyObj_callback, pyObj_errback);
+      Py_RETURN_NONE;
+    }
+    return execute_multi_op_sync<Request>(std::move(staging), std::move(dispatch));
+  } catch (const std::exception& e) {
+    return raise_invalid_argument(e.what());
+  }
+}
 
-      auto barrier = std::make_shared<std::promise<Response>>();
-      auto fut = barrier->get_future();
+template<typename Request, typename Staging>
+bool
+Connection::stage_multi_request(pycbc_kv_request* request,
+                                std::vector<Staging>& staging,
+                                std::vector<multi_stage_input>& inputs)
+{
+  multi_stage_input input;
+  std::string key_str = py_to_cbpp<std::string>(request->key);
+  extract_field(request->wrapper_span_name, input.span_name);
+  bool with_wrapper_span = !input.span_name.empty();
+
+  // The body is copied by build_multi_requests.  A wrapper span replaces the legacy one, which is
+  // not created at all then (it holds a Python object).
+  detached_request_field body{ request->value, has_document_value<Request>::value };
+  detached_request_field legacy_span{ request->parent_span, with_wrapper_span };
+  auto req = py_to_cbpp<Request>(request, nullptr);
+  if (PyErr_Occurred()) {
+    return false;
+  }
+  input.set_body(body.get());
 
-      staging.push_back({ std::move(req),
-                          std::move(key_str),
-                          std::move(wrapper_span),
-                          start_time,
-                          std::move(barrier),
-                          std::move(fut) });
-    }
+  // TODO(PYCBC-1746): Delete w/ removal of legacy tracing logic
+  if (!with_wrapper_span) {
+    add_cluster_labels(req);
+  }
 
-    {
-      gil_release_guard no_gil;
-      for (auto& s : staging) {
-        auto barrier = s.barrier;
-        cluster_.execute(s.req, [barrier](Response resp) {
-          barrier->set_value(std::move(resp));
-        });
-      }
+  std::optional<std::chrono::system_clock::time_point> start_time;
+  if (request->with_metrics == Py_True) {
+    start_time = std::chrono::system_clock::now();
+  }
 
-      for (auto& s : staging) {
-        s.fut.wait();
+  staging.push_back({ std::move(req), std::move(key_str), nullptr, start_time, nullptr, {} });
+  inputs.push_back(std::move(input));
+  return true;
+}
+
+template<typename Request, typename Staging>
+void
+Connection::build_multi_requests(std::vector<Staging>& staging,
+                                 const std::vector<multi_stage_input>& inputs)
+{
+  using Response = typename Request::response_type;
+
+  // Runs without the GIL, inputs keep the document bodies alive.
+  for (std::size_t i = 0; i < staging.size(); ++i) {
+    auto& s = staging[i];
+    const auto& input = inputs[i];
+    if constexpr (has_document_value<Request>::value) {
+      if (input.body != nullptr) {
+        s.req.value.assign(input.body, input.body + input.body_size);
       }
     }
+    if (!input.span_name.empty()) {
+      s.wrapper_span =
+        std::make_shared<couchbase::core::tracing::wrapper_sdk_span>(input.span_name);
+      s.req.parent_span = s.wrapper_span;
+    }
+    s.barrier = std::make_shared<std::promise<Response>>();
+    s.fut = s.barrier->get_future();
+  }
+}
 
-    bool all_okay = true;
-    for (auto& s : staging) {
-      PyObject* res = finalize_kv_result<Request>(
+template<typename Request, typename Staging>
+PyObject*
+Connection::execute_multi_op_sync(std::shared_ptr<std::vector<Staging>> staging,
+                                  std::shared_ptr<multi_dispatch_state> dispatch)
+{
+  dispatch->collect_completed = true;
+  {
+    gil_release_guard no_gil;
+    start_multi_dispatch<Request>(staging, dispatch);
+  }
+
+  // Responses are converted in the order they arrive, in batches of whatever arrived while the
+  // previous batch was converted, so the conversion overlaps with the requests still in flight.
+  std::vector<PyObject*> results(staging->size(), nullptr);
+  std::size_t converted = 0;
+  while (converted < staging->size()) {
+    std::vector<std::size_t> batch;
+    {
+      gil_release_guard no_gil;
+      batch = dispatch->wait_completed();
+    }
+    for (auto index : batch) {
+      auto& s = (*staging)[index];
+      results[index] = finalize_kv_result<Request>(
         s.fut.get(), std::move(s.wrapper_span), std::move(s.start_time));
+      ++converted;
       // OOM is not a per-key condition, so abandon the whole multi result rather than
-      // reporting a partial one. An exception is already pending.
-      if (res == nullptr) {
-        Py_DECREF(pyObj_multi_result);
-        return nullptr;
-      }
-      if (PyObject_TypeCheck(res, &pycbc_exception_type)) {
-        all_okay = false;
-      }
-      int rc = PyDict_SetItemString(multi_result->raw_result, s.key_str.c_str(), res);
-      Py_DECREF(res);
-      if (rc < 0) {
-        Py_DECREF(pyObj_multi_result);
+      // reporting a partial one. An exception is already pending.  The requests still in flight
+      // keep the staging and dispatch state alive.
+      if (results[index] == nullptr) {
+        clear_multi_results(results);
         return nullptr;
       }
     }
-    if (PyDict_SetItemString(multi_result->raw_result, "all_okay", all_okay ? Py_True : Py_False) <
+  }
+  return build_multi_result<Request>(*staging, results, *dispatch);
+}
+
+template<typename Request, typename Staging>
+PyObject*
+Connection::build_multi_result(const std::vector<Staging>& staging,
+                               std::vector<PyObject*>& results,
+                               const multi_dispatch_state& dispatch)
+{
+  // results holds the converted response of each staged request, in the same order; the
+  // references are consumed in every case.
+  PyObject* pyObj_multi_result = create_pycbc_result();
+  if (pyObj_multi_result == nullptr) {
+    clear_multi_results(results);
+    return nullptr;
+  }
+  pycbc_result* multi_result = reinterpret_cast<pycbc_result*>(pyObj_multi_result);
+
+  bool all_okay = true;
+  for (std::size_t i = 0; i < staging.size(); ++i) {
+    if (PyObject_TypeCheck(results[i], &pycbc_exception_type)) {
+      all_okay = false;
+    }
+    if (PyDict_SetItemString(multi_result->raw_result, staging[i].key_str.c_str(), results[i]) <
         0) {
+      clear_multi_results(results);
       Py_DECREF(pyObj_multi_result);
       return nullptr;
     }
-  } catch (const std::exception& e) {
+  }
+  clear_multi_results(results);
+  if (PyDict_SetItemString(multi_result->raw_result, "all_okay", all_okay ? Py_True : Py_False) <
+      0) {
     Py_DECREF(pyObj_multi_result);
-    return raise_invalid_argument(e.what());
+    return nullptr;
+  }
+  // dispatch stats are only reported when the dispatch was shaped by the options
+  if (!dispatch.options.is_default()) {
+    PyObject* pyObj_stats = dispatch.build_stats();
+    if (pyObj_stats == nullptr) {
+      Py_DECREF(pyObj_multi_result);
+      return nullptr;
+    }
+    Py_XDECREF(multi_result->dispatch_stats);
+    multi_result->dispatch_stats = pyObj_stats;
   }
-
   return pyObj_multi_result;
 }
 
+template<typename Request, typename Staging>
+void
+Connection::execute_multi_op_async(std::shared_ptr<std::vector<Staging>> staging,
+                                   std::shared_ptr<multi_dispatch_state> dispatch,
+                                   PyObject* pyObj_callback,
+                                   PyObject* pyObj_errback)
+{
+  // Released in complete_multi_op once the whole batch has been handed back to Python.
+  Py_INCREF(pyObj_callback);
+  Py_INCREF(pyObj_errback);
+
+  if (staging->empty()) {
+    complete_multi_op<Request>(*staging, *dispatch, pyObj_callback, pyObj_errback);
+    return;
+  }
+
+  // Each response is parked in its staging promise; only the last one to arrive reacquires the
+  // GIL, so the event loop is woken once per batch instead of once per key.  The handler calling
+  // on_complete owns a reference to the dispatch state, so a raw pointer does not create a cycle.
+  auto* state = dispatch.get();
+  dispatch->on_complete = [staging, state, pyObj_callback, pyObj_errback, this]() {
+    gil_acquire_guard gil;
+    complete_multi_op<Request>(*staging, *state, pyObj_callback, pyObj_errback);
+  };
+  {
+    gil_release_guard no_gil;
+    start_multi_dispatch<Request>(std::move(staging), std::move(dispatch));
+  }
+}
+
+template<typename Request, typename Staging>
+void
+Connection::start_multi_dispatch(std::shared_ptr<std::vector<Staging>> staging,
+                                 std::shared_ptr<multi_dispatch_state> dispatch)
+{
+  if (!dispatch->options.group_by_node || staging->empty()) {
+    dispatch->build_lanes(staging->size());
+    launch_multi_lanes<Request>(std::move(staging), std::move(dispatch));
+    return;
+  }
+
+  // All the requests of a multi operation target the same bucket.  The configuration is usually
+  // cached, in which case the handler runs right away on the calling thread.
+  auto bucket_name = staging->front().req.id.bucket();
+  // the lanes are labelled with the KV port the SDK connects to, i.e. the TLS one on a
+  // couchbases:// cluster
+  auto origin_result = cluster_.origin();
+  bool enable_tls = !origin_result.first && origin_result.second.options().enable_tls;
+  cluster_.with_bucket_configuration(
+    bucket_name,
+    [staging, dispatch, enable_tls, this](
+      std::error_code ec,
+      std::shared_ptr<couchbase::core::topology::configuration> config) {
+      if (ec || config == nullptr) {
+        // the core still routes each request, only the grouping is lost
+        CB_LOG_DEBUG("PYCBC: No configuration to group multi operation by node, ec={}",
+                     ec.message());
+        dispatch->build_lanes(staging->size());
+      } else {
+        dispatch->build_lanes(
+          staging->size(), [&staging, &config, enable_tls](std::size_t i) -> std::string {
+            auto node_index = config->map_key((*staging)[i].req.id.key(), 0).second;
+            if (!node_index.has_value() || node_index.value() >= config->nodes.size()) {
+              return {};
+            }
+            const auto& node = config->nodes[node_index.value()];
+            return node.hostname + ":" +
+                   std::to_string(
+                     node.port_or(couchbase::core::service_type::key_value, enable_tls, 0));
+          });
+      }
+      launch_multi_lanes<Request>(staging, dispatch);
+    });
+}
+
+template<typename Request, typename Staging>
+void
+Connection::launch_multi_lanes(std::shared_ptr<std::vector<Staging>> staging,
+                               std::shared_ptr<multi_dispatch_state> dispatch)
+{
+  for (auto& lane : dispatch->lanes) {
+    auto window = dispatch->initial_window(*lane);
+    // set before the first dispatch, responses claim the requests past the window
+    lane->next.store(window, std::memory_order_relaxed);
+    lane->start = std::chrono::steady_clock::now();
+    for (std::size_t pos = 0; pos < window; ++pos) {
+      dispatch_multi_request<Request>(staging, dispatch, lane.get(), pos);
+    }
+  }
+}
+
+template<typename Request, typename Staging>
+void
+Connection::dispatch_multi_request(std::shared_ptr<std::vector<Staging>> staging,
+                                   std::shared_ptr<multi_dispatch_state> dispatch,
+                                   multi_dispatch_lane* lane,
+                                   std::size_t pos)
+{
+  using Response = typename Request::response_type;
+
+  // The core can deliver a response from within execute (e.g. when the request fails right away);
+  // dispatching the next request from that handler would then recurse once per request.
+  static thread_local std::size_t dispatch_depth = 0;
+
+  auto index = lane->indices[pos];
+  auto& s = (*staging)[index];
+  auto barrier = s.barrier;
+  lane->on_dispatch();
+  ++dispatch_depth;
+  cluster_.execute(s.req, [staging, dispatch, lane, index, barrier, this](Response resp) {
+    lane->on_response();
+    // keep the lane's window full before handing the response over
+    auto next = lane->claim_next();
+    if (next < lane->indices.size()) {
+      if (dispatch_depth == 0) {
+        dispatch_multi_request<Request>(staging, dispatch, lane, next);
+      } else {
+        asio::post(io_, [staging, dispatch, lane, next, this]() {
+          dispatch_multi_request<Request>(staging, dispatch, lane, next);
+        });
+      }
+    }
+    barrier->set_value(std::move(resp));
+    if (dispatch->collect_completed) {
+      dispatch->push_completed(index);
+    }
+    if (dispatch->remaining.fetch_sub(1) == 1 && dispatch->on_complete) {
+      auto on_complete = std::move(dispatch->on_complete);
+      on_complete();
+    }
+  });
+  --dispatch_depth;
+}
+
+template<typename Request, typename Staging>
+void
+Connection::complete_multi_op(std::vector<Staging>& staging,
+                              const multi_dispatch_state& dispatch,
+                              PyObject* pyObj_callback,
+                              PyObject* pyObj_errback)
+{
+  std::vector<PyObject*> results;
+  results.reserve(staging.size());
+  PyObject* result = nullptr;
+  for (auto& s : staging) {
+    PyObject* res =
+      finalize_kv_result<Request>(s.fut.get(), std::move(s.wrapper_span), std::move(s.start_time));
+    if (res == nullptr) {
+      clear_multi_results(results);
+      break;
+    }
+    results.push_back(res);
+  }
+  if (results.size() == staging.size()) {
+    result = build_multi_result<Request>(staging, results, dispatch);
+  }
+  PyObject* target_handler = pyObj_callback;
+  if (result == nullptr) {
+    // Mirror the single-op path: the errback is the only error channel we have from here.
+    result = build_pycbc_exception_from_python_exc(
+      "Failed to build multi operation result.", __FILE__, __LINE__);
+    target_handler = pyObj_errback;
+  }
+
+  if (result != nullptr) {
+    PyObject* ret = PyObject_CallFunctionObjArgs(target_handler, result, nullptr);
+    if (ret == nullptr) {
+      // callback/errback raised; nothing else observes this IO thread's exception state.
+      PyErr_WriteUnraisable(target_handler);
+    }
+    Py_XDECREF(ret);
+    Py_DECREF(result);
+  } else {
+    PyErr_WriteUnraisable(pyObj_errback);
+    CB_LOG_WARNING("PYCBC: Failed to finalize KV multi result.");
+  }
+  Py_DECREF(pyObj_callback);
+  Py_DECREF(pyObj_errback);
+}
+
 template<typename Request>
 PyObject*
 Connection::execute_streaming_op(PyObject* kwargs)
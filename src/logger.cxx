@@ -49,13 +49,23 @@ pycbc_logger__configure_logging_sink__(PyObject* self, PyObject* args, PyObject*
   auto logger = reinterpret_cast<pycbc_logger*>(self);
   PyObject* pyObj_logger = nullptr;
   PyObject* pyObj_level = nullptr;
-  const char* kw_list[] = { "logger", "level", nullptr };
-  const char* kw_format = "OO";
-  if (!PyArg_ParseTupleAndKeywords(
-        args, kwargs, kw_format, const_cast<char**>(kw_list), &pyObj_logger, &pyObj_level)) {
+  Py_ssize_t queue_size = 0;
+  const char* kw_list[] = { "logger", "level", "queue_size", nullptr };
+  const char* kw_format = "OO|n";
+  if (!PyArg_ParseTupleAndKeywords(args,
+                                   kwargs,
+                                   kw_format,
+                                   const_cast<char**>(kw_list),
+                                   &pyObj_logger,
+                                   &pyObj_level,
+                                   &queue_size)) {
     return raise_invalid_argument(
       "Cannot set pycbc_logger sink.  Unable to parse args/kwargs.", __FILE__, __LINE__);
   }
+  if (queue_size < 0) {
+    return raise_invalid_argument(
+      "Cannot set pycbc_logger sink.  The queue size cannot be negative.", __FILE__, __LINE__);
+  }
 
   if (couchbase::core::logger::is_initialized()) {
     return raise_invalid_argument("Cannot create logger.  Another logger has already been "
@@ -85,8 +95,11 @@ pycbc_logger__configure_logging_sink__(PyObject* self, PyObject* args, PyObject*
       Py_DECREF(pyObj_logger_handle_method);
       return nullptr;
     }
-    logger->logger_sink_ = std::make_shared<pycbc_logger_sink>(
-      pyObj_logger, pyObj_logger_handle_method, pyObj_log_record_type);
+    logger->logger_sink_ =
+      std::make_shared<pycbc_logger_sink>(pyObj_logger,
+                                          pyObj_logger_handle_method,
+                                          pyObj_log_record_type,
+                                          static_cast<std::size_t>(queue_size));
     Py_DECREF(pyObj_log_record_type);
     Py_DECREF(pyObj_logger_handle_method);
   }
@@ -197,6 +210,62 @@ pycbc_logger__shutdown_sink__(PyObject* self, PyObject* Py_UNUSED(ignored))
   Py_RETURN_NONE;
 }
 
+PyObject*
+pycbc_logger__drain_logging_sink__(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  auto logger = reinterpret_cast<pycbc_logger*>(self);
+  Py_ssize_t max_messages = 0;
+  Py_ssize_t timeout_ms = 0;
+  const char* kw_list[] = { "max_messages", "timeout_ms", nullptr };
+  const char* kw_format = "n|n";
+  if (!PyArg_ParseTupleAndKeywords(
+        args, kwargs, kw_format, const_cast<char**>(kw_list), &max_messages, &timeout_ms)) {
+    return raise_invalid_argument(
+      "Cannot drain the logging sink.  Unable to parse args/kwargs.", __FILE__, __LINE__);
+  }
+  if (!logger->logger_sink_ || max_messages <= 0) {
+    return PyLong_FromSize_t(0);
+  }
+  // hold our own reference, the sink must outlive the drain even if the logger is reconfigured
+  auto sink = logger->logger_sink_;
+  auto drained = sink->drain(static_cast<std::size_t>(max_messages),
+                             std::chrono::milliseconds(timeout_ms > 0 ? timeout_ms : 0));
+  return PyLong_FromSize_t(drained);
+}
+
+PyObject*
+pycbc_logger__set_logging_sink_level__(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  auto logger = reinterpret_cast<pycbc_logger*>(self);
+  Py_ssize_t level = 0;
+  const char* kw_list[] = { "level", nullptr };
+  const char* kw_format = "n";
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, kw_format, const_cast<char**>(kw_list), &level)) {
+    return raise_invalid_argument(
+      "Cannot set the logging sink level.  Unable to parse args/kwargs.", __FILE__, __LINE__);
+  }
+  if (logger->logger_sink_) {
+    logger->logger_sink_->set_python_level(level > 0 ? static_cast<std::size_t>(level) : 0);
+  }
+  Py_RETURN_NONE;
+}
+
+PyObject*
+pycbc_logger__logging_sink_stats__(PyObject* self, PyObject* Py_UNUSED(ignored))
+{
+  auto logger = reinterpret_cast<pycbc_logger*>(self);
+  bool is_async = logger->logger_sink_ && logger->logger_sink_->is_async();
+  std::size_t queue_capacity = logger->logger_sink_ ? logger->logger_sink_->queue_capacity() : 0;
+  std::uint64_t dropped = logger->logger_sink_ ? logger->logger_sink_->dropped() : 0;
+  return Py_BuildValue("{s:O,s:n,s:K}",
+                       "async",
+                       is_async ? Py_True : Py_False,
+                       "queue_capacity",
+                       static_cast<Py_ssize_t>(queue_capacity),
+                       "dropped",
+                       static_cast<unsigned long long>(dropped));
+}
+
 static PyMethodDef pycbc_logger_methods[] = {
   { "configure_logging_sink",
     (PyCFunction)pycbc_logger__configure_logging_sink__,
@@ -218,6 +287,18 @@ static PyMethodDef pycbc_logger_methods[] = {
     (PyCFunction)pycbc_logger__is_file_logger__,
     METH_NOARGS,
     PyDoc_STR("Check if logger is file logger or not") },
+  { "drain_logging_sink",
+    (PyCFunction)pycbc_logger__drain_logging_sink__,
+    METH_VARARGS | METH_KEYWORDS,
+    PyDoc_STR("Hand the messages queued by the asynchronous logging sink to the logger") },
+  { "set_logging_sink_level",
+    (PyCFunction)pycbc_logger__set_logging_sink_level__,
+    METH_VARARGS | METH_KEYWORDS,
+    PyDoc_STR("Set the level below which the asynchronous logging sink discards messages") },
+  { "logging_sink_stats",
+    (PyCFunction)pycbc_logger__logging_sink_stats__,
+    METH_NOARGS,
+    PyDoc_STR("Get the logging sink's mode, queue capacity and dropped message count") },
   { "shutdown_sink",
     (PyCFunction)pycbc_logger__shutdown_sink__,
     METH_NOARGS,
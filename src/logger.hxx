@@ -19,13 +19,19 @@
 
 #include "Python.h"
 #include "gil_guard.hxx"
+#include "ring_buffer.hxx"
 #include <atomic>
+#include <chrono>
+#include <condition_variable>
 #include <core/logger/configuration.hxx>
 #include <core/logger/logger.hxx>
 #include <core/transactions.hxx>
+#include <cstdint>
+#include <mutex>
 #include <queue>
 #include <spdlog/details/log_msg.h>
 #include <spdlog/sinks/base_sink.h>
+#include <vector>
 
 namespace pycbc
 {
@@ -37,11 +43,14 @@ namespace pycbc
 
 struct log_msg_copy {
   std::string logger_name;
-  spdlog::level::level_enum level;
+  spdlog::level::level_enum level{ spdlog::level::level_enum::off };
   std::chrono::system_clock::time_point time;
   spdlog::source_loc source;
   std::string payload;
 
+  // an empty message, the ring buffer's cells hold one until a message is pushed
+  log_msg_copy() = default;
+
   log_msg_copy(const spdlog::details::log_msg& msg)
   {
     logger_name = std::string(msg.logger_name.data(), msg.logger_name.size());
@@ -70,6 +79,12 @@ convert_spdlog_level(spdlog::level::level_enum lvl);
 // Uses std::atomic<bool> active_ flag for lifecycle management instead.
 // Python-side atexit handler calls deactivate() before interpreter shutdown.
 //
+// ASYNC MODE: with a non-zero queue capacity, log() never takes the GIL.  Messages below the
+// Python logger's effective level (pushed down by the drain thread, see set_python_level()) are
+// discarded before anything is copied, the others are copied into a bounded lock-free ring buffer
+// and the message is dropped (and counted) if the buffer is full.  A Python thread calls drain()
+// to hand the queued messages to the logger in batches.
+//
 class pycbc_logger_sink : public spdlog::sinks::sink
 {
 public:
@@ -79,12 +94,18 @@ public:
   // remains responsible for the references it holds.
   pycbc_logger_sink(PyObject* pyObj_logger,
                     PyObject* pyObj_logger_handle_method,
-                    PyObject* pyObj_log_record_type)
+                    PyObject* pyObj_log_record_type,
+                    std::size_t queue_capacity = 0,
+                    std::size_t python_level = 0)
     : pyObj_logger_(pyObj_logger)
     , pyObj_logger_handle_method_(pyObj_logger_handle_method)
     , pyObj_log_record_type_(pyObj_log_record_type)
     , active_(true)
+    , python_level_(python_level)
   {
+    if (queue_capacity > 0) {
+      queue_ = std::make_unique<bounded_ring_buffer<log_msg_copy>>(queue_capacity);
+    }
     Py_INCREF(pyObj_logger_);
     Py_INCREF(pyObj_logger_handle_method_);
     Py_INCREF(pyObj_log_record_type_);
@@ -102,6 +123,10 @@ public:
   void deactivate()
   {
     active_.store(false, std::memory_order_release);
+    if (queue_) {
+      std::lock_guard<std::mutex> lock(drain_mutex_);
+      drain_cv_.notify_all();
+    }
   }
 
   ~pycbc_logger_sink()
@@ -122,11 +147,78 @@ public:
     if (!active_.load(std::memory_order_acquire)) {
       return;
     }
-    log_it_(msg);
+    if (!queue_) {
+      log_it_(msg);
+      return;
+    }
+    if (convert_spdlog_level(msg.level) < python_level_.load(std::memory_order_relaxed)) {
+      return;
+    }
+    if (!queue_->try_push(log_msg_copy{ msg })) {
+      dropped_.fetch_add(1, std::memory_order_relaxed);
+      return;
+    }
+    // only pay for the mutex when the drain thread is parked waiting for messages
+    if (drain_waiting_.load(std::memory_order_seq_cst)) {
+      std::lock_guard<std::mutex> lock(drain_mutex_);
+      drain_cv_.notify_one();
+    }
   }
 
   void flush() final {};
 
+  bool is_async() const
+  {
+    return static_cast<bool>(queue_);
+  }
+
+  std::size_t queue_capacity() const
+  {
+    return queue_ ? queue_->capacity() : 0;
+  }
+
+  std::uint64_t dropped() const
+  {
+    return dropped_.load(std::memory_order_relaxed);
+  }
+
+  // The Python logger's effective level, messages below it are discarded in log().
+  void set_python_level(std::size_t level)
+  {
+    python_level_.store(level, std::memory_order_relaxed);
+  }
+
+  // Hands up to max_messages queued messages to the logger.  Must be called with the GIL held,
+  // which is released while waiting up to timeout for a message when the queue is empty.
+  // Returns the number of messages handed to the logger.
+  std::size_t drain(std::size_t max_messages, std::chrono::milliseconds timeout)
+  {
+    if (!queue_ || max_messages == 0) {
+      return 0;
+    }
+    std::vector<log_msg_copy> batch;
+    {
+      pycbc::gil_release_guard nogil;
+      pop_batch_(batch, max_messages);
+      if (batch.empty() && timeout.count() > 0 && active_.load(std::memory_order_acquire)) {
+        std::unique_lock<std::mutex> lock(drain_mutex_);
+        drain_waiting_.store(true, std::memory_order_seq_cst);
+        // a producer that pushed before seeing drain_waiting_ is caught by this check, one that
+        // pushed after notifies under the mutex; the timeout bounds any missed wakeup regardless
+        if (queue_->empty()) {
+          drain_cv_.wait_for(lock, timeout);
+        }
+        drain_waiting_.store(false, std::memory_order_seq_cst);
+        lock.unlock();
+        pop_batch_(batch, max_messages);
+      }
+    }
+    for (const auto& msg : batch) {
+      emit_(msg);
+    }
+    return batch.size();
+  }
+
   void set_pattern(const std::string& pattern) final {};
   void set_formatter(std::unique_ptr<spdlog::formatter> sink_formatter) final {};
 
@@ -134,7 +226,20 @@ protected:
   void log_it_(const spdlog::details::log_msg& msg)
   {
     pycbc::gil_acquire_guard gil;
+    emit_(msg);
+  }
 
+  void pop_batch_(std::vector<log_msg_copy>& batch, std::size_t max_messages)
+  {
+    log_msg_copy msg;
+    while (batch.size() < max_messages && queue_->try_pop(msg)) {
+      batch.emplace_back(std::move(msg));
+    }
+  }
+
+  // Creates a LogRecord from the message and hands it to the logger, the GIL must be held.
+  void emit_(const log_msg_copy& msg)
+  {
     // convert the log_msg_copy to a dict first...
     auto pyObj_log_record_details = convert_log_msg(msg);
     if (nullptr == pyObj_log_record_details) {
@@ -271,6 +376,13 @@ private:
   PyObject* pyObj_logger_handle_method_;
   PyObject* pyObj_log_record_type_;
   std::atomic<bool> active_;
+  // async mode only
+  std::unique_ptr<bounded_ring_buffer<log_msg_copy>> queue_;
+  std::atomic<std::size_t> python_level_;
+  std::atomic<std::uint64_t> dropped_{ 0 };
+  std::atomic<bool> drain_waiting_{ false };
+  std::mutex drain_mutex_;
+  std::condition_variable drain_cv_;
 };
 
 struct pycbc_logger {
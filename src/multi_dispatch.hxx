@@ -0,0 +1,339 @@
+/*
+ *   Copyright 2016-2026. Couchbase, Inc.
+ *   All Rights Reserved.
+ *
+ *   Licensed under the Apache License, Version 2.0 (the "License");
+ *   you may not use this file except in compliance with the License.
+ *   You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *   Unless required by applicable law or agreed to in writing, software
+ *   distributed under the License is distributed on an "AS IS" BASIS,
+ *   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *   See the License for the specific language governing permissions and
+ *   limitations under the License.
+ */
+
+#pragma once
+
+#include "Python.h"
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <cstddef>
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace pycbc
+{
+
+// Dispatch settings of a multi operation.  The couchbase API hands the request list over as a
+// KeyValueMultiRequestList (see couchbase/logic/collection_multi_types.py), a list subclass that
+// carries them as attributes; a plain list keeps the defaults (everything dispatched at once).
+struct multi_dispatch_options {
+  // 0 means no limit
+  std::size_t max_in_flight{ 0 };
+  bool group_by_node{ false };
+
+  bool is_default() const
+  {
+    return max_in_flight == 0 && !group_by_node;
+  }
+};
+
+// Requires the GIL.  Returns false, with an exception set, if an attribute is invalid.
+inline bool
+get_multi_dispatch_options(PyObject* pyObj_requests, multi_dispatch_options& options)
+{
+  if (PyList_CheckExact(pyObj_requests)) {
+    return true;
+  }
+
+  PyObject* pyObj_max_in_flight = PyObject_GetAttrString(pyObj_requests, "max_in_flight");
+  if (pyObj_max_in_flight == nullptr) {
+    PyErr_Clear();
+  } else {
+    if (pyObj_max_in_flight != Py_None) {
+      options.max_in_flight = PyLong_AsSize_t(pyObj_max_in_flight);
+    }
+    Py_DECREF(pyObj_max_in_flight);
+    if (PyErr_Occurred()) {
+      return false;
+    }
+  }
+
+  PyObject* pyObj_group_by_node = PyObject_GetAttrString(pyObj_requests, "group_by_node");
+  if (pyObj_group_by_node == nullptr) {
+    PyErr_Clear();
+  } else {
+    int is_true = PyObject_IsTrue(pyObj_group_by_node);
+    Py_DECREF(pyObj_group_by_node);
+    if (is_true < 0) {
+      return false;
+    }
+    options.group_by_node = is_true == 1;
+  }
+  return true;
+}
+
+// Hides a field of a pycbc_kv_request from py_to_cbpp (extract_field skips nullptr) for the
+// lifetime of the guard, e.g. so a document body can be copied later without the GIL.  Requires the
+// GIL; does nothing unless detach is true.
+class detached_request_field
+{
+public:
+  detached_request_field(PyObject*& field, bool detach)
+    : field_(field)
+    , value_(detach ? field : nullptr)
+  {
+    if (detach) {
+      field_ = nullptr;
+    }
+  }
+
+  ~detached_request_field()
+  {
+    if (value_ != nullptr) {
+      field_ = value_;
+    }
+  }
+
+  detached_request_field(const detached_request_field&) = delete;
+  detached_request_field& operator=(const detached_request_field&) = delete;
+
+  // Borrowed reference, nullptr if the field was not detached or not set.
+  PyObject* get() const
+  {
+    return value_;
+  }
+
+private:
+  PyObject*& field_;
+  PyObject* value_;
+};
+
+// What the first stage of a multi operation reads from a pycbc_kv_request, under the GIL, for the
+// second stage to build from without it: the wrapper span name and the document body, kept alive
+// by a reference owned by the input.
+struct multi_stage_input {
+  multi_stage_input() = default;
+  multi_stage_input(const multi_stage_input&) = delete;
+  multi_stage_input& operator=(const multi_stage_input&) = delete;
+
+  multi_stage_input(multi_stage_input&& other) noexcept
+    : span_name(std::move(other.span_name))
+    , pyObj_body(other.pyObj_body)
+    , body(other.body)
+    , body_size(other.body_size)
+  {
+    other.pyObj_body = nullptr;
+  }
+
+  // Only the destructor of an input that still owns a body requires the GIL, see release_body.
+  ~multi_stage_input()
+  {
+    Py_XDECREF(pyObj_body);
+  }
+
+  // Requires the GIL.  Anything other than a non-empty bytes object is ignored, as py_to_cbpp does.
+  void set_body(PyObject* pyObj_value)
+  {
+    char* buffer = nullptr;
+    Py_ssize_t length = 0;
+    if (pyObj_value == nullptr || !PyBytes_Check(pyObj_value) ||
+        PyBytes_AsStringAndSize(pyObj_value, &buffer, &length) != 0 || length == 0) {
+      return;
+    }
+    Py_INCREF(pyObj_value);
+    pyObj_body = pyObj_value;
+    body = reinterpret_cast<const std::byte*>(buffer);
+    body_size = static_cast<std::size_t>(length);
+  }
+
+  // Requires the GIL.
+  void release_body()
+  {
+    Py_CLEAR(pyObj_body);
+    body = nullptr;
+    body_size = 0;
+  }
+
+  std::string span_name{};
+  PyObject* pyObj_body{ nullptr };
+  // the buffer of pyObj_body, bytes objects are immutable so it can be read without the GIL
+  const std::byte* body{ nullptr };
+  std::size_t body_size{ 0 };
+};
+
+// Requires the GIL.  Releases the results converted so far, when a multi operation is abandoned.
+inline void
+clear_multi_results(std::vector<PyObject*>& results)
+{
+  for (auto* res : results) {
+    Py_XDECREF(res);
+  }
+  results.clear();
+}
+
+// A lane is a sequence of staged requests with its own window: the whole batch, or the requests
+// mapped to one node when grouping by node.  The first max_in_flight requests of a lane are
+// dispatched by the calling thread, after that each response dispatches the lane's next request
+// from the core IO thread that delivered it, so a lane never has more than max_in_flight requests
+// outstanding and a node sees a steady pipeline rather than the whole batch at once.
+struct multi_dispatch_lane {
+  explicit multi_dispatch_lane(std::string lane_node)
+    : node(std::move(lane_node))
+  {
+  }
+
+  // Returns the position in indices of the next request to dispatch, or indices.size() once the
+  // lane is drained.
+  std::size_t claim_next()
+  {
+    auto pos = next.fetch_add(1, std::memory_order_relaxed);
+    return pos < indices.size() ? pos : indices.size();
+  }
+
+  void on_dispatch()
+  {
+    auto outstanding = in_flight.fetch_add(1, std::memory_order_relaxed) + 1;
+    auto peak = peak_in_flight.load(std::memory_order_relaxed);
+    while (outstanding > peak &&
+           !peak_in_flight.compare_exchange_weak(peak, outstanding, std::memory_order_relaxed)) {
+    }
+  }
+
+  void on_response()
+  {
+    in_flight.fetch_sub(1, std::memory_order_relaxed);
+    if (completed.fetch_add(1, std::memory_order_acq_rel) + 1 == indices.size()) {
+      // only the lane's last response writes this, it is read once every response has arrived
+      finish = std::chrono::steady_clock::now();
+    }
+  }
+
+  std::string node;
+  // positions in the staging vector, in dispatch order
+  std::vector<std::size_t> indices{};
+  std::atomic<std::size_t> next{ 0 };
+  std::atomic<std::size_t> in_flight{ 0 };
+  std::atomic<std::size_t> peak_in_flight{ 0 };
+  std::atomic<std::size_t> completed{ 0 };
+  std::chrono::steady_clock::time_point start{};
+  std::chrono::steady_clock::time_point finish{};
+};
+
+// Shared by every completion handler of a multi operation.
+struct multi_dispatch_state {
+  // key of the lane used when the requests are not grouped by node (or the node is unknown)
+  static constexpr const char* all_nodes = "*";
+
+  explicit multi_dispatch_state(multi_dispatch_options dispatch_options, std::size_t num_requests)
+    : options(dispatch_options)
+    , remaining(num_requests)
+  {
+  }
+
+  // Groups the staged requests by the node returned by node_of (empty if unknown), keeping their
+  // relative order within a lane.
+  void build_lanes(std::size_t num_requests,
+                   const std::function<std::string(std::size_t)>& node_of = nullptr)
+  {
+    std::map<std::string, std::size_t> lane_by_node;
+    for (std::size_t i = 0; i < num_requests; ++i) {
+      std::string node = node_of ? node_of(i) : std::string{};
+      if (node.empty()) {
+        node = all_nodes;
+      }
+      auto it = lane_by_node.find(node);
+      if (it == lane_by_node.end()) {
+        it = lane_by_node.emplace(node, lanes.size()).first;
+        lanes.push_back(std::make_unique<multi_dispatch_lane>(node));
+      }
+      lanes[it->second]->indices.push_back(i);
+    }
+  }
+
+  // Number of requests of a lane handed to the core before any response arrives.
+  std::size_t initial_window(const multi_dispatch_lane& lane) const
+  {
+    if (options.max_in_flight == 0 || options.max_in_flight > lane.indices.size()) {
+      return lane.indices.size();
+    }
+    return options.max_in_flight;
+  }
+
+  // couchbase API only: hands the position of a staged request whose response has arrived over to
+  // the calling thread, which converts responses to Python as they come in.
+  void push_completed(std::size_t index)
+  {
+    {
+      std::lock_guard<std::mutex> lock(completed_mutex);
+      completed.push_back(index);
+    }
+    completed_cv.notify_one();
+  }
+
+  // couchbase API only: blocks, without the GIL, until at least one response has arrived and
+  // returns the positions of every response not returned yet.
+  std::vector<std::size_t> wait_completed()
+  {
+    std::vector<std::size_t> batch;
+    std::unique_lock<std::mutex> lock(completed_mutex);
+    completed_cv.wait(lock, [this]() {
+      return !completed.empty();
+    });
+    batch.swap(completed);
+    return batch;
+  }
+
+  // Requires the GIL.  Only called once every response has arrived.  Returns a new reference to
+  // a {node: {"dispatched", "peak_in_flight", "elapsed_us"}} dict, or nullptr with an exception
+  // set.
+  PyObject* build_stats() const
+  {
+    PyObject* pyObj_stats = PyDict_New();
+    if (pyObj_stats == nullptr) {
+      return nullptr;
+    }
+    for (const auto& lane : lanes) {
+      auto elapsed =
+        std::chrono::duration_cast<std::chrono::microseconds>(lane->finish - lane->start).count();
+      PyObject* pyObj_lane = Py_BuildValue("{s:n,s:n,s:L}",
+                                           "dispatched",
+                                           static_cast<Py_ssize_t>(lane->indices.size()),
+                                           "peak_in_flight",
+                                           static_cast<Py_ssize_t>(lane->peak_in_flight.load()),
+                                           "elapsed_us",
+                                           static_cast<long long>(elapsed));
+      if (pyObj_lane == nullptr ||
+          PyDict_SetItemString(pyObj_stats, lane->node.c_str(), pyObj_lane) < 0) {
+        Py_XDECREF(pyObj_lane);
+        Py_DECREF(pyObj_stats);
+        return nullptr;
+      }
+      Py_DECREF(pyObj_lane);
+    }
+    return pyObj_stats;
+  }
+
+  multi_dispatch_options options;
+  std::vector<std::unique_ptr<multi_dispatch_lane>> lanes{};
+  // responses still expected across all lanes
+  std::atomic<std::size_t> remaining;
+  // acouchbase API only: called, without the GIL, by the handler of the last response
+  std::function<void()> on_complete{};
+  // couchbase API only: set before the first dispatch, see push_completed
+  bool collect_completed{ false };
+  std::mutex completed_mutex{};
+  std::condition_variable completed_cv{};
+  std::vector<std::size_t> completed{};
+};
+
+} // namespace pycbc
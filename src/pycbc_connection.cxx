@@ -2305,15 +2305,20 @@ static int
 pycbc_connection__init__(pycbc_connection* self, PyObject* args, PyObject* kwargs)
 {
   int num_io_threads = 1;
-
-  static const char* kw_list[] = { "num_io_threads", nullptr };
-  if (!PyArg_ParseTupleAndKeywords(
-        args, kwargs, "|i", const_cast<char**>(kw_list), &num_io_threads)) {
+  int zero_copy_values = 0;
+
+  static const char* kw_list[] = { "num_io_threads", "zero_copy_values", nullptr };
+  if (!PyArg_ParseTupleAndKeywords(args,
+                                   kwargs,
+                                   "|ip",
+                                   const_cast<char**>(kw_list),
+                                   &num_io_threads,
+                                   &zero_copy_values)) {
     return -1;
   }
 
   try {
-    self->conn = std::make_unique<Connection>(num_io_threads);
+    self->conn = std::make_unique<Connection>(num_io_threads, zero_copy_values != 0);
     return 0;
   } catch (const std::exception& e) {
     set_runtime_error_if_unset(e.what());
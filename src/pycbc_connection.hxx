@@ -93,7 +93,21 @@ validate_connection_and_multi_request(pycbc_connection* self, PyObject* arg, con
     return false;
   }
 
-  if (!PyList_Check(arg)) {
+  // The acouchbase API passes a (requests, callback, errback) tuple so the whole batch resolves
+  // through a single callback; see Connection::execute_multi_op.
+  PyObject* pyObj_requests = arg;
+  if (PyTuple_Check(arg)) {
+    if (PyTuple_Size(arg) != 3 || !PyCallable_Check(PyTuple_GET_ITEM(arg, 1)) ||
+        !PyCallable_Check(PyTuple_GET_ITEM(arg, 2))) {
+      std::string err_msg =
+        std::string(op_name) + " requires a (requests, callback, errback) tuple when async";
+      raise_invalid_argument(err_msg.c_str(), __FILE__, __LINE__);
+      return false;
+    }
+    pyObj_requests = PyTuple_GET_ITEM(arg, 0);
+  }
+
+  if (!PyList_Check(pyObj_requests)) {
     std::string err_msg = std::string(op_name) + " requires a list of pycbc_kv_request objects";
     raise_invalid_argument(err_msg.c_str(), __FILE__, __LINE__);
     return false;
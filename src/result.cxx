@@ -48,6 +48,8 @@ pycbc_result__init__(pycbc_result* self, PyObject* args, PyObject* kwargs)
   self->start_time = Py_None;
   Py_INCREF(Py_None);
   self->end_time = Py_None;
+  Py_INCREF(Py_None);
+  self->dispatch_stats = Py_None;
   return 0;
 }
 
@@ -65,6 +67,7 @@ pycbc_result__dealloc__(pycbc_result* self)
   Py_XDECREF(self->core_span);
   Py_XDECREF(self->start_time);
   Py_XDECREF(self->end_time);
+  Py_XDECREF(self->dispatch_stats);
   Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
@@ -89,6 +92,12 @@ static PyMemberDef pycbc_result_members[] = {
     offsetof(pycbc_result, end_time),
     READONLY,
     PyDoc_STR("Internal dictionary op end time") },
+  // writable so the results of a chunked multi operation can be merged
+  { "dispatch_stats",
+    T_OBJECT_EX,
+    offsetof(pycbc_result, dispatch_stats),
+    0,
+    PyDoc_STR("Internal dictionary of per-node dispatch stats of a multi operation") },
   { nullptr }
 };
 
@@ -178,6 +187,40 @@ pycbc_streamed_result__dealloc__(pycbc_streamed_result* self)
   Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
+static bool
+parse_next_batch_args(PyObject* args,
+                      PyObject* kwargs,
+                      std::size_t& max_rows,
+                      std::chrono::milliseconds& max_wait)
+{
+  static const char* kw_list[] = { "max_rows", "max_wait", nullptr };
+  Py_ssize_t pyObj_max_rows = 0;
+  PyObject* pyObj_max_wait = nullptr;
+  if (!PyArg_ParseTupleAndKeywords(
+        args, kwargs, "n|O", const_cast<char**>(kw_list), &pyObj_max_rows, &pyObj_max_wait)) {
+    return false;
+  }
+  if (pyObj_max_rows < 1) {
+    PyErr_SetString(PyExc_ValueError, "max_rows must be greater than 0");
+    return false;
+  }
+  max_rows = static_cast<std::size_t>(pyObj_max_rows);
+  // max_wait is in milliseconds; None (the default) means no limit
+  max_wait = std::chrono::milliseconds(-1);
+  if (pyObj_max_wait != nullptr && pyObj_max_wait != Py_None) {
+    long long wait_ms = PyLong_AsLongLong(pyObj_max_wait);
+    if (wait_ms == -1 && PyErr_Occurred()) {
+      return false;
+    }
+    if (wait_ms < 0) {
+      PyErr_SetString(PyExc_ValueError, "max_wait cannot be negative");
+      return false;
+    }
+    max_wait = std::chrono::milliseconds(wait_ms);
+  }
+  return true;
+}
+
 static PyObject*
 pycbc_streamed_result__iter__(PyObject* self)
 {
@@ -197,6 +240,38 @@ pycbc_streamed_result__iternext__(PyObject* self)
   return row; // Returns NULL (when row is Py_None) to signal StopIteration
 }
 
+static PyObject*
+pycbc_streamed_result__next_batch__(pycbc_streamed_result* self, PyObject* args, PyObject* kwargs)
+{
+  std::size_t max_rows;
+  std::chrono::milliseconds max_wait;
+  if (!parse_next_batch_args(args, kwargs, max_rows, max_wait)) {
+    return nullptr;
+  }
+
+  std::vector<PyObject*> rows;
+  {
+    Py_BEGIN_ALLOW_THREADS rows = self->rows->get_batch(max_rows, self->timeout_ms, max_wait);
+    Py_END_ALLOW_THREADS
+  }
+  if (rows.empty() && PyErr_Occurred()) {
+    return nullptr; // KeyboardInterrupt (or other signal exception) caught while waiting
+  }
+
+  // The list takes over the queue's references; an empty list signals end-of-iteration.
+  PyObject* pyObj_rows = PyList_New(static_cast<Py_ssize_t>(rows.size()));
+  if (pyObj_rows == nullptr) {
+    for (auto row : rows) {
+      Py_DECREF(row);
+    }
+    return nullptr;
+  }
+  for (std::size_t i = 0; i < rows.size(); ++i) {
+    PyList_SET_ITEM(pyObj_rows, static_cast<Py_ssize_t>(i), rows[i]);
+  }
+  return pyObj_rows;
+}
+
 static PyMemberDef pycbc_streamed_result_members[] = {
   { "core_span",
     T_OBJECT_EX,
@@ -234,6 +309,28 @@ pycbc_streamed_result__is_cancelled__(pycbc_streamed_result* self, PyObject* arg
   Py_RETURN_FALSE;
 }
 
+static PyObject*
+pycbc_streamed_result__set_notifier__(pycbc_streamed_result* self, PyObject* pyObj_notifier)
+{
+  if (pyObj_notifier != Py_None && !PyCallable_Check(pyObj_notifier)) {
+    PyErr_SetString(PyExc_TypeError, "notifier must be callable or None");
+    return nullptr;
+  }
+  if (self->rows) {
+    self->rows->set_notifier(pyObj_notifier == Py_None ? nullptr : pyObj_notifier);
+  }
+  Py_RETURN_NONE;
+}
+
+static PyObject*
+pycbc_streamed_result__is_ready__(pycbc_streamed_result* self, PyObject* args)
+{
+  if (self->rows && self->rows->ready()) {
+    Py_RETURN_TRUE;
+  }
+  Py_RETURN_FALSE;
+}
+
 static PyMethodDef pycbc_streamed_result_methods[] = {
   { "cancel",
     (PyCFunction)pycbc_streamed_result__cancel__,
@@ -243,6 +340,19 @@ static PyMethodDef pycbc_streamed_result_methods[] = {
     (PyCFunction)pycbc_streamed_result__is_cancelled__,
     METH_NOARGS,
     PyDoc_STR("Check if the streaming operation has been cancelled") },
+  { "set_notifier",
+    (PyCFunction)pycbc_streamed_result__set_notifier__,
+    METH_O,
+    PyDoc_STR(
+      "Register a callable invoked whenever a row becomes available (event loop delivery)") },
+  { "is_ready",
+    (PyCFunction)pycbc_streamed_result__is_ready__,
+    METH_NOARGS,
+    PyDoc_STR("Check if the next row can be retrieved without waiting") },
+  { "next_batch",
+    (PyCFunction)pycbc_streamed_result__next_batch__,
+    METH_VARARGS | METH_KEYWORDS,
+    PyDoc_STR("Retrieve up to max_rows rows, waiting at most max_wait ms after the first row") },
   { nullptr } // Sentinel
 };
 
@@ -358,6 +468,59 @@ pycbc_scan_iterator__iternext__(PyObject* self)
   return reinterpret_cast<PyObject*>(res);
 }
 
+static PyObject*
+pycbc_scan_iterator__next_batch__(pycbc_scan_iterator* self, PyObject* args, PyObject* kwargs)
+{
+  std::size_t max_rows;
+  std::chrono::milliseconds max_wait;
+  if (!parse_next_batch_args(args, kwargs, max_rows, max_wait)) {
+    return nullptr;
+  }
+
+  // scan_result::next() blocks per item, so unlike the rows_queue the deadline can only be
+  // checked between items.
+  std::vector<tl::expected<couchbase::core::range_scan_item, std::error_code>> items;
+  {
+    Py_BEGIN_ALLOW_THREADS auto deadline = std::chrono::steady_clock::now() + max_wait;
+    while (items.size() < max_rows) {
+      items.emplace_back(self->scan_result->next());
+      if (!items.back().has_value()) {
+        break;
+      }
+      if (max_wait.count() >= 0 && std::chrono::steady_clock::now() >= deadline) {
+        break;
+      }
+    }
+    Py_END_ALLOW_THREADS
+  }
+
+  PyObject* pyObj_items = PyList_New(0);
+  if (pyObj_items == nullptr) {
+    return nullptr;
+  }
+  for (const auto& item : items) {
+    PyObject* pyObj_item = nullptr;
+    if (!item.has_value()) {
+      // As with __next__, the error is returned as the (last) row rather than raised.
+      pyObj_item = build_exception(
+        item.error(), __FILE__, __LINE__, "Error retrieving next scan result item.");
+    } else {
+      pyObj_item = create_pycbc_result();
+      if (pyObj_item != nullptr) {
+        pycbc_result* res = reinterpret_cast<pycbc_result*>(pyObj_item);
+        add_field<couchbase::core::range_scan_item>(res->raw_result, "scan_item", item.value());
+      }
+    }
+    if (pyObj_item == nullptr || PyList_Append(pyObj_items, pyObj_item) < 0) {
+      Py_XDECREF(pyObj_item);
+      Py_DECREF(pyObj_items);
+      return nullptr;
+    }
+    Py_DECREF(pyObj_item);
+  }
+  return pyObj_items;
+}
+
 static PyObject*
 pycbc_scan_iterator__cancel__(pycbc_scan_iterator* self, PyObject* args)
 {
@@ -385,6 +548,10 @@ static PyMethodDef pycbc_scan_iterator_methods[] = {
     (PyCFunction)pycbc_scan_iterator__is_cancelled__,
     METH_NOARGS,
     PyDoc_STR("Check if the scan has been cancelled") },
+  { "next_batch",
+    (PyCFunction)pycbc_scan_iterator__next_batch__,
+    METH_VARARGS | METH_KEYWORDS,
+    PyDoc_STR("Retrieve up to max_rows scan items, stopping early once max_wait ms have passed") },
   { nullptr } // Sentinel
 };
 
@@ -446,6 +613,100 @@ create_pycbc_scan_iterator(couchbase::core::scan_result result)
   return iter;
 }
 
+// ======================================================================
+// pycbc_value_buffer type implementation
+// ======================================================================
+
+static PyObject*
+pycbc_value_buffer__new__(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+  pycbc_value_buffer* self = (pycbc_value_buffer*)type->tp_alloc(type, 0);
+  if (self != nullptr) {
+    new (&self->data) std::vector<std::byte>();
+  }
+  return (PyObject*)self;
+}
+
+static void
+pycbc_value_buffer__dealloc__(pycbc_value_buffer* self)
+{
+  self->data.~vector();
+  Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static int
+pycbc_value_buffer__getbuffer__(pycbc_value_buffer* self, Py_buffer* view, int flags)
+{
+  static char empty[1] = { 0 };
+  void* buf = self->data.empty() ? empty : reinterpret_cast<void*>(self->data.data());
+  // readonly: the body is shared by every view of this result
+  return PyBuffer_FillInfo(view,
+                           reinterpret_cast<PyObject*>(self),
+                           buf,
+                           static_cast<Py_ssize_t>(self->data.size()),
+                           1,
+                           flags);
+}
+
+static PyBufferProcs pycbc_value_buffer_as_buffer = {
+  (getbufferproc)pycbc_value_buffer__getbuffer__, // bf_getbuffer
+  nullptr,                                        // bf_releasebuffer
+};
+
+static PyTypeObject pycbc_value_buffer_type = {
+  PyVarObject_HEAD_INIT(nullptr, 0) "pycbc_core.pycbc_value_buffer", // tp_name
+  sizeof(pycbc_value_buffer),                                        // tp_basicsize
+  0,                                                                 // tp_itemsize
+  (destructor)pycbc_value_buffer__dealloc__,                         // tp_dealloc
+  0,                                                                 // tp_vectorcall_offset
+  nullptr,                                                           // tp_getattr
+  nullptr,                                                           // tp_setattr
+  nullptr,                                                           // tp_as_async
+  nullptr,                                                           // tp_repr
+  nullptr,                                                           // tp_as_number
+  nullptr,                                                           // tp_as_sequence
+  nullptr,                                                           // tp_as_mapping
+  nullptr,                                                           // tp_hash
+  nullptr,                                                           // tp_call
+  nullptr,                                                           // tp_str
+  nullptr,                                                           // tp_getattro
+  nullptr,                                                           // tp_setattro
+  &pycbc_value_buffer_as_buffer,                                     // tp_as_buffer
+  Py_TPFLAGS_DEFAULT,                                                // tp_flags
+  PyDoc_STR("pycbc read-only document body buffer"),                 // tp_doc
+  nullptr,                                                           // tp_traverse
+  nullptr,                                                           // tp_clear
+  nullptr,                                                           // tp_richcompare
+  0,                                                                 // tp_weaklistoffset
+  nullptr,                                                           // tp_iter
+  nullptr,                                                           // tp_iternext
+  nullptr,                                                           // tp_methods
+  nullptr,                                                           // tp_members
+  nullptr,                                                           // tp_getset
+  nullptr,                                                           // tp_base
+  nullptr,                                                           // tp_dict
+  nullptr,                                                           // tp_descr_get
+  nullptr,                                                           // tp_descr_set
+  0,                                                                 // tp_dictoffset
+  nullptr,                                                           // tp_init
+  nullptr,                                                           // tp_alloc
+  pycbc_value_buffer__new__,                                         // tp_new
+};
+
+PyObject*
+create_pycbc_value_memoryview(std::vector<std::byte>&& data)
+{
+  PyObject* pyObj_buffer = PyObject_CallObject((PyObject*)&pycbc_value_buffer_type, nullptr);
+  if (pyObj_buffer == nullptr) {
+    return nullptr;
+  }
+  reinterpret_cast<pycbc_value_buffer*>(pyObj_buffer)->data = std::move(data);
+  // the memoryview keeps the buffer object (and so the body) alive
+  PyObject* pyObj_view = PyMemoryView_FromObject(pyObj_buffer);
+  Py_DECREF(pyObj_buffer);
+  return pyObj_view;
+}
+
 int
 add_result_objects(PyObject* module)
 {
@@ -461,6 +722,10 @@ add_result_objects(PyObject* module)
     return -1;
   }
 
+  if (register_pytype(module, &pycbc_value_buffer_type, "pycbc_value_buffer") < 0) {
+    return -1;
+  }
+
   return 0;
 }
 
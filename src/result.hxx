@@ -30,6 +30,7 @@
 #include <mutex>
 #include <queue>
 #include <system_error>
+#include <vector>
 
 namespace pycbc
 {
@@ -43,6 +44,12 @@ namespace pycbc
 // Note: The timeout in get() logs a message but does NOT actually timeout.
 // This matches the reference implementation behavior - we wait indefinitely
 // for C++ core results to ensure we always get proper error details.
+//
+// Event loop delivery: instead of blocking a thread in get(), a consumer can register a
+// notifier (any Python callable).  The notifier is called, with the GIL held, each time the
+// queue becomes ready (see ready()), so an asyncio consumer can await readiness on its loop and
+// then call get(), which returns without waiting.  put() must be called with the GIL held once
+// a notifier is registered; all producers in connection.hxx already hold it.
 // ======================================================================
 template<class T>
 class rows_queue
@@ -53,6 +60,7 @@ public:
     , mut_()
     , cv_()
     , cancelled_(false)
+    , notifier_(nullptr)
   {
   }
 
@@ -70,13 +78,49 @@ public:
       rows_.pop();
       Py_XDECREF(item); // XDECREF handles NULL safely
     }
+    Py_XDECREF(notifier_);
   }
 
   void put(T row)
+  {
+    PyObject* notifier = nullptr;
+    {
+      std::lock_guard<std::mutex> lock(mut_);
+      if (notifier_ != nullptr && rows_.empty() && !cancelled_) {
+        notifier = notifier_;
+        Py_INCREF(notifier);
+      }
+      rows_.push(row);
+      cv_.notify_one();
+    }
+    notify(notifier);
+  }
+
+  // Register the event loop delivery notifier; requires the GIL.  If rows are already queued
+  // the notifier is called right away so the consumer never misses the initial batch.
+  void set_notifier(PyObject* notifier)
+  {
+    PyObject* previous = nullptr;
+    PyObject* ready_notifier = nullptr;
+    {
+      std::lock_guard<std::mutex> lock(mut_);
+      Py_XINCREF(notifier);
+      previous = notifier_;
+      notifier_ = notifier;
+      if (notifier_ != nullptr && (!rows_.empty() || cancelled_)) {
+        ready_notifier = notifier_;
+        Py_INCREF(ready_notifier);
+      }
+    }
+    Py_XDECREF(previous);
+    notify(ready_notifier);
+  }
+
+  // True when get() will return without waiting.
+  bool ready()
   {
     std::lock_guard<std::mutex> lock(mut_);
-    rows_.push(row);
-    cv_.notify_one();
+    return !rows_.empty() || cancelled_;
   }
 
   // Unblock a waiting get(): once cancelled, get() stops waiting for new rows and returns a
@@ -85,9 +129,17 @@ public:
   // server-side operation to complete.  Already-queued rows are still drained first.
   void cancel()
   {
-    std::lock_guard<std::mutex> lock(mut_);
-    cancelled_ = true;
-    cv_.notify_all();
+    PyObject* notifier = nullptr;
+    {
+      std::lock_guard<std::mutex> lock(mut_);
+      if (notifier_ != nullptr && rows_.empty() && !cancelled_) {
+        notifier = notifier_;
+        Py_INCREF(notifier);
+      }
+      cancelled_ = true;
+      cv_.notify_all();
+    }
+    notify(notifier);
   }
 
   bool is_cancelled()
@@ -142,6 +194,52 @@ public:
     return row;
   }
 
+  // Drain up to max_rows rows.  Waits for the first row exactly like get(); after that, waits at
+  // most max_wait for the batch to fill up (a negative max_wait waits until max_rows rows have been
+  // collected).  The batch ends after the end-of-rows sentinel (Py_None) so trailing metadata stays
+  // queued for the next get().  An empty batch means get() returned nullptr (cancelled with no
+  // rows remaining, or a signal was caught and its exception is set).
+  std::vector<T> get_batch(std::size_t max_rows,
+                           std::chrono::milliseconds timeout_ms,
+                           std::chrono::milliseconds max_wait)
+  {
+    std::vector<T> batch;
+    T first = get(timeout_ms);
+    if (first == nullptr) {
+      return batch;
+    }
+    batch.push_back(first);
+    if (first == Py_None) {
+      return batch;
+    }
+
+    auto deadline = std::chrono::steady_clock::now() + max_wait;
+    std::unique_lock<std::mutex> lock(mut_);
+    while (batch.size() < max_rows) {
+      if (rows_.empty()) {
+        if (cancelled_ || max_wait.count() == 0) {
+          break;
+        }
+        auto has_rows = [this]() {
+          return !rows_.empty() || cancelled_;
+        };
+        if (max_wait.count() < 0) {
+          cv_.wait(lock, has_rows);
+        } else if (!cv_.wait_until(lock, deadline, has_rows)) {
+          break;
+        }
+        continue;
+      }
+      T row = rows_.front();
+      rows_.pop();
+      batch.push_back(row);
+      if (row == Py_None) {
+        break;
+      }
+    }
+    return batch;
+  }
+
   int size()
   {
     std::lock_guard<std::mutex> lock(mut_);
@@ -149,17 +247,34 @@ public:
   }
 
 private:
+  // Called outside of mut_ so the notifier is free to call back into the queue.
+  static void notify(PyObject* notifier)
+  {
+    if (notifier == nullptr) {
+      return;
+    }
+    PyObject* result = PyObject_CallObject(notifier, nullptr);
+    if (result == nullptr) {
+      // Nothing observes the producer's (IO thread) exception state.
+      PyErr_WriteUnraisable(notifier);
+    }
+    Py_XDECREF(result);
+    Py_DECREF(notifier);
+  }
+
   std::queue<T> rows_;
   std::mutex mut_;
   std::condition_variable cv_;
   bool cancelled_;
+  PyObject* notifier_;
 };
 
 struct pycbc_result {
   PyObject_HEAD PyObject* raw_result;
-  PyObject* core_span;  // For tracing support
-  PyObject* start_time; // For metrics support
-  PyObject* end_time;   // For metrics support
+  PyObject* core_span;      // For tracing support
+  PyObject* start_time;     // For metrics support
+  PyObject* end_time;       // For metrics support
+  PyObject* dispatch_stats; // Multi operations only, see multi_dispatch_state
 };
 
 PyObject*
@@ -184,6 +299,16 @@ struct pycbc_scan_iterator {
 pycbc_scan_iterator*
 create_pycbc_scan_iterator(couchbase::core::scan_result result);
 
+// Read-only buffer that owns a document body moved out of a core response, so the body can be
+// handed to Python as a memoryview without copying it into a bytes object (zero copy values).
+struct pycbc_value_buffer {
+  PyObject_HEAD std::vector<std::byte> data;
+};
+
+// Returns a read-only memoryview over a pycbc_value_buffer that takes ownership of data.
+PyObject*
+create_pycbc_value_memoryview(std::vector<std::byte>&& data);
+
 int
 add_result_objects(PyObject* module);
 
@@ -0,0 +1,143 @@
+/*
+ *   Copyright 2016-2026. Couchbase, Inc.
+ *   All Rights Reserved.
+ *
+ *   Licensed under the Apache License, Version 2.0 (the "License");
+ *   you may not use this file except in compliance with the License.
+ *   You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *   Unless required by applicable law or agreed to in writing, software
+ *   distributed under the License is distributed on an "AS IS" BASIS,
+ *   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *   See the License for the specific language governing permissions and
+ *   limitations under the License.
+ */
+
+#pragma once
+
+#include <atomic>
+#include <cstddef>
+#include <memory>
+#include <utility>
+
+namespace pycbc
+{
+
+// Bounded, lock-free multi-producer/multi-consumer queue (D. Vyukov's bounded MPMC queue).
+// Each cell carries a sequence number that tells producers and consumers whether it is free to
+// write or ready to read, so a push or pop is a single CAS on the shared position plus a store
+// to the cell's sequence.  Neither operation blocks: a push to a full queue and a pop from an
+// empty one fail immediately, it is up to the caller to drop or retry.
+template<typename T>
+class bounded_ring_buffer
+{
+public:
+  // The capacity is rounded up to a power of two (at least 2).
+  explicit bounded_ring_buffer(std::size_t capacity)
+    : capacity_(round_up_capacity(capacity))
+    , mask_(capacity_ - 1)
+    , buffer_(new cell[capacity_])
+  {
+    for (std::size_t i = 0; i < capacity_; ++i) {
+      buffer_[i].sequence.store(i, std::memory_order_relaxed);
+    }
+    enqueue_pos_.store(0, std::memory_order_relaxed);
+    dequeue_pos_.store(0, std::memory_order_relaxed);
+  }
+
+  bounded_ring_buffer(const bounded_ring_buffer&) = delete;
+  bounded_ring_buffer(bounded_ring_buffer&&) = delete;
+  bounded_ring_buffer& operator=(const bounded_ring_buffer&) = delete;
+  bounded_ring_buffer& operator=(bounded_ring_buffer&&) = delete;
+
+  bool try_push(T&& value)
+  {
+    cell* c;
+    auto pos = enqueue_pos_.load(std::memory_order_relaxed);
+    for (;;) {
+      c = &buffer_[pos & mask_];
+      auto seq = c->sequence.load(std::memory_order_acquire);
+      auto diff = static_cast<std::ptrdiff_t>(seq) - static_cast<std::ptrdiff_t>(pos);
+      if (diff == 0) {
+        if (enqueue_pos_.compare_exchange_weak(pos, pos + 1, std::memory_order_relaxed)) {
+          break;
+        }
+      } else if (diff < 0) {
+        // the cell still holds the value pushed a lap ago: full
+        return false;
+      } else {
+        pos = enqueue_pos_.load(std::memory_order_relaxed);
+      }
+    }
+    c->value = std::move(value);
+    c->sequence.store(pos + 1, std::memory_order_release);
+    return true;
+  }
+
+  bool try_pop(T& value)
+  {
+    cell* c;
+    auto pos = dequeue_pos_.load(std::memory_order_relaxed);
+    for (;;) {
+      c = &buffer_[pos & mask_];
+      auto seq = c->sequence.load(std::memory_order_acquire);
+      auto diff = static_cast<std::ptrdiff_t>(seq) - static_cast<std::ptrdiff_t>(pos + 1);
+      if (diff == 0) {
+        if (dequeue_pos_.compare_exchange_weak(pos, pos + 1, std::memory_order_relaxed)) {
+          break;
+        }
+      } else if (diff < 0) {
+        // nothing has been pushed to the cell yet: empty
+        return false;
+      } else {
+        pos = dequeue_pos_.load(std::memory_order_relaxed);
+      }
+    }
+    value = std::move(c->value);
+    // release the value's resources now rather than when the cell is next written
+    c->value = T{};
+    c->sequence.store(pos + mask_ + 1, std::memory_order_release);
+    return true;
+  }
+
+  // A snapshot, only meaningful while no pop is in progress (e.g. checked by the only consumer).
+  bool empty() const
+  {
+    auto pos = dequeue_pos_.load(std::memory_order_seq_cst);
+    auto seq = buffer_[pos & mask_].sequence.load(std::memory_order_seq_cst);
+    return seq != pos + 1;
+  }
+
+  std::size_t capacity() const
+  {
+    return capacity_;
+  }
+
+private:
+  struct cell {
+    std::atomic<std::size_t> sequence;
+    T value;
+  };
+
+  static std::size_t round_up_capacity(std::size_t capacity)
+  {
+    std::size_t rounded = 2;
+    while (rounded < capacity) {
+      rounded <<= 1;
+    }
+    return rounded;
+  }
+
+  static constexpr std::size_t cache_line_size = 64;
+
+  const std::size_t capacity_;
+  const std::size_t mask_;
+  std::unique_ptr<cell[]> buffer_;
+  // producers and consumers each hammer their own position, keep them on separate cache lines
+  alignas(cache_line_size) std::atomic<std::size_t> enqueue_pos_;
+  alignas(cache_line_size) std::atomic<std::size_t> dequeue_pos_;
+};
+
+} // namespace pycbc
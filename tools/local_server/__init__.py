@@ -0,0 +1,23 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""A self-contained stand-in for a single node Couchbase Server.
+
+Unlike GoCAVES it needs nothing but the standard library, so it also runs on machines without internet access.  Run
+it with ``python -m tools.local_server`` and connect the SDK with ``couchbase://127.0.0.1:<kv port>``.
+"""
+
+from .faults import FaultInjection  # noqa: F401
+from .server import LocalServer  # noqa: F401
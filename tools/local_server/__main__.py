@@ -0,0 +1,101 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Runs the local server until interrupted.
+
+Once listening, a JSON object with the connection string and ports is written to stdout, on a single line.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import signal
+import sys
+
+from .faults import FaultInjection
+from .server import LocalServer
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m tools.local_server',
+                                     description='Local stand-in for a single node Couchbase Server.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--kv-port', type=int, default=0, help='Defaults to any free port.')
+    parser.add_argument('--http-port', type=int, default=0, help='Defaults to any free port.')
+    parser.add_argument('--bucket', action='append', dest='buckets',
+                        help='Name of a bucket (can be repeated). Defaults to default.')
+    parser.add_argument('--username', default='Administrator')
+    parser.add_argument('--password', default='password')
+    parser.add_argument('--vbuckets', type=int, default=1024, help='Number of vbuckets. Defaults to 1024.')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Latency added to every data operation, in milliseconds.')
+    parser.add_argument('--jitter-ms', type=float, default=0.0,
+                        help='Upper bound of the random latency added on top of --latency-ms, in milliseconds.')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction (0 to 1) of the data operations failing.')
+    parser.add_argument('--kv-error-status', type=lambda value: int(value, 0), default=0x86,
+                        help='Status of the failed KV operations. Defaults to 0x86 (temporary failure).')
+    parser.add_argument('--query-rows', type=int, default=10,
+                        help='Rows returned by a query without a LIMIT clause. Defaults to 10.')
+    parser.add_argument('--query-row-size', type=int, default=64,
+                        help='Padding of each query row, in bytes. Defaults to 64.')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the fault injection.')
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    faults = FaultInjection(latency=args.latency_ms / 1000,
+                            jitter=args.jitter_ms / 1000,
+                            error_rate=args.error_rate,
+                            kv_error_status=args.kv_error_status,
+                            seed=args.seed)
+    server = LocalServer(host=args.host,
+                         kv_port=args.kv_port,
+                         http_port=args.http_port,
+                         buckets=args.buckets,
+                         username=args.username,
+                         password=args.password,
+                         num_vbuckets=args.vbuckets,
+                         faults=faults,
+                         query_rows=args.query_rows,
+                         query_row_size=args.query_row_size)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stopped.set)
+        except NotImplementedError:
+            # Windows, interrupting raises KeyboardInterrupt instead
+            pass
+    print(json.dumps({'connstr': server.connstr, 'kv_port': server.kv_port, 'http_port': server.http_port}),
+          flush=True)
+    try:
+        await stopped.wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+    try:
+        asyncio.run(_run(_parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+from .protocol import Status
+
+
+class FaultInjection:
+    """Latency and errors added to the data operations (KV and query), bootstrapping is never affected.
+
+    Each response is delayed by ``latency`` plus a uniformly distributed ``[0, jitter]`` (in seconds).  A fraction
+    ``error_rate`` of the KV responses fail with ``kv_error_status``, and of the query responses with an internal
+    server error.
+    """
+
+    def __init__(self,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 kv_error_status: int = Status.TEMPORARY_FAILURE,
+                 seed: Optional[int] = None) -> None:
+        if latency < 0 or jitter < 0:
+            raise ValueError('latency and jitter cannot be negative.')
+        if not 0 <= error_rate <= 1:
+            raise ValueError('error_rate must be between 0 and 1.')
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.kv_error_status = kv_error_status
+        self._random = random.Random(seed)
+
+    def delay(self) -> float:
+        if self.jitter:
+            return self.latency + self._random.uniform(0, self.jitter)
+        return self.latency
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and self._random.random() < self.error_rate
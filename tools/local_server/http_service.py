@@ -0,0 +1,201 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""The HTTP services: cluster configuration (management) and query.
+
+Query does not evaluate statements, it streams synthetic rows instead: ``LIMIT n`` in the statement sets how many,
+otherwise the server's default row count is used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+import re
+import time
+import uuid
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    Optional)
+from urllib.parse import parse_qsl
+
+if TYPE_CHECKING:
+    from .server import LocalServer
+
+logger = logging.getLogger(__name__)
+
+_LIMIT = re.compile(r'\bLIMIT\s+(\d+)', re.IGNORECASE)
+_REASONS = {
+    200: 'OK', 400: 'Bad Request', 401: 'Unauthorized', 404: 'Not Found', 405: 'Method Not Allowed',
+    500: 'Internal Server Error',
+}
+# rows written to the socket at a time
+ROWS_PER_CHUNK = 100
+
+
+class HttpRequest:
+    def __init__(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> None:
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+    def json_body(self) -> Dict[str, Any]:
+        if not self.body:
+            return {}
+        if self.headers.get('content-type', '').startswith('application/x-www-form-urlencoded'):
+            return dict(parse_qsl(self.body.decode('utf-8')))
+        return json.loads(self.body)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[HttpRequest]:
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    lines = head.decode('latin-1').split('\r\n')
+    method, path, _ = lines[0].split(' ', 2)
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get('content-length', '0')))
+    return HttpRequest(method, path, headers, body)
+
+
+def _head(status: int, content_type: str = 'application/json', length: Optional[int] = None) -> bytes:
+    lines = [f'HTTP/1.1 {status} {_REASONS.get(status, "Error")}', f'Content-Type: {content_type}']
+    if length is None:
+        lines.append('Transfer-Encoding: chunked')
+    else:
+        lines.append(f'Content-Length: {length}')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+def _chunk(data: bytes) -> bytes:
+    return b'%x\r\n%s\r\n' % (len(data), data)
+
+
+class HttpConnection:
+    def __init__(self, server: LocalServer, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._server = server
+        self._reader = reader
+        self._writer = writer
+
+    async def serve(self) -> None:
+        transport = self._writer.transport
+        self._server.transports.add(transport)
+        try:
+            while True:
+                req = await _read_request(self._reader)
+                if req is None:
+                    break
+                await self._handle(req)
+        except ConnectionError:
+            pass
+        except Exception:
+            logger.exception('Closing the HTTP connection after an unexpected error.')
+        finally:
+            self._server.transports.discard(transport)
+            self._writer.close()
+
+    def _authorized(self, req: HttpRequest) -> bool:
+        scheme, _, credentials = req.headers.get('authorization', '').partition(' ')
+        if scheme.lower() != 'basic':
+            return False
+        username, _, password = base64.b64decode(credentials).decode('utf-8').partition(':')
+        return self._server.credentials.get(username, None) == password
+
+    async def _respond(self, status: int, body: Any) -> None:
+        data = json.dumps(body).encode('utf-8')
+        self._writer.write(_head(status, length=len(data)) + data)
+        await self._writer.drain()
+
+    async def _handle(self, req: HttpRequest) -> None:
+        if not self._authorized(req):
+            await self._respond(401, {'errors': [{'code': 10000, 'msg': 'Authentication failure'}]})
+            return
+        path = req.path.split('?', 1)[0]
+        if path == '/query/service':
+            if req.method != 'POST':
+                await self._respond(405, {})
+                return
+            await self._query(req)
+        elif path in ('/admin/ping', '/admin/ping/'):
+            await self._respond(200, {})
+        elif path == '/pools':
+            await self._respond(200, self._server.pools())
+        elif path == '/pools/default/nodeServices':
+            await self._respond(200, json.loads(self._server.cluster_config(None)))
+        elif path.startswith('/pools/default/b/') or path.startswith('/pools/default/buckets/'):
+            bucket = self._server.buckets.get(path.rstrip('/').rsplit('/', 1)[-1], None)
+            if bucket is None:
+                await self._respond(404, {})
+                return
+            await self._respond(200, json.loads(self._server.cluster_config(bucket)))
+        else:
+            await self._respond(404, {'errors': [{'code': 404, 'msg': f'Unsupported endpoint {path}'}]})
+
+    def _row_count(self, statement: str) -> int:
+        match = _LIMIT.search(statement)
+        return int(match.group(1)) if match else self._server.query_rows
+
+    async def _query(self, req: HttpRequest) -> None:
+        start = time.perf_counter()
+        faults = self._server.faults
+        delay = faults.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            payload = req.json_body()
+        except ValueError:
+            await self._respond(400, {'errors': [{'code': 1050, 'msg': 'Invalid request body'}], 'status': 'fatal'})
+            return
+        request_id = str(uuid.uuid4())
+        header = {
+            'requestID': request_id,
+            'clientContextID': payload.get('client_context_id', ''),
+        }  # type: Dict[str, Any]
+        if faults.should_fail():
+            header.update({'errors': [{'code': 5000, 'msg': 'Injected internal error'}], 'status': 'fatal'})
+            await self._respond(500, header)
+            return
+
+        statement = payload.get('statement', '')
+        if payload.get('auto_execute', False) or 'prepared' in payload:
+            header['prepared'] = payload.get('prepared', f'local-{uuid.uuid5(uuid.NAMESPACE_OID, statement)}')
+        header['signature'] = {'*': '*'}
+
+        count = self._row_count(statement)
+        padding = 'x' * self._server.query_row_size
+        prefix = json.dumps(header)[:-1] + ',"results":['
+        self._writer.write(_head(200) + _chunk(prefix.encode('utf-8')))
+        result_size = 0
+        for offset in range(0, count, ROWS_PER_CHUNK):
+            rows = [json.dumps({'id': idx, 'padding': padding})
+                    for idx in range(offset, min(offset + ROWS_PER_CHUNK, count))]
+            data = (',' if offset else '') + ','.join(rows)
+            result_size += len(data)
+            self._writer.write(_chunk(data.encode('utf-8')))
+            await self._writer.drain()
+        elapsed = f'{(time.perf_counter() - start) * 1000:.3f}ms'
+        metrics = {'elapsedTime': elapsed, 'executionTime': elapsed, 'resultCount': count, 'resultSize': result_size}
+        suffix = '],"status":"success","metrics":' + json.dumps(metrics) + '}'
+        self._writer.write(_chunk(suffix.encode('utf-8')) + _chunk(b''))
+        await self._writer.drain()
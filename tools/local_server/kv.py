@@ -0,0 +1,684 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""The KV service: one :class:`KvConnection` per client connection."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import copy
+import json
+import logging
+import socket
+import struct
+import time
+from collections import deque
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Deque,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from .protocol import (SUPPORTED_FEATURES,
+                       Datatype,
+                       Feature,
+                       FrameId,
+                       Opcode,
+                       Request,
+                       Status,
+                       decode_leb128,
+                       encode_leb128,
+                       encode_response,
+                       has_frame,
+                       parse_request)
+from .sasl import (MECHANISMS,
+                   SCRAM_MECHANISMS,
+                   SaslError,
+                   ScramServer,
+                   check_plain)
+from .store import (DEFAULT_COLLECTION_ID,
+                    DEFAULT_LOCK_TIME,
+                    MAX_LOCK_TIME,
+                    Bucket,
+                    Document,
+                    absolute_expiry)
+from .subdoc import (DocFlag,
+                     PathFlag,
+                     SubdocError,
+                     SubdocOpcode,
+                     crc32c,
+                     lookup,
+                     mutate,
+                     parse_path)
+
+if TYPE_CHECKING:
+    from .server import LocalServer
+
+logger = logging.getLogger(__name__)
+
+LOCKED_CAS = 0xffffffffffffffff
+NO_CREATE_EXPIRY = 0xffffffff
+
+# the operations affected by fault injection, bootstrapping and config polling never are
+DATA_OPCODES = frozenset({
+    Opcode.GET, Opcode.UPSERT, Opcode.INSERT, Opcode.REPLACE, Opcode.REMOVE, Opcode.INCREMENT, Opcode.DECREMENT,
+    Opcode.APPEND, Opcode.PREPEND, Opcode.TOUCH, Opcode.GET_AND_TOUCH, Opcode.GET_REPLICA, Opcode.GET_AND_LOCK,
+    Opcode.UNLOCK, Opcode.GET_META, Opcode.SUBDOC_MULTI_LOOKUP, Opcode.SUBDOC_MULTI_MUTATION,
+    Opcode.RANGE_SCAN_CREATE, Opcode.RANGE_SCAN_CONTINUE, Opcode.RANGE_SCAN_CANCEL,
+})
+# the operations allowed before authenticating
+UNAUTHENTICATED_OPCODES = frozenset({
+    Opcode.HELLO, Opcode.SASL_LIST_MECHS, Opcode.SASL_AUTH, Opcode.SASL_STEP, Opcode.GET_ERROR_MAP, Opcode.NOOP,
+})
+
+
+class KvError(Exception):
+    def __init__(self, status: Status, value: bytes = b'') -> None:
+        super().__init__(status.name)
+        self.status = status
+        self.value = value
+
+
+def _hex_le(value: int) -> str:
+    """The encoding of CAS values and sequence numbers in virtual xattrs and macros."""
+    return '0x' + struct.pack('<Q', value).hex()
+
+
+class KvConnection(asyncio.Protocol):
+    def __init__(self, server: LocalServer) -> None:
+        self._server = server
+        self._transport = None  # type: Optional[asyncio.Transport]
+        self._buffer = bytearray()
+        self._features = frozenset()  # type: frozenset
+        self._user = None  # type: Optional[str]
+        self._sasl = None  # type: Optional[ScramServer]
+        self._bucket = None  # type: Optional[Bucket]
+        # responses delayed by fault injection, when they must be sent in order
+        self._delayed = deque()  # type: Deque[Tuple[float, bytes]]
+        self._delayed_timer = None  # type: Optional[asyncio.TimerHandle]
+        self._handlers = {
+            Opcode.HELLO: self._hello,
+            Opcode.SASL_LIST_MECHS: self._sasl_list_mechs,
+            Opcode.SASL_AUTH: self._sasl_auth,
+            Opcode.SASL_STEP: self._sasl_step,
+            Opcode.GET_ERROR_MAP: self._get_error_map,
+            Opcode.NOOP: self._noop,
+            Opcode.SELECT_BUCKET: self._select_bucket,
+            Opcode.GET_CLUSTER_CONFIG: self._get_cluster_config,
+            Opcode.GET_COLLECTION_ID: self._get_collection_id,
+            Opcode.GET_COLLECTIONS_MANIFEST: self._get_collections_manifest,
+            Opcode.GET: self._get,
+            Opcode.GET_REPLICA: self._get,
+            Opcode.GET_AND_TOUCH: self._get_and_touch,
+            Opcode.GET_AND_LOCK: self._get_and_lock,
+            Opcode.UNLOCK: self._unlock,
+            Opcode.TOUCH: self._touch,
+            Opcode.GET_META: self._get_meta,
+            Opcode.UPSERT: self._store,
+            Opcode.INSERT: self._store,
+            Opcode.REPLACE: self._store,
+            Opcode.REMOVE: self._remove,
+            Opcode.INCREMENT: self._counter,
+            Opcode.DECREMENT: self._counter,
+            Opcode.APPEND: self._concat,
+            Opcode.PREPEND: self._concat,
+            Opcode.SUBDOC_MULTI_LOOKUP: self._lookup_in,
+            Opcode.SUBDOC_MULTI_MUTATION: self._mutate_in,
+            Opcode.RANGE_SCAN_CREATE: self._range_scan_create,
+            Opcode.RANGE_SCAN_CONTINUE: self._range_scan_continue,
+            Opcode.RANGE_SCAN_CANCEL: self._range_scan_cancel,
+        }  # type: Dict[int, Callable[[Request], bytes]]
+
+    # connection handling
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport
+        self._server.transports.add(transport)
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if self._delayed_timer is not None:
+            self._delayed_timer.cancel()
+        self._server.transports.discard(self._transport)
+        self._transport = None
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        offset = 0
+        try:
+            while True:
+                parsed = parse_request(self._buffer, offset)
+                if parsed is None:
+                    break
+                req, offset = parsed
+                self._dispatch(req)
+        except Exception:
+            logger.exception('Closing the connection after an unexpected error.')
+            if self._transport is not None:
+                self._transport.close()
+            return
+        del self._buffer[:offset]
+
+    def _dispatch(self, req: Request) -> None:
+        handler = self._handlers.get(req.opcode, None)
+        if handler is None:
+            self._send(self._response(req, Status.UNKNOWN_COMMAND))
+            return
+        if self._user is None and req.opcode not in UNAUTHENTICATED_OPCODES:
+            self._send(self._response(req, Status.AUTH_ERROR))
+            return
+        delay = 0.0
+        if req.opcode in DATA_OPCODES:
+            if self._bucket is None:
+                self._send(self._response(req, Status.NO_BUCKET))
+                return
+            faults = self._server.faults
+            delay = faults.delay()
+            if faults.should_fail():
+                self._send(self._response(req, faults.kv_error_status), delay)
+                return
+        try:
+            response = handler(req)
+        except KvError as ex:
+            response = self._response(req, ex.status, value=ex.value)
+        self._send(response, delay)
+
+    def _send(self, data: bytes, delay: float = 0.0) -> None:
+        if self._transport is None:
+            return
+        if delay <= 0 and not self._delayed:
+            self._transport.write(data)
+            return
+        loop = asyncio.get_running_loop()
+        if Feature.UNORDERED_EXECUTION in self._features:
+            loop.call_later(delay, self._write, data)
+            return
+        # responses must keep the order of the requests, a response cannot overtake an earlier delayed one
+        send_at = loop.time() + delay
+        if self._delayed:
+            send_at = max(send_at, self._delayed[-1][0])
+        self._delayed.append((send_at, data))
+        if self._delayed_timer is None:
+            self._delayed_timer = loop.call_at(send_at, self._flush_delayed)
+
+    def _write(self, data: bytes) -> None:
+        if self._transport is not None:
+            self._transport.write(data)
+
+    def _flush_delayed(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._delayed and self._delayed[0][0] <= now:
+            self._write(self._delayed.popleft()[1])
+        self._delayed_timer = loop.call_at(self._delayed[0][0], self._flush_delayed) if self._delayed else None
+
+    # helpers
+
+    def _response(self, req: Request, status: int = Status.SUCCESS, **kwargs: Any) -> bytes:
+        return encode_response(req.opcode, req.opaque, status, **kwargs)
+
+    def _doc_key(self, req: Request) -> Tuple[int, bytes]:
+        if Feature.COLLECTIONS not in self._features:
+            return DEFAULT_COLLECTION_ID, req.key
+        collection_id, offset = decode_leb128(req.key)
+        if not self._bucket.has_collection(collection_id):
+            raise KvError(Status.UNKNOWN_COLLECTION)
+        return collection_id, req.key[offset:]
+
+    def _existing(self, req: Request) -> Tuple[int, bytes, Document]:
+        collection_id, key = self._doc_key(req)
+        doc = self._bucket.get(collection_id, key)
+        if doc is None:
+            raise KvError(Status.NOT_FOUND)
+        return collection_id, key, doc
+
+    def _check_cas(self, req: Request, doc: Optional[Document]) -> None:
+        """Raises unless ``doc`` can be mutated by ``req``: the CAS of the request must match, if it has one, and
+        a locked document can only be mutated with the CAS of its lock.
+        """
+        if doc is None:
+            if req.cas:
+                raise KvError(Status.NOT_FOUND)
+            return
+        if doc.is_locked():
+            if req.cas != doc.lock_cas:
+                raise KvError(Status.LOCKED)
+        elif req.cas and req.cas != doc.cas:
+            raise KvError(Status.EXISTS)
+
+    def _datatype(self, doc: Document) -> int:
+        return doc.datatype & Datatype.JSON if Feature.JSON in self._features else Datatype.RAW
+
+    def _mutation_extras(self, key: bytes, seqno: int) -> bytes:
+        if Feature.MUTATION_SEQNO not in self._features:
+            return b''
+        return struct.pack('>QQ', *self._bucket.mutation_token(key, seqno))
+
+    def _stored_datatype(self, req: Request) -> int:
+        return req.datatype & Datatype.JSON
+
+    # bootstrap
+
+    def _hello(self, req: Request) -> bytes:
+        requested = struct.unpack(f'>{len(req.value) // 2}H', req.value)
+        features = [f for f in requested if f in SUPPORTED_FEATURES]
+        self._features = frozenset(Feature(f) for f in features)
+        return self._response(req, value=struct.pack(f'>{len(features)}H', *features))
+
+    def _sasl_list_mechs(self, req: Request) -> bytes:
+        return self._response(req, value=' '.join(MECHANISMS).encode('utf-8'))
+
+    def _sasl_auth(self, req: Request) -> bytes:
+        mechanism = req.key.decode('utf-8')
+        credentials = self._server.credentials
+        if mechanism == 'PLAIN':
+            username, valid = check_plain(req.value, credentials)
+            if not valid:
+                return self._response(req, Status.AUTH_ERROR)
+            self._user = username
+            return self._response(req)
+        if mechanism not in SCRAM_MECHANISMS:
+            return self._response(req, Status.AUTH_ERROR)
+        self._sasl = ScramServer(mechanism, credentials)
+        try:
+            return self._response(req, Status.AUTH_CONTINUE, value=self._sasl.start(req.value))
+        except SaslError:
+            self._sasl = None
+            return self._response(req, Status.AUTH_ERROR)
+
+    def _sasl_step(self, req: Request) -> bytes:
+        sasl, self._sasl = self._sasl, None
+        if sasl is None:
+            return self._response(req, Status.AUTH_ERROR)
+        try:
+            server_final = sasl.step(req.value)
+        except SaslError:
+            return self._response(req, Status.AUTH_ERROR)
+        self._user = sasl.username
+        return self._response(req, value=server_final)
+
+    def _get_error_map(self, req: Request) -> bytes:
+        return self._response(req, value=self._server.error_map())
+
+    def _noop(self, req: Request) -> bytes:
+        return self._response(req)
+
+    def _select_bucket(self, req: Request) -> bytes:
+        bucket = self._server.buckets.get(req.key.decode('utf-8'), None)
+        if bucket is None:
+            return self._response(req, Status.NOT_FOUND)
+        self._bucket = bucket
+        return self._response(req)
+
+    def _get_cluster_config(self, req: Request) -> bytes:
+        datatype = Datatype.JSON if Feature.JSON in self._features else Datatype.RAW
+        return self._response(req, value=self._server.cluster_config(self._bucket), datatype=datatype)
+
+    def _get_collection_id(self, req: Request) -> bytes:
+        if self._bucket is None:
+            return self._response(req, Status.NO_BUCKET)
+        path = (req.key or req.value).decode('utf-8')
+        scope, _, collection = path.partition('.')
+        collection_id = self._bucket.collection_id(scope, collection)
+        return self._response(req, extras=struct.pack('>QI', self._bucket.manifest_uid, collection_id))
+
+    def _get_collections_manifest(self, req: Request) -> bytes:
+        if self._bucket is None:
+            return self._response(req, Status.NO_BUCKET)
+        return self._response(req, value=json.dumps(self._bucket.manifest()).encode('utf-8'))
+
+    # documents
+
+    def _get(self, req: Request) -> bytes:
+        _, _, doc = self._existing(req)
+        cas = LOCKED_CAS if doc.is_locked() else doc.cas
+        return self._response(req, cas=cas, extras=struct.pack('>I', doc.flags), value=doc.value,
+                              datatype=self._datatype(doc))
+
+    def _get_and_touch(self, req: Request) -> bytes:
+        collection_id, key, doc = self._existing(req)
+        if doc.is_locked():
+            raise KvError(Status.LOCKED)
+        doc.expiry = absolute_expiry(struct.unpack('>I', req.extras)[0])
+        self._bucket.store(collection_id, key, doc)
+        return self._response(req, cas=doc.cas, extras=struct.pack('>I', doc.flags), value=doc.value,
+                              datatype=self._datatype(doc))
+
+    def _touch(self, req: Request) -> bytes:
+        collection_id, key, doc = self._existing(req)
+        if doc.is_locked():
+            raise KvError(Status.LOCKED)
+        doc.expiry = absolute_expiry(struct.unpack('>I', req.extras)[0])
+        self._bucket.store(collection_id, key, doc)
+        return self._response(req, cas=doc.cas)
+
+    def _get_and_lock(self, req: Request) -> bytes:
+        _, _, doc = self._existing(req)
+        if doc.is_locked():
+            raise KvError(Status.LOCKED)
+        lock_time = struct.unpack('>I', req.extras)[0] if req.extras else 0
+        if lock_time == 0 or lock_time > MAX_LOCK_TIME:
+            lock_time = DEFAULT_LOCK_TIME
+        doc.cas = doc.lock_cas = self._bucket.next_cas()
+        doc.locked_until = time.monotonic() + lock_time
+        return self._response(req, cas=doc.cas, extras=struct.pack('>I', doc.flags), value=doc.value,
+                              datatype=self._datatype(doc))
+
+    def _unlock(self, req: Request) -> bytes:
+        _, _, doc = self._existing(req)
+        if not doc.is_locked():
+            raise KvError(Status.NOT_LOCKED)
+        if req.cas != doc.lock_cas:
+            raise KvError(Status.LOCKED)
+        doc.unlock()
+        return self._response(req)
+
+    def _get_meta(self, req: Request) -> bytes:
+        _, _, doc = self._existing(req)
+        # deleted, flags, expiry, seqno and, from version 2 of the request, the datatype
+        extras = struct.pack('>IIIQ', 0, doc.flags, doc.expiry, doc.seqno)
+        if req.extras and req.extras[0] >= 2:
+            extras += bytes((self._datatype(doc),))
+        return self._response(req, cas=doc.cas, extras=extras)
+
+    def _store(self, req: Request) -> bytes:
+        collection_id, key = self._doc_key(req)
+        flags, expiry = struct.unpack('>II', req.extras)
+        existing = self._bucket.get(collection_id, key)
+        if req.opcode == Opcode.INSERT and existing is not None:
+            raise KvError(Status.EXISTS)
+        if req.opcode == Opcode.REPLACE and existing is None:
+            raise KvError(Status.NOT_FOUND)
+        self._check_cas(req, existing)
+        if existing is not None and has_frame(req.framing_extras, FrameId.PRESERVE_TTL):
+            expiry = existing.expiry
+        else:
+            expiry = absolute_expiry(expiry)
+        doc = self._bucket.store(collection_id, key,
+                                 Document(req.value, flags, self._stored_datatype(req), expiry))
+        return self._response(req, cas=doc.cas, extras=self._mutation_extras(key, doc.seqno))
+
+    def _remove(self, req: Request) -> bytes:
+        collection_id, key, doc = self._existing(req)
+        self._check_cas(req, doc)
+        cas, seqno = self._bucket.remove(collection_id, key)
+        return self._response(req, cas=cas, extras=self._mutation_extras(key, seqno))
+
+    def _counter(self, req: Request) -> bytes:
+        collection_id, key = self._doc_key(req)
+        delta, initial, expiry = struct.unpack('>QQI', req.extras)
+        doc = self._bucket.get(collection_id, key)
+        if doc is None:
+            if expiry == NO_CREATE_EXPIRY:
+                raise KvError(Status.NOT_FOUND)
+            if req.cas:
+                raise KvError(Status.NOT_FOUND)
+            result = initial
+            doc = Document(b'', 0, Datatype.JSON, absolute_expiry(expiry))
+        else:
+            self._check_cas(req, doc)
+            try:
+                current = int(doc.value)
+            except ValueError:
+                raise KvError(Status.DELTA_BAD_VALUE) from None
+            if current < 0 or current >= 1 << 64:
+                raise KvError(Status.DELTA_BAD_VALUE)
+            if req.opcode == Opcode.INCREMENT:
+                result = (current + delta) % (1 << 64)
+            else:
+                result = max(current - delta, 0)
+            doc = Document(b'', doc.flags, Datatype.JSON, doc.expiry, doc.xattrs)
+        doc.value = str(result).encode('utf-8')
+        self._bucket.store(collection_id, key, doc)
+        return self._response(req, cas=doc.cas, extras=self._mutation_extras(key, doc.seqno),
+                              value=struct.pack('>Q', result))
+
+    def _concat(self, req: Request) -> bytes:
+        collection_id, key = self._doc_key(req)
+        existing = self._bucket.get(collection_id, key)
+        if existing is None:
+            raise KvError(Status.NOT_STORED)
+        self._check_cas(req, existing)
+        if req.opcode == Opcode.APPEND:
+            value = existing.value + req.value
+        else:
+            value = req.value + existing.value
+        doc = self._bucket.store(collection_id, key,
+                                 Document(value, existing.flags, Datatype.RAW, existing.expiry, existing.xattrs))
+        return self._response(req, cas=doc.cas, extras=self._mutation_extras(key, doc.seqno))
+
+    # sub-document
+
+    def _virtual_xattrs(self, key: bytes, doc: Document) -> Dict[str, Any]:
+        return {
+            '$document': {
+                'CAS': _hex_le(doc.cas),
+                'vbucket_uuid': _hex_le(self._bucket.mutation_token(key, doc.seqno)[0]),
+                'seqno': _hex_le(doc.seqno),
+                'revid': str(doc.seqno),
+                'exptime': doc.expiry,
+                'value_bytes': len(doc.value),
+                'value_crc32c': f'0x{crc32c(doc.value):08x}',
+                'datatype': ['json'] if doc.datatype & Datatype.JSON else ['raw'],
+                'deleted': False,
+                'flags': doc.flags,
+                'last_modified': str(doc.cas // 1000000000),
+            },
+            '$vbucket': {'HLC': {'now': str(int(time.time())), 'mode': 'real'}},
+            '$XTOC': sorted(doc.xattrs),
+        }
+
+    def _lookup_in(self, req: Request) -> bytes:  # noqa: C901
+        collection_id, key, doc = self._existing(req)
+        body = None
+        body_error = None
+        xattrs = None
+        results = []  # type: List[Tuple[int, bytes]]
+        offset = 0
+        while offset < len(req.value):
+            opcode, flags, path_len = struct.unpack_from('>BBH', req.value, offset)
+            offset += 4
+            path = req.value[offset:offset + path_len].decode('utf-8')
+            offset += path_len
+            try:
+                tokens = parse_path(path)
+                if flags & PathFlag.XATTR:
+                    if xattrs is None:
+                        xattrs = dict(doc.xattrs, **self._virtual_xattrs(key, doc))
+                    if tokens and isinstance(tokens[0], str) and tokens[0].startswith('$') \
+                            and tokens[0] not in xattrs:
+                        raise SubdocError(Status.SUBDOC_XATTR_UNKNOWN_VATTR)
+                    value = lookup(xattrs, opcode, tokens)
+                elif opcode == SubdocOpcode.GET_DOC:
+                    value = doc.value
+                else:
+                    if body is None and body_error is None:
+                        try:
+                            body = json.loads(doc.value)
+                        except ValueError:
+                            body_error = Status.SUBDOC_DOC_NOT_JSON
+                    if body_error is not None:
+                        raise SubdocError(body_error)
+                    value = lookup(body, opcode, tokens)
+                results.append((Status.SUCCESS, value or b''))
+            except SubdocError as ex:
+                results.append((ex.status, b''))
+        status = Status.SUCCESS
+        if any(res_status != Status.SUCCESS for res_status, _ in results):
+            status = Status.SUBDOC_MULTI_PATH_FAILURE
+        value = b''.join(struct.pack('>HI', res_status, len(res_value)) + res_value
+                         for res_status, res_value in results)
+        cas = LOCKED_CAS if doc.is_locked() else doc.cas
+        return self._response(req, status, cas=cas, value=value)
+
+    def _mutate_in(self, req: Request) -> bytes:  # noqa: C901
+        collection_id, key = self._doc_key(req)
+        expiry = 0
+        doc_flags = 0
+        if len(req.extras) in (4, 5):
+            expiry = struct.unpack_from('>I', req.extras)[0]
+        if len(req.extras) in (1, 5):
+            doc_flags = req.extras[-1]
+
+        specs = []  # type: List[Tuple[int, int, int, str, bytes]]
+        offset = 0
+        while offset < len(req.value):
+            opcode, flags, path_len, value_len = struct.unpack_from('>BBHI', req.value, offset)
+            offset += 8
+            path = req.value[offset:offset + path_len].decode('utf-8')
+            offset += path_len
+            specs.append((len(specs), opcode, flags, path, req.value[offset:offset + value_len]))
+            offset += value_len
+
+        existing = self._bucket.get(collection_id, key)
+        if existing is not None and doc_flags & DocFlag.ADD:
+            raise KvError(Status.EXISTS)
+        if existing is None and not doc_flags & (DocFlag.MKDOC | DocFlag.ADD):
+            raise KvError(Status.NOT_FOUND)
+        self._check_cas(req, existing)
+
+        if any(opcode == SubdocOpcode.REMOVE_DOC for _, opcode, _, _, _ in specs):
+            if existing is None:
+                raise KvError(Status.NOT_FOUND)
+            cas, seqno = self._bucket.remove(collection_id, key)
+            return self._response(req, cas=cas, extras=self._mutation_extras(key, seqno))
+
+        if existing is not None:
+            try:
+                body = json.loads(existing.value)
+            except ValueError:
+                body = None
+            xattrs = copy.deepcopy(existing.xattrs)
+        else:
+            body_specs = [spec for spec in specs if not spec[2] & PathFlag.XATTR]
+            root_array = body_specs and body_specs[0][1] in (SubdocOpcode.ARRAY_PUSH_LAST,
+                                                             SubdocOpcode.ARRAY_PUSH_FIRST,
+                                                             SubdocOpcode.ARRAY_ADD_UNIQUE) \
+                and body_specs[0][3] == ''
+            body = [] if root_array else {}
+            xattrs = {}
+
+        results = []  # type: List[Tuple[int, bytes]]
+
+        def apply(target: Any, idx: int, opcode: int, flags: int, path: str, value: bytes) -> Any:
+            try:
+                target, result = mutate(target, opcode, parse_path(path), value,
+                                        bool(flags & PathFlag.CREATE_PARENTS))
+            except SubdocError as ex:
+                raise KvError(Status.SUBDOC_MULTI_PATH_FAILURE, struct.pack('>BH', idx, ex.status)) from None
+            if result is not None:
+                results.append((idx, result))
+            return target
+
+        # the body first, the value_crc32c macro expands to the checksum of the updated body
+        for idx, opcode, flags, path, value in specs:
+            if flags & PathFlag.XATTR:
+                continue
+            if body is None:
+                raise KvError(Status.SUBDOC_MULTI_PATH_FAILURE, struct.pack('>BH', idx, Status.SUBDOC_DOC_NOT_JSON))
+            body = apply(body, idx, opcode, flags, path, value)
+        new_value = json.dumps(body, separators=(',', ':')).encode('utf-8')
+
+        cas = self._bucket.next_cas()
+        macros = {
+            b'"${Mutation.CAS}"': f'"{_hex_le(cas)}"'.encode('utf-8'),
+            b'"${Mutation.seqno}"': f'"{_hex_le(self._bucket.next_seqno(key))}"'.encode('utf-8'),
+            b'"${Mutation.value_crc32c}"': f'"0x{crc32c(new_value):08x}"'.encode('utf-8'),
+        }
+        for idx, opcode, flags, path, value in specs:
+            if not flags & PathFlag.XATTR:
+                continue
+            if flags & PathFlag.EXPAND_MACROS:
+                for macro, expanded in macros.items():
+                    value = value.replace(macro, expanded)
+            xattrs = apply(xattrs, idx, opcode, flags, path, value)
+
+        if existing is not None and (expiry == 0 and has_frame(req.framing_extras, FrameId.PRESERVE_TTL)):
+            expiry = existing.expiry
+        else:
+            expiry = absolute_expiry(expiry)
+        flags = existing.flags if existing is not None else 0
+        doc = self._bucket.store(collection_id, key, Document(new_value, flags, Datatype.JSON, expiry, xattrs),
+                                 cas=cas)
+        value = b''.join(struct.pack('>BHI', idx, Status.SUCCESS, len(result)) + result for idx, result in results)
+        return self._response(req, cas=doc.cas, extras=self._mutation_extras(key, doc.seqno), value=value)
+
+    # range scans
+
+    def _range_scan_create(self, req: Request) -> bytes:
+        spec = json.loads(req.value)
+        collection_id = int(spec.get('collection', '0'), 16)
+        if not self._bucket.has_collection(collection_id):
+            raise KvError(Status.UNKNOWN_COLLECTION)
+        start = end = None
+        samples = seed = None
+        if 'sampling' in spec:
+            samples = int(spec['sampling']['samples'])
+            seed = spec['sampling'].get('seed', None)
+        if 'range' in spec:
+            scan_range = spec['range']
+            for name, exclusive in (('start', False), ('excl_start', True)):
+                if name in scan_range:
+                    start = (base64.b64decode(scan_range[name]), exclusive)
+            for name, exclusive in (('end', False), ('excl_end', True)):
+                if name in scan_range:
+                    end = (base64.b64decode(scan_range[name]), exclusive)
+        scan_id = self._bucket.create_scan(collection_id, req.vbucket, start, end, samples, seed,
+                                           bool(spec.get('key_only', False)))
+        if scan_id is None:
+            # nothing to scan in this vbucket
+            raise KvError(Status.NOT_FOUND)
+        return self._response(req, value=scan_id)
+
+    def _range_scan_continue(self, req: Request) -> bytes:
+        scan_id = req.extras[:16]
+        item_limit, _, byte_limit = struct.unpack_from('>III', req.extras, 16)
+        scan = self._bucket.get_scan(scan_id)
+        if scan is None:
+            raise KvError(Status.NOT_FOUND)
+        items = []  # type: List[bytes]
+        size = 0
+        while scan.position < len(scan.keys):
+            if (item_limit and len(items) >= item_limit) or (byte_limit and size >= byte_limit):
+                break
+            key = scan.keys[scan.position]
+            scan.position += 1
+            if scan.key_only:
+                item = encode_leb128(len(key)) + key
+            else:
+                doc = self._bucket.get(scan.collection_id, key)
+                if doc is None:
+                    continue
+                item = b''.join((struct.pack('>IIQQB', doc.flags, doc.expiry, doc.seqno, doc.cas, doc.datatype),
+                                 encode_leb128(len(key)), key, encode_leb128(len(doc.value)), doc.value))
+            items.append(item)
+            size += len(item)
+        status = Status.RANGE_SCAN_MORE
+        if scan.position >= len(scan.keys):
+            status = Status.RANGE_SCAN_COMPLETE
+            self._bucket.close_scan(scan_id)
+        extras = struct.pack('>I', 0 if scan.key_only else 1)
+        return self._response(req, status, extras=extras, value=b''.join(items))
+
+    def _range_scan_cancel(self, req: Request) -> bytes:
+        if not self._bucket.close_scan(req.extras[:16]):
+            raise KvError(Status.NOT_FOUND)
+        return self._response(req)
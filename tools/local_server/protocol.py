@@ -0,0 +1,280 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Memcached binary protocol framing and constants, as used by the KV service."""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from enum import IntEnum
+from typing import (NamedTuple,
+                    Optional,
+                    Tuple)
+
+HEADER_LEN = 24
+# magic, opcode, key len, extras len, datatype, vbucket (or status), body len, opaque, cas
+_HEADER = struct.Struct('>BBHBBHIIQ')
+# alternative encoding, the key len is split into the framing extras len and a 1 byte key len
+_ALT_HEADER = struct.Struct('>BBBBBBHIIQ')
+
+
+class Magic(IntEnum):
+    REQUEST = 0x80
+    ALT_REQUEST = 0x08
+    RESPONSE = 0x81
+    ALT_RESPONSE = 0x18
+
+
+class Opcode(IntEnum):
+    GET = 0x00
+    UPSERT = 0x01
+    INSERT = 0x02
+    REPLACE = 0x03
+    REMOVE = 0x04
+    INCREMENT = 0x05
+    DECREMENT = 0x06
+    NOOP = 0x0a
+    APPEND = 0x0e
+    PREPEND = 0x0f
+    TOUCH = 0x1c
+    GET_AND_TOUCH = 0x1d
+    HELLO = 0x1f
+    SASL_LIST_MECHS = 0x20
+    SASL_AUTH = 0x21
+    SASL_STEP = 0x22
+    GET_REPLICA = 0x83
+    SELECT_BUCKET = 0x89
+    GET_AND_LOCK = 0x94
+    UNLOCK = 0x95
+    GET_META = 0xa0
+    GET_CLUSTER_CONFIG = 0xb5
+    GET_COLLECTIONS_MANIFEST = 0xba
+    GET_COLLECTION_ID = 0xbb
+    SUBDOC_MULTI_LOOKUP = 0xd0
+    SUBDOC_MULTI_MUTATION = 0xd1
+    RANGE_SCAN_CREATE = 0xda
+    RANGE_SCAN_CONTINUE = 0xdb
+    RANGE_SCAN_CANCEL = 0xdc
+    GET_ERROR_MAP = 0xfe
+
+
+class Status(IntEnum):
+    SUCCESS = 0x00
+    NOT_FOUND = 0x01
+    EXISTS = 0x02
+    TOO_BIG = 0x03
+    INVALID = 0x04
+    NOT_STORED = 0x05
+    DELTA_BAD_VALUE = 0x06
+    NOT_MY_VBUCKET = 0x07
+    NO_BUCKET = 0x08
+    LOCKED = 0x09
+    NOT_LOCKED = 0x0e
+    AUTH_ERROR = 0x20
+    AUTH_CONTINUE = 0x21
+    UNKNOWN_COLLECTION = 0x88
+    UNKNOWN_COMMAND = 0x81
+    NOT_SUPPORTED = 0x83
+    INTERNAL = 0x84
+    BUSY = 0x85
+    TEMPORARY_FAILURE = 0x86
+    RANGE_SCAN_CANCELLED = 0xa5
+    RANGE_SCAN_MORE = 0xa6
+    RANGE_SCAN_COMPLETE = 0xa7
+    SUBDOC_PATH_NOT_FOUND = 0xc0
+    SUBDOC_PATH_MISMATCH = 0xc1
+    SUBDOC_PATH_INVALID = 0xc2
+    SUBDOC_PATH_TOO_BIG = 0xc3
+    SUBDOC_DOC_TOO_DEEP = 0xc4
+    SUBDOC_VALUE_CANNOT_INSERT = 0xc5
+    SUBDOC_DOC_NOT_JSON = 0xc6
+    SUBDOC_NUM_RANGE = 0xc7
+    SUBDOC_DELTA_INVALID = 0xc8
+    SUBDOC_PATH_EXISTS = 0xc9
+    SUBDOC_VALUE_TOO_DEEP = 0xca
+    SUBDOC_INVALID_COMBO = 0xcb
+    SUBDOC_MULTI_PATH_FAILURE = 0xcc
+    SUBDOC_XATTR_UNKNOWN_MACRO = 0xd0
+    SUBDOC_XATTR_UNKNOWN_VATTR = 0xd2
+
+
+class Feature(IntEnum):
+    TCP_NODELAY = 0x03
+    MUTATION_SEQNO = 0x04
+    XATTR = 0x06
+    XERROR = 0x07
+    SELECT_BUCKET = 0x08
+    JSON = 0x0b
+    UNORDERED_EXECUTION = 0x0e
+    ALT_REQUEST = 0x10
+    SYNC_REPLICATION = 0x11
+    COLLECTIONS = 0x12
+    PRESERVE_TTL = 0x14
+    VATTR = 0x15
+    SUBDOC_CREATE_AS_DELETED = 0x17
+
+
+SUPPORTED_FEATURES = frozenset(Feature)
+
+
+class Datatype(IntEnum):
+    RAW = 0x00
+    JSON = 0x01
+    SNAPPY = 0x02
+    XATTR = 0x04
+
+
+class FrameId(IntEnum):
+    """Ids of the framing extras of alternative requests."""
+    DURABILITY = 0x01
+    PRESERVE_TTL = 0x05
+
+
+class Request(NamedTuple):
+    opcode: int
+    datatype: int
+    vbucket: int
+    opaque: int
+    cas: int
+    extras: bytes
+    key: bytes
+    value: bytes
+    framing_extras: bytes = b''
+
+
+def parse_request(buf: bytearray, offset: int = 0) -> Optional[Tuple[Request, int]]:
+    """Parses the request starting at ``offset`` in ``buf``.
+
+    Returns the request and the offset following it, or ``None`` if ``buf`` does not hold a complete request yet.
+    """
+    if len(buf) - offset < HEADER_LEN:
+        return None
+    magic = buf[offset]
+    if magic == Magic.ALT_REQUEST:
+        (_, opcode, framing_len, key_len, extras_len, datatype,
+         vbucket, body_len, opaque, cas) = _ALT_HEADER.unpack_from(buf, offset)
+    elif magic == Magic.REQUEST:
+        _, opcode, key_len, extras_len, datatype, vbucket, body_len, opaque, cas = _HEADER.unpack_from(buf, offset)
+        framing_len = 0
+    else:
+        raise ValueError(f'Unexpected magic 0x{magic:02x}')
+    end = offset + HEADER_LEN + body_len
+    if len(buf) < end:
+        return None
+    pos = offset + HEADER_LEN
+    framing_extras = bytes(buf[pos:pos + framing_len])
+    pos += framing_len
+    extras = bytes(buf[pos:pos + extras_len])
+    pos += extras_len
+    key = bytes(buf[pos:pos + key_len])
+    pos += key_len
+    value = bytes(buf[pos:end])
+    return Request(opcode, datatype, vbucket, opaque, cas, extras, key, value, framing_extras), end
+
+
+def has_frame(framing_extras: bytes, frame_id: FrameId) -> bool:
+    pos = 0
+    while pos < len(framing_extras):
+        info = framing_extras[pos]
+        pos += 1
+        fid = info >> 4
+        length = info & 0x0f
+        # ids and lengths of 15 and more are escaped, the next byte holds the value minus 15
+        if fid == 0x0f:
+            fid = framing_extras[pos] + 0x0f
+            pos += 1
+        if length == 0x0f:
+            length = framing_extras[pos] + 0x0f
+            pos += 1
+        if fid == frame_id:
+            return True
+        pos += length
+    return False
+
+
+def encode_response(opcode: int,
+                    opaque: int,
+                    status: int = Status.SUCCESS,
+                    cas: int = 0,
+                    extras: bytes = b'',
+                    key: bytes = b'',
+                    value: bytes = b'',
+                    datatype: int = Datatype.RAW) -> bytes:
+    header = _HEADER.pack(Magic.RESPONSE, opcode, len(key), len(extras), datatype, status,
+                          len(extras) + len(key) + len(value), opaque, cas)
+    return b''.join((header, extras, key, value))
+
+
+def encode_request(opcode: int,
+                   opaque: int = 0,
+                   vbucket: int = 0,
+                   cas: int = 0,
+                   extras: bytes = b'',
+                   key: bytes = b'',
+                   value: bytes = b'',
+                   datatype: int = Datatype.RAW) -> bytes:
+    header = _HEADER.pack(Magic.REQUEST, opcode, len(key), len(extras), datatype, vbucket,
+                          len(extras) + len(key) + len(value), opaque, cas)
+    return b''.join((header, extras, key, value))
+
+
+def parse_response(buf: bytearray, offset: int = 0) -> Optional[Tuple[Request, int]]:
+    """Parses the response starting at ``offset`` in ``buf``, as :func:`parse_request`.
+
+    The ``vbucket`` field of the returned request holds the response's status.
+    """
+    if len(buf) - offset < HEADER_LEN:
+        return None
+    _, opcode, key_len, extras_len, datatype, status, body_len, opaque, cas = _HEADER.unpack_from(buf, offset)
+    end = offset + HEADER_LEN + body_len
+    if len(buf) < end:
+        return None
+    pos = offset + HEADER_LEN
+    extras = bytes(buf[pos:pos + extras_len])
+    pos += extras_len
+    key = bytes(buf[pos:pos + key_len])
+    value = bytes(buf[pos + key_len:end])
+    return Request(opcode, datatype, status, opaque, cas, extras, key, value), end
+
+
+def encode_leb128(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def decode_leb128(buf: bytes, offset: int = 0) -> Tuple[int, int]:
+    """Returns the decoded value and the offset of the first byte following it."""
+    value = 0
+    shift = 0
+    while True:
+        byte = buf[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def vbucket_for_key(key: bytes, num_vbuckets: int) -> int:
+    """The vbucket the SDK maps ``key`` to (CRC32 hashing, as in the bucket configuration)."""
+    return ((zlib.crc32(key) >> 16) & 0x7fff) % num_vbuckets
@@ -0,0 +1,121 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Server side of the SASL mechanisms the SDK authenticates with: SCRAM-SHA512/256/1 (RFC 5802) and PLAIN."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+from functools import lru_cache
+from typing import (Dict,
+                    Optional,
+                    Tuple)
+
+SCRAM_MECHANISMS = {
+    'SCRAM-SHA512': 'sha512',
+    'SCRAM-SHA256': 'sha256',
+    'SCRAM-SHA1': 'sha1',
+}
+MECHANISMS = tuple(SCRAM_MECHANISMS) + ('PLAIN',)
+
+SCRAM_ITERATIONS = 4096
+
+
+class SaslError(Exception):
+    pass
+
+
+@lru_cache(maxsize=None)
+def _salted_password(digest: str, password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac(digest, password.encode('utf-8'), salt, iterations)
+
+
+def _parse_attributes(message: str) -> Dict[str, str]:
+    attrs = {}
+    for attr in message.split(','):
+        if len(attr) < 2 or attr[1] != '=':
+            raise SaslError(f'Invalid SCRAM attribute {attr!r}')
+        attrs[attr[0]] = attr[2:]
+    return attrs
+
+
+def _decode_username(name: str) -> str:
+    return name.replace('=2C', ',').replace('=3D', '=')
+
+
+class ScramServer:
+    """One SCRAM exchange: :meth:`start` answers the client-first message, :meth:`step` the client-final one."""
+
+    def __init__(self, mechanism: str, credentials: Dict[str, str]) -> None:
+        self._digest = SCRAM_MECHANISMS[mechanism]
+        self._credentials = credentials
+        self._salt = os.urandom(16)
+        self.username = None  # type: Optional[str]
+        self._nonce = None  # type: Optional[str]
+        self._password = None  # type: Optional[str]
+        self._auth_message_prefix = None  # type: Optional[str]
+
+    def start(self, client_first: bytes) -> bytes:
+        message = client_first.decode('utf-8')
+        # gs2 header: channel binding flag and authzid, not supported
+        parts = message.split(',', 2)
+        if len(parts) != 3:
+            raise SaslError('Invalid SCRAM client-first message')
+        client_first_bare = parts[2]
+        attrs = _parse_attributes(client_first_bare)
+        username = _decode_username(attrs.get('n', ''))
+        if username not in self._credentials:
+            raise SaslError(f'Unknown user {username!r}')
+        self.username = username
+        self._password = self._credentials[username]
+        self._nonce = attrs['r'] + base64.b64encode(os.urandom(18)).decode('ascii')
+        server_first = (f'r={self._nonce},s={base64.b64encode(self._salt).decode("ascii")},'
+                        f'i={SCRAM_ITERATIONS}')
+        self._auth_message_prefix = f'{client_first_bare},{server_first}'
+        return server_first.encode('utf-8')
+
+    def step(self, client_final: bytes) -> bytes:
+        if self._auth_message_prefix is None:
+            raise SaslError('SCRAM step before start')
+        message = client_final.decode('utf-8')
+        without_proof, _, proof = message.rpartition(',p=')
+        attrs = _parse_attributes(without_proof)
+        if attrs.get('r', None) != self._nonce:
+            raise SaslError('SCRAM nonce mismatch')
+
+        salted = _salted_password(self._digest, self._password, self._salt, SCRAM_ITERATIONS)
+        client_key = hmac.new(salted, b'Client Key', self._digest).digest()
+        stored_key = hashlib.new(self._digest, client_key).digest()
+        auth_message = f'{self._auth_message_prefix},{without_proof}'.encode('utf-8')
+        client_signature = hmac.new(stored_key, auth_message, self._digest).digest()
+        expected_proof = bytes(a ^ b for a, b in zip(client_key, client_signature))
+        if not hmac.compare_digest(expected_proof, base64.b64decode(proof)):
+            raise SaslError('Invalid SCRAM proof')
+
+        server_key = hmac.new(salted, b'Server Key', self._digest).digest()
+        server_signature = hmac.new(server_key, auth_message, self._digest).digest()
+        return b'v=' + base64.b64encode(server_signature)
+
+
+def check_plain(payload: bytes, credentials: Dict[str, str]) -> Tuple[str, bool]:
+    """Returns the username of a PLAIN payload (``authzid \\0 username \\0 password``) and whether it is valid."""
+    parts = payload.decode('utf-8').split('\0')
+    if len(parts) != 3:
+        return '', False
+    _, username, password = parts
+    return username, credentials.get(username, None) == password
@@ -0,0 +1,180 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from typing import (Any,
+                    Dict,
+                    Iterable,
+                    Optional,
+                    Set)
+
+from .faults import FaultInjection
+from .http_service import HttpConnection
+from .kv import KvConnection
+from .protocol import Status
+from .store import Bucket
+
+SERVER_VERSION = '7.6.0-0000-enterprise'
+
+BUCKET_CAPABILITIES = [
+    'collections', 'durableWrite', 'tombstonedUserXAttrs', 'couchapi', 'subdoc.ReplicaRead',
+    'subdoc.DocumentMacroSupport', 'subdoc.ReviveDocument', 'dcp', 'cbhello', 'touch', 'cccp',
+    'xdcrCheckpointing', 'nodesExt', 'xattr', 'rangeScan',
+]
+
+# the error map sent to the SDK, for the statuses it may not know the attributes of
+_ERROR_MAP = {
+    Status.LOCKED: ('LOCKED', 'Requested resource is locked', ['item-locked', 'item-only']),
+    Status.BUSY: ('EBUSY', 'Server is busy', ['temp', 'retry-later']),
+    Status.TEMPORARY_FAILURE: ('ETMPFAIL', 'Temporary failure', ['temp', 'retry-later']),
+}
+
+
+class LocalServer:
+    """A single node stand-in for a Couchbase Server cluster, running in the current event loop.
+
+    It serves the KV service (memcached binary protocol, including SASL, bucket selection, cluster configurations,
+    collections, sub-document operations and range scans) and, on a second port, the management and query HTTP
+    services.  Documents are kept in memory.  See :class:`~tools.local_server.faults.FaultInjection` for the latency
+    and errors that can be added to the data operations.
+    """
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 kv_port: int = 0,
+                 http_port: int = 0,
+                 buckets: Optional[Iterable[str]] = None,
+                 username: str = 'Administrator',
+                 password: str = 'password',
+                 num_vbuckets: int = 1024,
+                 faults: Optional[FaultInjection] = None,
+                 query_rows: int = 10,
+                 query_row_size: int = 64) -> None:
+        self.host = host
+        self.kv_port = kv_port
+        self.http_port = http_port
+        if buckets is None:
+            buckets = ['default']
+        self.buckets = {name: Bucket(name, num_vbuckets) for name in buckets}  # type: Dict[str, Bucket]
+        self.credentials = {username: password}
+        self.faults = faults if faults is not None else FaultInjection()
+        self.query_rows = query_rows
+        self.query_row_size = query_row_size
+        self.cluster_uuid = uuid.uuid4().hex
+        self._servers = []  # type: list
+        # the client connections, closed when stopping
+        self.transports = set()  # type: Set[asyncio.BaseTransport]
+        self._http_tasks = set()  # type: Set[asyncio.Task]
+        self._configs = {}  # type: Dict[Optional[str], bytes]
+
+    @property
+    def connstr(self) -> str:
+        return f'couchbase://{self.host}:{self.kv_port}'
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        kv_server = await loop.create_server(lambda: KvConnection(self), self.host, self.kv_port)
+        http_server = await asyncio.start_server(self._serve_http, self.host, self.http_port)
+        self._servers = [kv_server, http_server]
+        # the actual ports, if any was 0
+        self.kv_port = kv_server.sockets[0].getsockname()[1]
+        self.http_port = http_server.sockets[0].getsockname()[1]
+        self._configs.clear()
+
+    async def stop(self) -> None:
+        for server in self._servers:
+            server.close()
+        for transport in list(self.transports):
+            transport.close()
+        # the HTTP handlers return once they see their connection closed
+        await asyncio.gather(*self._http_tasks, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+
+    async def serve_forever(self) -> None:
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def _serve_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._http_tasks.add(task)
+        try:
+            await HttpConnection(self, reader, writer).serve()
+        finally:
+            self._http_tasks.discard(task)
+
+    def cluster_config(self, bucket: Optional[Bucket]) -> bytes:
+        """The cluster configuration, including the bucket's vbucket map if ``bucket`` is given."""
+        name = bucket.name if bucket is not None else None
+        config = self._configs.get(name, None)
+        if config is None:
+            config = self._configs[name] = json.dumps(self._build_config(bucket)).encode('utf-8')
+        return config
+
+    def _build_config(self, bucket: Optional[Bucket]) -> Dict[str, Any]:
+        config = {
+            'rev': 1,
+            'revEpoch': 1,
+            'nodesExt': [{
+                'services': {'mgmt': self.http_port, 'kv': self.kv_port, 'n1ql': self.http_port},
+                'thisNode': True,
+                'hostname': self.host,
+            }],
+            'clusterCapabilitiesVer': [1, 0],
+            'clusterCapabilities': {'n1ql': ['enhancedPreparedStatements']},
+            'clusterName': 'local',
+            'clusterUUID': self.cluster_uuid,
+        }  # type: Dict[str, Any]
+        if bucket is not None:
+            config.update({
+                'name': bucket.name,
+                'uuid': bucket.uuid,
+                'bucketType': 'membase',
+                'nodeLocator': 'vbucket',
+                'collectionsManifestUid': f'{bucket.manifest_uid:x}',
+                'bucketCapabilitiesVer': '',
+                'bucketCapabilities': BUCKET_CAPABILITIES,
+                'nodes': [{
+                    'couchApiBase': f'http://{self.host}:{self.http_port}/{bucket.name}',
+                    'hostname': f'{self.host}:{self.http_port}',
+                    'ports': {'direct': self.kv_port},
+                }],
+                'vBucketServerMap': {
+                    'hashAlgorithm': 'CRC',
+                    'numReplicas': 0,
+                    'serverList': [f'{self.host}:{self.kv_port}'],
+                    'vBucketMap': [[0]] * bucket.num_vbuckets,
+                },
+            })
+        return config
+
+    def error_map(self) -> bytes:
+        errors = {f'{status:x}': {'name': name, 'desc': desc, 'attrs': attrs}
+                  for status, (name, desc, attrs) in _ERROR_MAP.items()}
+        return json.dumps({'version': 2, 'revision': 1, 'errors': errors}).encode('utf-8')
+
+    def pools(self) -> Dict[str, Any]:
+        return {
+            'isAdminCreds': True,
+            'isEnterprise': True,
+            'implementationVersion': SERVER_VERSION,
+            'componentsVersion': {'ns_server': SERVER_VERSION},
+            'uuid': self.cluster_uuid,
+            'pools': [{'name': 'default', 'uri': '/pools/default'}],
+        }
@@ -0,0 +1,198 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""In-memory buckets: documents, CAS and sequence numbers, collections and range scans."""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+import uuid
+from typing import (Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from .protocol import vbucket_for_key
+
+# expiries up to 30 days are relative, larger ones are unix timestamps
+RELATIVE_EXPIRY_LIMIT = 30 * 24 * 60 * 60
+DEFAULT_LOCK_TIME = 15
+MAX_LOCK_TIME = 30
+
+DEFAULT_COLLECTION_ID = 0
+# the KV service reserves the collection ids up to 7
+FIRST_COLLECTION_ID = 8
+
+
+def absolute_expiry(expiry: int) -> int:
+    if expiry == 0 or expiry > RELATIVE_EXPIRY_LIMIT:
+        return expiry
+    return int(time.time()) + expiry
+
+
+class Document:
+    __slots__ = ('value', 'flags', 'datatype', 'cas', 'expiry', 'xattrs', 'seqno', 'lock_cas', 'locked_until')
+
+    def __init__(self,
+                 value: bytes,
+                 flags: int = 0,
+                 datatype: int = 0,
+                 expiry: int = 0,
+                 xattrs: Optional[Dict[str, Any]] = None) -> None:
+        self.value = value
+        self.flags = flags
+        self.datatype = datatype
+        self.expiry = expiry
+        self.xattrs = xattrs if xattrs is not None else {}
+        self.cas = 0
+        self.seqno = 0
+        self.lock_cas = 0
+        self.locked_until = 0.0
+
+    def is_locked(self) -> bool:
+        return self.lock_cas != 0 and self.locked_until > time.monotonic()
+
+    def unlock(self) -> None:
+        self.lock_cas = 0
+        self.locked_until = 0.0
+
+
+class RangeScan:
+    __slots__ = ('collection_id', 'keys', 'position', 'key_only')
+
+    def __init__(self, collection_id: int, keys: List[bytes], key_only: bool) -> None:
+        self.collection_id = collection_id
+        self.keys = keys
+        self.position = 0
+        self.key_only = key_only
+
+
+class Bucket:
+    def __init__(self, name: str, num_vbuckets: int) -> None:
+        self.name = name
+        self.uuid = uuid.uuid4().hex
+        self.num_vbuckets = num_vbuckets
+        self.vbucket_uuids = [int.from_bytes(os.urandom(8), 'big') >> 1 for _ in range(num_vbuckets)]
+        self._seqnos = [0] * num_vbuckets
+        self._last_cas = 0
+        # the documents of each vbucket, by (collection id, key)
+        self._docs = [{} for _ in range(num_vbuckets)]  # type: List[Dict[Tuple[int, bytes], Document]]
+        self._collections = {'_default._default': DEFAULT_COLLECTION_ID}  # type: Dict[str, int]
+        self.manifest_uid = 0
+        self._scans = {}  # type: Dict[bytes, RangeScan]
+
+    def vbucket(self, key: bytes) -> int:
+        return vbucket_for_key(key, self.num_vbuckets)
+
+    def next_cas(self) -> int:
+        self._last_cas = max(self._last_cas + 1, time.time_ns())
+        return self._last_cas
+
+    def get(self, collection_id: int, key: bytes) -> Optional[Document]:
+        docs = self._docs[self.vbucket(key)]
+        doc = docs.get((collection_id, key), None)
+        if doc is not None and doc.expiry and doc.expiry <= time.time():
+            del docs[(collection_id, key)]
+            return None
+        return doc
+
+    def next_seqno(self, key: bytes) -> int:
+        """The sequence number of the next mutation of the vbucket of ``key``."""
+        return self._seqnos[self.vbucket(key)] + 1
+
+    def store(self, collection_id: int, key: bytes, doc: Document, cas: Optional[int] = None) -> Document:
+        """Stores ``doc``, assigning its sequence number and CAS (a new one unless given)."""
+        vbucket = self.vbucket(key)
+        self._seqnos[vbucket] += 1
+        doc.seqno = self._seqnos[vbucket]
+        doc.cas = self.next_cas() if cas is None else cas
+        doc.unlock()
+        self._docs[vbucket][(collection_id, key)] = doc
+        return doc
+
+    def remove(self, collection_id: int, key: bytes) -> Tuple[int, int]:
+        """Removes the document, returning the CAS and sequence number of the removal."""
+        vbucket = self.vbucket(key)
+        del self._docs[vbucket][(collection_id, key)]
+        self._seqnos[vbucket] += 1
+        return self.next_cas(), self._seqnos[vbucket]
+
+    def mutation_token(self, key: bytes, seqno: int) -> Tuple[int, int]:
+        return self.vbucket_uuids[self.vbucket(key)], seqno
+
+    def collection_id(self, scope: str, collection: str) -> int:
+        """The id of ``scope.collection``, unknown collections are created on first use."""
+        name = f'{scope or "_default"}.{collection or "_default"}'
+        cid = self._collections.get(name, None)
+        if cid is None:
+            cid = FIRST_COLLECTION_ID + len(self._collections) - 1
+            self._collections[name] = cid
+            self.manifest_uid += 1
+        return cid
+
+    def has_collection(self, collection_id: int) -> bool:
+        return collection_id in self._collections.values()
+
+    def manifest(self) -> Dict[str, Any]:
+        scopes = {}  # type: Dict[str, List[Dict[str, str]]]
+        for name, cid in self._collections.items():
+            scope, collection = name.split('.', 1)
+            scopes.setdefault(scope, []).append({'name': collection, 'uid': f'{cid:x}'})
+        return {
+            'uid': f'{self.manifest_uid:x}',
+            'scopes': [{'name': scope, 'uid': '0' if scope == '_default' else f'{idx + 8:x}', 'collections': colls}
+                       for idx, (scope, colls) in enumerate(scopes.items())],
+        }
+
+    def create_scan(self,
+                    collection_id: int,
+                    vbucket: int,
+                    start: Optional[Tuple[bytes, bool]],
+                    end: Optional[Tuple[bytes, bool]],
+                    samples: Optional[int],
+                    seed: Optional[int],
+                    key_only: bool) -> Optional[bytes]:
+        """Creates a scan of the keys of ``vbucket``, either a range or a sample.
+
+        ``start`` and ``end`` are ``(key, exclusive)`` pairs.  Returns the scan's id, or ``None`` if no key matches.
+        """
+        now = time.time()
+        keys = [key for (cid, key), doc in self._docs[vbucket].items()
+                if cid == collection_id and not (doc.expiry and doc.expiry <= now)]
+        if samples is not None:
+            rand = random.Random(seed)
+            keys = rand.sample(keys, min(samples, len(keys)))
+        else:
+            if start is not None:
+                start_key, exclusive = start
+                keys = [k for k in keys if k > start_key or (k == start_key and not exclusive)]
+            if end is not None:
+                end_key, exclusive = end
+                keys = [k for k in keys if k < end_key or (k == end_key and not exclusive)]
+            keys.sort()
+        if not keys:
+            return None
+        scan_id = uuid.uuid4().bytes
+        self._scans[scan_id] = RangeScan(collection_id, keys, key_only)
+        return scan_id
+
+    def get_scan(self, scan_id: bytes) -> Optional[RangeScan]:
+        return self._scans.get(scan_id, None)
+
+    def close_scan(self, scan_id: bytes) -> bool:
+        return self._scans.pop(scan_id, None) is not None
@@ -0,0 +1,315 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Sub-document paths and operations, applied to decoded JSON documents."""
+
+from __future__ import annotations
+
+import json
+from enum import IntEnum
+from typing import (Any,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
+
+from .protocol import Status
+
+PathToken = Union[str, int]
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def _crc32c_table() -> List[int]:
+    table = []
+    for idx in range(256):
+        crc = idx
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82f63b78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _crc32c_table()
+
+
+def crc32c(data: bytes) -> int:
+    """CRC-32C (Castagnoli), the checksum of the ``${Mutation.value_crc32c}`` macro."""
+    crc = 0xffffffff
+    for byte in data:
+        crc = _CRC32C_TABLE[(crc ^ byte) & 0xff] ^ (crc >> 8)
+    return crc ^ 0xffffffff
+
+
+class SubdocOpcode(IntEnum):
+    GET_DOC = 0x00
+    SET_DOC = 0x01
+    REMOVE_DOC = 0x04
+    GET = 0xc5
+    EXISTS = 0xc6
+    DICT_ADD = 0xc7
+    DICT_UPSERT = 0xc8
+    DELETE = 0xc9
+    REPLACE = 0xca
+    ARRAY_PUSH_LAST = 0xcb
+    ARRAY_PUSH_FIRST = 0xcc
+    ARRAY_INSERT = 0xcd
+    ARRAY_ADD_UNIQUE = 0xce
+    COUNTER = 0xcf
+    GET_COUNT = 0xd2
+
+
+class PathFlag(IntEnum):
+    CREATE_PARENTS = 0x01
+    XATTR = 0x04
+    EXPAND_MACROS = 0x10
+
+
+class DocFlag(IntEnum):
+    MKDOC = 0x01
+    ADD = 0x02
+    ACCESS_DELETED = 0x04
+    CREATE_AS_DELETED = 0x08
+    REVIVE = 0x10
+
+
+class SubdocError(Exception):
+    def __init__(self, status: Status) -> None:
+        super().__init__(status.name)
+        self.status = status
+
+
+def parse_path(path: str) -> List[PathToken]:  # noqa: C901
+    """Splits a path such as ``a.b[0].`c.d```, into its keys and array indexes."""
+    tokens = []  # type: List[PathToken]
+    idx = 0
+    size = len(path)
+    expect_key = True
+    while idx < size:
+        char = path[idx]
+        if char == '[':
+            end = path.find(']', idx)
+            if end < 0:
+                raise SubdocError(Status.SUBDOC_PATH_INVALID)
+            try:
+                tokens.append(int(path[idx + 1:end]))
+            except ValueError:
+                raise SubdocError(Status.SUBDOC_PATH_INVALID) from None
+            idx = end + 1
+            expect_key = False
+        elif char == '.':
+            if expect_key:
+                raise SubdocError(Status.SUBDOC_PATH_INVALID)
+            idx += 1
+            expect_key = True
+        elif not expect_key:
+            raise SubdocError(Status.SUBDOC_PATH_INVALID)
+        elif char == '`':
+            # a literal backtick is escaped by doubling it
+            key = []
+            idx += 1
+            while True:
+                if idx >= size:
+                    raise SubdocError(Status.SUBDOC_PATH_INVALID)
+                if path[idx] == '`':
+                    if idx + 1 < size and path[idx + 1] == '`':
+                        key.append('`')
+                        idx += 2
+                        continue
+                    idx += 1
+                    break
+                key.append(path[idx])
+                idx += 1
+            tokens.append(''.join(key))
+            expect_key = False
+        else:
+            end = idx
+            while end < size and path[end] not in '.[':
+                end += 1
+            tokens.append(path[idx:end])
+            idx = end
+            expect_key = False
+    if expect_key and tokens:
+        raise SubdocError(Status.SUBDOC_PATH_INVALID)
+    return tokens
+
+
+def parse_fragment(value: bytes, multi: bool = False) -> Any:
+    """Decodes a JSON value sent with a mutation spec, or a comma separated list of values if ``multi``."""
+    try:
+        text = value.decode('utf-8')
+        return json.loads(f'[{text}]') if multi else json.loads(text)
+    except ValueError:
+        raise SubdocError(Status.SUBDOC_VALUE_CANNOT_INSERT) from None
+
+
+def _child(container: Any, token: PathToken) -> Any:
+    if isinstance(token, int):
+        if not isinstance(container, list):
+            raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+        idx = token if token >= 0 else len(container) + token
+        if idx < 0 or idx >= len(container):
+            raise SubdocError(Status.SUBDOC_PATH_NOT_FOUND)
+        return container[idx]
+    if not isinstance(container, dict):
+        raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+    if token not in container:
+        raise SubdocError(Status.SUBDOC_PATH_NOT_FOUND)
+    return container[token]
+
+
+def resolve(doc: Any, tokens: List[PathToken]) -> Any:
+    for token in tokens:
+        doc = _child(doc, token)
+    return doc
+
+
+def _parent(doc: Any, tokens: List[PathToken], create_parents: bool) -> Any:
+    container = doc
+    for token in tokens[:-1]:
+        try:
+            container = _child(container, token)
+        except SubdocError as ex:
+            if ex.status != Status.SUBDOC_PATH_NOT_FOUND or not create_parents or isinstance(token, int):
+                raise
+            container[token] = {}
+            container = container[token]
+    return container
+
+
+def lookup(doc: Any, opcode: int, tokens: List[PathToken]) -> Optional[bytes]:
+    """Applies a lookup spec, returning the JSON encoded value (``None`` for the ``exists`` spec)."""
+    if opcode == SubdocOpcode.GET_DOC:
+        return json.dumps(doc, separators=(',', ':')).encode('utf-8')
+    value = resolve(doc, tokens)
+    if opcode == SubdocOpcode.EXISTS:
+        return None
+    if opcode == SubdocOpcode.GET_COUNT:
+        if not isinstance(value, (dict, list)):
+            raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+        return str(len(value)).encode('utf-8')
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _array(doc: Any, tokens: List[PathToken], create_parents: bool) -> Tuple[Any, list]:
+    """Returns the (possibly replaced) document and the array at ``tokens``, created if allowed."""
+    if not tokens:
+        if not isinstance(doc, list):
+            raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+        return doc, doc
+    try:
+        target = resolve(doc, tokens)
+    except SubdocError as ex:
+        if ex.status != Status.SUBDOC_PATH_NOT_FOUND or not create_parents or isinstance(tokens[-1], int):
+            raise
+        parent = _parent(doc, tokens, create_parents)
+        if not isinstance(parent, dict):
+            raise
+        target = parent[tokens[-1]] = []
+    if not isinstance(target, list):
+        raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+    return doc, target
+
+
+def mutate(doc: Any,  # noqa: C901
+           opcode: int,
+           tokens: List[PathToken],
+           value: bytes,
+           create_parents: bool) -> Tuple[Any, Optional[bytes]]:
+    """Applies a mutation spec to ``doc``, in place where possible.
+
+    Returns the updated document and, for the counter spec, the JSON encoded result.
+    """
+    if opcode == SubdocOpcode.SET_DOC:
+        return parse_fragment(value), None
+
+    if opcode in (SubdocOpcode.ARRAY_PUSH_LAST, SubdocOpcode.ARRAY_PUSH_FIRST, SubdocOpcode.ARRAY_ADD_UNIQUE):
+        values = parse_fragment(value, multi=opcode != SubdocOpcode.ARRAY_ADD_UNIQUE)
+        doc, target = _array(doc, tokens, create_parents)
+        if opcode == SubdocOpcode.ARRAY_PUSH_LAST:
+            target.extend(values)
+        elif opcode == SubdocOpcode.ARRAY_PUSH_FIRST:
+            target[:0] = values
+        else:
+            if isinstance(values, (dict, list)):
+                raise SubdocError(Status.SUBDOC_VALUE_CANNOT_INSERT)
+            if any(type(item) is type(values) and item == values for item in target):
+                raise SubdocError(Status.SUBDOC_PATH_EXISTS)
+            target.append(values)
+        return doc, None
+
+    if not tokens:
+        raise SubdocError(Status.SUBDOC_PATH_INVALID)
+    parent = _parent(doc, tokens, create_parents)
+    last = tokens[-1]
+
+    if opcode == SubdocOpcode.ARRAY_INSERT:
+        values = parse_fragment(value, multi=True)
+        if not isinstance(last, int):
+            raise SubdocError(Status.SUBDOC_PATH_INVALID)
+        if not isinstance(parent, list):
+            raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+        if last < 0:
+            raise SubdocError(Status.SUBDOC_PATH_INVALID)
+        if last > len(parent):
+            raise SubdocError(Status.SUBDOC_PATH_NOT_FOUND)
+        parent[last:last] = values
+        return doc, None
+
+    if opcode in (SubdocOpcode.DICT_ADD, SubdocOpcode.DICT_UPSERT):
+        new_value = parse_fragment(value)
+        if not isinstance(last, str):
+            raise SubdocError(Status.SUBDOC_PATH_INVALID)
+        if not isinstance(parent, dict):
+            raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+        if opcode == SubdocOpcode.DICT_ADD and last in parent:
+            raise SubdocError(Status.SUBDOC_PATH_EXISTS)
+        parent[last] = new_value
+        return doc, None
+
+    if opcode == SubdocOpcode.COUNTER:
+        try:
+            delta = int(value)
+        except ValueError:
+            raise SubdocError(Status.SUBDOC_DELTA_INVALID) from None
+        if delta == 0 or not INT64_MIN <= delta <= INT64_MAX:
+            raise SubdocError(Status.SUBDOC_DELTA_INVALID)
+        try:
+            current = _child(parent, last)
+        except SubdocError as ex:
+            if ex.status != Status.SUBDOC_PATH_NOT_FOUND or not isinstance(parent, dict):
+                raise
+            current = 0
+        if isinstance(current, bool) or not isinstance(current, int):
+            raise SubdocError(Status.SUBDOC_PATH_MISMATCH)
+        result = current + delta
+        if not INT64_MIN <= result <= INT64_MAX:
+            raise SubdocError(Status.SUBDOC_NUM_RANGE)
+        parent[last] = result
+        return doc, str(result).encode('utf-8')
+
+    if opcode in (SubdocOpcode.REPLACE, SubdocOpcode.DELETE):
+        # raises if the path does not exist
+        _child(parent, last)
+        if isinstance(last, int) and last < 0:
+            last = len(parent) + last
+        if opcode == SubdocOpcode.DELETE:
+            del parent[last]
+        else:
+            parent[last] = parse_fragment(value)
+        return doc, None
+
+    raise SubdocError(Status.SUBDOC_INVALID_COMBO)
@@ -0,0 +1,6 @@
+"""Package entry point."""
+
+from tools.microbench.cli import main
+
+if __name__ == "__main__":
+    main()
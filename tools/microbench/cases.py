@@ -0,0 +1,248 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""The benchmark cases.
+
+A case's setup function is passed an :class:`OfflineEnvironment` and returns the callable to benchmark.  Cases
+with ``per_profile=True`` depend on the observability instruments and are run once per instrument profile
+(their names are suffixed with ``[<profile>]``), the other cases run once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import (Any,
+                    Callable,
+                    List)
+
+import couchbase.subdocument as SD
+from couchbase.cluster import Cluster
+from couchbase.collection import Collection
+from couchbase.logic.observability import ObservableRequestHandler
+from couchbase.logic.operation_types import KeyValueOperationType
+from couchbase.logic.options import get_valid_multi_args
+from couchbase.options import (GetOptions,
+                               UpsertMultiOptions,
+                               UpsertOptions,
+                               forward_args)
+from couchbase.result import (GetResult,
+                              LookupInResult,
+                              MultiGetResult,
+                              MultiMutationResult,
+                              MutationResult)
+from couchbase.transcoder import JSONTranscoder, LegacyTranscoder
+
+from .stub import (CANNED_DOC,
+                   CANNED_RAW_RESULTS,
+                   canned_result,
+                   offline_cluster)
+
+MULTI_KEYS = [f'airline_{idx}' for idx in range(10)]
+
+
+class OfflineEnvironment:
+    """An offline cluster, see :func:`~tools.microbench.stub.offline_cluster`, and its default collection."""
+
+    def __init__(self, profile: str) -> None:
+        self.profile = profile
+        self.cluster = offline_cluster(profile)  # type: Cluster
+        self.collection = self.cluster.bucket('default').default_collection()  # type: Collection
+
+    def close(self) -> None:
+        self.cluster.close()
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    setup: Callable[[OfflineEnvironment], Callable[[], Any]]
+    per_profile: bool = False
+
+
+def _collection_op(method: str, *args: Any, **kwargs: Any) -> Callable[[OfflineEnvironment], Callable[[], Any]]:
+    def _setup(env: OfflineEnvironment) -> Callable[[], Any]:
+        fn = getattr(env.collection, method)
+        return lambda: fn(*args, **kwargs)
+    return _setup
+
+
+def _binary_op(method: str, *args: Any) -> Callable[[OfflineEnvironment], Callable[[], Any]]:
+    def _setup(env: OfflineEnvironment) -> Callable[[], Any]:
+        fn = getattr(env.collection.binary(), method)
+        return lambda: fn(*args)
+    return _setup
+
+
+def _build_get(env: OfflineEnvironment) -> Callable[[], Any]:
+    builder = env.collection._impl.request_builder
+    opts = GetOptions(timeout=timedelta(seconds=2))
+    return lambda: builder.build_get_request('airline_10', None, opts)
+
+
+def _build_upsert(env: OfflineEnvironment) -> Callable[[], Any]:
+    builder = env.collection._impl.request_builder
+    opts = UpsertOptions(expiry=timedelta(hours=1), timeout=timedelta(seconds=2))
+    return lambda: builder.build_upsert_request('airline_10', CANNED_DOC, None, opts)
+
+
+def _build_lookup_in(env: OfflineEnvironment) -> Callable[[], Any]:
+    builder = env.collection._impl.request_builder
+    specs = (SD.get('name'), SD.exists('iata'))
+    return lambda: builder.build_lookup_in_request('airline_10', specs, None)
+
+
+def _build_mutate_in(env: OfflineEnvironment) -> Callable[[], Any]:
+    builder = env.collection._impl.request_builder
+    specs = (SD.upsert('name', '40-Mile Air'), SD.increment('version', 1))
+    return lambda: builder.build_mutate_in_request('airline_10', specs, None)
+
+
+def _build_get_multi(env: OfflineEnvironment) -> Callable[[], Any]:
+    builder = env.collection._impl.multi_request_builder
+    return lambda: builder.build_get_multi_request(MULTI_KEYS, None)
+
+
+def _build_upsert_multi(env: OfflineEnvironment) -> Callable[[], Any]:
+    builder = env.collection._impl.multi_request_builder
+    docs = {key: CANNED_DOC for key in MULTI_KEYS}
+    return lambda: builder.build_upsert_multi_request(docs, None)
+
+
+def _forward_args(env: OfflineEnvironment) -> Callable[[], Any]:
+    opts = UpsertOptions(expiry=timedelta(hours=1), timeout=timedelta(seconds=2))
+    return lambda: forward_args({'kwargs': {'preserve_expiry': True}}, opts)
+
+
+def _get_valid_multi_args(env: OfflineEnvironment) -> Callable[[], Any]:
+    opts = UpsertMultiOptions(expiry=timedelta(hours=1),
+                              per_key_options={'airline_1': UpsertOptions(timeout=timedelta(seconds=2))})
+    return lambda: get_valid_multi_args(UpsertMultiOptions, {}, opts)
+
+
+def _json_encode(env: OfflineEnvironment) -> Callable[[], Any]:
+    transcoder = JSONTranscoder()
+    return lambda: transcoder.encode_value(CANNED_DOC)
+
+
+def _json_decode(env: OfflineEnvironment) -> Callable[[], Any]:
+    transcoder = JSONTranscoder()
+    raw = CANNED_RAW_RESULTS['get']
+    return lambda: transcoder.decode_value(raw['value'], raw['flags'])
+
+
+def _legacy_encode(env: OfflineEnvironment) -> Callable[[], Any]:
+    transcoder = LegacyTranscoder()
+    return lambda: transcoder.encode_value(CANNED_DOC)
+
+
+def _get_result(env: OfflineEnvironment) -> Callable[[], Any]:
+    transcoder = JSONTranscoder()
+    raw = CANNED_RAW_RESULTS['get']
+    return lambda: GetResult(canned_result(raw), transcoder=transcoder, key='airline_10').content_as[dict]
+
+
+def _mutation_result(env: OfflineEnvironment) -> Callable[[], Any]:
+    raw = CANNED_RAW_RESULTS['upsert']
+    return lambda: MutationResult(canned_result(raw), key='airline_10').mutation_token()
+
+
+def _lookup_in_result(env: OfflineEnvironment) -> Callable[[], Any]:
+    transcoder = JSONTranscoder()
+    raw = CANNED_RAW_RESULTS['lookup_in']
+    return lambda: LookupInResult(canned_result(raw), transcoder=transcoder, is_subdoc=True,
+                                  key='airline_10').content_as[str](0)
+
+
+def _multi_raw(op: str) -> Callable[[], Any]:
+    raw = CANNED_RAW_RESULTS[op]
+
+    def _build():
+        res = canned_result({key: canned_result(raw) for key in MULTI_KEYS})
+        res.raw_result['all_okay'] = True
+        return res
+    return _build
+
+
+def _multi_get_result(env: OfflineEnvironment) -> Callable[[], Any]:
+    build = _multi_raw('get')
+    transcoders = {key: JSONTranscoder() for key in MULTI_KEYS}
+    return lambda: MultiGetResult(build(), return_exceptions=True, transcoders=transcoders).results
+
+
+def _multi_mutation_result(env: OfflineEnvironment) -> Callable[[], Any]:
+    build = _multi_raw('upsert')
+    return lambda: MultiMutationResult(build(), return_exceptions=True).results
+
+
+def _handler(env: OfflineEnvironment) -> Callable[[], Any]:
+    instruments = env.collection._impl.observability_instruments
+    details = env.collection._impl.request_builder._collection_dtls.get_details_as_dict()
+
+    def _run():
+        with ObservableRequestHandler(KeyValueOperationType.Get, instruments) as obs_handler:
+            obs_handler.create_kv_span(details)
+    return _run
+
+
+CASES = [
+    # request building and option forwarding
+    BenchmarkCase('builder.get', _build_get),
+    BenchmarkCase('builder.upsert', _build_upsert),
+    BenchmarkCase('builder.lookup_in', _build_lookup_in),
+    BenchmarkCase('builder.mutate_in', _build_mutate_in),
+    BenchmarkCase('builder.get_multi[10]', _build_get_multi),
+    BenchmarkCase('builder.upsert_multi[10]', _build_upsert_multi),
+    BenchmarkCase('options.forward_args', _forward_args),
+    BenchmarkCase('options.get_valid_multi_args', _get_valid_multi_args),
+    # transcoding
+    BenchmarkCase('transcoder.json.encode', _json_encode),
+    BenchmarkCase('transcoder.json.decode', _json_decode),
+    BenchmarkCase('transcoder.legacy.encode', _legacy_encode),
+    # result construction
+    BenchmarkCase('result.get', _get_result),
+    BenchmarkCase('result.mutation', _mutation_result),
+    BenchmarkCase('result.lookup_in', _lookup_in_result),
+    BenchmarkCase('result.multi_get[10]', _multi_get_result),
+    BenchmarkCase('result.multi_mutation[10]', _multi_mutation_result),
+    # observability
+    BenchmarkCase('handler.kv', _handler, per_profile=True),
+    # end to end, through the Collection API
+    BenchmarkCase('collection.get', _collection_op('get', 'airline_10'), per_profile=True),
+    BenchmarkCase('collection.get_and_touch', _collection_op('get_and_touch', 'airline_10', timedelta(seconds=10)),
+                  per_profile=True),
+    BenchmarkCase('collection.get_and_lock', _collection_op('get_and_lock', 'airline_10', timedelta(seconds=10)),
+                  per_profile=True),
+    BenchmarkCase('collection.get_any_replica', _collection_op('get_any_replica', 'airline_10'), per_profile=True),
+    BenchmarkCase('collection.exists', _collection_op('exists', 'airline_10'), per_profile=True),
+    BenchmarkCase('collection.insert', _collection_op('insert', 'airline_10', CANNED_DOC), per_profile=True),
+    BenchmarkCase('collection.upsert', _collection_op('upsert', 'airline_10', CANNED_DOC), per_profile=True),
+    BenchmarkCase('collection.replace', _collection_op('replace', 'airline_10', CANNED_DOC), per_profile=True),
+    BenchmarkCase('collection.remove', _collection_op('remove', 'airline_10'), per_profile=True),
+    BenchmarkCase('collection.touch', _collection_op('touch', 'airline_10', timedelta(seconds=10)),
+                  per_profile=True),
+    BenchmarkCase('collection.unlock', _collection_op('unlock', 'airline_10', 1), per_profile=True),
+    BenchmarkCase('collection.lookup_in', _collection_op('lookup_in', 'airline_10', (SD.get('name'),)),
+                  per_profile=True),
+    BenchmarkCase('collection.mutate_in',
+                  _collection_op('mutate_in', 'airline_10', (SD.upsert('name', '40-Mile Air'),)),
+                  per_profile=True),
+    BenchmarkCase('collection.get_multi[10]', _collection_op('get_multi', MULTI_KEYS), per_profile=True),
+    BenchmarkCase('collection.upsert_multi[10]',
+                  _collection_op('upsert_multi', {key: CANNED_DOC for key in MULTI_KEYS}), per_profile=True),
+    BenchmarkCase('collection.remove_multi[10]', _collection_op('remove_multi', MULTI_KEYS), per_profile=True),
+    BenchmarkCase('binary.increment', _binary_op('increment', 'counter'), per_profile=True),
+    BenchmarkCase('binary.append', _binary_op('append', 'airline_10', 'x'), per_profile=True),
+]  # type: List[BenchmarkCase]
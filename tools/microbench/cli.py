@@ -0,0 +1,118 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+from typing import (Any,
+                    Dict,
+                    List,
+                    Optional)
+
+from couchbase import __version__ as sdk_version
+
+from .cases import CASES, OfflineEnvironment
+from .runner import (BenchmarkResult,
+                     compare,
+                     measure)
+from .stub import PROFILES
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m tools.microbench',
+                                     description='Offline micro-benchmarks of the SDK\'s Python hot path.')
+    parser.add_argument('-k', '--filter', action='append', default=None,
+                        help='Only run the benchmarks matching this glob pattern (can be repeated).')
+    parser.add_argument('--profiles', default=','.join(PROFILES),
+                        help=f'Comma separated instrument profiles. Defaults to {",".join(PROFILES)}.')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Approximate seconds spent timing each benchmark. Defaults to 0.2.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of timed runs, the best is reported. Defaults to 5.')
+    parser.add_argument('--quick', action='store_true',
+                        help='Run each benchmark a few times only, to check the suite still runs.')
+    parser.add_argument('--json', dest='json_path', help='Write the results to this JSON file.')
+    parser.add_argument('--compare', dest='baseline_path',
+                        help='Compare the results with a JSON file written by a previous run.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Regression ratio reported by --compare. Defaults to 0.1 (10%%).')
+    return parser.parse_args(argv)
+
+
+def _selected(name: str, patterns: Optional[List[str]]) -> bool:
+    return patterns is None or any(fnmatch.fnmatchcase(name, p) for p in patterns)
+
+
+def run(args: argparse.Namespace) -> List[BenchmarkResult]:
+    profiles = [p.strip() for p in args.profiles.split(',') if p.strip()]
+    unknown = [p for p in profiles if p not in PROFILES]
+    if unknown:
+        raise SystemExit(f'Unknown profile(s): {", ".join(unknown)}')
+
+    results = []
+    for idx, profile in enumerate(profiles):
+        env = OfflineEnvironment(profile)
+        try:
+            for case in CASES:
+                if not case.per_profile and idx > 0:
+                    continue
+                name = f'{case.name}[{profile}]' if case.per_profile else case.name
+                if not _selected(name, args.filter):
+                    continue
+                fn = case.setup(env)
+                if args.quick:
+                    res = measure(name, fn, repeat=1, loops=3)
+                else:
+                    res = measure(name, fn, min_time=args.min_time, repeat=args.repeat)
+                results.append(res)
+                print(f'{res.name:<50} {res.ns_per_op:>12,.0f} ns/op {res.blocks_per_op:>8.1f} blocks/op '
+                      f'{res.peak_bytes_per_op:>10,} B peak/op', flush=True)
+        finally:
+            env.close()
+    return results
+
+
+def _metadata() -> Dict[str, Any]:
+    return {
+        'sdk_version': sdk_version,
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    results = run(args)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as out:
+            json.dump({'metadata': _metadata(), 'results': {r.name: r.as_dict() for r in results}}, out, indent=2)
+
+    if args.baseline_path:
+        with open(args.baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline['results'], args.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} regression(s) compared to {args.baseline_path} '
+                  f'(SDK {baseline["metadata"]["sdk_version"]}):')
+            for regression in regressions:
+                print(f'  {regression}')
+            sys.exit(1)
+        print(f'\nNo regressions compared to {args.baseline_path}.')
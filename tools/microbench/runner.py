@@ -0,0 +1,137 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Measures the time and memory allocated per call of a benchmark."""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Optional)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    # best of the repeats
+    ns_per_op: float
+    # memory blocks allocated by a call that are still alive once it returns (e.g. the result objects)
+    blocks_per_op: float
+    # high-water mark of the memory traced during a single call, transient allocations included
+    peak_bytes_per_op: int
+    loops: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _time_loops(fn: Callable[[], Any], loops: int) -> int:
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        fn()
+    return time.perf_counter_ns() - start
+
+
+def _calibrate(fn: Callable[[], Any], target_ns: int) -> int:
+    loops = 1
+    while True:
+        elapsed = _time_loops(fn, loops)
+        if elapsed >= target_ns or loops >= 1 << 24:
+            return loops
+        # aim slightly past the target, at most 10x more loops per step
+        loops = max(loops + 1, min(loops * 10, int(loops * 1.2 * target_ns / max(elapsed, 1))))
+
+
+def _blocks_per_op(fn: Callable[[], Any], loops: int) -> float:
+    # keep every result alive, the slots are allocated up front so the list never grows
+    keep = [None] * loops  # type: List[Any]
+    before = sys.getallocatedblocks()
+    for idx in range(loops):
+        keep[idx] = fn()
+    after = sys.getallocatedblocks()
+    del keep
+    return (after - before) / loops
+
+
+def _peak_bytes_per_op(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        # the first traced call fills lazily initialized caches
+        fn()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - current
+
+
+def measure(name: str,
+            fn: Callable[[], Any],
+            min_time: float = 0.2,
+            repeat: int = 5,
+            loops: Optional[int] = None) -> BenchmarkResult:
+    """Benchmarks ``fn``, called without arguments.
+
+    The loop count is calibrated so each of the ``repeat`` timed runs lasts about ``min_time / repeat`` seconds.
+    The garbage collector is disabled while measuring, as with :mod:`timeit`.
+    """
+    # warm up
+    for _ in range(10):
+        fn()
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        if loops is None:
+            loops = _calibrate(fn, int(min_time * 1e9 / repeat))
+        best = min(_time_loops(fn, loops) for _ in range(repeat))
+        blocks = _blocks_per_op(fn, min(loops, 1000))
+    finally:
+        if gc_enabled:
+            gc.enable()
+    peak = _peak_bytes_per_op(fn)
+    return BenchmarkResult(name=name,
+                           ns_per_op=best / loops,
+                           blocks_per_op=blocks,
+                           peak_bytes_per_op=peak,
+                           loops=loops)
+
+
+def compare(results: List[BenchmarkResult],
+            baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[str]:
+    """Returns a description of each benchmark that regressed by more than ``threshold`` (a ratio) from
+    ``baseline``, a mapping of benchmark names to the :meth:`BenchmarkResult.as_dict` of a previous run.
+    """
+    regressions = []
+    for res in results:
+        base = baseline.get(res.name, None)
+        if base is None:
+            continue
+        if res.ns_per_op > base['ns_per_op'] * (1 + threshold):
+            regressions.append(f'{res.name}: {base["ns_per_op"]:.0f} -> {res.ns_per_op:.0f} ns/op')
+        # a fraction of a block is noise (e.g. an occasional dict resize)
+        if res.blocks_per_op > base['blocks_per_op'] * (1 + threshold) + 0.5:
+            regressions.append(f'{res.name}: {base["blocks_per_op"]:.1f} -> {res.blocks_per_op:.1f} blocks/op')
+    return regressions
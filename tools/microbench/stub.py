@@ -0,0 +1,163 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Offline stand-in for the C++ core connection.
+
+A :class:`StubConnection` replaces the ``pycbc_connection`` of a cluster created with
+``skip_connect='TEST_SKIP_CONNECT'``.  Its key-value operations return canned ``pycbc_result`` objects, so the
+complete Python side of an operation (option forwarding, request building, observability and result construction)
+runs without a server, while the C++ core work is skipped.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List)
+
+from couchbase.auth import PasswordAuthenticator
+from couchbase.cluster import Cluster
+from couchbase.logic.binding_map import BindingMap
+from couchbase.logic.operation_types import ClusterOperationType
+from couchbase.logic.pycbc_core import pycbc_result
+from couchbase.options import ClusterOptions
+from couchbase.transcoder import FMT_JSON
+
+# Instrument profiles, the cluster options enabling each combination of tracer and meter
+PROFILES = {
+    'noop': {'enable_tracing': False, 'enable_metrics': False},
+    'threshold': {'enable_tracing': True, 'enable_metrics': False},
+    'logging_meter': {'enable_tracing': False, 'enable_metrics': True},
+}
+
+CANNED_DOC = {
+    'id': 'airline_10',
+    'type': 'airline',
+    'name': '40-Mile Air',
+    'iata': 'Q5',
+    'icao': 'MLA',
+    'callsign': 'MILE-AIR',
+    'country': 'United States',
+    'routes': [{'from': 'SFO', 'to': 'LAX', 'stops': 0}, {'from': 'LAX', 'to': 'JFK', 'stops': 1}],
+}
+CANNED_VALUE = json.dumps(CANNED_DOC).encode('utf-8')
+CANNED_CAS = 1700000000000000000
+CANNED_TOKEN = {'partition_id': 42, 'partition_uuid': 3004, 'sequence_number': 7, 'bucket_name': 'default'}
+
+_GET = {'cas': CANNED_CAS, 'flags': FMT_JSON, 'value': CANNED_VALUE}
+_MUTATION = {'cas': CANNED_CAS, 'token': CANNED_TOKEN}
+_SUBDOC_FIELD = {'opcode': 0xc5, 'status': 0, 'path': 'name', 'index': 0, 'exists': True, 'value': b'"40-Mile Air"'}
+
+# raw results of the key-value operations, by binding name
+CANNED_RAW_RESULTS = {
+    'append': _MUTATION,
+    'decrement': dict(_MUTATION, content=41),
+    'exists': {'cas': CANNED_CAS, 'document_exists': True},
+    'get': _GET,
+    'get_and_lock': _GET,
+    'get_and_touch': _GET,
+    'get_any_replica': dict(_GET, is_replica=False),
+    'get_projected': _GET,
+    'increment': dict(_MUTATION, content=43),
+    'insert': _MUTATION,
+    'lookup_in': {'cas': CANNED_CAS, 'fields': [_SUBDOC_FIELD]},
+    'mutate_in': dict(_MUTATION, fields=[]),
+    'prepend': _MUTATION,
+    'remove': _MUTATION,
+    'replace': _MUTATION,
+    'touch': {'cas': CANNED_CAS},
+    'unlock': {},
+    'upsert': _MUTATION,
+}  # type: Dict[str, Dict[str, Any]]
+
+
+def canned_result(raw: Dict[str, Any]) -> pycbc_result:
+    """Returns a new ``pycbc_result`` holding a copy of ``raw``."""
+    res = pycbc_result()
+    res.raw_result.update(raw)
+    return res
+
+
+class StubConnection:
+    """Stand-in for ``pycbc_connection``, see the module docstring.
+
+    Any binding (``pycbc_<name>``) is available: the key-value operations (and their ``_multi`` and
+    ``_with_legacy_durability`` variants) return canned results, the other operations return ``None``.
+    """
+
+    connected = True
+
+    def __init__(self, raw_results: Dict[str, Dict[str, Any]] = None) -> None:
+        self._raw_results = dict(CANNED_RAW_RESULTS if raw_results is None else raw_results)
+
+    def pycbc_get_cluster_labels(self, **kwargs: Any) -> Dict[str, str]:
+        return {'clusterName': 'microbench', 'clusterUUID': '00000000-0000-0000-0000-000000000000'}
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if not name.startswith('pycbc_'):
+            raise AttributeError(name)
+        op_name = name[len('pycbc_'):]
+        is_multi = op_name.endswith('_multi')
+        if is_multi:
+            op_name = op_name[:-len('_multi')]
+        op_name = op_name.replace('_with_legacy_durability', '')
+        raw = self._raw_results.get(op_name, None)
+        if raw is None:
+            return _no_result
+        if is_multi:
+            return _multi_op(raw)
+        return _single_op(raw)
+
+
+def _no_result(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+def _single_op(raw: Dict[str, Any]) -> Callable[[Any], pycbc_result]:
+    def _op(req: Any) -> pycbc_result:
+        return canned_result(raw)
+    return _op
+
+
+def _multi_op(raw: Dict[str, Any]) -> Callable[[List[Any]], pycbc_result]:
+    def _op(reqs: List[Any]) -> pycbc_result:
+        res = pycbc_result()
+        res.raw_result.update({req.key: canned_result(raw) for req in reqs})
+        res.raw_result['all_okay'] = True
+        return res
+    return _op
+
+
+def install_stub_connection(cluster: Cluster, connection: StubConnection = None) -> StubConnection:
+    """Replaces the core connection of a cluster created with ``skip_connect='TEST_SKIP_CONNECT'``."""
+    if connection is None:
+        connection = StubConnection()
+    impl = cluster._impl
+    adapter = impl._client_adapter
+    adapter._connection = connection
+    adapter._binding_map = BindingMap(connection)
+    impl._cluster_settings.set_observability_cluster_labels_callable(
+        adapter._binding_map.op_map[ClusterOperationType.GetClusterLabels.value])
+    return connection
+
+
+def offline_cluster(profile: str = 'noop') -> Cluster:
+    """Returns a cluster, using the instruments of ``profile``, whose operations never leave the process."""
+    opts = ClusterOptions(PasswordAuthenticator('Administrator', 'password'), **PROFILES[profile])
+    cluster = Cluster('couchbase://localhost', opts, skip_connect='TEST_SKIP_CONNECT')
+    install_stub_connection(cluster)
+    return cluster
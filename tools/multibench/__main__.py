@@ -0,0 +1,6 @@
+"""Package entry point."""
+
+from tools.multibench.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import (Any,
+                    Dict,
+                    Iterator,
+                    List,
+                    Optional)
+
+from couchbase import __version__ as sdk_version
+from couchbase.auth import PasswordAuthenticator
+from couchbase.cluster import Cluster
+from couchbase.options import ClusterOptions, ClusterTimeoutOptions
+
+from .runner import (OPERATIONS,
+                     MultiBenchmarkResult,
+                     compare,
+                     measure)
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m tools.multibench',
+                                     description='Benchmarks of the SDK\'s multi key-value operations.')
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help='Comma separated batch sizes. Defaults to 1000,10000,100000.')
+    parser.add_argument('--ops', default=','.join(OPERATIONS),
+                        help=f'Comma separated operations. Defaults to {",".join(OPERATIONS)}.')
+    parser.add_argument('--doc-size', type=int, default=256,
+                        help='Size of the JSON documents, in bytes. Defaults to 256.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of timed runs, the best is reported. Defaults to 5.')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help='max_in_flight option of the multi operations. Defaults to no limit.')
+    parser.add_argument('--connstr',
+                        help='Run against this cluster instead of starting the local server (tools.local_server).')
+    parser.add_argument('--bucket', default='default')
+    parser.add_argument('--username', default='Administrator')
+    parser.add_argument('--password', default='password')
+    parser.add_argument('--kv-timeout', type=float, default=120.0,
+                        help='KV timeout in seconds, large enough for the largest batch. Defaults to 120.')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Latency added by the local server to every data operation, in milliseconds.')
+    parser.add_argument('--json', dest='json_path', help='Write the results to this JSON file.')
+    parser.add_argument('--compare', dest='baseline_path',
+                        help='Compare the results with a JSON file written by a previous run.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Regression ratio reported by --compare. Defaults to 0.1 (10%%).')
+    return parser.parse_args(argv)
+
+
+def _split(value: str) -> List[str]:
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+@contextmanager
+def _local_server(args: argparse.Namespace) -> Iterator[str]:
+    # A separate process, so the server does not compete with the benchmark for the GIL.
+    cmd = [sys.executable, '-m', 'tools.local_server',
+           '--bucket', args.bucket,
+           '--username', args.username,
+           '--password', args.password,
+           '--latency-ms', str(args.latency_ms)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    try:
+        line = proc.stdout.readline()
+        if not line:
+            raise SystemExit('The local server failed to start.')
+        yield json.loads(line)['connstr']
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def run(args: argparse.Namespace, connstr: str) -> List[MultiBenchmarkResult]:
+    sizes = [int(s) for s in _split(args.sizes)]
+    ops = _split(args.ops)
+    unknown = [op for op in ops if op not in OPERATIONS]
+    if unknown:
+        raise SystemExit(f'Unknown operation(s): {", ".join(unknown)}')
+
+    opts = ClusterOptions(PasswordAuthenticator(args.username, args.password),
+                          timeout_options=ClusterTimeoutOptions(kv_timeout=timedelta(seconds=args.kv_timeout)))
+    cluster = Cluster.connect(connstr, opts)
+    try:
+        collection = cluster.bucket(args.bucket).default_collection()
+        results = []
+        for size in sizes:
+            for op in ops:
+                res = measure(collection,
+                              op,
+                              size,
+                              doc_size=args.doc_size,
+                              repeat=args.repeat,
+                              max_in_flight=args.max_in_flight)
+                results.append(res)
+                print(f'{res.name:<24} {res.ms_per_batch:>10,.1f} ms/batch {res.keys_per_sec:>12,.0f} keys/s '
+                      f'{res.gil_free:>6.0%} GIL free', flush=True)
+        return results
+    finally:
+        cluster.close()
+
+
+def _metadata() -> Dict[str, Any]:
+    return {
+        'sdk_version': sdk_version,
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    if args.connstr:
+        results = run(args, args.connstr)
+    else:
+        with _local_server(args) as connstr:
+            results = run(args, connstr)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as out:
+            json.dump({'metadata': _metadata(), 'results': {r.name: r.as_dict() for r in results}}, out, indent=2)
+
+    if args.baseline_path:
+        with open(args.baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)
+        print(f'\nCompared to {args.baseline_path} (SDK {baseline["metadata"]["sdk_version"]}):')
+        changes, regressions = compare(results, baseline['results'], args.threshold)
+        for change in changes:
+            print(f'  {change}')
+        if regressions:
+            print(f'\n{len(regressions)} regression(s):')
+            for regression in regressions:
+                print(f'  {regression}')
+            sys.exit(1)
+        print('\nNo regressions.')
@@ -0,0 +1,162 @@
+#  Copyright 2016-2026. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Times a multi operation and how much of that time the GIL was left to other threads."""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.collection import Collection
+from couchbase.options import GetMultiOptions, UpsertMultiOptions
+
+OPERATIONS = ('upsert_multi', 'get_multi')
+
+
+@dataclass
+class MultiBenchmarkResult:
+    name: str
+    keys: int
+    # best of the repeats
+    ms_per_batch: float
+    keys_per_sec: float
+    # progress of a pure Python thread during a batch, relative to its progress when idle
+    gil_free: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _PythonThreadProgress(threading.Thread):
+    """Counts the iterations of a pure Python loop, which only progresses while the GIL is free."""
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.count = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        count = 0
+        while not self._stopped.is_set():
+            for _ in range(1000):
+                pass
+            count += 1
+            self.count = count
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def _progress_rate(fn: Callable[[], Any]) -> Tuple[float, float]:
+    progress = _PythonThreadProgress()
+    progress.start()
+    try:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        count = progress.count
+    finally:
+        progress.stop()
+    return count / elapsed, elapsed
+
+
+def _build_op(collection: Collection,
+              op: str,
+              size: int,
+              doc_size: int,
+              max_in_flight: Optional[int]) -> Callable[[], Any]:
+    keys = [f'multibench-{size}-{i}' for i in range(size)]
+    docs = {key: {'id': key, 'padding': 'x' * max(doc_size - len(key) - 24, 0)} for key in keys}
+    # the documents are read back by get_multi
+    res = collection.upsert_multi(docs, UpsertMultiOptions(max_in_flight=max_in_flight))
+    if not res.all_ok:
+        raise SystemExit(f'Failed to load the documents: {next(iter(res.exceptions.values()))}')
+
+    def _run_op() -> None:
+        if op == 'upsert_multi':
+            res = collection.upsert_multi(docs, UpsertMultiOptions(max_in_flight=max_in_flight))
+        else:
+            res = collection.get_multi(keys, GetMultiOptions(max_in_flight=max_in_flight))
+        if not res.all_ok:
+            raise SystemExit(f'{op} failed: {next(iter(res.exceptions.values()))}')
+
+    return _run_op
+
+
+def measure(collection: Collection,
+            op: str,
+            size: int,
+            doc_size: int = 256,
+            repeat: int = 5,
+            max_in_flight: Optional[int] = None) -> MultiBenchmarkResult:
+    """Benchmarks a batch of ``size`` keys of the ``op`` multi operation.
+
+    The garbage collector is disabled while timing, as with :mod:`timeit`.  The share of the GIL left to other
+    threads is measured on a separate run, so the thread competing for the GIL does not slow the timed runs down.
+    """
+    fn = _build_op(collection, op, size, doc_size, max_in_flight)
+    # warm up
+    fn()
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        timings = []  # type: List[float]
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        idle_rate, _ = _progress_rate(lambda: time.sleep(0.2))
+        busy_rate, _ = _progress_rate(fn)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    best = min(timings)
+    return MultiBenchmarkResult(name=f'{op}[{size}]',
+                                keys=size,
+                                ms_per_batch=best * 1e3,
+                                keys_per_sec=size / best,
+                                gil_free=min(busy_rate / idle_rate, 1.0) if idle_rate > 0 else 0.0)
+
+
+def compare(results: List[MultiBenchmarkResult],
+            baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> Tuple[List[str], List[str]]:
+    """Returns the change of each benchmark found in ``baseline``, a mapping of benchmark names to the
+    :meth:`MultiBenchmarkResult.as_dict` of a previous run, and a description of each one that regressed by more
+    than ``threshold`` (a ratio).
+    """
+    changes = []
+    regressions = []
+    for res in results:
+        base = baseline.get(res.name, None)
+        if base is None:
+            continue
+        speedup = base['ms_per_batch'] / res.ms_per_batch if res.ms_per_batch > 0 else float('inf')
+        changes.append(f'{res.name}: {base["ms_per_batch"]:,.1f} -> {res.ms_per_batch:,.1f} ms/batch '
+                       f'(x{speedup:.2f}), GIL free {base["gil_free"]:.0%} -> {res.gil_free:.0%}')
+        if res.ms_per_batch > base['ms_per_batch'] * (1 + threshold):
+            regressions.append(f'{res.name}: {base["ms_per_batch"]:,.1f} -> {res.ms_per_batch:,.1f} ms/batch')
+    return changes, regressions
@@ -81,7 +81,7 @@ class N1QLRequest(QueryRequestLogic):
         if self._done_streaming is True:
             return
 
-        row = next(self._streaming_result)
+        row = self._row_buffer.next(self._streaming_result)
         if isinstance(row, PycbcCoreException):
             raise ErrorMapper.build_exception(row)
 
@@ -80,7 +80,7 @@ class FullTextSearchRequest(FullTextSearchRequestLogic):
         if self.done_streaming is True:
             return
 
-        row = next(self._streaming_result)
+        row = self._row_buffer.next(self._streaming_result)
         if isinstance(row, PycbcCoreException):
             raise ErrorMapper.build_exception(row)
 
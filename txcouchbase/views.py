@@ -80,7 +80,7 @@ class ViewRequest(ViewRequestLogic):
         if self._done_streaming is True:
             return
 
-        row = next(self._streaming_result)
+        row = self._row_buffer.next(self._streaming_result)
         if isinstance(row, PycbcCoreException):
             raise ErrorMapper.build_exception(row)
         # should only be None one query request is complete and _no_ errors found